@@ -0,0 +1,174 @@
+"""
+Benchmark CN key modes: VARCHAR join keys vs. Int64 join keys.
+
+By default every CN column (CN, PLT_CN, TRE_CN, STRATUM_CN, ...) is read as a
+string, so the plot × tree × stratum joins and the per-plot group-bys hash
+15-20 byte strings. ``FIA(..., key_dtype="int64")`` reads them as BIGINT
+instead. This script builds a synthetic FIA-shaped database and, for each
+key mode, times the tree → plot → stratum join and a per-plot group-by,
+reporting the joined frame size and the peak resident memory of the process.
+
+Each mode runs in its own child process so peak memory is measured
+independently.
+
+Usage
+-----
+    python benchmarks/benchmark_key_dtype.py
+    python benchmarks/benchmark_key_dtype.py --plots 200000 --trees-per-plot 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import duckdb
+import polars as pl
+
+from pyfia.core.data_reader import FIADataReader
+
+
+def build_database(path: Path, n_plots: int, trees_per_plot: int) -> None:
+    """Create a synthetic database with FIADB-sized CNs stored as VARCHAR."""
+    n_strata = max(n_plots // 50, 1)
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute(
+            f"""
+            CREATE TABLE POP_STRATUM AS
+            SELECT CAST(188908493010661 + i AS VARCHAR) AS CN,
+                   random() * 5000 AS EXPNS,
+                   1.0 AS ADJ_FACTOR_SUBP
+            FROM range({n_strata}) t(i)
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TABLE POP_PLOT_STRATUM_ASSGN AS
+            SELECT CAST(247862125010854 + i AS VARCHAR) AS PLT_CN,
+                   CAST(188908493010661 + i % {n_strata} AS VARCHAR) AS STRATUM_CN
+            FROM range({n_plots}) t(i)
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TABLE PLOT AS
+            SELECT CAST(247862125010854 + i AS VARCHAR) AS CN,
+                   CAST(i % 50 + 1 AS INTEGER) AS STATECD,
+                   CAST(2015 + i % 8 AS INTEGER) AS INVYR
+            FROM range({n_plots}) t(i)
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TABLE TREE AS
+            SELECT CAST(412538912010478 + i AS VARCHAR) AS CN,
+                   CAST(247862125010854 + i % {n_plots} AS VARCHAR) AS PLT_CN,
+                   CAST(i % 3 + 1 AS INTEGER) AS STATUSCD,
+                   random() * 30 AS DIA,
+                   random() * 10 AS TPA_UNADJ
+            FROM range({n_plots * trees_per_plot}) t(i)
+            """
+        )
+    finally:
+        conn.close()
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and kilobytes elsewhere
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def run_mode(db_path: Path, key_dtype: str, iterations: int) -> dict[str, float]:
+    """Load the tables in one key mode and time the join and group-by."""
+    reader = FIADataReader(db_path, key_dtype=key_dtype)
+    tree = reader.read_table("TREE", lazy=False)
+    plot = reader.read_table("PLOT", lazy=False)
+    ppsa = reader.read_table("POP_PLOT_STRATUM_ASSGN", lazy=False)
+    strata = reader.read_table("POP_STRATUM", lazy=False)
+    reader._backend.disconnect()
+
+    join_times = []
+    group_times = []
+    joined_mb = 0.0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        joined = (
+            tree.join(plot, left_on="PLT_CN", right_on="CN", suffix="_PLOT")
+            .join(ppsa, on="PLT_CN")
+            .join(strata, left_on="STRATUM_CN", right_on="CN", suffix="_STRATUM")
+        )
+        join_times.append(time.perf_counter() - start)
+        joined_mb = joined.estimated_size("mb")
+
+        start = time.perf_counter()
+        joined.group_by("PLT_CN", "STRATUM_CN").agg(
+            (pl.col("TPA_UNADJ") * pl.col("EXPNS")).sum().alias("TPA_TOTAL")
+        )
+        group_times.append(time.perf_counter() - start)
+        del joined
+
+    return {
+        "join": statistics.mean(join_times),
+        "group_by": statistics.mean(group_times),
+        "joined_mb": joined_mb,
+        "peak_mb": peak_rss_mb(),
+    }
+
+
+def _run_mode_in_child(args: tuple[Path, str, int]) -> dict[str, float]:
+    return run_mode(*args)
+
+
+def run_benchmarks(n_plots: int, trees_per_plot: int, iterations: int) -> None:
+    """Run both key modes in fresh processes and print a summary table."""
+    print("=" * 72)
+    print("KEY DTYPE BENCHMARK: VARCHAR vs. Int64 CN join keys")
+    print("=" * 72)
+    print(
+        f"{'Mode':>8} {'Join (s)':>10} {'Group-by (s)':>13} "
+        f"{'Joined (MB)':>12} {'Peak RSS (MB)':>14}"
+    )
+    print("-" * 72)
+
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "fia.duckdb"
+        build_database(db_path, n_plots, trees_per_plot)
+        results = {}
+        for key_dtype in ("string", "int64"):
+            with ctx.Pool(1) as pool:
+                results[key_dtype] = pool.apply(
+                    _run_mode_in_child, ((db_path, key_dtype, iterations),)
+                )
+            r = results[key_dtype]
+            print(
+                f"{key_dtype:>8} {r['join']:>10.3f} {r['group_by']:>13.3f} "
+                f"{r['joined_mb']:>12.1f} {r['peak_mb']:>14.1f}"
+            )
+
+    s, i = results["string"], results["int64"]
+    print("-" * 72)
+    print(
+        f"Int64 speedup: join {s['join'] / i['join']:.1f}x, "
+        f"group-by {s['group_by'] / i['group_by']:.1f}x; "
+        f"peak memory {i['peak_mb'] / s['peak_mb']:.0%} of string mode"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--plots", type=int, default=100_000)
+    parser.add_argument("--trees-per-plot", type=int, default=15)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmarks(args.plots, args.trees_per_plot, args.iterations)
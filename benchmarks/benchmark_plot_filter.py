@@ -0,0 +1,159 @@
+"""
+Benchmark EVALID plot filtering: batched PLT_CN IN-lists vs. a semi-join.
+
+``FIA.load_table`` used to restrict PLT_CN tables to the evaluation's plots
+with one query per 900 plot CNs, each carrying a string
+``PLT_CN IN ('...', ...)`` literal, concatenated in Polars. It now registers
+the plot set once and issues a single semi-join. This script builds
+synthetic multi-state databases and times both strategies loading TREE for
+1, 10 and 50 states.
+
+Usage
+-----
+    python benchmarks/benchmark_plot_filter.py
+    python benchmarks/benchmark_plot_filter.py --states 1 10 50 --plots-per-state 6000
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+import duckdb
+import polars as pl
+
+from pyfia import FIA
+
+# Plot CNs per IN-list in the previous strategy
+IN_LIST_BATCH_SIZE = 900
+
+
+def build_database(
+    path: Path, n_states: int, plots_per_state: int, trees_per_plot: int
+) -> list[int]:
+    """Create a synthetic FIA-shaped database and return one EVALID per state."""
+    n_plots = n_states * plots_per_state
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute(
+            f"""
+            CREATE TABLE POP_PLOT_STRATUM_ASSGN AS
+            SELECT CAST(1000000000 + i AS BIGINT) AS PLT_CN,
+                   CAST(i // {plots_per_state} + 1 AS INTEGER) AS STATECD,
+                   CAST((i // {plots_per_state} + 1) * 10000 + 2301 AS INTEGER)
+                       AS EVALID
+            FROM range({n_plots}) t(i)
+            """
+        )
+        # Half of the TREE rows belong to plots outside the evaluation
+        conn.execute(
+            f"""
+            CREATE TABLE TREE AS
+            SELECT CAST(5000000000 + i AS BIGINT) AS CN,
+                   CAST(1000000000 + i % ({2 * n_plots}) AS BIGINT) AS PLT_CN,
+                   CAST((i % ({2 * n_plots})) // {plots_per_state} % {n_states} + 1
+                       AS INTEGER) AS STATECD,
+                   CAST(i % 3 + 1 AS INTEGER) AS STATUSCD,
+                   random() * 30 AS DIA,
+                   random() * 10 AS TPA_UNADJ
+            FROM range({2 * n_plots * trees_per_plot}) t(i)
+            """
+        )
+        evalids = [
+            row[0]
+            for row in conn.execute(
+                "SELECT DISTINCT EVALID FROM POP_PLOT_STRATUM_ASSGN ORDER BY 1"
+            ).fetchall()
+        ]
+    finally:
+        conn.close()
+    return evalids
+
+
+def load_with_in_lists(db: FIA) -> pl.DataFrame:
+    """Reproduce the previous batched ``PLT_CN IN (...)`` strategy."""
+    plot_cns = db._get_valid_plot_cns() or []
+    batches = []
+    for i in range(0, len(plot_cns), IN_LIST_BATCH_SIZE):
+        cn_str = ", ".join(f"'{cn}'" for cn in plot_cns[i : i + IN_LIST_BATCH_SIZE])
+        batches.append(
+            db._reader.read_table("TREE", where=f"PLT_CN IN ({cn_str})", lazy=False)
+        )
+    return pl.concat(batches) if batches else pl.DataFrame()
+
+
+def load_with_semi_join(db: FIA) -> pl.DataFrame:
+    """Load TREE through ``FIA.load_table`` (single semi-join)."""
+    db.tables.pop("TREE", None)
+    return db.load_table("TREE").collect()
+
+
+def time_strategy(
+    db_path: Path,
+    evalids: list[int],
+    strategy: Callable[[FIA], pl.DataFrame],
+    iterations: int,
+) -> tuple[float, float, int]:
+    """Return mean and std dev (seconds) and row count for a strategy."""
+    times = []
+    rows = 0
+    for _ in range(iterations):
+        db = FIA(db_path)
+        db.clip_by_evalid(evalids)
+        start = time.perf_counter()
+        rows = strategy(db).height
+        times.append(time.perf_counter() - start)
+        del db
+    std = statistics.stdev(times) if len(times) > 1 else 0.0
+    return statistics.mean(times), std, rows
+
+
+def run_benchmarks(
+    state_counts: list[int], plots_per_state: int, trees_per_plot: int, iterations: int
+) -> None:
+    """Run the comparison for each state count and print a summary table."""
+    print("=" * 78)
+    print("PLOT FILTER BENCHMARK: batched IN-lists vs. semi-join (TREE load)")
+    print("=" * 78)
+    print(
+        f"{'States':>6} {'Plots':>9} {'Rows':>11} {'IN-lists (s)':>15} "
+        f"{'Semi-join (s)':>15} {'Speedup':>9}"
+    )
+    print("-" * 78)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_states in state_counts:
+            db_path = Path(tmp) / f"fia_{n_states}.duckdb"
+            evalids = build_database(db_path, n_states, plots_per_state, trees_per_plot)
+            old_mean, old_std, old_rows = time_strategy(
+                db_path, evalids, load_with_in_lists, iterations
+            )
+            new_mean, new_std, new_rows = time_strategy(
+                db_path, evalids, load_with_semi_join, iterations
+            )
+            if old_rows != new_rows:
+                raise RuntimeError(
+                    f"Row mismatch for {n_states} states: {old_rows} vs {new_rows}"
+                )
+            print(
+                f"{n_states:>6} {n_states * plots_per_state:>9,} {new_rows:>11,} "
+                f"{old_mean:>8.3f} ±{old_std:>5.3f} {new_mean:>8.3f} ±{new_std:>5.3f} "
+                f"{old_mean / new_mean:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--states", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--plots-per-state", type=int, default=3000)
+    parser.add_argument("--trees-per-plot", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmarks(
+        args.states, args.plots_per_state, args.trees_per_plot, args.iterations
+    )
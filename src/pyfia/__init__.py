@@ -21,6 +21,7 @@ __author__ = "Chris Mihiar"
 
 # Core exports - Main functionality
 # Estimation functions - High-level API
+from pyfia.batch import estimate_many
 from pyfia.core.data_reader import FIADataReader
 from pyfia.core.exceptions import (
     ConfigurationError,
@@ -50,21 +51,24 @@ from pyfia.downloader import (
     VALID_STATE_CODES,
     DataMartClient,
     DownloadCache,
+    build_plot_lineage,
     cache_info,
     clear_cache,
     download,
+    optimize_database,
 )
 from pyfia.estimation.estimators.area import area
 from pyfia.estimation.estimators.area_change import area_change
 from pyfia.estimation.estimators.biomass import biomass
 from pyfia.estimation.estimators.growth import growth
 from pyfia.estimation.estimators.mortality import mortality
-from pyfia.estimation.estimators.panel import panel
+from pyfia.estimation.estimators.panel import panel, write_panel
 from pyfia.estimation.estimators.removals import removals
 from pyfia.estimation.estimators.site_index import site_index
 from pyfia.estimation.estimators.tpa import tpa
 from pyfia.estimation.estimators.tree_metrics import tree_metrics
 from pyfia.estimation.estimators.volume import volume
+from pyfia.estimation.grm_materialize import materialize_grm
 
 # EVALIDator API client - For validation against official USFS estimates
 from pyfia.evalidator.client import EVALIDatorClient, EVALIDatorEstimate
@@ -75,6 +79,9 @@ from pyfia.evalidator.validation import (
     validate_pyfia_estimate,
 )
 
+# Partitioned execution - One worker process per state
+from pyfia.parallel import estimate_by_partition
+
 # Reference table utilities - Useful for adding descriptive names to results
 from pyfia.utils.reference_tables import (
     join_forest_type_names,
@@ -120,9 +127,13 @@ __all__ = [
     "mortality",
     "growth",
     "panel",
+    "write_panel",
     "removals",
     "site_index",
     "tree_metrics",
+    "estimate_by_partition",
+    "estimate_many",
+    "materialize_grm",
     # Reference table utilities
     "join_forest_type_names",
     "join_species_names",
@@ -143,6 +154,8 @@ __all__ = [
     "VALID_STATE_CODES",
     "clear_cache",
     "cache_info",
+    "optimize_database",
+    "build_plot_lineage",
 ]
 
 
@@ -0,0 +1,190 @@
+"""
+Batch estimation over one shared data load.
+
+Each estimator function loads TREE and COND, joins them and builds the
+stratification frame on its own, so a report running many estimates
+against the same evaluation repeats that work for every call.
+:func:`estimate_many` plans the union of the columns every requested
+estimator needs, reads and joins the tables once, builds the
+stratification frame once, and hands each estimator the shared frame for
+its own domain filtering, value calculation, aggregation and variance.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import polars as pl
+
+from .core.fia import FIA
+from .estimation.base import BaseEstimator
+from .estimation.codes import decode_code_columns
+from .estimation.estimators.biomass import BiomassEstimator, biomass
+from .estimation.estimators.carbon_pools import CarbonPoolEstimator, carbon_pool
+from .estimation.estimators.tpa import TPAEstimator, tpa
+from .estimation.estimators.volume import VolumeEstimator, volume
+from .estimation.utils import (
+    apply_variance_columns,
+    build_estimator_config,
+    ensure_evalid_set,
+    ensure_fia_instance,
+)
+
+logger = logging.getLogger(__name__)
+
+_ESTIMATORS: dict[str, tuple[type[BaseEstimator], Callable[..., pl.DataFrame]]] = {
+    "biomass": (BiomassEstimator, biomass),
+    "carbon_pool": (CarbonPoolEstimator, carbon_pool),
+    "tpa": (TPAEstimator, tpa),
+    "volume": (VolumeEstimator, volume),
+}
+
+
+def estimate_many(
+    db: str | FIA,
+    requests: Sequence[tuple[str, dict[str, Any]]],
+    **options: Any,
+) -> list[pl.DataFrame]:
+    """
+    Run several tree estimators against one shared data load.
+
+    Each result is identical to calling the estimator function with the
+    same options on the same database. TREE and COND are read once with
+    the union of the columns all requests need and joined once; the
+    stratification frame is also built once. Filters that differ between
+    requests (tree and land type, domains) are applied per request on the
+    shared frame.
+
+    Parameters
+    ----------
+    db : str | FIA
+        Database connection or path to FIA database. If no EVALID is set,
+        the most recent EXPVOL evaluations are selected, as the tree
+        estimator functions do.
+    requests : sequence of (str, dict)
+        Estimator name ('volume', 'biomass', 'tpa' or 'carbon_pool') and
+        its options, as accepted by the estimator function (e.g.
+        ``("volume", {"vol_type": "sawlog"})``).
+    **options
+        Options shared by every request, such as ``grp_by`` or
+        ``land_type``. A request's own options take precedence.
+
+    Returns
+    -------
+    list of pl.DataFrame
+        One result per request, in request order.
+
+    Raises
+    ------
+    ValueError
+        If an estimator name or option is not supported. EVALID selection
+        options (``most_recent``, ``eval_type``) are rejected; clip the
+        database before calling instead.
+
+    Examples
+    --------
+    >>> from pyfia import FIA, estimate_many
+    >>> with FIA("georgia.duckdb") as db:
+    ...     db.clip_most_recent(eval_type="VOL")
+    ...     vol, bio, trees = estimate_many(
+    ...         db,
+    ...         [("volume", {}), ("biomass", {"component": "AG"}), ("tpa", {})],
+    ...         grp_by="OWNGRPCD",
+    ...     )
+    """
+    for name, _ in requests:
+        if name not in _ESTIMATORS:
+            raise ValueError(
+                f"Invalid estimator '{name}'. "
+                f"Must be one of: {', '.join(sorted(_ESTIMATORS))}"
+            )
+    configs = [
+        (
+            name,
+            build_estimator_config(
+                _ESTIMATORS[name][1],
+                {**options, **request_options},
+                reserved=("db", "most_recent", "eval_type", "grouping_sets", "engine"),
+            ),
+        )
+        for name, request_options in requests
+    ]
+    if not configs:
+        return []
+
+    db, owns_db = ensure_fia_instance(db)
+    try:
+        ensure_evalid_set(db, eval_type="VOL", estimator_name="estimate_many")
+        estimators = [_ESTIMATORS[name][0](db, config) for name, config in configs]
+
+        logger.info(f"Loading shared data for {len(estimators)} estimates")
+        data = _load_shared_data(db, estimators)
+        strat_data = estimators[0]._get_stratification_data().collect().lazy()
+
+        results = []
+        for estimator in estimators:
+            estimator._stratification_cache = strat_data
+            estimator_data = data
+            if estimator.config.get("plot_domain"):
+                valid_plots = estimator.data_loader._get_valid_plots_filter()
+                if valid_plots is not None:
+                    estimator_data = data.join(valid_plots, on="PLT_CN", how="semi")
+
+            agg_result = estimator.run_aggregation(estimator_data)
+            formatted = decode_code_columns(
+                estimator.format_output(estimator.calculate_variance(agg_result))
+            )
+            results.append(
+                apply_variance_columns(
+                    formatted, estimator.config.get("variance", False)
+                )
+            )
+        return results
+    finally:
+        if owns_db and hasattr(db, "close"):
+            db.close()
+
+
+def _load_shared_data(db: FIA, estimators: list[BaseEstimator]) -> pl.LazyFrame:
+    """Load and join TREE and COND once for every estimator."""
+    tree_cols: list[str] = []
+    cond_cols: list[str] = []
+    tree_filters = []
+    cond_filters = []
+    for estimator in estimators:
+        loader = estimator.data_loader
+        tree, cond = loader._prepare_column_lists(
+            estimator.get_tree_columns(), estimator.get_cond_columns()
+        )
+        tree_cols.extend(c for c in tree or [] if c not in tree_cols)
+        cond_cols.extend(c for c in cond or [] if c not in cond_cols)
+        tree_filters.append(loader._build_tree_sql_filter())
+        cond_filters.append(loader._build_cond_sql_filter())
+
+    # A column routed to TREE for one request must not come from COND too
+    cond_cols = [
+        c for c in cond_cols if c in ("PLT_CN", "CONDID") or c not in tree_cols
+    ]
+
+    tree_df = db.load_table("TREE", tree_cols, _shared_filter(tree_filters))
+    cond_df = db.load_table("COND", cond_cols, _shared_filter(cond_filters))
+
+    data = tree_df.select(tree_cols).join(
+        cond_df.select(cond_cols), on=["PLT_CN", "CONDID"], how="inner"
+    )
+    return data.collect().lazy()
+
+
+def _shared_filter(filters: list[str | None]) -> str | None:
+    """Keep the SQL filter clauses every request applies.
+
+    DataLoader filters are conjunctions of simple clauses, so the clauses
+    common to all requests select a superset of every request's rows; the
+    rest is re-applied per request by ``apply_filters``.
+    """
+    clause_sets = [set(f.split(" AND ")) if f else set() for f in filters]
+    common = set.intersection(*clause_sets)
+    clauses = [c for c in (filters[0] or "").split(" AND ") if c in common]
+    return " AND ".join(clauses) if clauses else None
@@ -76,6 +76,21 @@ class TreeComponent:
     HARVEST = "HARVEST"
     INGROWTH = "INGROWTH"
 
+    # Values of the SUBP_COMPONENT_* columns in TREE_GRM_COMPONENT
+    GRM_CODES = (
+        "SURVIVOR",
+        "INGROWTH",
+        "MORTALITY1",
+        "MORTALITY2",
+        "CUT1",
+        "CUT2",
+        "DIVERSION1",
+        "DIVERSION2",
+        "REVERSION1",
+        "REVERSION2",
+        "NOT USED",
+    )
+
 
 class EvaluationType:
     """FIA evaluation type codes."""
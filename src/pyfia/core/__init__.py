@@ -32,12 +32,14 @@ from .exceptions import (
 )
 from .fia import FIA
 from .settings import PyFIASettings, get_default_db_path, get_default_engine, settings
+from .table_cache import TableCache
 
 __all__ = [
     # Main classes
     "FIA",
     "FIADataReader",
     "PyFIASettings",
+    "TableCache",
     # Settings helpers
     "get_default_db_path",
     "get_default_engine",
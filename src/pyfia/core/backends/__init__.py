@@ -40,6 +40,7 @@ def create_backend(db_path: str | Path, **kwargs: Any) -> DatabaseBackend:
         - read_only: bool, default True
         - memory_limit: str, e.g., "8GB"
         - threads: int
+        - key_dtype: str, 'string' (default) or 'int64' CN columns
         - motherduck_token: str (for MotherDuck connections)
 
     Returns
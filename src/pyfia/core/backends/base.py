@@ -7,16 +7,160 @@ to ensure consistent behavior across different database engines.
 
 from __future__ import annotations
 
+import hashlib
+import logging
+import re
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Iterable, Iterator, Sequence
 
 import polars as pl
 from pydantic import BaseModel, ConfigDict, Field
 
 from pyfia.validation import validate_domain_expression, validate_sql_identifier
 
+logger = logging.getLogger(__name__)
+
+# Name prefix for value sets registered by build_semi_join_clause()
+VALUE_RELATION_PREFIX = "pyfia_values_"
+_VALUE_RELATION_PATTERN = re.compile(rf"\b{VALUE_RELATION_PREFIX}[0-9a-f]{{16}}\b")
+
+# Database integer types read as BIGINT (Polars Int64)
+INTEGER_SQL_TYPES = frozenset(
+    {
+        "TINYINT",
+        "SMALLINT",
+        "INTEGER",
+        "INT",
+        "UTINYINT",
+        "USMALLINT",
+        "UINTEGER",
+    }
+)
+STRING_SQL_TYPES = frozenset({"VARCHAR", "TEXT", "CHAR", "STRING"})
+
+# SQL type CN columns are read as for each key mode
+CN_SQL_TYPES: dict[str, str] = {"string": "VARCHAR", "int64": "BIGINT"}
+
+# Statements that can change table schemas and invalidate the schema catalog
+DDL_PATTERN = re.compile(
+    r"^\s*(CREATE|DROP|ALTER|ATTACH|DETACH|IMPORT|USE)\b", re.IGNORECASE
+)
+
+# Declared FIADB types of numeric columns that some state databases (built
+# from CSV or older snapshots) store as VARCHAR (#106). Such columns are cast
+# to the declared type when read.
+FIADB_NUMERIC_TYPES: dict[str, str] = {
+    **dict.fromkeys(
+        [
+            "ADJ_FACTOR_MACR",
+            "ADJ_FACTOR_MICR",
+            "ADJ_FACTOR_SUBP",
+            "AREA_USED",
+            "CARBON_AG",
+            "CARBON_BG",
+            "CONDPROP_UNADJ",
+            "DIA",
+            "DIA_BEGIN",
+            "DIA_END",
+            "DIA_MIDPT",
+            "DRYBIO_AG",
+            "DRYBIO_BG",
+            "DRYBIO_BOLE",
+            "DRYBIO_BRANCH",
+            "EXPNS",
+            "HT",
+            "MACRO_BREAKPOINT_DIA",
+            "REMPER",
+            "TPA_UNADJ",
+            "VOLBFNET",
+            "VOLCFGRS",
+            "VOLCFNET",
+            "VOLCSGRS",
+            "VOLCSNET",
+        ],
+        "DOUBLE",
+    ),
+    **dict.fromkeys(
+        [
+            "CONDID",
+            "COND_STATUS_CD",
+            "COUNTYCD",
+            "EVALID",
+            "FORTYPCD",
+            "INVYR",
+            "OWNGRPCD",
+            "P1PNTCNT_EU",
+            "P1POINTCNT",
+            "P2POINTCNT",
+            "PLOT",
+            "RESERVCD",
+            "SITECLCD",
+            "SPCD",
+            "STATECD",
+            "STATUSCD",
+            "TREECLCD",
+        ],
+        "BIGINT",
+    ),
+}
+
+# GRM columns are named per tree and land type, e.g. SUBP_TPAGROW_UNADJ_GS_FOREST
+FIADB_NUMERIC_PREFIXES: dict[str, str] = {
+    "SUBP_TPA": "DOUBLE",
+    "SUBP_SUBPTYP_GRM": "BIGINT",
+}
+
+
+def validate_key_dtype(key_dtype: str) -> str:
+    """
+    Validate a CN key mode.
+
+    Parameters
+    ----------
+    key_dtype : str
+        Key mode, 'string' or 'int64'.
+
+    Returns
+    -------
+    str
+        The validated key mode.
+
+    Raises
+    ------
+    ValueError
+        If the key mode is not supported.
+    """
+    if key_dtype not in CN_SQL_TYPES:
+        raise ValueError(
+            f"Invalid key_dtype '{key_dtype}'. Must be one of {list(CN_SQL_TYPES)}"
+        )
+    return key_dtype
+
+
+def fiadb_numeric_type(column_name: str) -> str | None:
+    """
+    Look up the declared SQL type of a numeric FIADB column.
+
+    Parameters
+    ----------
+    column_name : str
+        Name of the column
+
+    Returns
+    -------
+    str | None
+        'DOUBLE' or 'BIGINT', or None if the column is not a known numeric
+        FIADB column
+    """
+    if column_name in FIADB_NUMERIC_TYPES:
+        return FIADB_NUMERIC_TYPES[column_name]
+    for prefix, sql_type in FIADB_NUMERIC_PREFIXES.items():
+        if column_name.startswith(prefix):
+            return sql_type
+    return None
+
 
 class QueryResult(BaseModel):
     """Result of a database query."""
@@ -42,7 +186,10 @@ class DatabaseBackend(ABC):
     must follow to ensure consistent behavior across different backends.
     """
 
-    def __init__(self, db_path: str | Path, **kwargs: Any):
+    # Number of value sets kept registered by build_semi_join_clause()
+    MAX_VALUE_RELATIONS = 8
+
+    def __init__(self, db_path: str | Path, key_dtype: str = "string", **kwargs: Any):
         """
         Initialize database backend.
 
@@ -50,6 +197,8 @@ class DatabaseBackend(ABC):
         ----------
         db_path : str | Path
             Path to database file
+        key_dtype : str, default 'string'
+            How CN columns are read: 'string' (VARCHAR) or 'int64' (BIGINT)
         **kwargs : Any
             Backend-specific configuration options
         """
@@ -57,8 +206,16 @@ class DatabaseBackend(ABC):
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database not found: {db_path}")
 
+        self.key_dtype = validate_key_dtype(key_dtype)
+
         self._connection: Any | None = None
         self._schema_cache: dict[str, dict[str, str]] = {}
+        self._select_expression_cache: dict[str, dict[str, str]] = {}
+        self._describe_cache: dict[str, list[tuple]] = {}
+        self._catalog_loaded = False
+        self._catalog_fingerprint: Any = None
+        self._relations: dict[str, Any] = {}
+        self._value_sets: dict[str, pl.DataFrame] = {}
         self._kwargs = kwargs
 
     @abstractmethod
@@ -145,6 +302,11 @@ class DatabaseBackend(ABC):
         """
         pass
 
+    @property
+    def cn_sql_type(self) -> str:
+        """SQL type CN columns are read as ('VARCHAR' or 'BIGINT')."""
+        return CN_SQL_TYPES[self.key_dtype]
+
     @abstractmethod
     def is_cn_column(self, column_name: str) -> bool:
         """
@@ -219,6 +381,121 @@ class DatabaseBackend(ABC):
         """
         pass
 
+    def schema_catalog(self) -> dict[str, dict[str, str]]:
+        """
+        Get the schemas of all tables in the database.
+
+        The catalog is loaded with a single query the first time it is
+        needed on a connection and reused by every schema lookup. It is
+        reloaded after DDL run through :meth:`execute_query`, after a
+        reconnect, and when :meth:`_database_fingerprint` changes (e.g. the
+        database file was rewritten by another process).
+
+        Returns
+        -------
+        dict[str, dict[str, str]]
+            Table name to a mapping of column names to SQL types
+        """
+        fingerprint = self._database_fingerprint()
+        if not self._catalog_loaded or fingerprint != self._catalog_fingerprint:
+            self.invalidate_schema_catalog()
+            self._schema_cache.update(self._load_schema_catalog())
+            self._catalog_loaded = True
+            self._catalog_fingerprint = fingerprint
+        return self._schema_cache
+
+    def invalidate_schema_catalog(self) -> None:
+        """Discard cached schemas so the next lookup reloads the catalog."""
+        self._schema_cache.clear()
+        self._select_expression_cache.clear()
+        self._describe_cache.clear()
+        self._catalog_loaded = False
+
+    def _load_schema_catalog(self) -> dict[str, dict[str, str]]:
+        """
+        Query the column names and types of every table.
+
+        Returns
+        -------
+        dict[str, dict[str, str]]
+            Table name to a mapping of column names to SQL types
+        """
+        rows = self.execute_query(
+            "SELECT table_name, column_name, data_type "
+            "FROM information_schema.columns "
+            "WHERE table_catalog = current_database() AND table_schema = 'main' "
+            "ORDER BY table_name, ordinal_position"
+        ).rows()
+        catalog: dict[str, dict[str, str]] = {}
+        for table, column, data_type in rows:
+            catalog.setdefault(table, {})[column] = data_type
+        return catalog
+
+    def _database_fingerprint(self) -> Any:
+        """
+        Identify the current version of the database.
+
+        Returns
+        -------
+        Any
+            Value that changes when the database is modified outside this
+            connection, or None if changes cannot be detected.
+        """
+        return None
+
+    def _track_schema_changes(self, query: str) -> None:
+        """Invalidate the schema catalog after a DDL statement."""
+        if DDL_PATTERN.match(query):
+            self.invalidate_schema_catalog()
+
+    def select_expressions(self, table_name: str) -> dict[str, str]:
+        """
+        Get the typed SELECT expression of every column in a table.
+
+        Casts are done in SQL so query results arrive with their final types
+        and need no per-column conversion afterwards:
+
+        - CN fields are cast to VARCHAR, or BIGINT when ``key_dtype`` is
+          'int64'
+        - Integer columns are cast to BIGINT (Polars Int64)
+        - Known numeric FIADB columns stored as VARCHAR are cast to their
+          declared type, with empty strings read as NULL
+
+        Expressions are computed once per table from the cached schema.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table
+
+        Returns
+        -------
+        dict[str, str]
+            Column name to SELECT expression, for columns that need a cast
+        """
+        cached = self._select_expression_cache.get(table_name)
+        if cached is not None:
+            return cached
+
+        expressions = {}
+        for col, col_type in self.get_table_schema(table_name).items():
+            col_type = col_type.upper()
+            if self.is_cn_column(col):
+                source = (
+                    f"NULLIF({col}, '')"
+                    if self.key_dtype == "int64" and col_type in STRING_SQL_TYPES
+                    else col
+                )
+                expressions[col] = f"CAST({source} AS {self.cn_sql_type}) AS {col}"
+            elif col_type in INTEGER_SQL_TYPES:
+                expressions[col] = f"CAST({col} AS BIGINT) AS {col}"
+            elif col_type in STRING_SQL_TYPES:
+                sql_type = fiadb_numeric_type(col)
+                if sql_type is not None:
+                    expressions[col] = f"CAST(NULLIF({col}, '') AS {sql_type}) AS {col}"
+        self._select_expression_cache[table_name] = expressions
+        return expressions
+
     @abstractmethod
     def build_select_clause(
         self, table_name: str, columns: list[str] | None = None
@@ -259,6 +536,195 @@ class DatabaseBackend(ABC):
         """
         pass
 
+    def iter_dataframes(
+        self, query: str, batch_size: int = 100_000
+    ) -> Iterator[pl.DataFrame]:
+        """
+        Execute query and yield results as a stream of DataFrames.
+
+        The query runs on a dedicated cursor from :meth:`_stream_cursor`, so
+        a partially consumed stream does not interfere with other queries on
+        the shared connection, and only one Arrow record batch is held in
+        memory at a time. Backends without a streaming cursor materialize
+        the full result with :meth:`read_dataframe` and yield it as a single
+        frame.
+
+        Parameters
+        ----------
+        query : str
+            SQL query to execute
+        batch_size : int, default 100_000
+            Target number of rows per yielded DataFrame
+
+        Yields
+        ------
+        pl.DataFrame
+            Consecutive chunks of the query result
+        """
+        cursor = self._stream_cursor()
+        if cursor is None:
+            yield self.read_dataframe(query)
+            return
+
+        try:
+            result = cursor.execute(query)
+            # to_arrow_reader() replaced fetch_record_batch() in newer DuckDB
+            if hasattr(result, "to_arrow_reader"):
+                reader = result.to_arrow_reader(batch_size)
+            else:
+                reader = result.fetch_record_batch(batch_size)
+            for batch in reader:
+                yield pl.from_arrow(batch)  # type: ignore[misc]
+        except Exception as e:
+            logger.error(f"Streaming query failed: {e}")
+            logger.debug(f"Query: {query}")
+            raise
+        finally:
+            cursor.close()
+
+    def _stream_cursor(self) -> Any | None:
+        """
+        Open a cursor for :meth:`iter_dataframes`, or None if unsupported.
+
+        The cursor must see the relations added with
+        :meth:`register_relation` and is closed when the stream ends.
+        """
+        return None
+
+    def register_relation(self, name: str, data: pl.DataFrame) -> None:
+        """
+        Expose an in-memory DataFrame to SQL queries under ``name``.
+
+        Registered relations stay available to every later query on this
+        backend, including streamed ones, until unregistered.
+
+        Parameters
+        ----------
+        name : str
+            Relation name to use in SQL
+        data : pl.DataFrame
+            Data to expose
+
+        Raises
+        ------
+        NotImplementedError
+            If the backend cannot query in-memory data.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support registered relations"
+        )
+
+    def unregister_relation(self, name: str) -> None:
+        """
+        Remove a relation added with :meth:`register_relation`.
+
+        Parameters
+        ----------
+        name : str
+            Relation name
+        """
+        self._relations.pop(name, None)
+
+    def build_semi_join_clause(
+        self, table_name: str, column: str, values: Sequence[str | int]
+    ) -> str:
+        """
+        Build a WHERE condition keeping rows whose ``column`` is in ``values``.
+
+        The values are registered once as an in-memory relation (see
+        :meth:`register_relation`) and the condition is a single semi-join
+        against it, instead of one literal ``IN (...)`` list per batch of
+        values. Identical value sets reuse the same relation, and only the
+        ``MAX_VALUE_RELATIONS`` most recently used sets are kept registered.
+        SQL that is run later, such as a lazy scan, must keep the sets it
+        names with :meth:`referenced_value_sets` and re-register them with
+        :meth:`restore_value_sets` before running.
+
+        Parameters
+        ----------
+        table_name : str
+            Table the condition will be applied to
+        column : str
+            Column to filter (e.g., 'PLT_CN')
+        values : Sequence[str | int]
+            Values to keep (integer CNs in int64 key mode)
+
+        Returns
+        -------
+        str
+            SQL condition (without 'WHERE' keyword)
+        """
+        safe_column = validate_sql_identifier(column, "column name")
+        digest = hashlib.blake2b(
+            "\x00".join(map(str, values)).encode(), digest_size=8
+        ).hexdigest()
+        name = f"{VALUE_RELATION_PREFIX}{digest}"
+
+        if name in self._value_sets:
+            # Mark as most recently used
+            self._value_sets[name] = self._value_sets.pop(name)
+        else:
+            self._register_value_set(
+                name,
+                pl.DataFrame(
+                    {"VALUE": pl.Series([str(v) for v in values], dtype=pl.String)}
+                ),
+            )
+
+        # Cast the (small) value set to the column's stored type so the
+        # join key is not cast row by row
+        col_type = self.get_table_schema(table_name).get(safe_column, "VARCHAR")
+        return f"{safe_column} IN (SELECT CAST(VALUE AS {col_type}) FROM {name})"
+
+    def referenced_value_sets(self, query: str) -> dict[str, pl.DataFrame]:
+        """
+        Value sets from :meth:`build_semi_join_clause` named in ``query``.
+
+        Parameters
+        ----------
+        query : str
+            SQL query or condition
+
+        Returns
+        -------
+        dict[str, pl.DataFrame]
+            Registered value sets by relation name, to pass to
+            :meth:`restore_value_sets` before ``query`` is run
+        """
+        return {
+            name: self._value_sets[name]
+            for name in _VALUE_RELATION_PATTERN.findall(query)
+            if name in self._value_sets
+        }
+
+    def restore_value_sets(self, value_sets: dict[str, pl.DataFrame]) -> None:
+        """
+        Re-register value sets evicted since :meth:`referenced_value_sets`.
+
+        Parameters
+        ----------
+        value_sets : dict[str, pl.DataFrame]
+            Value sets by relation name
+        """
+        for name, data in value_sets.items():
+            if name in self._value_sets:
+                self._value_sets[name] = self._value_sets.pop(name)
+            else:
+                self._register_value_set(name, data, keep=value_sets.keys())
+
+    def _register_value_set(
+        self, name: str, data: pl.DataFrame, keep: Iterable[str] = ()
+    ) -> None:
+        """Register a value set, evicting the least recently used extras."""
+        self.register_relation(name, data)
+        self._value_sets[name] = data
+        pinned = {name, *keep}
+        excess = max(len(self._value_sets) - self.MAX_VALUE_RELATIONS, 0)
+        stale = [key for key in self._value_sets if key not in pinned][:excess]
+        for key in stale:
+            del self._value_sets[key]
+            self.unregister_relation(key)
+
     def read_table(
         self,
         table_name: str,
@@ -87,6 +87,11 @@ class DuckDBBackend(DatabaseBackend):
         try:
             self._connection = duckdb.connect(**connect_kwargs)  # type: ignore[arg-type]
             logger.info(f"Connected to DuckDB database: {self.db_path}")
+            self.invalidate_schema_catalog()
+
+            # Restore relations registered before a reconnect
+            for name, table in self._relations.items():
+                self._connection.register(name, table)
         except duckdb.Error as e:
             logger.error(f"Failed to connect to DuckDB: {e}")
             raise
@@ -140,6 +145,7 @@ class DuckDBBackend(DatabaseBackend):
 
             # Native DuckDB to Polars conversion
             df: pl.DataFrame = result.pl()
+            self._track_schema_changes(query)
 
             execution_time = (time.time() - start_time) * 1000
             logger.debug(
@@ -169,11 +175,11 @@ class DuckDBBackend(DatabaseBackend):
         dict[str, str]
             Dictionary mapping column names to SQL types
         """
-        if table_name in self._schema_cache:
-            return self._schema_cache[table_name]
+        catalog = self.schema_catalog()
+        if table_name in catalog:
+            return catalog[table_name]
 
-        if not self._connection:
-            self.connect()
+        # Not in the catalog (e.g. a differently cased name): ask DuckDB
         assert self._connection is not None
 
         # Validate table name to prevent SQL injection
@@ -182,7 +188,7 @@ class DuckDBBackend(DatabaseBackend):
         try:
             result = self._connection.execute(f'DESCRIBE "{safe_table}"').fetchall()
             schema = {row[0]: row[1] for row in result}
-            self._schema_cache[table_name] = schema
+            catalog[table_name] = schema
             return schema
         except duckdb.Error as e:
             # Use debug level - missing tables are often expected (e.g., BEGINEND)
@@ -203,16 +209,8 @@ class DuckDBBackend(DatabaseBackend):
         bool
             True if table exists, False otherwise
         """
-        if not self._connection:
-            self.connect()
-        assert self._connection is not None
-
         try:
-            result = self._connection.execute(
-                "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
-                [table_name],
-            ).fetchone()
-            return result[0] > 0 if result else False
+            return table_name in self.schema_catalog()
         except duckdb.Error:
             return False
 
@@ -230,8 +228,10 @@ class DuckDBBackend(DatabaseBackend):
         list[tuple]
             List of tuples with column information
         """
-        if not self._connection:
-            self.connect()
+        # Reload cached descriptions along with the schema catalog
+        self.schema_catalog()
+        if table_name in self._describe_cache:
+            return self._describe_cache[table_name]
         assert self._connection is not None
 
         # Validate table name to prevent SQL injection
@@ -241,16 +241,38 @@ class DuckDBBackend(DatabaseBackend):
             result: list[tuple[Any, ...]] = self._connection.execute(
                 f'DESCRIBE "{safe_table}"'
             ).fetchall()
+            self._describe_cache[table_name] = result
             return result
         except duckdb.Error as e:
             logger.error(f"Failed to describe table {table_name}: {e}")
             raise
 
+    def _database_fingerprint(self) -> Any:
+        """
+        Identify the current version of the database file.
+
+        Returns
+        -------
+        Any
+            Size and modification time of the database file and its
+            write-ahead log.
+        """
+        fingerprint: list[tuple[int, int] | None] = []
+        for path in (self.db_path, self.db_path.with_name(f"{self.db_path.name}.wal")):
+            try:
+                stat = path.stat()
+            except OSError:
+                fingerprint.append(None)
+            else:
+                fingerprint.append((stat.st_size, stat.st_mtime_ns))
+        return tuple(fingerprint)
+
     def is_cn_column(self, column_name: str) -> bool:
         """
         Check if a column is a CN (Control Number) field.
 
-        FIA uses CN fields as identifiers that should always be treated as text.
+        FIA uses CN fields as identifiers; they are read as text, or as Int64
+        in ``key_dtype="int64"`` mode.
 
         Parameters
         ----------
@@ -281,7 +303,7 @@ class DuckDBBackend(DatabaseBackend):
             True if the column should be treated as a string
         """
         if self.is_cn_column(column_name):
-            return True
+            return self.key_dtype == "string"
 
         schema = self.get_table_schema(table_name)
         col_type = schema.get(column_name, "").upper()
@@ -326,7 +348,7 @@ class DuckDBBackend(DatabaseBackend):
             True if the column should be treated as an integer
         """
         if self.is_cn_column(column_name):
-            return False  # CN fields are always strings
+            return self.key_dtype == "int64"
 
         schema = self.get_table_schema(table_name)
         col_type = schema.get(column_name, "").upper()
@@ -339,6 +361,9 @@ class DuckDBBackend(DatabaseBackend):
         """
         Build SELECT clause with appropriate type casting for FIA data.
 
+        CN fields are cast to VARCHAR (BIGINT in int64 key mode) and numeric
+        columns to their final types (see :meth:`select_expressions`).
+
         Parameters
         ----------
         table_name : str
@@ -351,21 +376,11 @@ class DuckDBBackend(DatabaseBackend):
         str
             SELECT clause with type casting
         """
-        schema = self.get_table_schema(table_name)
-
         if columns is None:
-            columns = list(schema.keys())
-
-        select_parts = []
-        for col in columns:
-            if self.is_cn_column(col):
-                # Always cast CN fields to VARCHAR
-                select_parts.append(f"CAST({col} AS VARCHAR) AS {col}")
-            else:
-                # Use column as-is
-                select_parts.append(col)
+            columns = list(self.get_table_schema(table_name).keys())
 
-        return ", ".join(select_parts)
+        expressions = self.select_expressions(table_name)
+        return ", ".join(expressions.get(col, col) for col in columns)
 
     def read_dataframe(self, query: str, **kwargs) -> pl.DataFrame:
         """
@@ -387,6 +402,54 @@ class DuckDBBackend(DatabaseBackend):
         """
         return self.execute_query(query)
 
+    def register_relation(self, name: str, data: pl.DataFrame) -> None:
+        """
+        Expose an in-memory DataFrame to SQL queries under ``name``.
+
+        The frame is registered as a zero-copy Arrow view, so queries can
+        join against it like a temporary table without writing to the
+        (read-only) database.
+
+        Parameters
+        ----------
+        name : str
+            Relation name to use in SQL
+        data : pl.DataFrame
+            Data to expose
+        """
+        if not self._connection:
+            self.connect()
+        assert self._connection is not None
+
+        safe_name = validate_sql_identifier(name, "relation name")
+        table = data.to_arrow()
+        self._connection.register(safe_name, table)
+        self._relations[safe_name] = table
+
+    def unregister_relation(self, name: str) -> None:
+        """
+        Remove a relation added with :meth:`register_relation`.
+
+        Parameters
+        ----------
+        name : str
+            Relation name
+        """
+        if self._relations.pop(name, None) is not None and self._connection:
+            self._connection.unregister(name)
+
+    def _stream_cursor(self) -> duckdb.DuckDBPyConnection:
+        """Open a cursor sharing the registered relations for streaming."""
+        if not self._connection:
+            self.connect()
+        assert self._connection is not None
+
+        cursor: duckdb.DuckDBPyConnection = self._connection.cursor()
+        # Registered relations are connection-local; share them zero-copy
+        for name, table in self._relations.items():
+            cursor.register(name, table)
+        return cursor
+
     def load_spatial_extension(self) -> None:
         """
         Load the DuckDB spatial extension.
@@ -17,7 +17,7 @@ import polars as pl
 
 from pyfia.validation import validate_sql_identifier
 
-from .base import DatabaseBackend
+from .base import DatabaseBackend, validate_key_dtype
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +54,7 @@ class MotherDuckBackend(DatabaseBackend):
         self,
         database: str,
         motherduck_token: str | None = None,
+        key_dtype: str = "string",
         **kwargs: Any,
     ):
         """
@@ -66,14 +67,23 @@ class MotherDuckBackend(DatabaseBackend):
         motherduck_token : str | None
             MotherDuck authentication token. If not provided, uses
             MOTHERDUCK_TOKEN environment variable.
+        key_dtype : str, default 'string'
+            How CN columns are read: 'string' (VARCHAR) or 'int64' (BIGINT)
         **kwargs : Any
             Additional configuration options
         """
         # Don't pass db_path to super since we don't have a file path
         self.database = database
+        self.key_dtype = validate_key_dtype(key_dtype)
         self.motherduck_token = motherduck_token or os.environ.get("MOTHERDUCK_TOKEN")
         self._connection: duckdb.DuckDBPyConnection | None = None
         self._schema_cache: dict[str, dict[str, str]] = {}
+        self._select_expression_cache: dict[str, dict[str, str]] = {}
+        self._describe_cache: dict[str, list[tuple]] = {}
+        self._catalog_loaded = False
+        self._catalog_fingerprint: Any = None
+        self._relations: dict[str, Any] = {}
+        self._value_sets: dict[str, pl.DataFrame] = {}
 
         if not self.motherduck_token:
             raise ValueError(
@@ -96,6 +106,11 @@ class MotherDuckBackend(DatabaseBackend):
 
             # Attach the shared reference database for cross-database queries
             self._attach_reference_database()
+            self.invalidate_schema_catalog()
+
+            # Restore relations registered before a reconnect
+            for name, table in self._relations.items():
+                self._connection.register(name, table)
         except duckdb.Error as e:
             logger.error(f"Failed to connect to MotherDuck: {e}")
             raise
@@ -177,6 +192,7 @@ class MotherDuckBackend(DatabaseBackend):
 
             # Native DuckDB to Polars conversion
             df: pl.DataFrame = result.pl()
+            self._track_schema_changes(query)
 
             execution_time = (time.time() - start_time) * 1000
             logger.debug(
@@ -228,11 +244,11 @@ class MotherDuckBackend(DatabaseBackend):
         dict[str, str]
             Dictionary mapping column names to SQL types
         """
-        if table_name in self._schema_cache:
-            return self._schema_cache[table_name]
+        catalog = self.schema_catalog()
+        if table_name in catalog:
+            return catalog[table_name]
 
-        if not self._connection:
-            self.connect()
+        # Not in the catalog (e.g. a differently cased name): ask MotherDuck
         assert self._connection is not None
 
         try:
@@ -240,7 +256,7 @@ class MotherDuckBackend(DatabaseBackend):
             qualified_name = self._get_qualified_table_name(table_name)
             result = self._connection.execute(f"DESCRIBE {qualified_name}").fetchall()
             schema = {row[0]: row[1] for row in result}
-            self._schema_cache[table_name] = schema
+            catalog[table_name] = schema
             return schema
         except duckdb.Error as e:
             # Use debug level - missing tables are often expected (e.g., BEGINEND)
@@ -261,24 +277,9 @@ class MotherDuckBackend(DatabaseBackend):
         bool
             True if table exists, False otherwise
         """
-        if not self._connection:
-            self.connect()
-        assert self._connection is not None
-
         try:
-            # For reference tables, check in the reference database
-            if table_name in REFERENCE_TABLES:
-                result = self._connection.execute(
-                    "SELECT COUNT(*) FROM information_schema.tables "
-                    "WHERE table_catalog = ? AND table_name = ?",
-                    [REFERENCE_DATABASE, table_name],
-                ).fetchone()
-            else:
-                result = self._connection.execute(
-                    "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
-                    [table_name],
-                ).fetchone()
-            return result[0] > 0 if result else False
+            # Reference tables are cataloged from the reference database
+            return table_name in self.schema_catalog()
         except duckdb.Error:
             return False
 
@@ -296,23 +297,56 @@ class MotherDuckBackend(DatabaseBackend):
         list[tuple]
             List of tuples with column information
         """
-        if not self._connection:
-            self.connect()
+        # Reload cached descriptions along with the schema catalog
+        self.schema_catalog()
+        if table_name in self._describe_cache:
+            return self._describe_cache[table_name]
         assert self._connection is not None
 
         try:
             # Use qualified name for reference tables
             qualified_name = self._get_qualified_table_name(table_name)
-            return self._connection.execute(f"DESCRIBE {qualified_name}").fetchall()
+            result = self._connection.execute(f"DESCRIBE {qualified_name}").fetchall()
+            self._describe_cache[table_name] = result
+            return result
         except duckdb.Error as e:
             logger.error(f"Failed to describe table {table_name}: {e}")
             raise
 
+    def _load_schema_catalog(self) -> dict[str, dict[str, str]]:
+        """
+        Query the column names and types of every table in one round trip.
+
+        Reference tables are read from the shared reference database, as
+        :meth:`_get_qualified_table_name` does.
+
+        Returns
+        -------
+        dict[str, dict[str, str]]
+            Table name to a mapping of column names to SQL types
+        """
+        rows = self.execute_query(
+            "SELECT table_catalog = current_database() AS is_main, table_name, "
+            "column_name, data_type "
+            "FROM information_schema.columns "
+            "WHERE table_schema = 'main' "
+            "AND table_catalog IN (current_database(), :reference) "
+            "ORDER BY table_name, ordinal_position",
+            {"reference": REFERENCE_DATABASE},
+        ).rows()
+        catalog: dict[str, dict[str, str]] = {}
+        for is_main, table, column, data_type in rows:
+            if is_main != (table not in REFERENCE_TABLES):
+                continue
+            catalog.setdefault(table, {})[column] = data_type
+        return catalog
+
     def is_cn_column(self, column_name: str) -> bool:
         """
         Check if a column is a CN (Control Number) field.
 
-        FIA uses CN fields as identifiers that should always be treated as text.
+        FIA uses CN fields as identifiers; they are read as text, or as Int64
+        in ``key_dtype="int64"`` mode.
 
         Parameters
         ----------
@@ -343,7 +377,7 @@ class MotherDuckBackend(DatabaseBackend):
             True if the column should be treated as a string
         """
         if self.is_cn_column(column_name):
-            return True
+            return self.key_dtype == "string"
 
         schema = self.get_table_schema(table_name)
         col_type = schema.get(column_name, "").upper()
@@ -388,7 +422,7 @@ class MotherDuckBackend(DatabaseBackend):
             True if the column should be treated as an integer
         """
         if self.is_cn_column(column_name):
-            return False  # CN fields are always strings
+            return self.key_dtype == "int64"
 
         schema = self.get_table_schema(table_name)
         col_type = schema.get(column_name, "").upper()
@@ -402,7 +436,9 @@ class MotherDuckBackend(DatabaseBackend):
         Build SELECT clause with appropriate type casting for FIA data.
 
         MotherDuck stores CN columns as DOUBLE (due to large values >1e22).
-        This method casts CN columns to VARCHAR for consistent string-based joins.
+        This method casts CN columns to VARCHAR for consistent string-based
+        joins (BIGINT in int64 key mode), and numeric columns to their final
+        types (see :meth:`select_expressions`).
 
         Parameters
         ----------
@@ -416,22 +452,11 @@ class MotherDuckBackend(DatabaseBackend):
         str
             SELECT clause with type casting
         """
-        schema = self.get_table_schema(table_name)
-
         if columns is None:
-            columns = list(schema.keys())
-
-        select_parts = []
-        for col in columns:
-            if self.is_cn_column(col):
-                # Cast CN fields to VARCHAR for consistent joins
-                # MotherDuck stores these as DOUBLE which can overflow
-                select_parts.append(f"CAST({col} AS VARCHAR) AS {col}")
-            else:
-                # Use column as-is
-                select_parts.append(col)
+            columns = list(self.get_table_schema(table_name).keys())
 
-        return ", ".join(select_parts)
+        expressions = self.select_expressions(table_name)
+        return ", ".join(expressions.get(col, col) for col in columns)
 
     def read_dataframe(self, query: str, **kwargs) -> pl.DataFrame:
         """
@@ -452,3 +477,51 @@ class MotherDuckBackend(DatabaseBackend):
             Polars DataFrame with results
         """
         return self.execute_query(query)
+
+    def register_relation(self, name: str, data: pl.DataFrame) -> None:
+        """
+        Expose an in-memory DataFrame to SQL queries under ``name``.
+
+        The frame is registered as a zero-copy Arrow view, so queries can
+        join against it like a temporary table without writing to the
+        (read-only) database.
+
+        Parameters
+        ----------
+        name : str
+            Relation name to use in SQL
+        data : pl.DataFrame
+            Data to expose
+        """
+        if not self._connection:
+            self.connect()
+        assert self._connection is not None
+
+        safe_name = validate_sql_identifier(name, "relation name")
+        table = data.to_arrow()
+        self._connection.register(safe_name, table)
+        self._relations[safe_name] = table
+
+    def unregister_relation(self, name: str) -> None:
+        """
+        Remove a relation added with :meth:`register_relation`.
+
+        Parameters
+        ----------
+        name : str
+            Relation name
+        """
+        if self._relations.pop(name, None) is not None and self._connection:
+            self._connection.unregister(name)
+
+    def _stream_cursor(self) -> duckdb.DuckDBPyConnection:
+        """Open a cursor sharing the registered relations for streaming."""
+        if not self._connection:
+            self.connect()
+        assert self._connection is not None
+
+        cursor: duckdb.DuckDBPyConnection = self._connection.cursor()
+        # Registered relations are connection-local; share them zero-copy
+        for name, table in self._relations.items():
+            cursor.register(name, table)
+        return cursor
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Literal, overload
+from typing import Iterator, Literal, Sequence, overload
 
 import polars as pl
 
@@ -33,7 +33,12 @@ class FIADataReader:
     db_path: str | Path
 
     def __init__(
-        self, db_path: str | Path, engine: str | None = None, **backend_kwargs
+        self,
+        db_path: str | Path,
+        engine: str | None = None,
+        streaming: bool | None = None,
+        key_dtype: str | None = None,
+        **backend_kwargs,
     ):
         """
         Initialize data reader.
@@ -46,6 +51,14 @@ class FIADataReader:
             - MotherDuck: "md:database_name" or "motherduck:database_name"
         engine : str, optional
             Database engine ('duckdb' or 'sqlite'). If None, auto-detect.
+        streaming : bool, optional
+            If True, ``read_table(..., lazy=True)`` returns a streaming scan
+            (see :meth:`scan_table`) instead of an eagerly loaded frame.
+            Defaults to ``settings.streaming_scans``.
+        key_dtype : {'string', 'int64'}, optional
+            Type CN columns are read as. 'int64' keeps plot, tree and stratum
+            keys numeric so joins and group-bys hash integers instead of
+            strings. Defaults to ``settings.key_dtype``.
         **backend_kwargs
             Additional backend-specific options:
                 - For DuckDB: read_only, memory_limit, threads
@@ -64,10 +77,19 @@ class FIADataReader:
             if not self.db_path.exists():
                 raise FileNotFoundError(f"Database not found: {db_path}")
 
+        from .settings import settings
+
+        if streaming is None:
+            streaming = settings.streaming_scans
+        self.streaming = streaming
+        if key_dtype is None:
+            key_dtype = settings.key_dtype
+
         # Create backend using factory function
         self._backend: DatabaseBackend = create_backend(
-            db_path, engine=engine, **backend_kwargs
+            db_path, engine=engine, key_dtype=key_dtype, **backend_kwargs
         )
+        self.key_dtype = self._backend.key_dtype
 
         # Connect to database
         self._backend.connect()
@@ -154,24 +176,6 @@ class FIADataReader:
         """
         return self._backend.is_float_column(table_name, column_name)
 
-    def _is_integer_column(self, table_name: str, column_name: str) -> bool:
-        """
-        Check if a column should be treated as an integer.
-
-        Parameters
-        ----------
-        table_name : str
-            Name of the table.
-        column_name : str
-            Name of the column.
-
-        Returns
-        -------
-        bool
-            True if the column should be treated as an integer.
-        """
-        return self._backend.is_integer_column(table_name, column_name)
-
     def supports_spatial(self) -> bool:
         """
         Check if the backend supports spatial operations.
@@ -282,6 +286,148 @@ class FIADataReader:
         pl.DataFrame or pl.LazyFrame
             Polars DataFrame or LazyFrame.
         """
+        if lazy and self.streaming:
+            return self.scan_table(table_name, columns=columns, where=where)
+
+        # Execute query using backend; columns are typed in the SELECT clause
+        df: pl.DataFrame = self._backend.read_dataframe(
+            self._build_table_query(table_name, columns, where)
+        )
+
+        # Return as lazy frame or DataFrame based on lazy parameter
+        if lazy:
+            return df.lazy()
+        return df
+
+    def scan_table(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        where: str | None = None,
+        batch_size: int | None = None,
+    ) -> pl.LazyFrame:
+        """
+        Lazily scan a table, streaming rows from the database on collect.
+
+        Unlike ``read_table(..., lazy=True)``, nothing is read when this
+        method returns. Polars pushes projections, simple predicates and
+        row limits into the SQL query, and the result is streamed in
+        Arrow record batches so only the rows and columns the query plan
+        needs are ever materialized. Every ``collect()`` re-runs the query.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table to scan.
+        columns : list of str, optional
+            Optional list of columns to expose.
+        where : str, optional
+            Optional WHERE clause (without 'WHERE' keyword).
+        batch_size : int, optional
+            Rows per record batch. Defaults to ``settings.scan_batch_size``.
+
+        Returns
+        -------
+        pl.LazyFrame
+            LazyFrame backed by a streaming database scan.
+        """
+        from polars.io.plugins import register_io_source
+
+        from .pushdown import expr_to_sql, quote_identifier
+
+        if batch_size is None:
+            from .settings import settings
+
+            batch_size = settings.scan_batch_size
+
+        base_query = self._build_table_query(table_name, columns, where)
+        # Semi-join value sets in ``where`` may be evicted before collect();
+        # keep them with the frame and re-register them on each collect
+        value_sets = self._backend.referenced_value_sets(base_query)
+
+        # Resolve the output schema without reading any rows
+        schema = self._backend.read_dataframe(f"{base_query} LIMIT 0").schema
+        backend = self._backend
+        default_batch_size = batch_size
+
+        def source(
+            with_columns: list[str] | None,
+            predicate: pl.Expr | None,
+            n_rows: int | None,
+            batch_size: int | None,
+        ) -> Iterator[pl.DataFrame]:
+            output_columns = (
+                list(schema.keys()) if with_columns is None else with_columns
+            )
+
+            # The predicate may reference columns outside the projection
+            needed = list(output_columns)
+            sql_predicate = None
+            if predicate is not None:
+                for col in predicate.meta.root_names():
+                    if col not in needed:
+                        needed.append(col)
+                sql_predicate = expr_to_sql(predicate)
+
+            # Something must be selected for row counts like pl.len()
+            select_list = (
+                ", ".join(quote_identifier(col) for col in needed)
+                if needed
+                else "NULL AS __pyfia_row"
+            )
+            query = f"SELECT {select_list} FROM ({base_query}) AS __pyfia_scan"
+            if sql_predicate:
+                query += f" WHERE {sql_predicate}"
+            if n_rows is not None and (predicate is None or sql_predicate):
+                # Still enforced below when only part of the predicate is pushed
+                query += f" LIMIT {n_rows}"
+
+            backend.restore_value_sets(value_sets)
+            remaining = n_rows
+            for batch in backend.iter_dataframes(
+                query, batch_size=batch_size or default_batch_size
+            ):
+                if predicate is not None:
+                    batch = batch.filter(predicate)
+                batch = batch.select(output_columns)
+                if remaining is not None:
+                    if remaining <= 0:
+                        break
+                    batch = batch.head(remaining)
+                    remaining -= batch.height
+                yield batch
+
+        return register_io_source(
+            source,
+            schema=schema,
+            validate_schema=True,
+            explain_name="pyfia_scan",
+            explain_detail=table_name,
+        )
+
+    def _build_table_query(
+        self,
+        table_name: str,
+        columns: list[str] | None = None,
+        where: str | None = None,
+    ) -> str:
+        """
+        Build the SELECT statement used to read a table.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table.
+        columns : list of str, optional
+            Optional list of columns to select.
+        where : str, optional
+            Optional WHERE clause (without 'WHERE' keyword).
+
+        Returns
+        -------
+        str
+            SQL query string.
+        """
         # Build SELECT clause with appropriate type casting
         select_clause = self._build_select_clause(table_name, columns)
         # Use qualified table name (for MotherDuck cross-database reference table queries)
@@ -290,26 +436,33 @@ class FIADataReader:
 
         if where:
             query += f" WHERE {where}"
+        return query
 
-        # Execute query using backend
-        df: pl.DataFrame = self._backend.read_dataframe(query)
-
-        # Post-process to convert types
-        for col in df.columns:
-            if self._is_integer_column(table_name, col):
-                # Convert integer columns back to Int64
-                try:
-                    df = df.with_columns(pl.col(col).cast(pl.Int64))
-                except (
-                    pl.exceptions.ComputeError,
-                    pl.exceptions.InvalidOperationError,
-                ):
-                    pass  # Keep as string if conversion fails
+    def plot_filter_clause(
+        self, table_name: str, plot_cns: Sequence[str | int], column: str = "PLT_CN"
+    ) -> str:
+        """
+        Build a WHERE condition restricting a table to a set of plots.
 
-        # Return as lazy frame or DataFrame based on lazy parameter
-        if lazy:
-            return df.lazy()
-        return df
+        The plot CNs are registered once with the backend and the returned
+        condition is a single semi-join against them, so a national plot
+        set needs one query rather than hundreds of batched ``IN`` lists.
+
+        Parameters
+        ----------
+        table_name : str
+            Table the condition will be applied to.
+        plot_cns : sequence of str or int
+            Plot CNs to keep.
+        column : str, default 'PLT_CN'
+            Column holding the plot CN ('CN' for the PLOT table).
+
+        Returns
+        -------
+        str
+            SQL condition (without 'WHERE' keyword).
+        """
+        return self._backend.build_semi_join_clause(table_name, column, plot_cns)
 
     def read_plot_data(self, evalid: list[int]) -> pl.DataFrame:
         """
@@ -337,17 +490,12 @@ class FIADataReader:
         # Get unique plot CNs
         plot_cns = ppsa.select("PLT_CN").unique().collect()["PLT_CN"].to_list()
 
-        # Read plots using batch processing utility
-        from .utils import batch_query_by_values
-
         if plot_cns:
-
-            def query_plots(batch: list[str]) -> pl.LazyFrame:
-                cn_str = ", ".join(f"'{cn}'" for cn in batch)
-                return self.read_table("PLOT", where=f"CN IN ({cn_str})", lazy=True)
-
-            result = batch_query_by_values(plot_cns, query_plots)
-            plots = result.collect() if hasattr(result, "collect") else result
+            plots = self.read_table(
+                "PLOT",
+                where=self.plot_filter_clause("PLOT", plot_cns, column="CN"),
+                lazy=False,
+            )
         else:
             plots = pl.DataFrame()
 
@@ -380,17 +528,12 @@ class FIADataReader:
         pl.DataFrame
             DataFrame with tree data.
         """
-        from .utils import batch_query_by_values
-
         if not plot_cns:
             return pl.DataFrame()
 
-        def query_trees(batch: list[str]) -> pl.LazyFrame:
-            cn_str = ", ".join(f"'{cn}'" for cn in batch)
-            return self.read_table("TREE", where=f"PLT_CN IN ({cn_str})", lazy=True)
-
-        result = batch_query_by_values(plot_cns, query_trees)
-        return result.collect() if hasattr(result, "collect") else result
+        return self.read_table(
+            "TREE", where=self.plot_filter_clause("TREE", plot_cns), lazy=False
+        )
 
     def read_cond_data(self, plot_cns: list[str]) -> pl.DataFrame:
         """
@@ -406,17 +549,12 @@ class FIADataReader:
         pl.DataFrame
             DataFrame with condition data.
         """
-        from .utils import batch_query_by_values
-
         if not plot_cns:
             return pl.DataFrame()
 
-        def query_conds(batch: list[str]) -> pl.LazyFrame:
-            cn_str = ", ".join(f"'{cn}'" for cn in batch)
-            return self.read_table("COND", where=f"PLT_CN IN ({cn_str})", lazy=True)
-
-        result = batch_query_by_values(plot_cns, query_conds)
-        return result.collect() if hasattr(result, "collect") else result
+        return self.read_table(
+            "COND", where=self.plot_filter_clause("COND", plot_cns), lazy=False
+        )
 
     def read_pop_tables(self, evalid: list[int]) -> dict[str, pl.DataFrame]:
         """
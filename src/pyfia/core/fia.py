@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 import warnings
+from collections.abc import MutableMapping, Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -23,6 +24,8 @@ from .exceptions import (
     SpatialExtensionError,
     SpatialFileError,
 )
+from .settings import settings
+from .table_cache import TableCache
 
 if TYPE_CHECKING:
     from .backends import MotherDuckBackend
@@ -104,8 +107,9 @@ class FIA:
     ----------
     db_path : str | Path
         Path to the DuckDB database or MotherDuck connection string.
-    tables : dict[str, pl.LazyFrame]
-        Loaded FIA tables as lazy frames.
+    tables : TableCache
+        Loaded FIA tables, a mapping from table name to lazy frame with a
+        memory budget set by ``settings.table_cache_max_mb``.
     evalid : list of int or None
         Active EVALID filter.
     most_recent : bool
@@ -114,7 +118,14 @@ class FIA:
 
     db_path: str | Path
 
-    def __init__(self, db_path: str | Path, engine: str | None = None):
+    def __init__(
+        self,
+        db_path: str | Path,
+        engine: str | None = None,
+        streaming: bool | None = None,
+        key_dtype: str | None = None,
+        compact_codes: bool | None = None,
+    ):
         """
         Initialize FIA database connection.
 
@@ -126,6 +137,21 @@ class FIA:
             - MotherDuck: "md:database_name" or "motherduck:database_name"
         engine : str, optional
             Database engine ('duckdb', 'sqlite', or None for auto-detect).
+        streaming : bool, optional
+            If True, tables loaded into ``self.tables`` are streaming DuckDB
+            scans that only read the columns and rows a query needs when it
+            is collected, rather than eager copies of each table. Defaults to
+            ``settings.streaming_scans``.
+        key_dtype : {'string', 'int64'}, optional
+            Type CN columns (CN, PLT_CN, TRE_CN, STRATUM_CN, ...) are loaded
+            as. 'int64' keeps them numeric end to end, so the plot, tree and
+            stratum joins hash 64-bit integers instead of strings. Defaults to
+            ``settings.key_dtype`` ('string').
+        compact_codes : bool, optional
+            If True, estimators carry code columns (SPCD, FORTYPCD, OWNGRPCD,
+            STATECD, COUNTYCD, AGENTCD, ...) as UInt16 and GRM components as
+            an Enum while loading, joining and grouping. Results are returned
+            with the standard dtypes. Defaults to ``settings.compact_codes``.
         """
         db_str = str(db_path)
         self._is_motherduck = db_str.startswith("md:") or db_str.startswith(
@@ -140,7 +166,7 @@ class FIA:
                 raise FileNotFoundError(f"Database not found: {db_path}")
 
         # Initialize with appropriate engine
-        self.tables: dict[str, pl.LazyFrame] = {}
+        self.tables = TableCache(settings.table_cache_max_mb)
         self.evalid: list[int] | None = None
         self.most_recent: bool = False
         self.state_filter: list[int] | None = None  # Add state filter
@@ -153,7 +179,13 @@ class FIA:
             None  # CN → polygon attributes mapping
         )
         # Connection managed by FIADataReader
-        self._reader = FIADataReader(db_path, engine=engine)
+        self._reader = FIADataReader(
+            db_path, engine=engine, streaming=streaming, key_dtype=key_dtype
+        )
+        self.key_dtype = self._reader.key_dtype
+        self.compact_codes = (
+            settings.compact_codes if compact_codes is None else compact_codes
+        )
 
     @classmethod
     def from_download(
@@ -215,6 +247,19 @@ class FIA:
 
         return cls(db_path)
 
+    @property
+    def tables(self) -> TableCache:
+        """Loaded tables, cached by table name, column set and WHERE clause."""
+        return self._tables
+
+    @tables.setter
+    def tables(self, tables: MutableMapping[str, pl.LazyFrame]) -> None:
+        if not isinstance(tables, TableCache):
+            cache = TableCache(settings.table_cache_max_mb)
+            cache.update(tables)
+            tables = cache
+        self._tables = tables
+
     def __enter__(self):
         """Context manager entry."""
         # Connection managed by FIADataReader
@@ -364,8 +409,17 @@ class FIA:
         Returns
         -------
         pl.LazyFrame
-            Polars LazyFrame of the requested table.
+            Polars LazyFrame of the requested table. A cached projection of
+            the table with the same WHERE clause and a superset of the
+            columns is reused rather than read again.
         """
+        cached = self.tables.lookup(table_name, columns, where)
+        if cached is not None:
+            return cached.lazy() if isinstance(cached, pl.DataFrame) else cached
+
+        # Read the columns of earlier projections too, replacing them
+        columns = self.tables.columns_to_load(table_name, columns, where)
+
         # Inspect table schema to determine which filters apply
         table_schema = self._reader.get_table_schema(table_name)
         table_columns = set(table_schema.keys())
@@ -386,57 +440,32 @@ class FIA:
                 base_where_clause = where
 
         # EVALID filter via PLT_CN for any table that has a PLT_CN column
-        # This is a critical optimization - it reduces data load by 90%+
+        # This is a critical optimization - it reduces data load by 90%+.
+        # The valid plot set is registered once and joined in a single query.
         if self.evalid and has_plt_cn:
             valid_plot_cns = self._get_valid_plot_cns()
             if valid_plot_cns:
-                from .utils import batch_query_by_values
-
-                def query_batch(batch: list) -> pl.LazyFrame:
-                    cn_str = ", ".join(f"'{cn}'" for cn in batch)
-                    plt_cn_where = f"PLT_CN IN ({cn_str})"
-                    # Combine with base where clause if present
-                    if base_where_clause:
-                        where_clause = f"{base_where_clause} AND {plt_cn_where}"
-                    else:
-                        where_clause = plt_cn_where
-                    return self._reader.read_table(
-                        table_name,
-                        columns=columns,
-                        where=where_clause,
-                        lazy=True,
-                    )
-
-                batch_result = batch_query_by_values(valid_plot_cns, query_batch)
-                # batch_query_by_values returns DataFrame | LazyFrame, but
-                # query_batch always returns LazyFrame so the result is LazyFrame
-                result: pl.LazyFrame = (
-                    batch_result
-                    if isinstance(batch_result, pl.LazyFrame)
-                    else batch_result.lazy()
+                plt_cn_where = self._reader.plot_filter_clause(
+                    table_name, valid_plot_cns
                 )
+                if base_where_clause:
+                    base_where_clause = f"({base_where_clause}) AND {plt_cn_where}"
+                else:
+                    base_where_clause = plt_cn_where
 
-                # Join polygon attributes for PLOT table if available
-                if table_name == "PLOT" and self._polygon_attributes is not None:
-                    result = result.join(
-                        self._polygon_attributes.lazy(),
-                        on="CN",
-                        how="left",
-                    )
-
-                # Apply spatial filter if set (clip_by_polygon)
-                result = self._apply_spatial_filter(result, table_name)
-
-                self.tables[table_name] = result
-                return self.tables[table_name]
-
-        # Default path - no EVALID filtering or table has no PLT_CN column
-        df = self._reader.read_table(
-            table_name,
-            columns=columns,
-            where=base_where_clause,
-            lazy=True,
-        )
+        # Streaming scans hold no data; eager reads are measured for the
+        # table cache's memory budget
+        if getattr(self._reader, "streaming", False):
+            df = self._reader.read_table(
+                table_name, columns=columns, where=base_where_clause, lazy=True
+            )
+            nbytes = 0
+        else:
+            eager = self._reader.read_table(
+                table_name, columns=columns, where=base_where_clause, lazy=False
+            )
+            nbytes = int(eager.estimated_size())
+            df = eager.lazy()
 
         # Join polygon attributes for PLOT table if available
         if table_name == "PLOT" and self._polygon_attributes is not None:
@@ -449,8 +478,8 @@ class FIA:
         # Apply spatial filter if set (clip_by_polygon)
         df = self._apply_spatial_filter(df, table_name)
 
-        self.tables[table_name] = df
-        return self.tables[table_name]
+        self.tables.store(table_name, df, columns, where, nbytes)
+        return df
 
     def find_evalid(
         self,
@@ -814,6 +843,7 @@ class FIA:
 
         # Sanitize the path for safe SQL interpolation (prevents SQL injection)
         safe_path = sanitize_sql_path(polygon_path)
+        cn_type = self._reader._backend.cn_sql_type
 
         # Build the spatial query
         # Note: FIA stores coordinates as LAT, LON but we need to create POINT(LON, LAT)
@@ -827,7 +857,7 @@ class FIA:
                 SELECT ST_Union_Agg(geom) as geom
                 FROM ST_Read('{safe_path}')
             )
-            SELECT CAST(p.CN AS VARCHAR) as CN
+            SELECT CAST(p.CN AS {cn_type}) as CN
             FROM PLOT p, boundary b
             WHERE {predicate_fn}(
                 ST_Point(p.LON, p.LAT),
@@ -843,7 +873,7 @@ class FIA:
                     SELECT ST_Union_Agg(geom) as geom
                     FROM ST_Read('{safe_path}')
                 )
-                SELECT CAST(p.CN AS VARCHAR) as CN
+                SELECT CAST(p.CN AS {cn_type}) as CN
                 FROM PLOT p, boundary b
                 WHERE p.STATECD IN ({state_list})
                 AND {predicate_fn}(
@@ -985,6 +1015,7 @@ class FIA:
 
         # Sanitize the path for safe SQL interpolation (prevents SQL injection)
         safe_path = sanitize_sql_path(polygon_path)
+        cn_type = self._reader._backend.cn_sql_type
 
         # First, check what columns exist in the polygon file
         try:
@@ -1016,7 +1047,7 @@ class FIA:
         query = f"""
             WITH ranked AS (
                 SELECT
-                    CAST(p.CN AS VARCHAR) as CN,
+                    CAST(p.CN AS {cn_type}) as CN,
                     {attr_select},
                     ROW_NUMBER() OVER (PARTITION BY p.CN ORDER BY ST_Area(poly.geom) ASC) as rn
                 FROM PLOT p
@@ -1419,7 +1450,13 @@ class MotherDuckFIA(FIA):
     ...     print(db.area())
     """
 
-    def __init__(self, database: str, motherduck_token: str | None = None):
+    def __init__(
+        self,
+        database: str,
+        motherduck_token: str | None = None,
+        key_dtype: str | None = None,
+        compact_codes: bool | None = None,
+    ):
         """
         Initialize MotherDuck FIA connection.
 
@@ -1430,6 +1467,11 @@ class MotherDuckFIA(FIA):
         motherduck_token : str | None
             MotherDuck authentication token. If not provided, uses
             MOTHERDUCK_TOKEN environment variable.
+        key_dtype : {'string', 'int64'}, optional
+            Type CN columns are loaded as. Defaults to ``settings.key_dtype``.
+        compact_codes : bool, optional
+            Carry code columns in compact dtypes during estimation. Defaults
+            to ``settings.compact_codes``.
         """
         from .backends import MotherDuckBackend
 
@@ -1437,7 +1479,7 @@ class MotherDuckFIA(FIA):
         self.motherduck_token = motherduck_token
 
         # Initialize attributes that FIA.__init__ would set
-        self.tables: dict[str, pl.LazyFrame] = {}
+        self.tables = TableCache(settings.table_cache_max_mb)
         self.evalid: list[int] | None = None
         self.most_recent: bool = False
         self.state_filter: list[int] | None = None
@@ -1447,8 +1489,16 @@ class MotherDuckFIA(FIA):
         self._polygon_attributes: pl.DataFrame | None = None
 
         # Create MotherDuck backend directly
-        self._backend = MotherDuckBackend(database, motherduck_token=motherduck_token)
+        self._backend = MotherDuckBackend(
+            database,
+            motherduck_token=motherduck_token,
+            key_dtype=key_dtype or settings.key_dtype,
+        )
         self._backend.connect()
+        self.key_dtype = self._backend.key_dtype
+        self.compact_codes = (
+            settings.compact_codes if compact_codes is None else compact_codes
+        )
 
         # Create a minimal reader-like wrapper for compatibility
         self._reader = _MotherDuckReaderWrapper(self._backend)  # type: ignore[assignment]
@@ -1516,6 +1566,12 @@ class _MotherDuckReaderWrapper:
             return df.lazy()
         return df
 
+    def plot_filter_clause(
+        self, table_name: str, plot_cns: Sequence[str | int], column: str = "PLT_CN"
+    ) -> str:
+        """Build a semi-join condition restricting a table to a set of plots."""
+        return self._backend.build_semi_join_clause(table_name, column, plot_cns)
+
     def supports_spatial(self) -> bool:
         """
         Check if the backend supports spatial operations.
@@ -0,0 +1,188 @@
+"""
+Translation of Polars predicates into DuckDB SQL.
+
+Streaming table scans (see :meth:`FIADataReader.scan_table`) receive the
+predicate Polars wants to push into the source as a :class:`polars.Expr`.
+This module turns the simple, common shapes of those expressions -
+comparisons between a column and a literal, null checks, negation, and
+AND/OR combinations - into a SQL fragment DuckDB can evaluate while
+scanning.
+
+Translation is deliberately conservative: anything that is not recognised
+returns ``None`` and stays on the Polars side. Callers always re-apply the
+full Polars predicate to the returned rows, so the SQL fragment only needs
+to be a superset filter, never an exact one.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from typing import Any
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+_COMPARISON_OPS = {
+    "Eq": "=",
+    "NotEq": "<>",
+    "Gt": ">",
+    "GtEq": ">=",
+    "Lt": "<",
+    "LtEq": "<=",
+}
+
+# Mirror of each comparison when the literal is on the left-hand side
+_FLIPPED_OPS = {
+    "=": "=",
+    "<>": "<>",
+    ">": "<",
+    ">=": "<=",
+    "<": ">",
+    "<=": ">=",
+}
+
+
+def quote_identifier(name: str) -> str:
+    """
+    Quote a column name for use in DuckDB SQL.
+
+    Parameters
+    ----------
+    name : str
+        Column name.
+
+    Returns
+    -------
+    str
+        Double-quoted identifier with embedded quotes escaped.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def expr_to_sql(expr: pl.Expr) -> str | None:
+    """
+    Translate a Polars predicate into a DuckDB WHERE fragment.
+
+    Top-level AND conjuncts are translated independently, so a predicate
+    that mixes supported and unsupported terms still pushes the supported
+    part into SQL.
+
+    Parameters
+    ----------
+    expr : pl.Expr
+        Boolean Polars expression.
+
+    Returns
+    -------
+    str or None
+        SQL fragment (without ``WHERE``) selecting a superset of the rows
+        matched by ``expr``, or None if nothing could be translated.
+    """
+    try:
+        tree = json.loads(expr.meta.serialize(format="json"))
+    except Exception as e:  # serialization format is not a stable API
+        logger.debug(f"Could not serialize predicate for pushdown: {e}")
+        return None
+
+    parts = [sql for sql in map(_node_to_sql, _conjuncts(tree)) if sql]
+    if not parts:
+        return None
+    return " AND ".join(parts)
+
+
+def _conjuncts(node: Any) -> list[Any]:
+    """Split a serialized expression on its top-level AND operators."""
+    binary = node.get("BinaryExpr") if isinstance(node, dict) else None
+    if binary and binary.get("op") in ("And", "LogicalAnd"):
+        return _conjuncts(binary["left"]) + _conjuncts(binary["right"])
+    return [node]
+
+
+def _node_to_sql(node: Any) -> str | None:
+    """Translate one serialized predicate node, or return None."""
+    if not isinstance(node, dict) or len(node) != 1:
+        return None
+
+    kind, body = next(iter(node.items()))
+
+    if kind == "BinaryExpr":
+        op = body.get("op")
+        if op in ("And", "LogicalAnd", "Or", "LogicalOr"):
+            left = _node_to_sql(body["left"])
+            right = _node_to_sql(body["right"])
+            if left is None or right is None:
+                return None
+            keyword = "AND" if "And" in op else "OR"
+            return f"({left} {keyword} {right})"
+
+        sql_op = _COMPARISON_OPS.get(op)
+        if sql_op is None:
+            return None
+
+        left_col = _column_name(body["left"])
+        right_col = _column_name(body["right"])
+        if left_col is not None:
+            literal = _literal_to_sql(body["right"])
+            if literal is None:
+                return None
+            return f"{quote_identifier(left_col)} {sql_op} {literal}"
+        if right_col is not None:
+            literal = _literal_to_sql(body["left"])
+            if literal is None:
+                return None
+            return f"{quote_identifier(right_col)} {_FLIPPED_OPS[sql_op]} {literal}"
+        return None
+
+    if kind == "Function":
+        function = body.get("function")
+        inputs = body.get("input", [])
+        boolean = function.get("Boolean") if isinstance(function, dict) else None
+        if boolean in ("IsNull", "IsNotNull") and len(inputs) == 1:
+            col = _column_name(inputs[0])
+            if col is None:
+                return None
+            suffix = "IS NULL" if boolean == "IsNull" else "IS NOT NULL"
+            return f"{quote_identifier(col)} {suffix}"
+        if boolean == "Not" and len(inputs) == 1:
+            inner = _node_to_sql(inputs[0])
+            return None if inner is None else f"(NOT {inner})"
+        return None
+
+    return None
+
+
+def _column_name(node: Any) -> str | None:
+    """Return the column name if ``node`` is a bare column reference."""
+    if isinstance(node, dict) and isinstance(node.get("Column"), str):
+        return str(node["Column"])
+    return None
+
+
+def _literal_to_sql(node: Any) -> str | None:
+    """Render a serialized scalar literal as SQL, or return None."""
+    if not isinstance(node, dict) or "Literal" not in node:
+        return None
+    literal = node["Literal"]
+    if not isinstance(literal, dict) or len(literal) != 1:
+        return None
+
+    # Literals are either dynamically typed ("Dyn") or typed scalars
+    wrapper = literal.get("Dyn") or literal.get("Scalar")
+    if not isinstance(wrapper, dict) or len(wrapper) != 1:
+        return None
+
+    dtype, value = next(iter(wrapper.items()))
+    if dtype == "Boolean" and isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if dtype == "String" and isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int) and (dtype == "Int" or dtype.startswith(("Int", "UInt"))):
+        return str(value)
+    if isinstance(value, float) and dtype in ("Float", "Float32", "Float64"):
+        return repr(value) if math.isfinite(value) else None
+    return None
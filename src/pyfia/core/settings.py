@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -49,11 +49,31 @@ class PyFIASettings(BaseSettings):
     chunk_size: int = Field(
         default=10000, ge=1000, description="Chunk size for batch processing"
     )
-    sql_batch_size: int = Field(
-        default=900,
-        ge=100,
-        le=2000,
-        description="Batch size for SQL IN clauses to avoid query limits",
+    streaming_scans: bool = Field(
+        default=False,
+        description=(
+            "Back lazy table reads with streaming DuckDB scans instead of "
+            "materializing each table on load"
+        ),
+    )
+    scan_batch_size: int = Field(
+        default=100_000,
+        ge=1000,
+        description="Rows per Arrow record batch for streaming table scans",
+    )
+    key_dtype: Literal["string", "int64"] = Field(
+        default="string",
+        description=(
+            "Type CN key columns are read as: 'string' (Utf8) or 'int64' "
+            "(integer joins and group-bys)"
+        ),
+    )
+    compact_codes: bool = Field(
+        default=False,
+        description=(
+            "Carry FIA code columns as UInt16 and GRM components as an Enum "
+            "in estimation"
+        ),
     )
 
     # Cache settings
@@ -61,6 +81,19 @@ class PyFIASettings(BaseSettings):
     cache_dir: Path = Field(
         default=Path.home() / ".pyfia" / "cache", description="Cache directory"
     )
+    table_cache_max_mb: float | None = Field(
+        default=None,
+        gt=0,
+        description="Memory budget for tables cached by FIA.load_table in MB "
+        "(unbounded if not set)",
+    )
+    result_cache_enabled: bool = Field(
+        default=False,
+        description="Cache estimator results on disk under cache_dir",
+    )
+    result_cache_max_mb: float = Field(
+        default=1024, gt=0, description="Maximum size of the result cache in MB"
+    )
 
     # Download settings
     download_dir: Path = Field(
@@ -0,0 +1,287 @@
+"""
+Memory-budgeted cache of loaded FIA tables.
+
+:meth:`FIA.load_table` stores every table it reads in a :class:`TableCache`
+keyed by table name, column set and WHERE clause:
+
+- A request is served by any cached entry for the same table and WHERE
+  clause whose columns are a superset of the requested columns.
+- On a miss, the columns of cached entries for the same table and WHERE
+  clause are merged into the new projection and those entries replaced,
+  so repeated loads with growing column lists converge on one read.
+- The bytes each entry holds are tracked and the least recently used
+  entries are evicted once ``settings.table_cache_max_mb`` is exceeded.
+  Streaming scans hold no data and count as zero bytes.
+
+For compatibility the cache is also a mapping from table name to the most
+recently used frame for that table, which is how estimators read
+``db.tables["PLOT"]`` after loading it.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, MutableMapping
+from dataclasses import asdict, dataclass
+
+import polars as pl
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TableCacheStats:
+    """
+    Counters for a table cache.
+
+    Parameters
+    ----------
+    hits : int
+        Loads answered from a cached entry.
+    misses : int
+        Loads that read from the database.
+    evictions : int
+        Entries removed to stay within the memory budget.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+
+@dataclass
+class _TableEntry:
+    """A cached table projection."""
+
+    table: str
+    columns: frozenset[str] | None  # None: every column
+    where: str | None
+    frame: pl.LazyFrame
+    nbytes: int
+
+
+_Key = tuple[str, frozenset[str] | None, str | None]
+
+
+class TableCache(MutableMapping[str, pl.LazyFrame]):
+    """
+    LRU cache of table projections with a memory budget.
+
+    Parameters
+    ----------
+    max_memory_mb : float, optional
+        Memory budget in MB. Unbounded if None.
+
+    Examples
+    --------
+    >>> cache = TableCache(max_memory_mb=2048)
+    >>> frame = cache.lookup("TREE", ["CN", "DIA"], None)
+    >>> if frame is None:
+    ...     columns = cache.columns_to_load("TREE", ["CN", "DIA"], None)
+    ...     frame = cache.store("TREE", read(columns), columns, None, nbytes)
+    """
+
+    def __init__(self, max_memory_mb: float | None = None):
+        self._entries: OrderedDict[_Key, _TableEntry] = OrderedDict()
+        self.max_bytes = (
+            int(max_memory_mb * 1024 * 1024) if max_memory_mb is not None else None
+        )
+        self.stats = TableCacheStats()
+
+    @staticmethod
+    def _key(table: str, columns: Iterable[str] | None, where: str | None) -> _Key:
+        return (table, frozenset(columns) if columns is not None else None, where)
+
+    def _matching(self, table: str, where: str | None) -> list[_Key]:
+        return [k for k in self._entries if k[0] == table and k[2] == where]
+
+    def lookup(
+        self, table: str, columns: list[str] | None, where: str | None
+    ) -> pl.LazyFrame | None:
+        """
+        Find a cached entry that can serve a load.
+
+        Parameters
+        ----------
+        table : str
+            Table name.
+        columns : list of str, optional
+            Requested columns; None requests every column.
+        where : str, optional
+            WHERE clause of the load.
+
+        Returns
+        -------
+        pl.LazyFrame or None
+            The most recently used entry for the same table and WHERE clause
+            whose columns cover the request, or None.
+        """
+        wanted = set(columns) if columns is not None else None
+        for key in reversed(self._matching(table, where)):
+            cached = key[1]
+            if cached is None or (wanted is not None and wanted <= cached):
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return self._entries[key].frame
+        self.stats.misses += 1
+        return None
+
+    def columns_to_load(
+        self, table: str, columns: list[str] | None, where: str | None
+    ) -> list[str] | None:
+        """
+        Merge a requested projection with cached projections of the table.
+
+        Parameters
+        ----------
+        table : str
+            Table name.
+        columns : list of str, optional
+            Requested columns; None requests every column.
+        where : str, optional
+            WHERE clause of the load.
+
+        Returns
+        -------
+        list of str or None
+            Requested columns followed by the other columns cached for the
+            same table and WHERE clause, or None for every column.
+        """
+        if columns is None:
+            return None
+        merged = list(dict.fromkeys(columns))
+        for key in self._matching(table, where):
+            cached = key[1]
+            if cached is not None:
+                merged.extend(sorted(cached - set(merged)))
+        return merged
+
+    def store(
+        self,
+        table: str,
+        frame: pl.LazyFrame,
+        columns: list[str] | None,
+        where: str | None,
+        nbytes: int = 0,
+    ) -> pl.LazyFrame:
+        """
+        Cache a loaded projection and evict entries over the budget.
+
+        Entries for the same table and WHERE clause whose columns are
+        covered by the new projection are replaced.
+
+        Parameters
+        ----------
+        table : str
+            Table name.
+        frame : pl.LazyFrame
+            Loaded data.
+        columns : list of str, optional
+            Columns loaded; None if every column was loaded.
+        where : str, optional
+            WHERE clause of the load.
+        nbytes : int, default 0
+            Memory held by the frame.
+
+        Returns
+        -------
+        pl.LazyFrame
+            The stored frame.
+        """
+        key = self._key(table, columns, where)
+        for other in self._matching(table, where):
+            if key[1] is None or (other[1] is not None and other[1] <= key[1]):
+                del self._entries[other]
+        self._entries[key] = _TableEntry(table, key[1], where, frame, nbytes)
+        self._evict(keep=key)
+        return frame
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by cached entries."""
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    def _evict(self, keep: _Key) -> None:
+        """Drop least recently used entries, except ``keep``, over the budget."""
+        if self.max_bytes is None:
+            return
+        total = self.nbytes
+        for key in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= self._entries.pop(key).nbytes
+            self.stats.evictions += 1
+            logger.debug(f"Evicted cached {key[0]} table")
+
+    def get_cache_info(self) -> dict:
+        """
+        Get information about the cache.
+
+        Returns
+        -------
+        dict
+            Entries per table, memory use, budget and hit/miss/evict counts.
+        """
+        return {
+            "entries": [
+                {
+                    "table": entry.table,
+                    "columns": sorted(entry.columns) if entry.columns else None,
+                    "where": entry.where,
+                    "size_mb": entry.nbytes / (1024 * 1024),
+                }
+                for entry in self._entries.values()
+            ],
+            "total_size_mb": self.nbytes / (1024 * 1024),
+            "max_size_mb": (
+                self.max_bytes / (1024 * 1024) if self.max_bytes is not None else None
+            ),
+            **asdict(self.stats),
+        }
+
+    # Mapping interface by table name
+
+    def _latest(self, table: str) -> _Key | None:
+        for key in reversed(self._entries):
+            if key[0] == table:
+                return key
+        return None
+
+    def __getitem__(self, table: str) -> pl.LazyFrame:
+        key = self._latest(table)
+        if key is None:
+            raise KeyError(table)
+        self._entries.move_to_end(key)
+        return self._entries[key].frame
+
+    def __setitem__(self, table: str, frame: pl.LazyFrame) -> None:
+        columns = (
+            frame.collect_schema().names()
+            if isinstance(frame, pl.LazyFrame)
+            else frame.columns
+        )
+        nbytes = int(frame.estimated_size()) if isinstance(frame, pl.DataFrame) else 0
+        self.store(table, frame, columns, None, nbytes)
+
+    def __delitem__(self, table: str) -> None:
+        keys = [k for k in self._entries if k[0] == table]
+        if not keys:
+            raise KeyError(table)
+        for key in keys:
+            del self._entries[key]
+
+    def __contains__(self, table: object) -> bool:
+        return any(key[0] == table for key in self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(dict.fromkeys(key[0] for key in self._entries))
+
+    def __len__(self) -> int:
+        return len({key[0] for key in self._entries})
+
+    def clear(self) -> None:
+        """Remove every cached table."""
+        self._entries.clear()
@@ -47,6 +47,14 @@ from pyfia.downloader.exceptions import (
     StateNotFoundError,
     TableNotFoundError,
 )
+from pyfia.downloader.lineage import LINEAGE_TABLE, build_plot_lineage
+from pyfia.downloader.optimize import (
+    LAYOUT_VERSION,
+    get_layout_version,
+    optimize_database,
+)
+from pyfia.downloader.schema import REJECTS_TABLE, read_csv_sql, save_csv_rejects
+from pyfia.downloader.stream import open_zip_csv, zip_csv_members
 from pyfia.downloader.tables import (
     ALL_TABLES,
     COMMON_TABLES,
@@ -57,7 +65,7 @@ from pyfia.downloader.tables import (
     get_tables_for_download,
     validate_state_code,
 )
-from pyfia.validation import sanitize_sql_path, validate_sql_identifier
+from pyfia.validation import validate_sql_identifier
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -74,6 +82,12 @@ __all__ = [
     "DataMartClient",
     # Cache
     "DownloadCache",
+    # Layout optimization
+    "optimize_database",
+    "get_layout_version",
+    "LAYOUT_VERSION",
+    "build_plot_lineage",
+    "LINEAGE_TABLE",
     # Exceptions
     "DownloadError",
     "StateNotFoundError",
@@ -160,6 +174,17 @@ def _verify_reference_tables_or_discard(db_path: Path, label: str) -> None:
         )
 
 
+def _report_csv_rejects(conn, show_progress: bool) -> None:
+    """Save rows that failed typed CSV parsing and report them."""
+    rejects = save_csv_rejects(conn)
+    if rejects and show_progress:
+        total = sum(rejects.values())
+        console.print(
+            f"[yellow]{total:,} rows could not be parsed and were not loaded; "
+            f"see the {REJECTS_TABLE} table[/yellow]"
+        )
+
+
 def _convert_csvs_to_duckdb(
     csv_dir: Path,
     output_path: Path,
@@ -169,6 +194,10 @@ def _convert_csvs_to_duckdb(
     """
     Convert downloaded CSV files to DuckDB format.
 
+    Columns are read with their declared FIADB types (see
+    :mod:`pyfia.downloader.schema`); rows that fail to parse are saved to
+    the ``PYFIA_CSV_REJECTS`` table instead of being silently dropped.
+
     Parameters
     ----------
     csv_dir : Path
@@ -199,60 +228,11 @@ def _convert_csvs_to_duckdb(
 
     try:
         for csv_file in csv_files:
-            # Extract table name from filename
-            # State tables: GA_PLOT.csv -> PLOT, GA_TREE_GRM_COMPONENT.csv -> TREE_GRM_COMPONENT
-            # Reference tables: REF_SPECIES.csv -> REF_SPECIES (keep as-is)
-            filename = csv_file.stem.upper()
-
-            if filename.startswith("REF_"):
-                # Reference table - keep full name
-                table_name = filename
-            else:
-                # State table - strip state prefix
-                name_parts = filename.split("_")
-                if len(name_parts) >= 2:
-                    table_name = "_".join(name_parts[1:])
-                else:
-                    table_name = name_parts[0]
-
-            # Validate table name to prevent SQL injection
-            try:
-                safe_table = validate_sql_identifier(table_name, "table name")
-            except ValueError as e:
-                logger.warning(f"Skipping invalid table name {table_name}: {e}")
-                continue
-
-            # Sanitize CSV path for safe SQL interpolation
-            safe_csv_path = sanitize_sql_path(csv_file)
-
-            if show_progress:
-                console.print(f"  Converting {safe_table}...", end=" ")
-
-            try:
-                if state_code is not None:
-                    conn.execute(f"""
-                        CREATE TABLE IF NOT EXISTS "{safe_table}" AS
-                        SELECT *, {state_code} AS STATE_ADDED
-                        FROM read_csv_auto('{safe_csv_path}', header=true, ignore_errors=true)
-                    """)
-                else:
-                    conn.execute(f"""
-                        CREATE TABLE IF NOT EXISTS "{safe_table}" AS
-                        SELECT * FROM read_csv_auto('{safe_csv_path}', header=true, ignore_errors=true)
-                    """)
-
-                row_result = conn.execute(
-                    f'SELECT COUNT(*) FROM "{safe_table}"'
-                ).fetchone()
-                row_count = row_result[0] if row_result else 0
-                if show_progress:
-                    console.print(f"[green]{row_count:,} rows[/green]")
-
-            except duckdb.Error as e:
-                if show_progress:
-                    console.print(f"[red]FAILED[/red] ({e})")
-                logger.warning(f"Failed to convert {safe_table}: {e}")
+            _import_csv_file(
+                conn, csv_file, state_code=state_code, show_progress=show_progress
+            )
 
+        _report_csv_rejects(conn, show_progress)
         conn.execute("CHECKPOINT")
 
     finally:
@@ -261,6 +241,169 @@ def _convert_csvs_to_duckdb(
     return output_path
 
 
+def _csv_table_name(csv_file: Path) -> str:
+    """Table name of a DataMart CSV file.
+
+    State tables drop the state prefix (GA_TREE_GRM_COMPONENT.csv ->
+    TREE_GRM_COMPONENT); reference tables keep their name (REF_SPECIES.csv ->
+    REF_SPECIES).
+    """
+    filename = csv_file.stem.upper()
+    if filename.startswith("REF_"):
+        return filename
+    name_parts = filename.split("_")
+    if len(name_parts) >= 2:
+        return "_".join(name_parts[1:])
+    return name_parts[0]
+
+
+def _import_csv_file(
+    conn,
+    csv_file: Path,
+    state_code: int | None = None,
+    append: bool = False,
+    show_progress: bool = True,
+    columns: list[str] | None = None,
+) -> bool:
+    """
+    Load one DataMart CSV file into its DuckDB table.
+
+    Parameters
+    ----------
+    conn : duckdb.DuckDBPyConnection
+        Connection to the output database.
+    csv_file : Path
+        CSV file to load.
+    state_code : int, optional
+        State FIPS code to add as a STATE_ADDED column.
+    append : bool, default False
+        Append to the table if it already exists (multi-state merges);
+        otherwise an existing table is left unchanged.
+    show_progress : bool, default True
+        Show progress messages.
+    columns : list of str, optional
+        Header columns of the file, for a file that can only be read once.
+
+    Returns
+    -------
+    bool
+        Whether the file was loaded.
+    """
+    import duckdb
+
+    table_name = _csv_table_name(csv_file)
+
+    # Validate table name to prevent SQL injection
+    try:
+        safe_table = validate_sql_identifier(table_name, "table name")
+    except ValueError as e:
+        logger.warning(f"Skipping invalid table name {table_name}: {e}")
+        return False
+
+    state_column = f", {state_code} AS STATE_ADDED" if state_code is not None else ""
+    select = f"SELECT *{state_column} FROM {read_csv_sql(csv_file, columns)}"
+
+    try:
+        # Check if table exists (using parameterized query - safe)
+        existing_result = conn.execute(
+            "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+            [safe_table],
+        ).fetchone()
+        exists = bool(existing_result and existing_result[0])
+
+        if append and exists:
+            conn.execute(f'INSERT INTO "{safe_table}" {select}')
+        else:
+            conn.execute(f'CREATE TABLE IF NOT EXISTS "{safe_table}" AS {select}')
+
+        if show_progress:
+            row_result = conn.execute(f'SELECT COUNT(*) FROM "{safe_table}"').fetchone()
+            row_count = row_result[0] if row_result else 0
+            console.print(
+                f"  Converted {safe_table}: [green]{row_count:,} rows[/green]"
+            )
+
+    except duckdb.Error as e:
+        if show_progress:
+            console.print(f"  Converting {safe_table} [red]FAILED[/red] ({e})")
+        logger.warning(f"Failed to convert {safe_table}: {e}")
+        return False
+
+    return True
+
+
+def _import_zip_file(
+    conn,
+    zip_path: Path,
+    tables: list[str] | None = None,
+    state_code: int | None = None,
+    append: bool = False,
+    show_progress: bool = True,
+) -> int:
+    """
+    Load the CSV members of a DataMart ZIP file without extracting them.
+
+    Each member is streamed into DuckDB (see :func:`open_zip_csv`) in its
+    own transaction, so a member that fails to decompress leaves no
+    partial table behind.
+
+    Parameters
+    ----------
+    conn : duckdb.DuckDBPyConnection
+        Connection to the output database.
+    zip_path : Path
+        Downloaded DataMart ZIP file.
+    tables : list of str, optional
+        Table names of the members to load. If None, loads every member.
+    state_code : int, optional
+        State FIPS code to add as a STATE_ADDED column.
+    append : bool, default False
+        Append to tables that already exist (multi-state merges).
+    show_progress : bool, default True
+        Show progress messages.
+
+    Returns
+    -------
+    int
+        Number of members loaded.
+    """
+    import duckdb
+
+    wanted = {t.upper() for t in tables} if tables is not None else None
+    loaded = 0
+    for member in zip_csv_members(zip_path):
+        if wanted is not None and _csv_table_name(Path(member)) not in wanted:
+            continue
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            with open_zip_csv(zip_path, member) as (csv_path, columns):
+                ok = _import_csv_file(
+                    conn,
+                    csv_path,
+                    state_code=state_code,
+                    append=append,
+                    show_progress=show_progress,
+                    columns=columns,
+                )
+        except DownloadError as e:
+            conn.execute("ROLLBACK")
+            if show_progress:
+                console.print(f"  Converting {member} [red]FAILED[/red] ({e})")
+            logger.warning(f"Failed to load {member}: {e}")
+            continue
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        try:
+            conn.execute("COMMIT")
+        except duckdb.Error:
+            # A failed statement already aborted the transaction
+            conn.execute("ROLLBACK")
+            ok = False
+        loaded += ok
+    return loaded
+
+
 def download(
     states: str | list[str],
     dir: str | Path | None = None,
@@ -269,6 +412,7 @@ def download(
     force: bool = False,
     show_progress: bool = True,
     use_cache: bool = True,
+    optimize: bool = True,
 ) -> Path:
     """
     Download FIA data from the FIA DataMart.
@@ -295,6 +439,9 @@ def download(
         Show download progress bars.
     use_cache : bool, default True
         Use cached downloads if available.
+    optimize : bool, default True
+        Sort and index the built database (see :func:`optimize_database`)
+        so plot and EVALID filters can skip most of each table.
 
     Returns
     -------
@@ -368,6 +515,7 @@ def download(
             force=force,
             show_progress=show_progress,
             use_cache=use_cache,
+            optimize=optimize,
         )
     else:
         return _download_multi_state(
@@ -380,6 +528,135 @@ def download(
             force=force,
             show_progress=show_progress,
             use_cache=use_cache,
+            optimize=optimize,
+        )
+
+
+def _check_cached(
+    cache: DownloadCache,
+    client: DataMartClient,
+    key: str,
+    label: str,
+    show_progress: bool,
+) -> tuple[Path | None, bool]:
+    """
+    Look up a cached database, re-validating it against the DataMart if stale.
+
+    A cached database older than the staleness window is checked with HEAD
+    requests against the ETag/Last-Modified recorded for its source files.
+    If nothing changed its age is reset and it is used; if a file changed it
+    is dropped so the caller rebuilds it. Without recorded validators, or if
+    the check fails, the stale database is used with a warning.
+
+    Returns
+    -------
+    tuple of (Path or None, bool)
+        Cached database to use, or None to download; and whether the
+        DataMart data changed since the cached download.
+    """
+    cached_path = cache.get_cached(key)
+    if not cached_path or not cached_path.exists():
+        return None, False
+
+    cached_entry = cache.get_entry(key)
+    stale = cached_entry is not None and cached_entry.is_stale
+    if stale and cached_entry is not None and cached_entry.validators:
+        try:
+            unchanged = client.is_unchanged(cached_entry.validators)
+        except NetworkError as e:
+            logger.warning(f"Could not check cached {label} for updates: {e}")
+        else:
+            if not unchanged:
+                if show_progress:
+                    console.print(
+                        f"[yellow]DataMart files changed since the cached "
+                        f"{label} was downloaded; re-downloading.[/yellow]"
+                    )
+                cache.remove_from_cache(key)
+                return None, True
+            cache.mark_fresh(key)
+            stale = False
+
+    if show_progress:
+        console.print(f"[bold green]Using cached {label}[/bold green]: {cached_path}")
+        # Warn if cache is old
+        if stale and cached_entry is not None:
+            console.print(
+                f"[yellow]Warning: Cached data is {cached_entry.age_days:.0f} days old. "
+                f"Use force=True to re-download.[/yellow]"
+            )
+
+    return cached_path, False
+
+
+def _download_and_import_state(
+    client: DataMartClient,
+    conn,
+    state: str,
+    tables: list[str] | None,
+    common: bool,
+    state_code: int | None,
+    append: bool = False,
+    show_progress: bool = True,
+) -> int:
+    """
+    Download a state's tables and load each one as soon as it arrives.
+
+    Downloads run concurrently (see :meth:`DataMartClient.iter_download_tables`)
+    while finished tables are streamed from their ZIP files into DuckDB,
+    with no extracted CSV on disk; each ZIP is deleted once loaded.
+
+    Returns
+    -------
+    int
+        Number of tables downloaded.
+    """
+    downloaded = 0
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for _, zip_path in client.iter_download_tables(
+            state,
+            tables=tables,
+            common=common,
+            dest_dir=Path(temp_dir),
+            show_progress=show_progress,
+            extract=False,
+        ):
+            downloaded += 1
+            _import_zip_file(
+                conn,
+                zip_path,
+                state_code=state_code,
+                append=append,
+                show_progress=show_progress,
+            )
+            zip_path.unlink(missing_ok=True)
+    return downloaded
+
+
+def _import_reference_tables(
+    client: DataMartClient, conn, state_code: int | None, show_progress: bool
+) -> None:
+    """Download the required reference tables and load them."""
+    if show_progress:
+        console.print("\n[bold]Downloading reference tables...[/bold]")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        try:
+            zip_path = client.download_reference_zip(
+                Path(temp_dir), show_progress=show_progress
+            )
+        except Exception as e:
+            # Logged here for the root cause; the post-build verification
+            # is what makes a missing-reference-table build fatal (#86).
+            logger.warning(f"Failed to download reference tables: {e}")
+            return
+
+        _import_zip_file(
+            conn,
+            zip_path,
+            tables=list(REQUIRED_REFERENCE_TABLES),
+            state_code=state_code,
+            show_progress=show_progress,
         )
 
 
@@ -393,95 +670,80 @@ def _download_single_state(
     force: bool,
     show_progress: bool,
     use_cache: bool,
+    optimize: bool = True,
 ) -> Path:
     """Download FIA data for a single state."""
     state_dir = data_dir / state.lower()
     duckdb_path = state_dir / f"{state.lower()}.duckdb"
 
     # Check cache for existing download (unless force=True)
+    changed = False
     if use_cache and not force:
-        cached_path = cache.get_cached(state)
-        if cached_path and cached_path.exists():
-            if show_progress:
-                console.print(
-                    f"[bold green]Using cached data for {state}[/bold green]: {cached_path}"
-                )
-
-                # Warn if cache is old
-                cached_entry = cache._metadata.get(cache._get_cache_key(state))
-                if cached_entry and cached_entry.is_stale:
-                    console.print(
-                        f"[yellow]Warning: Cached data is {cached_entry.age_days:.0f} days old. "
-                        f"Use force=True to re-download.[/yellow]"
-                    )
-
+        cached_path, changed = _check_cached(
+            cache, client, state, f"data for {state}", show_progress
+        )
+        if cached_path is not None:
             return cached_path
 
     if show_progress:
         console.print(f"\n[bold]Downloading FIA data for {state}[/bold]")
         console.print(f"Data directory: {state_dir}")
 
-    # Remove existing file if force=True
-    if force and duckdb_path.exists():
+    # Remove existing file if force=True or the DataMart data changed
+    if (force or changed) and duckdb_path.exists():
         duckdb_path.unlink()
 
-    # Use temp directory for CSV downloads
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        csv_dir = temp_path / "csv"
-        csv_dir.mkdir()
+    import duckdb
 
-        # Download CSVs
+    # Get state FIPS code
+    state_code = None
+    try:
+        state_code = get_state_fips(state)
+    except ValueError:
+        pass
+
+    duckdb_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = duckdb.connect(str(duckdb_path))
+
+    try:
         if show_progress:
-            console.print("\n[bold]Downloading CSV files...[/bold]")
+            console.print("\n[bold]Downloading and converting tables...[/bold]")
 
-        downloaded = client.download_tables(
+        downloaded = _download_and_import_state(
+            client,
+            conn,
             state,
             tables=tables,
             common=common,
-            dest_dir=csv_dir,
+            state_code=state_code,
             show_progress=show_progress,
         )
 
         if not downloaded:
+            conn.close()
+            duckdb_path.unlink(missing_ok=True)
             raise DownloadError(f"No tables downloaded for {state}")
 
         # Also download key reference tables (state-independent)
-        if show_progress:
-            console.print("\n[bold]Downloading reference tables...[/bold]")
+        _import_reference_tables(client, conn, state_code, show_progress)
 
-        try:
-            client.download_reference_tables(
-                dest_dir=csv_dir,
-                tables=list(REQUIRED_REFERENCE_TABLES),
-                show_progress=show_progress,
-            )
-        except Exception as e:
-            # Logged here for the root cause; the post-build verification below
-            # is what makes a missing-reference-table build fatal (#86).
-            logger.warning(f"Failed to download reference tables: {e}")
-
-        # Convert to DuckDB
-        if show_progress:
-            console.print("\n[bold]Converting to DuckDB...[/bold]")
+        _report_csv_rejects(conn, show_progress)
+        conn.execute("CHECKPOINT")
 
-        # Get state FIPS code
-        state_code = None
-        try:
-            state_code = get_state_fips(state)
-        except ValueError:
-            pass
+    finally:
+        conn.close()
 
-        _convert_csvs_to_duckdb(
-            csv_dir, duckdb_path, state_code=state_code, show_progress=show_progress
-        )
+    if optimize:
+        if show_progress:
+            console.print("\n[bold]Optimizing database layout...[/bold]")
+        optimize_database(duckdb_path, force=True, show_progress=show_progress)
 
     # Fail loudly (and discard) rather than caching a database that is missing
     # its reference tables.
     _verify_reference_tables_or_discard(duckdb_path, state)
 
     if use_cache:
-        cache.add_to_cache(state, duckdb_path)
+        cache.add_to_cache(state, duckdb_path, validators=client.validators)
 
     if show_progress:
         size_mb = duckdb_path.stat().st_size / (1024 * 1024)
@@ -503,6 +765,7 @@ def _download_multi_state(
     force: bool,
     show_progress: bool,
     use_cache: bool,
+    optimize: bool = True,
 ) -> Path:
     """Download and merge FIA data for multiple states."""
     # Create merged database name
@@ -515,13 +778,12 @@ def _download_multi_state(
 
     # Check cache
     cache_key = f"MERGED_{states_suffix.upper()}"
+    changed = False
     if use_cache and not force:
-        cached_path = cache.get_cached(cache_key)
-        if cached_path and cached_path.exists():
-            if show_progress:
-                console.print(
-                    f"[bold green]Using cached merged data[/bold green]: {cached_path}"
-                )
+        cached_path, changed = _check_cached(
+            cache, client, cache_key, "merged data", show_progress
+        )
+        if cached_path is not None:
             return cached_path
 
     if show_progress:
@@ -531,8 +793,8 @@ def _download_multi_state(
     # Download each state and merge
     import duckdb
 
-    # Remove existing output if force
-    if output_path.exists() and force:
+    # Remove existing output if force or the DataMart data changed
+    if output_path.exists() and (force or changed):
         output_path.unlink()
 
     conn = duckdb.connect(str(output_path))
@@ -544,120 +806,40 @@ def _download_multi_state(
                     f"\n[bold][{i}/{len(states)}] Processing {state}...[/bold]"
                 )
 
-            # Download state
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                csv_dir = temp_path / "csv"
-                csv_dir.mkdir()
-
-                # Download CSVs
-                downloaded = client.download_tables(
-                    state,
-                    tables=tables,
-                    common=common,
-                    dest_dir=csv_dir,
-                    show_progress=show_progress,
-                )
+            downloaded = _download_and_import_state(
+                client,
+                conn,
+                state,
+                tables=tables,
+                common=common,
+                state_code=get_state_fips(state),
+                append=True,
+                show_progress=show_progress,
+            )
 
-                if not downloaded:
-                    logger.warning(f"No tables downloaded for {state}, skipping")
-                    continue
-
-                # Get state FIPS code
-                state_code = get_state_fips(state)
-
-                # Import into DuckDB
-                csv_files = list(csv_dir.glob("*.csv")) + list(csv_dir.glob("*.CSV"))
-
-                for csv_file in csv_files:
-                    # Extract table name (same logic as _convert_csvs_to_duckdb)
-                    filename = csv_file.stem.upper()
-                    if filename.startswith("REF_"):
-                        table_name = filename
-                    else:
-                        name_parts = filename.split("_")
-                        if len(name_parts) >= 2:
-                            table_name = "_".join(name_parts[1:])
-                        else:
-                            table_name = name_parts[0]
-
-                    # Validate table name to prevent SQL injection
-                    try:
-                        safe_table = validate_sql_identifier(table_name, "table name")
-                    except ValueError as e:
-                        logger.warning(f"Skipping invalid table name {table_name}: {e}")
-                        continue
-
-                    # Sanitize CSV path for safe SQL interpolation
-                    safe_csv_path = sanitize_sql_path(csv_file)
-
-                    try:
-                        # Check if table exists (using parameterized query - safe)
-                        existing_result = conn.execute(
-                            "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
-                            [safe_table],
-                        ).fetchone()
-                        existing = existing_result[0] if existing_result else 0
-
-                        if existing > 0:
-                            # Append to existing table
-                            conn.execute(f"""
-                                INSERT INTO "{safe_table}"
-                                SELECT *, {state_code} AS STATE_ADDED
-                                FROM read_csv_auto('{safe_csv_path}', header=true, ignore_errors=true)
-                            """)
-                        else:
-                            # Create new table
-                            conn.execute(f"""
-                                CREATE TABLE "{safe_table}" AS
-                                SELECT *, {state_code} AS STATE_ADDED
-                                FROM read_csv_auto('{safe_csv_path}', header=true, ignore_errors=true)
-                            """)
-
-                    except duckdb.Error as e:
-                        logger.warning(
-                            f"Failed to import {safe_table} for {state}: {e}"
-                        )
+            if not downloaded:
+                logger.warning(f"No tables downloaded for {state}, skipping")
 
         # Download and add reference tables (once for all states)
-        if show_progress:
-            console.print("\n[bold]Downloading reference tables...[/bold]")
-
-        try:
-            with tempfile.TemporaryDirectory() as ref_temp_dir:
-                ref_temp_path = Path(ref_temp_dir)
-                ref_tables = client.download_reference_tables(
-                    dest_dir=ref_temp_path,
-                    tables=list(REQUIRED_REFERENCE_TABLES),
-                    show_progress=show_progress,
-                )
-
-                for table_name, csv_path in ref_tables.items():
-                    try:
-                        safe_table = validate_sql_identifier(table_name, "table name")
-                        safe_csv_path = sanitize_sql_path(csv_path)
-                        conn.execute(f"""
-                            CREATE TABLE IF NOT EXISTS "{safe_table}" AS
-                            SELECT * FROM read_csv_auto('{safe_csv_path}', header=true, ignore_errors=true)
-                        """)
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to import reference table {table_name}: {e}"
-                        )
-        except Exception as e:
-            logger.warning(f"Failed to download reference tables: {e}")
+        _import_reference_tables(client, conn, None, show_progress)
 
+        _report_csv_rejects(conn, show_progress)
         conn.execute("CHECKPOINT")
 
     finally:
         conn.close()
 
+    if optimize:
+        if show_progress:
+            console.print("\n[bold]Optimizing database layout...[/bold]")
+        optimize_database(output_path, force=True, show_progress=show_progress)
+
     # Fail loudly (and discard) rather than caching a database that is missing
     # its reference tables.
     _verify_reference_tables_or_discard(output_path, cache_key)
 
     if use_cache:
-        cache.add_to_cache(cache_key, output_path)
+        cache.add_to_cache(cache_key, output_path, validators=client.validators)
 
     if show_progress:
         size_mb = output_path.stat().st_size / (1024 * 1024)
@@ -10,7 +10,7 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -34,6 +34,9 @@ class CachedDownload:
         File size in bytes.
     checksum : str
         MD5 checksum of the file.
+    validators : dict, optional
+        ETag/Last-Modified headers of each DataMart URL the file was built
+        from, keyed by URL, used to check freshness without re-downloading.
     """
 
     state: str
@@ -41,6 +44,7 @@ class CachedDownload:
     downloaded_at: str
     size_bytes: int
     checksum: str
+    validators: dict[str, dict[str, str]] = field(default_factory=dict)
 
     @property
     def age_days(self) -> float:
@@ -197,6 +201,7 @@ class DownloadCache:
         state: str,
         path: Path,
         checksum: str | None = None,
+        validators: dict[str, dict[str, str]] | None = None,
     ) -> None:
         """
         Add a downloaded DuckDB file to the cache.
@@ -209,6 +214,8 @@ class DownloadCache:
             Path to the downloaded DuckDB file.
         checksum : str, optional
             MD5 checksum of the file. Calculated if not provided.
+        validators : dict, optional
+            ETag/Last-Modified headers of the source URLs, keyed by URL.
         """
         key = self._get_cache_key(state)
         path = Path(path)
@@ -226,12 +233,43 @@ class DownloadCache:
             downloaded_at=datetime.now().isoformat(),
             size_bytes=path.stat().st_size,
             checksum=checksum,
+            validators=dict(validators or {}),
         )
 
         self._metadata[key] = cached
         self._save_metadata()
         logger.debug(f"Added to cache: {key} -> {path}")
 
+    def get_entry(self, state: str) -> CachedDownload | None:
+        """
+        Get the metadata of a cached download.
+
+        Parameters
+        ----------
+        state : str
+            State abbreviation or cache key.
+
+        Returns
+        -------
+        CachedDownload or None
+            Cache entry, or None if not cached.
+        """
+        return self._metadata.get(self._get_cache_key(state))
+
+    def mark_fresh(self, state: str) -> None:
+        """
+        Reset the age of a cached download confirmed to be up to date.
+
+        Parameters
+        ----------
+        state : str
+            State abbreviation or cache key.
+        """
+        cached = self.get_entry(state)
+        if cached is not None:
+            cached.downloaded_at = datetime.now().isoformat()
+            self._save_metadata()
+
     def remove_from_cache(self, state: str) -> bool:
         """
         Remove an entry from the cache.
@@ -17,14 +17,19 @@ import logging
 import shutil
 import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
 from rich.progress import (
     BarColumn,
     DownloadColumn,
     Progress,
     SpinnerColumn,
+    TaskID,
     TextColumn,
     TimeRemainingColumn,
     TransferSpeedColumn,
@@ -46,6 +51,20 @@ logger = logging.getLogger(__name__)
 # FIA DataMart URLs
 DATAMART_CSV_BASE = "https://apps.fs.usda.gov/fia/datamart/CSV/"
 
+# Response headers identifying a version of a downloaded file, strongest first
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+
+
+def _resumes_at(response: requests.Response, offset: int) -> bool:
+    """Whether a response is a partial body starting at byte ``offset``."""
+    if response.status_code != 206:
+        return False
+    content_range = response.headers.get("Content-Range", "")
+    # e.g. "bytes 1048576-5242879/5242880"
+    unit, _, spec = content_range.partition(" ")
+    start = spec.partition("-")[0]
+    return unit == "bytes" and start.isdigit() and int(start) == offset
+
 
 class DataMartClient:
     """
@@ -62,6 +81,12 @@ class DataMartClient:
         Download chunk size in bytes (default 1MB).
     max_retries : int, default 3
         Maximum number of retry attempts for failed downloads.
+    max_workers : int, default 4
+        Maximum number of tables downloaded at once. This is also the
+        connection pool size per host, so no more than ``max_workers``
+        connections are open to the DataMart.
+    base_url : str, optional
+        Base URL of the CSV downloads. Defaults to the FIA DataMart.
 
     Examples
     --------
@@ -75,12 +100,23 @@ class DataMartClient:
         timeout: int = 300,
         chunk_size: int = 1024 * 1024,
         max_retries: int = 3,
+        max_workers: int = 4,
+        base_url: str = DATAMART_CSV_BASE,
     ):
         self.timeout = timeout
         self.chunk_size = chunk_size
         self.max_retries = max_retries
+        self.max_workers = max(1, max_workers)
+        self.base_url = base_url if base_url.endswith("/") else f"{base_url}/"
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "pyFIA/1.0 (download client)"})
+        # ETag/Last-Modified of every downloaded URL, for freshness checks
+        self.validators: dict[str, dict[str, str]] = {}
+
+        # Block rather than open extra connections when the pool is in use
+        adapter = HTTPAdapter(pool_maxsize=self.max_workers, pool_block=True)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _build_csv_url(self, state: str, table: str) -> str:
         """
@@ -108,7 +144,7 @@ class DataMartClient:
             # State tables: GA_PLOT.zip
             filename = f"{state}_{table}.zip"
 
-        return f"{DATAMART_CSV_BASE}{filename}"
+        return f"{self.base_url}{filename}"
 
     def _download_file(
         self,
@@ -116,6 +152,7 @@ class DataMartClient:
         dest_path: Path,
         description: str | None = None,
         show_progress: bool = True,
+        progress: Progress | None = None,
     ) -> Path:
         """
         Download a file from URL to destination path.
@@ -130,6 +167,9 @@ class DataMartClient:
             Description for progress bar.
         show_progress : bool, default True
             Show download progress bar.
+        progress : Progress, optional
+            Shared progress display to add this download's bar to, instead
+            of showing a bar of its own.
 
         Returns
         -------
@@ -143,84 +183,189 @@ class DataMartClient:
         """
         last_error = None
 
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.get(
-                    url, stream=True, timeout=self.timeout, allow_redirects=True
-                )
-
-                if response.status_code == 404:
-                    raise TableNotFoundError(dest_path.stem)
-
-                response.raise_for_status()
-
-                # Get file size if available
-                total_size = int(response.headers.get("content-length", 0))
-
-                # Ensure parent directory exists
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+        # Download to a temporary file in the same directory, then atomically
+        # move it into place, so a truncated file never appears at the
+        # canonical path that downstream code would treat as complete. Failed
+        # attempts keep the .part file, and retries resume it with a Range
+        # request guarded by If-Range, so an interrupted transfer continues
+        # where it stopped unless the file changed on the server.
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = dest_path.with_name(dest_path.name + ".part")
+        # A leftover .part of unknown origin cannot be resumed safely
+        tmp_path.unlink(missing_ok=True)
+        validator: str | None = None
 
-                # Download to a temporary file in the same directory, then
-                # atomically move it into place. A crash or network interrupt
-                # mid-stream leaves the .part file behind, never a truncated
-                # file at the canonical path that downstream code would treat
-                # as complete.
-                tmp_path = dest_path.with_name(dest_path.name + ".part")
+        try:
+            for attempt in range(self.max_retries):
+                offset = tmp_path.stat().st_size if tmp_path.exists() else 0
+                headers = {}
+                if offset and validator:
+                    headers = {"Range": f"bytes={offset}-", "If-Range": validator}
                 try:
-                    if show_progress and total_size > 0:
-                        with Progress(
-                            SpinnerColumn(),
-                            TextColumn("[bold blue]{task.description}"),
-                            BarColumn(),
-                            DownloadColumn(),
-                            TransferSpeedColumn(),
-                            TimeRemainingColumn(),
-                        ) as progress:
-                            task = progress.add_task(
-                                description or dest_path.name, total=total_size
-                            )
-
-                            with open(tmp_path, "wb") as f:
-                                for chunk in response.iter_content(
-                                    chunk_size=self.chunk_size
-                                ):
-                                    if chunk:
-                                        f.write(chunk)
-                                        progress.update(task, advance=len(chunk))
-                    else:
+                    response = self.session.get(
+                        url,
+                        stream=True,
+                        timeout=self.timeout,
+                        allow_redirects=True,
+                        headers=headers,
+                    )
+
+                    if response.status_code == 404:
+                        raise TableNotFoundError(dest_path.stem)
+                    if response.status_code == 416:
+                        # Stale partial file: start over on the next attempt
+                        tmp_path.unlink(missing_ok=True)
+
+                    response.raise_for_status()
+
+                    if response.status_code == 206 and not _resumes_at(
+                        response, offset
+                    ):
+                        # A range other than the one requested: start over
+                        response.close()
+                        tmp_path.unlink(missing_ok=True)
+                        validator = None
+                        logger.warning(f"Unexpected Content-Range from {url}")
+                        continue
+                    if response.status_code != 206:
+                        # Full body (no range requested, or the file changed)
+                        offset = 0
+                    validator = response.headers.get("ETag") or response.headers.get(
+                        "Last-Modified"
+                    )
+                    self._record_validators(url, response)
+
+                    # Get file size if available
+                    content_length = int(response.headers.get("content-length", 0))
+                    total_size = offset + content_length if content_length else 0
+
+                    if not show_progress or total_size <= 0:
                         # No progress bar (small file or progress disabled)
-                        with open(tmp_path, "wb") as f:
-                            for chunk in response.iter_content(
-                                chunk_size=self.chunk_size
-                            ):
-                                if chunk:
-                                    f.write(chunk)
+                        self._write_response(response, tmp_path, append=offset > 0)
+                    elif progress is not None:
+                        self._write_response(
+                            response,
+                            tmp_path,
+                            progress,
+                            progress.add_task(
+                                description or dest_path.name,
+                                total=total_size,
+                                completed=offset,
+                            ),
+                            append=offset > 0,
+                        )
+                    else:
+                        with self._progress() as own_progress:
+                            self._write_response(
+                                response,
+                                tmp_path,
+                                own_progress,
+                                own_progress.add_task(
+                                    description or dest_path.name,
+                                    total=total_size,
+                                    completed=offset,
+                                ),
+                                append=offset > 0,
+                            )
 
                     tmp_path.replace(dest_path)
-                except BaseException:
-                    # Clean up the partial file on any failure or interrupt.
-                    tmp_path.unlink(missing_ok=True)
-                    raise
-
-                logger.debug(f"Downloaded {url} to {dest_path}")
-                return dest_path
-
-            except requests.exceptions.RequestException as e:
-                last_error = e
-                logger.warning(f"Download attempt {attempt + 1} failed: {e}")
-                if attempt < self.max_retries - 1:
-                    continue
-                raise NetworkError(
-                    f"Failed to download after {self.max_retries} attempts: {e}",
-                    url=url,
-                    status_code=getattr(e.response, "status_code", None)
-                    if hasattr(e, "response")
-                    else None,
-                ) from last_error
+                    logger.debug(f"Downloaded {url} to {dest_path}")
+                    return dest_path
+
+                except requests.exceptions.RequestException as e:
+                    last_error = e
+                    logger.warning(f"Download attempt {attempt + 1} failed: {e}")
+                    if attempt < self.max_retries - 1:
+                        continue
+                    raise NetworkError(
+                        f"Failed to download after {self.max_retries} attempts: {e}",
+                        url=url,
+                        status_code=getattr(e.response, "status_code", None)
+                        if hasattr(e, "response")
+                        else None,
+                    ) from last_error
+        except BaseException:
+            # Clean up the partial file once the download has failed for good
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         # Should not reach here, but just in case
         raise NetworkError(f"Download failed: {last_error}", url=url)
 
+    def _record_validators(self, url: str, response: requests.Response) -> None:
+        """Remember the ETag/Last-Modified of a downloaded URL."""
+        validators = {
+            name: response.headers[name]
+            for name in VALIDATOR_HEADERS
+            if response.headers.get(name)
+        }
+        if validators:
+            self.validators[url] = validators
+
+    def is_unchanged(self, validators: dict[str, dict[str, str]]) -> bool:
+        """
+        Check with HEAD requests whether downloaded files are unchanged.
+
+        Parameters
+        ----------
+        validators : dict
+            URL to the ETag/Last-Modified headers recorded when it was
+            downloaded (see :attr:`validators`).
+
+        Returns
+        -------
+        bool
+            True if every URL still reports the recorded ETag (or, without
+            one, Last-Modified); False if any file changed or no longer
+            reports a validator.
+
+        Raises
+        ------
+        NetworkError
+            If a HEAD request fails.
+        """
+        for url, recorded in validators.items():
+            try:
+                response = self.session.head(
+                    url, timeout=self.timeout, allow_redirects=True
+                )
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                raise NetworkError(f"Freshness check failed: {e}", url=url) from e
+
+            name = next((n for n in VALIDATOR_HEADERS if recorded.get(n)), None)
+            if name is None or response.headers.get(name) != recorded[name]:
+                return False
+        return True
+
+    @staticmethod
+    def _progress() -> Progress:
+        """Progress display for file downloads."""
+        return Progress(
+            SpinnerColumn(),
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            DownloadColumn(),
+            TransferSpeedColumn(),
+            TimeRemainingColumn(),
+        )
+
+    def _write_response(
+        self,
+        response: requests.Response,
+        path: Path,
+        progress: Progress | None = None,
+        task: TaskID | None = None,
+        append: bool = False,
+    ) -> None:
+        """Stream a response body to ``path``, advancing a progress task."""
+        with open(path, "ab" if append else "wb") as f:
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if chunk:
+                    f.write(chunk)
+                    if progress is not None and task is not None:
+                        progress.update(task, advance=len(chunk))
+
     def _extract_zip(
         self, zip_path: Path, extract_dir: Path, show_progress: bool = True
     ) -> list[Path]:
@@ -267,6 +412,7 @@ class DataMartClient:
         table: str,
         dest_dir: Path,
         show_progress: bool = True,
+        progress: Progress | None = None,
     ) -> Path:
         """
         Download a single FIA table for a state.
@@ -281,6 +427,8 @@ class DataMartClient:
             Directory to save the extracted CSV file.
         show_progress : bool, default True
             Show download progress bar.
+        progress : Progress, optional
+            Shared progress display for the download bar.
 
         Returns
         -------
@@ -301,27 +449,15 @@ class DataMartClient:
         >>> client = DataMartClient()
         >>> csv_path = client.download_table("GA", "PLOT", Path("./data"))
         """
-        state = validate_state_code(state)
-        table = table.upper()
-
-        url = self._build_csv_url(state, table)
-        logger.info(f"Downloading {state}_{table} from {url}")
-
-        # Download to temp file
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
-            zip_filename = f"{state}_{table}.zip" if state != "REF" else f"{table}.zip"
-            zip_path = temp_path / zip_filename
-
-            try:
-                self._download_file(
-                    url,
-                    zip_path,
-                    description=f"{state}_{table}",
-                    show_progress=show_progress,
-                )
-            except TableNotFoundError:
-                raise TableNotFoundError(table, state)
+            zip_path = self.download_table_zip(
+                state,
+                table,
+                temp_path,
+                show_progress=show_progress,
+                progress=progress,
+            )
 
             # Extract CSV
             extracted = self._extract_zip(zip_path, temp_path, show_progress=False)
@@ -329,7 +465,7 @@ class DataMartClient:
             # Find the CSV file
             csv_files = [f for f in extracted if f.suffix.lower() == ".csv"]
             if not csv_files:
-                raise DownloadError(f"No CSV file found in {zip_filename}", url=url)
+                raise DownloadError(f"No CSV file found in {zip_path.name}")
 
             # Move to destination
             dest_dir.mkdir(parents=True, exist_ok=True)
@@ -338,9 +474,67 @@ class DataMartClient:
 
             shutil.move(str(csv_file), str(dest_path))
 
-            logger.info(f"Extracted {table} to {dest_path}")
+            logger.info(f"Extracted {table.upper()} to {dest_path}")
             return dest_path
 
+    def download_table_zip(
+        self,
+        state: str,
+        table: str,
+        dest_dir: Path,
+        show_progress: bool = True,
+        progress: Progress | None = None,
+    ) -> Path:
+        """
+        Download the DataMart ZIP of a single FIA table without extracting it.
+
+        Parameters
+        ----------
+        state : str
+            State abbreviation (e.g., 'GA') or 'REF' for reference tables.
+        table : str
+            Table name (e.g., 'PLOT', 'TREE').
+        dest_dir : Path
+            Directory to save the ZIP file.
+        show_progress : bool, default True
+            Show download progress bar.
+        progress : Progress, optional
+            Shared progress display for the download bar.
+
+        Returns
+        -------
+        Path
+            Path to the ZIP file, holding the table's CSV.
+
+        Raises
+        ------
+        StateNotFoundError
+            If the state code is invalid.
+        TableNotFoundError
+            If the table is not found for the state.
+        NetworkError
+            If the download fails.
+        """
+        state = validate_state_code(state)
+        table = table.upper()
+
+        url = self._build_csv_url(state, table)
+        logger.info(f"Downloading {state}_{table} from {url}")
+
+        zip_filename = f"{state}_{table}.zip" if state != "REF" else f"{table}.zip"
+        zip_path = dest_dir / zip_filename
+
+        try:
+            return self._download_file(
+                url,
+                zip_path,
+                description=f"{state}_{table}",
+                show_progress=show_progress,
+                progress=progress,
+            )
+        except TableNotFoundError:
+            raise TableNotFoundError(table, state)
+
     def download_tables(
         self,
         state: str,
@@ -352,6 +546,8 @@ class DataMartClient:
         """
         Download multiple FIA tables for a state.
 
+        Up to ``max_workers`` tables are downloaded concurrently.
+
         Parameters
         ----------
         state : str
@@ -376,6 +572,63 @@ class DataMartClient:
         >>> paths = client.download_tables("GA", common=True)
         >>> print(f"Downloaded {len(paths)} tables")
         """
+        return dict(
+            self.iter_download_tables(
+                state,
+                tables=tables,
+                common=common,
+                dest_dir=dest_dir,
+                show_progress=show_progress,
+            )
+        )
+
+    def iter_download_tables(
+        self,
+        state: str,
+        tables: list[str] | None = None,
+        common: bool = True,
+        dest_dir: Path | None = None,
+        show_progress: bool = True,
+        extract: bool = True,
+    ) -> Iterator[tuple[str, Path]]:
+        """
+        Download multiple FIA tables concurrently, yielding each when done.
+
+        Up to ``max_workers`` tables download at once, under one combined
+        progress display. Tables are yielded in completion order, so a
+        caller can process one table while the others are still
+        downloading. Tables that are not found or fail to download are
+        logged and skipped.
+
+        Parameters
+        ----------
+        state : str
+            State abbreviation (e.g., 'GA') or 'REF' for reference tables.
+        tables : list of str, optional
+            Specific tables to download. If None, uses common or all tables.
+        common : bool, default True
+            If tables is None, download only common tables (True) or all (False).
+        dest_dir : Path, optional
+            Directory to save files. Defaults to ~/.pyfia/data/{state}/csv/
+        show_progress : bool, default True
+            Show download progress.
+        extract : bool, default True
+            Extract each table's CSV. If False, the downloaded ZIP files are
+            yielded instead, e.g. to stream them with
+            :func:`pyfia.downloader.stream.open_zip_csv`.
+
+        Yields
+        ------
+        tuple of (str, Path)
+            Table name and path of the extracted CSV file (or of the ZIP
+            file if ``extract`` is False).
+
+        Examples
+        --------
+        >>> client = DataMartClient()
+        >>> for table, path in client.iter_download_tables("GA"):
+        ...     print(table, path)
+        """
         state = validate_state_code(state)
 
         # Determine tables to download
@@ -392,7 +645,7 @@ class DataMartClient:
 
         dest_dir.mkdir(parents=True, exist_ok=True)
 
-        downloaded = {}
+        n_downloaded = 0
         failed = []
 
         if show_progress:
@@ -403,40 +656,49 @@ class DataMartClient:
                 f"\n[bold]Downloading {len(tables_to_download)} tables for {state}[/bold]\n"
             )
 
-        for i, table in enumerate(tables_to_download, 1):
-            if show_progress:
-                from rich.console import Console
-
-                console = Console()
-                console.print(f"[{i}/{len(tables_to_download)}] {table}...", end=" ")
-
-            try:
-                path = self.download_table(
-                    state, table, dest_dir, show_progress=show_progress
-                )
-                downloaded[table] = path
-                if show_progress:
-                    console.print("[green]OK[/green]")
-            except (TableNotFoundError, NetworkError) as e:
-                failed.append((table, str(e)))
-                if show_progress:
-                    console.print(f"[red]FAILED[/red] ({e})")
-                logger.warning(f"Failed to download {state}_{table}: {e}")
+        progress = self._progress() if show_progress else None
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="pyfia-download"
+        )
+        fetch = self.download_table if extract else self.download_table_zip
+        futures = {
+            pool.submit(
+                fetch,
+                state,
+                table,
+                dest_dir,
+                show_progress=show_progress,
+                progress=progress,
+            ): table
+            for table in tables_to_download
+        }
+        try:
+            with progress if progress is not None else nullcontext():
+                for future in as_completed(futures):
+                    table = futures[future]
+                    try:
+                        path = future.result()
+                    except (TableNotFoundError, NetworkError) as e:
+                        failed.append((table, str(e)))
+                        logger.warning(f"Failed to download {state}_{table}: {e}")
+                        continue
+                    n_downloaded += 1
+                    yield table, path
+        finally:
+            # Stop queued downloads if the caller stops early or fails
+            for future in futures:
+                future.cancel()
+            pool.shutdown(wait=True)
 
         if show_progress:
-            from rich.console import Console
-
-            console = Console()
             console.print(
-                f"\n[bold green]Downloaded {len(downloaded)}/{len(tables_to_download)} tables[/bold green]"
+                f"\n[bold green]Downloaded {n_downloaded}/{len(tables_to_download)} tables[/bold green]"
             )
             if failed:
                 console.print(
                     f"[yellow]Failed: {', '.join(t for t, _ in failed)}[/yellow]"
                 )
 
-        return downloaded
-
     def get_file_checksum(self, file_path: Path) -> str:
         """
         Calculate MD5 checksum of a file.
@@ -514,24 +776,13 @@ class DataMartClient:
         default_tables = ["REF_SPECIES", "REF_FOREST_TYPE", "REF_STATE"]
         keep_tables = [t.upper() for t in (tables or default_tables)]
 
-        url = f"{DATAMART_CSV_BASE}FIADB_REFERENCE.zip"
-        logger.info(f"Downloading reference tables from {url}")
-
         downloaded = {}
 
         with tempfile.TemporaryDirectory() as temp_dir:
             temp_path = Path(temp_dir)
-            zip_path = temp_path / "FIADB_REFERENCE.zip"
-
-            try:
-                self._download_file(
-                    url,
-                    zip_path,
-                    description="FIADB_REFERENCE",
-                    show_progress=show_progress,
-                )
-            except TableNotFoundError:
-                raise TableNotFoundError("FIADB_REFERENCE")
+            zip_path = self.download_reference_zip(
+                temp_path, show_progress=show_progress
+            )
 
             # Extract all files
             extracted = self._extract_zip(zip_path, temp_path, show_progress=False)
@@ -557,3 +808,41 @@ class DataMartClient:
             )
 
         return downloaded
+
+    def download_reference_zip(
+        self, dest_dir: Path, show_progress: bool = True
+    ) -> Path:
+        """
+        Download the bundled FIADB_REFERENCE.zip without extracting it.
+
+        Parameters
+        ----------
+        dest_dir : Path
+            Directory to save the ZIP file.
+        show_progress : bool, default True
+            Show download progress bar.
+
+        Returns
+        -------
+        Path
+            Path to the ZIP file, holding one CSV per reference table.
+
+        Raises
+        ------
+        TableNotFoundError
+            If the reference ZIP is not found.
+        NetworkError
+            If the download fails.
+        """
+        url = f"{self.base_url}FIADB_REFERENCE.zip"
+        logger.info(f"Downloading reference tables from {url}")
+
+        try:
+            return self._download_file(
+                url,
+                dest_dir / "FIADB_REFERENCE.zip",
+                description="FIADB_REFERENCE",
+                show_progress=show_progress,
+            )
+        except TableNotFoundError:
+            raise TableNotFoundError("FIADB_REFERENCE")
@@ -0,0 +1,143 @@
+"""
+Plot-lineage index for remeasurement lookups.
+
+Each PLOT row links to its previous measurement through PREV_PLT_CN, so
+finding remeasurement pairs means joining PLOT (and then COND) to itself
+across the whole database. :func:`build_plot_lineage` stores the links once
+as :data:`LINEAGE_TABLE`, a narrow table of every plot's CN, PREV_PLT_CN,
+remeasurement period, inventory year and its position in the chain of
+measurements of the same plot location, indexed on CN and PREV_PLT_CN.
+Panel construction selects the remeasured plots from this table and reads
+only the conditions of those plots and the previous plots they reference.
+
+Examples
+--------
+>>> from pyfia import build_plot_lineage
+>>> build_plot_lineage("data/ga/ga.duckdb")
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from pyfia.downloader.metadata import METADATA_TABLE, table_columns, write_metadata
+
+logger = logging.getLogger(__name__)
+
+# Bump when the columns or content of LINEAGE_TABLE change
+LINEAGE_VERSION = 1
+
+# Table build_plot_lineage() stores the index in
+LINEAGE_TABLE = "PYFIA_PLOT_LINEAGE"
+
+# Longest chain followed; FIA plots have at most a few dozen measurements,
+# and the limit stops corrupt PREV_PLT_CN cycles from recursing forever
+MAX_CHAIN_LENGTH = 100
+
+# PLOT columns copied into the index when present
+LINEAGE_PLOT_COLUMNS = ("STATECD", "INVYR", "REMPER", "CYCLE")
+
+_VERSION_KEY = "plot_lineage_version"
+
+
+def build_plot_lineage(db_path: str | Path) -> Path:
+    """
+    Build the plot-lineage index of a DuckDB database.
+
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the DuckDB database, opened read-write.
+
+    Returns
+    -------
+    Path
+        Path to the database.
+
+    Raises
+    ------
+    ValueError
+        If the database has no PLOT table with CN and PREV_PLT_CN.
+    """
+    import duckdb
+
+    db_path = Path(db_path)
+    conn = duckdb.connect(str(db_path))
+    try:
+        if not _build_plot_lineage(conn):
+            raise ValueError(f"{db_path} has no PLOT table with CN and PREV_PLT_CN")
+        conn.execute("CHECKPOINT")
+    finally:
+        conn.close()
+    return db_path
+
+
+def _build_plot_lineage(conn) -> bool:
+    """Create LINEAGE_TABLE on ``conn``; False if PLOT cannot be linked."""
+    plot = table_columns(conn).get("PLOT", set())
+    if not {"CN", "PREV_PLT_CN"} <= plot:
+        return False
+
+    extra = [c for c in LINEAGE_PLOT_COLUMNS if c in plot]
+    extra_select = "".join(f", p.{c}" for c in extra)
+    # Chains start at plots whose previous measurement is not in the
+    # database; MEASUREMENT counts measurements along the chain from 1
+    conn.execute(
+        f"""
+        CREATE OR REPLACE TABLE {LINEAGE_TABLE} AS
+        WITH RECURSIVE chain(CN, CHAIN_CN, MEASUREMENT) AS (
+            SELECT p.CN, p.CN, 1
+            FROM PLOT p
+            WHERE p.PREV_PLT_CN IS NULL
+               OR p.PREV_PLT_CN NOT IN (SELECT CN FROM PLOT)
+            UNION ALL
+            SELECT p.CN, c.CHAIN_CN, c.MEASUREMENT + 1
+            FROM PLOT p
+            JOIN chain c ON p.PREV_PLT_CN = c.CN
+            WHERE c.MEASUREMENT < {MAX_CHAIN_LENGTH}
+        )
+        SELECT p.CN, p.PREV_PLT_CN{extra_select}, c.CHAIN_CN, c.MEASUREMENT
+        FROM PLOT p
+        LEFT JOIN chain c ON c.CN = p.CN
+        ORDER BY c.CHAIN_CN, c.MEASUREMENT
+        """
+    )
+    for col in ("CN", "PREV_PLT_CN"):
+        conn.execute(
+            f'CREATE INDEX IF NOT EXISTS "{LINEAGE_TABLE}_{col}_IDX" '
+            f'ON {LINEAGE_TABLE} ("{col}")'
+        )
+    write_metadata(conn, {_VERSION_KEY: str(LINEAGE_VERSION)})
+    logger.debug(f"Built {LINEAGE_TABLE}")
+    return True
+
+
+def plot_lineage_table(db) -> str | None:
+    """
+    Name of a database's current plot-lineage index, if it has one.
+
+    Parameters
+    ----------
+    db : FIA
+        Database connection.
+
+    Returns
+    -------
+    str or None
+        :data:`LINEAGE_TABLE` if it was built with the current
+        :data:`LINEAGE_VERSION`, else None.
+    """
+    from pyfia.core.backends.base import DatabaseBackend
+
+    backend = getattr(getattr(db, "_reader", None), "_backend", None)
+    if not isinstance(backend, DatabaseBackend):
+        return None
+    if not (
+        backend.table_exists(LINEAGE_TABLE) and backend.table_exists(METADATA_TABLE)
+    ):
+        return None
+    rows = backend.execute_query(
+        f"SELECT VALUE FROM {METADATA_TABLE} WHERE KEY = '{_VERSION_KEY}'"
+    ).rows()
+    return LINEAGE_TABLE if rows and rows[0][0] == str(LINEAGE_VERSION) else None
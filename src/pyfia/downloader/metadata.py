@@ -0,0 +1,75 @@
+"""
+Build metadata and schema helpers for pyFIA DuckDB databases.
+
+pyFIA records how a database was built (layout version, derived tables such
+as the plot-lineage index and materialized GRM facts) as key/value pairs in
+:data:`METADATA_TABLE`. These helpers work on a read-write ``duckdb``
+connection and are shared by the modules that build those tables.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from pyfia.validation import validate_sql_identifier
+
+logger = logging.getLogger(__name__)
+
+# Key/value table recording how a database was built
+METADATA_TABLE = "PYFIA_METADATA"
+
+
+def table_columns(conn) -> dict[str, set[str]]:
+    """
+    Columns of every base table in the main schema.
+
+    Parameters
+    ----------
+    conn : duckdb.DuckDBPyConnection
+        Database connection.
+
+    Returns
+    -------
+    dict of str to set of str
+        Upper-case column names by upper-case table name. Tables whose names
+        are not valid SQL identifiers are skipped.
+    """
+    rows = conn.execute(
+        """
+        SELECT c.table_name, c.column_name
+        FROM information_schema.columns c
+        JOIN information_schema.tables t
+          ON c.table_schema = t.table_schema AND c.table_name = t.table_name
+        WHERE t.table_type = 'BASE TABLE' AND c.table_schema = 'main'
+        """
+    ).fetchall()
+    columns: dict[str, set[str]] = {}
+    for table, column in rows:
+        try:
+            validate_sql_identifier(table, "table name")
+        except ValueError:
+            logger.debug(f"Skipping table with invalid name {table!r}")
+            continue
+        columns.setdefault(table.upper(), set()).add(column.upper())
+    return columns
+
+
+def write_metadata(conn, values: dict[str, str]) -> None:
+    """
+    Upsert key/value pairs into :data:`METADATA_TABLE`, creating it if needed.
+
+    Parameters
+    ----------
+    conn : duckdb.DuckDBPyConnection
+        Read-write database connection.
+    values : dict of str to str
+        Keys and values to record.
+    """
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {METADATA_TABLE} "
+        "(KEY VARCHAR PRIMARY KEY, VALUE VARCHAR)"
+    )
+    for key, value in values.items():
+        conn.execute(
+            f"INSERT OR REPLACE INTO {METADATA_TABLE} VALUES (?, ?)", [key, value]
+        )
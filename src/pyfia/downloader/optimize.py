@@ -0,0 +1,183 @@
+"""
+Physical layout optimization for downloaded FIA DuckDB databases.
+
+DataMart CSVs are loaded in file order with no indexes, so every PLT_CN or
+EVALID filter scans a whole table. :func:`optimize_database` rewrites the
+large plot-keyed tables sorted by state and plot, so DuckDB's per-row-group
+min/max statistics (zone maps) can skip row groups for state and plot
+filters, builds ART indexes on the key columns used for point and
+semi-join lookups, and builds the plot-lineage index used for remeasurement
+lookups (see :mod:`pyfia.downloader.lineage`). The layout version is
+recorded in a metadata table, which readers can check with
+:func:`get_layout_version`.
+
+Examples
+--------
+>>> from pyfia import optimize_database
+>>> optimize_database("data/ga/ga.duckdb")
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+
+from rich.console import Console
+
+from pyfia.downloader.metadata import METADATA_TABLE, table_columns, write_metadata
+
+logger = logging.getLogger(__name__)
+console = Console()
+
+# Bump when SORT_KEYS, INDEX_COLUMNS or the derived tables change, so older
+# files are re-optimized
+LAYOUT_VERSION = 2
+
+# Tables rewritten in physical order; leading columns missing from a table
+# are skipped (e.g. a hand-built TREE without STATECD is sorted by PLT_CN)
+SORT_KEYS: dict[str, tuple[str, ...]] = {
+    "TREE": ("STATECD", "PLT_CN"),
+    "COND": ("STATECD", "PLT_CN"),
+    "TREE_GRM_COMPONENT": ("STATECD", "PLT_CN"),
+    "TREE_GRM_MIDPT": ("STATECD", "PLT_CN"),
+}
+
+# Columns indexed in every non-reference table that has them
+INDEX_COLUMNS = ("CN", "PLT_CN", "TRE_CN", "EVALID")
+
+
+def get_layout_version(db_path: str | Path) -> int | None:
+    """
+    Return the layout version recorded in a DuckDB database.
+
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the DuckDB database.
+
+    Returns
+    -------
+    int or None
+        Layout version written by :func:`optimize_database`, or None if the
+        database has not been optimized.
+    """
+    import duckdb
+
+    conn = duckdb.connect(str(db_path), read_only=True)
+    try:
+        return _read_layout_version(conn)
+    finally:
+        conn.close()
+
+
+def optimize_database(
+    db_path: str | Path,
+    force: bool = False,
+    show_progress: bool = False,
+) -> Path:
+    """
+    Sort and index a DuckDB database built from FIA DataMart CSVs.
+
+    Rewrites the tables in :data:`SORT_KEYS` ordered by their sort keys,
+    builds ART indexes on the :data:`INDEX_COLUMNS` of every non-reference
+    table, builds the plot-lineage index, and records :data:`LAYOUT_VERSION` in :data:`METADATA_TABLE`.
+    Estimates are unaffected; only the physical layout changes.
+
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to the DuckDB database, opened read-write.
+    force : bool, default False
+        Re-optimize even if the database already has the current layout.
+    show_progress : bool, default False
+        Show progress messages.
+
+    Returns
+    -------
+    Path
+        Path to the optimized database.
+    """
+    import duckdb
+
+    from pyfia.downloader.lineage import _build_plot_lineage
+
+    db_path = Path(db_path)
+    conn = duckdb.connect(str(db_path))
+    try:
+        if not force and _read_layout_version(conn) == LAYOUT_VERSION:
+            logger.debug(f"{db_path} already has layout version {LAYOUT_VERSION}")
+            return db_path
+
+        columns = table_columns(conn)
+        for table, keys in SORT_KEYS.items():
+            if table not in columns:
+                continue
+            order = [k for k in keys if k in columns[table]]
+            if not order:
+                continue
+            if show_progress:
+                console.print(f"  Sorting {table} by {', '.join(order)}...")
+            _drop_indexes(conn, table)
+            order_by = ", ".join(f'"{k}"' for k in order)
+            conn.execute(
+                f'CREATE OR REPLACE TABLE "{table}" AS '
+                f'SELECT * FROM "{table}" ORDER BY {order_by}'
+            )
+
+        for table, present in columns.items():
+            if table.startswith("REF_") or table == METADATA_TABLE:
+                continue
+            for col in INDEX_COLUMNS:
+                if col not in present:
+                    continue
+                index = f"{table}_{col}_IDX"
+                if show_progress:
+                    console.print(f"  Indexing {table}.{col}...")
+                conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS "{index}" ON "{table}" ("{col}")'
+                )
+
+        if show_progress:
+            console.print("  Building plot lineage index...")
+        _build_plot_lineage(conn)
+
+        write_metadata(
+            conn,
+            {
+                "layout_version": str(LAYOUT_VERSION),
+                "optimized_at": datetime.now(timezone.utc).isoformat(),
+            },
+        )
+        conn.execute("CHECKPOINT")
+    finally:
+        conn.close()
+
+    return db_path
+
+
+def _drop_indexes(conn, table: str) -> None:
+    """Drop the indexes on ``table`` so it can be replaced."""
+    rows = conn.execute(
+        "SELECT index_name FROM duckdb_indexes() WHERE upper(table_name) = ?",
+        [table],
+    ).fetchall()
+    for (index,) in rows:
+        conn.execute(f'DROP INDEX IF EXISTS "{index}"')
+
+
+def _read_layout_version(conn) -> int | None:
+    """Layout version from the metadata table, if present and well-formed."""
+    exists = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+        [METADATA_TABLE],
+    ).fetchone()
+    if not exists or not exists[0]:
+        return None
+    row = conn.execute(
+        f"SELECT VALUE FROM {METADATA_TABLE} WHERE KEY = 'layout_version'"
+    ).fetchone()
+    try:
+        return int(row[0]) if row else None
+    except ValueError:
+        return None
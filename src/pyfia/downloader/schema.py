@@ -0,0 +1,152 @@
+"""
+Typed CSV reads for FIA DataMart to DuckDB conversion.
+
+``read_csv_auto`` sniffs each column's type from a sample of rows, which can
+store numeric FIADB columns as VARCHAR (#106) and, with
+``ignore_errors=true``, silently drops rows that do not parse. Conversion
+instead declares the FIADB type of every known column (CN keys and the
+numeric columns registered in
+:data:`pyfia.core.backends.base.FIADB_NUMERIC_TYPES`), leaves only the
+remaining columns to the sniffer, and keeps rows that fail to parse in a
+reject table that is saved to the database as :data:`REJECTS_TABLE`.
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+from pathlib import Path
+
+from pyfia.core.backends.base import fiadb_numeric_type
+from pyfia.validation import sanitize_sql_path, validate_sql_identifier
+
+logger = logging.getLogger(__name__)
+
+# CN keys are stored as BIGINT, the type the DuckDB sniffer picks for them
+CN_CSV_TYPE = "BIGINT"
+
+# Rows that failed to parse, saved by save_csv_rejects()
+REJECTS_TABLE = "PYFIA_CSV_REJECTS"
+
+# Session tables DuckDB collects rejected rows and their scans in
+_REJECTS_ERRORS = "pyfia_csv_reject_errors"
+_REJECTS_SCANS = "pyfia_csv_reject_scans"
+
+
+def csv_header(csv_path: Path) -> list[str]:
+    """Return the column names in the header row of a CSV file."""
+    with open(csv_path, newline="", encoding="utf-8-sig") as f:
+        return next(csv.reader(f), [])
+
+
+def csv_column_types(columns: list[str]) -> dict[str, str]:
+    """
+    Declared SQL types of the FIADB columns in a CSV header.
+
+    Parameters
+    ----------
+    columns : list of str
+        CSV column names.
+
+    Returns
+    -------
+    dict[str, str]
+        Column name to SQL type, for CN keys and registered numeric columns.
+        Other columns are absent and left to type sniffing.
+    """
+    types = {}
+    for col in columns:
+        name = col.upper()
+        if name == "CN" or name.endswith("_CN"):
+            types[col] = CN_CSV_TYPE
+        else:
+            sql_type = fiadb_numeric_type(name)
+            if sql_type is not None:
+                types[col] = sql_type
+    return types
+
+
+def read_csv_sql(csv_path: Path, columns: list[str] | None = None) -> str:
+    """
+    Build a typed ``read_csv`` call for a DataMart CSV file.
+
+    Parameters
+    ----------
+    csv_path : Path
+        Path to the CSV file.
+    columns : list of str, optional
+        Header columns of the file. Read from the file if not given; pass
+        them for a file that can only be read once, such as a named pipe.
+
+    Returns
+    -------
+    str
+        SQL table function reading the file with declared FIADB types,
+        parallel parsing, and rejected rows stored for save_csv_rejects().
+    """
+    safe_csv_path = sanitize_sql_path(csv_path)
+    types = []
+    if columns is None:
+        columns = csv_header(csv_path)
+    for col, sql_type in csv_column_types(columns).items():
+        try:
+            validate_sql_identifier(col, "column name")
+        except ValueError:
+            continue
+        types.append(f"'{col}': '{sql_type}'")
+    types_option = f", types={{{', '.join(types)}}}" if types else ""
+    return (
+        f"read_csv('{safe_csv_path}', header=true{types_option}, parallel=true, "
+        f"store_rejects=true, rejects_table='{_REJECTS_ERRORS}', "
+        f"rejects_scan='{_REJECTS_SCANS}')"
+    )
+
+
+def save_csv_rejects(conn) -> dict[str, int]:
+    """
+    Save the rows rejected by read_csv_sql() reads on ``conn``.
+
+    Rejected rows are written to :data:`REJECTS_TABLE` (file, line, column,
+    error and raw CSV line), replacing an earlier report. Nothing is written
+    when every row parsed.
+
+    Parameters
+    ----------
+    conn : duckdb.DuckDBPyConnection
+        Connection the CSV files were read on.
+
+    Returns
+    -------
+    dict[str, int]
+        Number of rejected rows per CSV file name.
+    """
+    exists = conn.execute(
+        "SELECT COUNT(*) FROM duckdb_tables() WHERE table_name = ?",
+        [_REJECTS_ERRORS],
+    ).fetchone()
+    if not exists or not exists[0]:
+        return {}
+
+    conn.execute(
+        f"""
+        CREATE OR REPLACE TABLE {REJECTS_TABLE} AS
+        SELECT s.file_path AS FILE_PATH, e.line AS LINE,
+               e.column_name AS COLUMN_NAME, e.error_type AS ERROR_TYPE,
+               e.error_message AS ERROR_MESSAGE, e.csv_line AS CSV_LINE
+        FROM {_REJECTS_ERRORS} e
+        JOIN {_REJECTS_SCANS} s USING (scan_id, file_id)
+        """
+    )
+    rows = conn.execute(
+        f"SELECT FILE_PATH, COUNT(*) FROM {REJECTS_TABLE} GROUP BY FILE_PATH"
+    ).fetchall()
+    if not rows:
+        conn.execute(f"DROP TABLE {REJECTS_TABLE}")
+        return {}
+
+    counts = {Path(path).name: count for path, count in rows}
+    for name, count in counts.items():
+        logger.warning(
+            f"{count:,} rows of {name} could not be parsed; see {REJECTS_TABLE}"
+        )
+    return counts
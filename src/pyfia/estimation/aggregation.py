@@ -21,6 +21,9 @@ from __future__ import annotations
 
 import polars as pl
 
+# Columns identifying one plot-condition in condition-level aggregates
+CONDITION_KEY_COLUMNS = ["PLT_CN", "CONDID", "STRATUM_CN", "EXPNS", "CONDPROP_UNADJ"]
+
 
 def aggregate_to_condition_level(
     data_with_strat: pl.LazyFrame,
@@ -61,13 +64,7 @@ def aggregate_to_condition_level(
     ... )
     """
     # Define condition-level grouping columns (always needed)
-    condition_group_cols = [
-        "PLT_CN",
-        "CONDID",
-        "STRATUM_CN",
-        "EXPNS",
-        "CONDPROP_UNADJ",
-    ]
+    condition_group_cols = list(CONDITION_KEY_COLUMNS)
 
     # Add user-specified grouping columns if they exist at condition level
     if group_cols:
@@ -88,6 +85,47 @@ def aggregate_to_condition_level(
     return condition_agg, condition_group_cols
 
 
+def rollup_condition_level(
+    condition_agg: pl.LazyFrame,
+    metric_mappings: dict[str, str],
+    group_cols: list[str],
+) -> tuple[pl.LazyFrame, list[str]]:
+    """
+    Roll condition-level aggregates up to a coarser grouping.
+
+    Condition-level aggregates grouped by a set of columns can be summed
+    over the columns not in ``group_cols`` to give exactly what
+    :func:`aggregate_to_condition_level` returns for ``group_cols``. This
+    lets several groupings share one pass over tree-level data.
+
+    Parameters
+    ----------
+    condition_agg : pl.LazyFrame
+        Output of aggregate_to_condition_level for a grouping that includes
+        every column of ``group_cols`` present at condition level
+    metric_mappings : dict[str, str]
+        Mapping of adjusted metrics to condition-level aggregates
+    group_cols : list[str]
+        Grouping columns to keep
+
+    Returns
+    -------
+    tuple[pl.LazyFrame, list[str]]
+        Condition-level aggregated data and the grouping columns used
+    """
+    available_cols = condition_agg.collect_schema().names()
+    condition_group_cols = list(CONDITION_KEY_COLUMNS)
+    for col in group_cols:
+        if col in available_cols and col not in condition_group_cols:
+            condition_group_cols.append(col)
+
+    rolled_up = condition_agg.group_by(condition_group_cols).agg(
+        [pl.col(cond_col).sum() for cond_col in metric_mappings.values()]
+        + [pl.col("TREES_PER_CONDITION").sum()]
+    )
+    return rolled_up, condition_group_cols
+
+
 def aggregate_to_population_level(
     condition_agg: pl.LazyFrame,
     metric_mappings: dict[str, str],
@@ -345,7 +383,9 @@ def apply_two_stage_aggregation(
 
 
 __all__ = [
+    "CONDITION_KEY_COLUMNS",
     "aggregate_to_condition_level",
+    "rollup_condition_level",
     "aggregate_to_population_level",
     "compute_per_acre_values",
     "apply_two_stage_aggregation",
@@ -31,7 +31,12 @@ from .aggregation import (
 from .aggregation import (
     compute_per_acre_values as _compute_per_acre_values_impl,
 )
+from .aggregation import (
+    rollup_condition_level as _rollup_condition_level_impl,
+)
+from .codes import decode_code_columns
 from .data_loading import DataLoader
+from .result_cache import get_result_cache, result_cache_key
 from .utils import apply_variance_columns
 
 logger = logging.getLogger(__name__)
@@ -73,6 +78,10 @@ class BaseEstimator(ABC):
     deep inheritance hierarchies.
     """
 
+    # Whether N_PLOTS counts only plots with a positive first metric
+    # (EVALIDator's "non-zero plots") rather than every plot with data
+    _count_nonzero_plots = False
+
     def __init__(self, db: str | FIA, config: dict):
         """
         Initialize the estimator.
@@ -101,6 +110,8 @@ class BaseEstimator(ABC):
         # Simple caches for commonly used data
         self._ref_species_cache: pl.DataFrame | None = None
         self._stratification_cache: pl.LazyFrame | None = None
+        # Finest-grouping condition aggregates while estimating grouping sets
+        self._condition_level_cache: dict[tuple, pl.DataFrame] | None = None
 
     def estimate(self) -> pl.DataFrame:
         """
@@ -111,20 +122,34 @@ class BaseEstimator(ABC):
         pl.DataFrame
             Final estimation results
         """
-        # 1. Load required data
-        data = self.load_data()
+        cache = get_result_cache()
+        cache_key = (
+            result_cache_key(self.db, type(self).__name__, self.config)
+            if cache is not None
+            else None
+        )
+        if cache is not None and cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Using cached result for {type(self).__name__}")
+                return cached
 
-        # 2. Apply filters (domain filtering)
-        if data is not None:
-            data = self.apply_filters(data)
+        # Results carry standard dtypes whatever the code encoding
+        result = decode_code_columns(self._estimate())
+        if cache is not None and cache_key is not None:
+            cache.put(cache_key, result)
+        return result
 
-        # 3. Calculate estimation values
-        if data is not None:
-            data = self.calculate_values(data)
+    def _estimate(self) -> pl.DataFrame:
+        """Run the estimation workflow without the result cache."""
+        if self.config.get("engine", "polars") == "sql":
+            return self._estimate_in_database()
 
-        # 4. Aggregate results with stratification
-        # Returns AggregationResult with results, plot_tree_data, and group_cols
-        agg_result = self.aggregate_results(data)
+        if self.config.get("grouping_sets"):
+            return self._estimate_grouping_sets()
+
+        # 1-4. Load, filter, calculate values and aggregate
+        agg_result = self.run_aggregation()
 
         # 5. Calculate variance using explicit AggregationResult
         results = self.calculate_variance(agg_result)
@@ -136,6 +161,112 @@ class BaseEstimator(ABC):
         #    always keep _SE columns; add _VARIANCE columns only if requested.
         return apply_variance_columns(formatted, self.config.get("variance", False))
 
+    def _estimate_in_database(self) -> pl.DataFrame:
+        """
+        Run the estimation workflow in the database (``engine="sql"``).
+
+        The database returns per-group partial results and stratum
+        statistics (see :mod:`pyfia.estimation.sql_engine`), which are
+        finalized like a single partition of a partitioned estimate.
+
+        Returns
+        -------
+        pl.DataFrame
+            Results with the same columns as the Polars engine.
+        """
+        from .sql_engine import aggregate_in_database
+
+        results, stats, group_cols = aggregate_in_database(self)
+        combined = self.combine_partial_results([results], stats, group_cols)
+        formatted = self.format_output(combined)
+        return apply_variance_columns(formatted, self.config.get("variance", False))
+
+    def _estimate_grouping_sets(self) -> pl.DataFrame:
+        """
+        Estimate every grouping in ``config["grouping_sets"]`` in one pass.
+
+        Data is loaded, filtered and valued once with every grouping column,
+        and conditions are aggregated once at the finest grouping. Each
+        grouping set is then rolled up from those condition-level aggregates
+        and runs its own variance and formatting.
+
+        Returns
+        -------
+        pl.DataFrame
+            Long-format results: a GROUPING_SET column with the set's index
+            in ``grouping_sets``, and null grouping columns for the columns a
+            set does not group by.
+        """
+        base_config = self.config
+        grouping_sets: list[list[str]] = base_config["grouping_sets"]
+        all_group_cols = list(dict.fromkeys(c for gs in grouping_sets for c in gs))
+
+        # Load with every grouping column, as a grp_by over all of them would
+        self.config = {**base_config, "grp_by": all_group_cols or None}
+        self.data_loader = DataLoader(self.db, self.config)
+        data = self.load_data()
+        if data is not None:
+            data = self.calculate_values(self.apply_filters(data)).collect().lazy()
+        self._stratification_cache = self._get_stratification_data().collect().lazy()
+        self._condition_level_cache = {}
+
+        frames = []
+        try:
+            for set_id, group_cols in enumerate(grouping_sets):
+                self.config = {**base_config, "grp_by": group_cols or None}
+                agg_result = self.aggregate_results(data)
+                results = self.format_output(self.calculate_variance(agg_result))
+                frames.append(
+                    results.with_columns(pl.lit(set_id).alias("GROUPING_SET"))
+                )
+        finally:
+            self.config = base_config
+            self._condition_level_cache = None
+
+        # Lay columns out like the most detailed set, ids first
+        template = max(
+            frames, key=lambda f: sum(c in all_group_cols for c in f.columns)
+        )
+        columns = ["GROUPING_SET"] + [
+            c for c in template.columns if c != "GROUPING_SET"
+        ]
+        combined = pl.concat(frames, how="diagonal_relaxed")
+        combined = combined.select(
+            columns + [c for c in combined.columns if c not in columns]
+        )
+        return apply_variance_columns(combined, base_config.get("variance", False))
+
+    def run_aggregation(self, data: pl.LazyFrame | None = None) -> AggregationResult:
+        """
+        Run the workflow up to and including aggregation.
+
+        Parameters
+        ----------
+        data : pl.LazyFrame | None
+            Joined data already loaded for this estimator, e.g. a frame
+            shared by several estimators. Loaded with load_data() if None.
+
+        Returns
+        -------
+        AggregationResult
+            Results, plot_tree_data and group_cols from aggregate_results().
+        """
+        # 1. Load required data
+        if data is None:
+            data = self.load_data()
+
+        # 2. Apply filters (domain filtering)
+        if data is not None:
+            data = self.apply_filters(data)
+
+        # 3. Calculate estimation values
+        if data is not None:
+            data = self.calculate_values(data)
+
+        # 4. Aggregate results with stratification
+        # Returns AggregationResult with results, plot_tree_data, and group_cols
+        return self.aggregate_results(data)
+
     def load_data(self) -> pl.LazyFrame | None:
         """
         Load and join required tables.
@@ -297,6 +428,175 @@ class BaseEstimator(ABC):
             "See Bechtold & Patterson (2005) for methodology."
         )
 
+    def calculate_partial_statistics(
+        self, agg_result: AggregationResult
+    ) -> pl.DataFrame:
+        """
+        Reduce one partition's data to mergeable stratum statistics.
+
+        Used by partitioned execution (see ``pyfia.parallel``): each
+        partition covers complete estimation units, so its statistics can
+        be concatenated with other partitions' and finalized by
+        ``combine_partial_results`` without the plot data.
+
+        Parameters
+        ----------
+        agg_result : AggregationResult
+            Output of aggregate_results() for the partition.
+
+        Returns
+        -------
+        pl.DataFrame
+            Stratum statistics table from ``calculate_stratum_statistics``
+            with ``y_{i}_i`` for each variance metric and ``x_i``. Empty
+            when the partition has no data.
+
+        Raises
+        ------
+        NotImplementedError
+            If the estimator does not use the shared variance path.
+        """
+        from .variance import calculate_stratum_statistics
+
+        metric_configs = self._variance_metric_configs()
+        if not metric_configs:
+            raise NotImplementedError(
+                f"{self.__class__.__name__} does not support partitioned estimation"
+            )
+
+        plot_tree_data = agg_result.plot_tree_data
+        if plot_tree_data is None or plot_tree_data.is_empty():
+            return pl.DataFrame()
+
+        plot_data = self._build_variance_plot_data(
+            plot_tree_data, agg_result.group_cols, metric_configs
+        )
+        return calculate_stratum_statistics(
+            plot_data,
+            self._get_all_plots_for_variance(),
+            [c for c in agg_result.group_cols if c in plot_data.columns],
+            [f"y_{i}_i" for i in range(len(metric_configs))],
+            "x_i",
+        )
+
+    def combine_partial_results(
+        self,
+        partial_results: list[pl.DataFrame],
+        stats: pl.DataFrame,
+        group_cols: list[str],
+    ) -> pl.DataFrame:
+        """
+        Combine per-partition results into what calculate_variance() returns.
+
+        Totals and plot/tree counts are additive across disjoint
+        partitions and are summed per group. Per-acre estimates are ratios
+        and, like the standard errors, are recomputed from the combined
+        stratum statistics.
+
+        Parameters
+        ----------
+        partial_results : list of pl.DataFrame
+            ``AggregationResult.results`` of each partition.
+        stats : pl.DataFrame
+            Combined output of calculate_partial_statistics().
+        group_cols : list[str]
+            Grouping columns of the estimate.
+
+        Returns
+        -------
+        pl.DataFrame
+            Results with estimate, SE and variance columns for all metrics.
+        """
+        from .variance import (
+            align_join_key_dtypes,
+            calculate_variance_from_stratum_statistics,
+            join_on_groups,
+        )
+
+        metric_configs = self._variance_metric_configs()
+        combined = pl.concat(partial_results, how="diagonal_relaxed")
+        join_cols = [c for c in group_cols if c in combined.columns]
+        acre_cols = [cfg["acre_col"] for cfg in metric_configs]
+        sum_cols = [
+            c for c in combined.columns if c not in join_cols and c not in acre_cols
+        ]
+
+        variance_df = calculate_variance_from_stratum_statistics(
+            stats,
+            [c for c in join_cols if c in stats.columns],
+            [f"y_{i}_i" for i in range(len(metric_configs))],
+            "x_i",
+        )
+        estimates = variance_df.select(
+            *[c for c in join_cols if c in variance_df.columns],
+            *[
+                pl.col(f"y_{i}_i_ratio").alias(cfg["acre_col"])
+                for i, cfg in enumerate(metric_configs)
+            ],
+            *self._metric_variance_columns(metric_configs),
+        )
+
+        results = self._sum_partial_results(combined, join_cols, sum_cols)
+        if join_cols:
+            estimates = align_join_key_dtypes(results, estimates, join_cols)
+            value_cols = [c for c in estimates.columns if c not in join_cols]
+            results = join_on_groups(results, estimates, join_cols).with_columns(
+                pl.col(value_cols).fill_null(0.0)
+            )
+        else:
+            results = pl.concat([results, estimates], how="horizontal")
+
+        # Keep the column order of a single-process run
+        ordered = [c for c in combined.columns if c in results.columns]
+        results = results.select(
+            ordered + [c for c in results.columns if c not in ordered]
+        )
+
+        if self.config.get("include_cv", False):
+            results = self._add_cv_columns(results, metric_configs)
+        return results
+
+    def _sum_partial_results(
+        self, combined: pl.DataFrame, join_cols: list[str], sum_cols: list[str]
+    ) -> pl.DataFrame:
+        """Sum additive partition columns per group, keeping all-null values null."""
+        sums = [
+            pl.when(pl.col(c).is_not_null().any()).then(pl.col(c).sum()).alias(c)
+            for c in sum_cols
+        ]
+        if join_cols:
+            return combined.group_by(join_cols, maintain_order=True).agg(sums)
+        return combined.select(sums)
+
+    def _variance_metric_configs(self) -> list[dict[str, str]]:
+        """
+        Metric configurations for the shared variance path.
+
+        Estimators that compute variance with _calculate_variance_for_metrics()
+        return their metric configurations (see that method for the keys)
+        here; ``acre_col`` is required for partitioned estimation.
+
+        Returns
+        -------
+        list of dict
+            Metric configurations; empty if the estimator has its own
+            variance calculation.
+        """
+        return []
+
+    def _sql_tree_values(self) -> list[str]:
+        """
+        Per-tree values of the variance metrics as SQL, for ``engine="sql"``.
+
+        Returns
+        -------
+        list of str
+            One expression per entry of _variance_metric_configs(): the
+            unadjusted per-acre value over (unqualified) TREE columns. Empty
+            if the estimator cannot run in the database.
+        """
+        return []
+
     def format_output(self, results: pl.DataFrame) -> pl.DataFrame:
         """
         Format output to match expected structure.
@@ -377,8 +677,26 @@ class BaseEstimator(ABC):
         tuple[pl.LazyFrame, list[str]]
             Condition-level aggregated data and the grouping columns used
         """
-        return _aggregate_to_condition_level_impl(
-            data_with_strat, metric_mappings, group_cols, available_cols
+        if self._condition_level_cache is None:
+            return _aggregate_to_condition_level_impl(
+                data_with_strat, metric_mappings, group_cols, available_cols
+            )
+
+        # Grouping sets: aggregate once by every grouping column, then roll up
+        key = tuple(metric_mappings.items())
+        if key not in self._condition_level_cache:
+            all_group_cols = list(
+                dict.fromkeys(
+                    group_cols
+                    + [c for gs in self.config.get("grouping_sets") or [] for c in gs]
+                )
+            )
+            condition_agg, _ = _aggregate_to_condition_level_impl(
+                data_with_strat, metric_mappings, all_group_cols, available_cols
+            )
+            self._condition_level_cache[key] = condition_agg.collect()
+        return _rollup_condition_level_impl(
+            self._condition_level_cache[key].lazy(), metric_mappings, group_cols
         )
 
     def _aggregate_to_population_level(
@@ -486,21 +804,35 @@ class BaseEstimator(ABC):
         - Condition-level values are expanded using stratification factors (EXPNS)
         - Per-acre estimates = sum(metric x EXPNS) / sum(CONDPROP_UNADJ x EXPNS)
         """
-        return _apply_two_stage_aggregation_impl(
-            data_with_strat, metric_mappings, group_cols, use_grm_adjustment
+        if self._condition_level_cache is None:
+            return _apply_two_stage_aggregation_impl(
+                data_with_strat, metric_mappings, group_cols, use_grm_adjustment
+            )
+
+        # Grouping sets: go through the condition-level rollup
+        available_cols = data_with_strat.collect_schema().names()
+        condition_agg, condition_group_cols = self._aggregate_to_condition_level(
+            data_with_strat, metric_mappings, group_cols, available_cols
         )
+        results = self._aggregate_to_population_level(
+            condition_agg, metric_mappings, group_cols, condition_group_cols
+        ).collect()
+        return self._compute_per_acre_values(results, metric_mappings)
 
     def _get_stratification_data(self) -> pl.LazyFrame:
         """
         Get stratification data with simple caching.
 
-        Delegates to DataLoader for actual data loading operations.
+        Delegates to DataLoader for actual data loading operations, unless
+        stratification data has been provided through the cache.
 
         Returns
         -------
         pl.LazyFrame
             Joined PPSA, POP_STRATUM, and PLOT data including MACRO_BREAKPOINT_DIA
         """
+        if self._stratification_cache is not None:
+            return self._stratification_cache
         return self.data_loader.get_stratification_data()
 
     def _aggregate_area_only(self, strat_data: pl.LazyFrame) -> pl.DataFrame:
@@ -698,76 +1030,26 @@ class BaseEstimator(ABC):
 
         return plot_data
 
-    def _expand_plots_for_all_groups(
-        self,
-        plot_data: pl.DataFrame,
-        results: pl.DataFrame,
-        group_cols: list[str],
-        y_col_alias: str,
-    ) -> tuple[pl.DataFrame, list[str]]:
+    def _get_all_plots_for_variance(self) -> pl.DataFrame:
         """
-        Expand plot data to include all plots with zeros for missing groups.
+        Get every plot in the evaluation with its stratum design columns.
 
-        Parameters
-        ----------
-        plot_data : pl.DataFrame
-            Plot-level aggregated data
-        results : pl.DataFrame
-            Results containing unique group combinations
-        group_cols : list[str]
-            Grouping columns
-        y_col_alias : str
-            Alias for the y column
+        Plots without data for a group are zeros for that group; variance
+        functions reconstruct them from this frame rather than from an
+        expanded plots x groups table.
 
         Returns
         -------
-        tuple[pl.DataFrame, list[str]]
-            Expanded plot data and valid group columns
+        pl.DataFrame
+            PLT_CN, STRATUM_CN, EXPNS and the B&P columns when available.
         """
-        # Get all plots from stratification (include B&P columns when available)
         strat_data = self._get_stratification_data()
         strat_schema = strat_data.collect_schema().names()
         bp_cols = ["ESTN_UNIT_CN", "STRATUM_WGT", "AREA_USED", "P2POINTCNT"]
         select_cols = ["PLT_CN", "STRATUM_CN", "EXPNS"] + [
             c for c in bp_cols if c in strat_schema
         ]
-        all_plots = strat_data.select(select_cols).unique().collect()
-
-        valid_group_cols = [c for c in group_cols if c in plot_data.columns]
-
-        if valid_group_cols:
-            # Get unique group values from results
-            unique_groups = results.select(valid_group_cols).unique()
-
-            # Cross join all plots with all groups to ensure complete coverage
-            all_plots_expanded = all_plots.join(unique_groups, how="cross")
-
-            # Left join with actual plot data to get values (missing = 0)
-            join_cols = ["PLT_CN"] + valid_group_cols
-            all_plots_with_data = all_plots_expanded.join(
-                plot_data.select(join_cols + [y_col_alias, "x_i"]),
-                on=join_cols,
-                how="left",
-            ).with_columns(
-                [
-                    pl.col(y_col_alias).fill_null(0.0),
-                    pl.col("x_i").fill_null(0.0),
-                ]
-            )
-        else:
-            # No grouping - just use all plots with plot_data
-            all_plots_with_data = all_plots.join(
-                plot_data.select(["PLT_CN", y_col_alias, "x_i"]),
-                on="PLT_CN",
-                how="left",
-            ).with_columns(
-                [
-                    pl.col(y_col_alias).fill_null(0.0),
-                    pl.col("x_i").fill_null(0.0),
-                ]
-            )
-
-        return all_plots_with_data, valid_group_cols
+        return strat_data.select(select_cols).unique().collect()
 
     def _rename_variance_columns(
         self,
@@ -834,12 +1116,15 @@ class BaseEstimator(ABC):
             Results with variance columns added
         """
         if valid_group_cols:
-            from .variance import align_join_key_dtypes
+            from .variance import align_join_key_dtypes, join_on_groups
 
             # Align all-null group keys so a Null-typed key cannot break the
-            # join against the typed results key (#105).
+            # join against the typed results key (#105). Groups without any
+            # non-zero plots have zero variance.
             variance_df = align_join_key_dtypes(results, variance_df, valid_group_cols)
-            return results.join(variance_df, on=valid_group_cols, how="left")
+            value_cols = [c for c in variance_df.columns if c not in valid_group_cols]
+            results = join_on_groups(results, variance_df, valid_group_cols)
+            return results.with_columns(pl.col(value_cols).fill_null(0.0))
         else:
             # No grouping - just add the single variance row's columns
             for col in variance_df.columns:
@@ -896,19 +1181,20 @@ class BaseEstimator(ABC):
             plot_tree_data, metric_col, group_cols, y_col_alias
         )
 
-        # Step 3-4: Expand to include all plots with zeros for missing groups
-        all_plots_with_data, valid_group_cols = self._expand_plots_for_all_groups(
-            plot_data, results, group_cols, y_col_alias
-        )
+        # Step 3-4: All plots in the evaluation; plots without data for a
+        # group enter the variance as zeros without being materialized
+        all_plots = self._get_all_plots_for_variance()
+        valid_group_cols = [c for c in group_cols if c in plot_data.columns]
 
         # Step 5: Calculate variance for all groups in one vectorized operation
         variance_df = calculate_grouped_domain_total_variance(
-            all_plots_with_data,
+            plot_data,
             group_cols=valid_group_cols,
             y_col=y_col_alias,
             x_col="x_i",
             stratum_col="STRATUM_CN",
             weight_col="EXPNS",
+            all_plots=all_plots,
         )
 
         # Step 6: Rename variance columns to match expected output
@@ -992,6 +1278,61 @@ class BaseEstimator(ABC):
                 "correctly in the estimation pipeline."
             )
 
+        # Steps 1-2: Aggregate to plot level for all metrics
+        plot_data = self._build_variance_plot_data(
+            plot_tree_data, group_cols, metric_configs
+        )
+
+        # Step 3: Get ALL plots in the evaluation for proper variance calculation
+        all_plots = self._get_all_plots_for_variance()
+
+        # Step 4: Calculate variance for each group or overall
+        if group_cols:
+            results = self._calculate_grouped_multi_metric_variance(
+                plot_data=plot_data,
+                all_plots=all_plots,
+                results=results,
+                group_cols=group_cols,
+                metric_configs=metric_configs,
+            )
+        else:
+            results = self._calculate_overall_multi_metric_variance(
+                plot_data=plot_data,
+                all_plots=all_plots,
+                results=results,
+                metric_configs=metric_configs,
+            )
+
+        # Step 5: Add CV if requested
+        if include_cv:
+            results = self._add_cv_columns(results, metric_configs)
+
+        return results
+
+    def _build_variance_plot_data(
+        self,
+        plot_tree_data: pl.DataFrame,
+        group_cols: list[str],
+        metric_configs: list[dict[str, str]],
+    ) -> pl.DataFrame:
+        """
+        Aggregate plot-tree data to plot-level Y and X values for variance.
+
+        Parameters
+        ----------
+        plot_tree_data : pl.DataFrame
+            Plot-tree level data preserved during aggregation
+        group_cols : list[str]
+            Grouping columns
+        metric_configs : list of dict
+            Metric configurations; metric ``i`` becomes column ``y_{i}_i``.
+
+        Returns
+        -------
+        pl.DataFrame
+            One row per plot and group with PLT_CN, STRATUM_CN, EXPNS, the
+            group columns, ``y_{i}_i`` for each metric and ``x_i``.
+        """
         # Step 1: Aggregate to plot-condition level for all metrics
         plot_group_cols = ["PLT_CN", "CONDID", "EXPNS"]
         if "STRATUM_CN" in plot_tree_data.columns:
@@ -1035,40 +1376,7 @@ class BaseEstimator(ABC):
         for i in range(len(metric_configs)):
             plot_agg_exprs.append(pl.sum(f"y_{i}_ic").alias(f"y_{i}_i"))
 
-        plot_data = plot_cond_data.group_by(plot_level_cols).agg(plot_agg_exprs)
-
-        # Step 3: Get ALL plots in the evaluation for proper variance calculation
-        strat_data = self._get_stratification_data()
-        strat_schema = strat_data.collect_schema().names()
-        # Select B&P variance columns when available
-        bp_cols = ["ESTN_UNIT_CN", "STRATUM_WGT", "AREA_USED", "P2POINTCNT"]
-        select_cols = ["PLT_CN", "STRATUM_CN", "EXPNS"] + [
-            c for c in bp_cols if c in strat_schema
-        ]
-        all_plots = strat_data.select(select_cols).unique().collect()
-
-        # Step 4: Calculate variance for each group or overall
-        if group_cols:
-            results = self._calculate_grouped_multi_metric_variance(
-                plot_data=plot_data,
-                all_plots=all_plots,
-                results=results,
-                group_cols=group_cols,
-                metric_configs=metric_configs,
-            )
-        else:
-            results = self._calculate_overall_multi_metric_variance(
-                plot_data=plot_data,
-                all_plots=all_plots,
-                results=results,
-                metric_configs=metric_configs,
-            )
-
-        # Step 5: Add CV if requested
-        if include_cv:
-            results = self._add_cv_columns(results, metric_configs)
-
-        return results
+        return plot_cond_data.group_by(plot_level_cols).agg(plot_agg_exprs)
 
     def _calculate_grouped_multi_metric_variance(
         self,
@@ -1081,108 +1389,65 @@ class BaseEstimator(ABC):
         """
         Calculate variance for grouped estimates with multiple metrics.
 
-        Uses a loop over groups for now; could be further optimized with
-        vectorized operations in the future.
+        All groups are computed in one vectorized pass over the plots that
+        carry data; plots outside a group enter as analytic zeros rather
+        than through a per-group join against every plot.
 
         Uses ratio-of-means variance for per-acre SE:
         V(R) = (1/X^2) * [V(Y) + R^2*V(X) - 2*R*Cov(Y,X)]
         """
-        from .variance import calculate_ratio_of_means_variance
-
-        variance_results = []
+        from .variance import (
+            align_join_key_dtypes,
+            calculate_grouped_ratio_of_means_variance,
+            join_on_groups,
+        )
 
-        for group_vals in results.iter_rows():
-            # Build filter for this group
-            group_filter = pl.lit(True)
-            group_dict = {}
+        join_cols = [
+            c for c in group_cols if c in plot_data.columns and c in results.columns
+        ]
+        if not join_cols:
+            return results
 
-            for col in group_cols:
-                if col in plot_data.columns:
-                    val = group_vals[results.columns.index(col)]
-                    group_dict[col] = val
-                    if val is None:
-                        group_filter = group_filter & pl.col(col).is_null()
-                    else:
-                        group_filter = group_filter & (pl.col(col) == val)
-
-            # Filter plot data for this specific group
-            group_plot_data = plot_data.filter(group_filter)
-
-            # Build select columns for join
-            select_cols = ["PLT_CN", "x_i"] + [
-                f"y_{i}_i" for i in range(len(metric_configs))
+        y_cols = [f"y_{i}_i" for i in range(len(metric_configs))]
+        stats = calculate_grouped_ratio_of_means_variance(
+            plot_data, all_plots, join_cols, y_cols, "x_i"
+        )
+        var_df = stats.select(
+            [
+                *map(pl.col, join_cols),
+                *self._metric_variance_columns(metric_configs),
             ]
-            select_cols = [c for c in select_cols if c in group_plot_data.columns]
-
-            # Join with ALL plots, filling missing with zeros
-            all_plots_group = all_plots.join(
-                group_plot_data.select(select_cols),
-                on="PLT_CN",
-                how="left",
-            )
+        )
 
-            # Fill nulls with zeros
-            fill_exprs = [pl.col("x_i").fill_null(0.0)]
-            for i in range(len(metric_configs)):
-                col_name = f"y_{i}_i"
-                if col_name in all_plots_group.columns:
-                    fill_exprs.append(pl.col(col_name).fill_null(0.0))
-
-            all_plots_group = all_plots_group.with_columns(fill_exprs)
-
-            # Calculate variance for each metric
-            result_row = dict(group_dict)
-
-            if len(all_plots_group) > 0:
-                for i, cfg in enumerate(metric_configs):
-                    y_col = f"y_{i}_i"
-                    if y_col in all_plots_group.columns:
-                        ratio_stats = calculate_ratio_of_means_variance(
-                            all_plots_group, y_col, "x_i"
-                        )
-                        se_acre = ratio_stats["se_ratio"]
-
-                        result_row[cfg["acre_se_col"]] = se_acre
-                        result_row[cfg["total_se_col"]] = ratio_stats["se_total"]
-
-                        # Add variance columns if specified
-                        if "acre_var_col" in cfg:
-                            result_row[cfg["acre_var_col"]] = ratio_stats[
-                                "variance_ratio"
-                            ]
-                        if "total_var_col" in cfg:
-                            result_row[cfg["total_var_col"]] = ratio_stats[
-                                "variance_total"
-                            ]
-            else:
-                # No data for this group
-                for cfg in metric_configs:
-                    result_row[cfg["acre_se_col"]] = 0.0
-                    result_row[cfg["total_se_col"]] = 0.0
-                    if "acre_var_col" in cfg:
-                        result_row[cfg["acre_var_col"]] = 0.0
-                    if "total_var_col" in cfg:
-                        result_row[cfg["total_var_col"]] = 0.0
-
-            variance_results.append(result_row)
-
-        # Join variance results back to main results
-        if variance_results:
-            from .variance import align_join_key_dtypes
-
-            var_df = pl.DataFrame(variance_results)
-            # Use only valid group columns that exist in both dataframes
-            join_cols = [
-                c for c in group_cols if c in var_df.columns and c in results.columns
+        # Align all-null group keys so a Null-typed key (e.g. a disturbance
+        # code null across every group) does not break the join against the
+        # typed results key (#105). Null keys match each other, and groups
+        # without plot data have zero variance.
+        var_df = align_join_key_dtypes(results, var_df, join_cols)
+        value_cols = [c for c in var_df.columns if c not in join_cols]
+        results = join_on_groups(results, var_df, join_cols)
+        return results.with_columns(pl.col(value_cols).fill_null(0.0))
+
+    def _metric_variance_columns(
+        self, metric_configs: list[dict[str, str]]
+    ) -> list[pl.Expr]:
+        """Map ``y_{i}_i`` ratio-of-means statistics onto configured columns."""
+        output_cols = []
+        for i, cfg in enumerate(metric_configs):
+            y_col = f"y_{i}_i"
+            output_cols += [
+                pl.col(f"{y_col}_se_ratio").alias(cfg["acre_se_col"]),
+                pl.col(f"{y_col}_se_total").alias(cfg["total_se_col"]),
             ]
-            if join_cols:
-                # Align all-null group keys so a Null-typed key (e.g. a
-                # disturbance code null across every group) does not break the
-                # join against the typed results key (#105).
-                var_df = align_join_key_dtypes(results, var_df, join_cols)
-                results = results.join(var_df, on=join_cols, how="left")
-
-        return results
+            if "acre_var_col" in cfg:
+                output_cols.append(
+                    pl.col(f"{y_col}_variance_ratio").alias(cfg["acre_var_col"])
+                )
+            if "total_var_col" in cfg:
+                output_cols.append(
+                    pl.col(f"{y_col}_variance_total").alias(cfg["total_var_col"])
+                )
+        return output_cols
 
     def _calculate_overall_multi_metric_variance(
         self,
@@ -0,0 +1,120 @@
+"""Compact encoding of FIA code columns for estimation.
+
+FIA classification codes (species, forest type, ownership, state, county,
+damage agent) are small non-negative integers, but are read as Int64, and
+the GRM component is read as a string. With ``FIA(..., compact_codes=True)``
+the estimation loaders carry code columns as UInt16 and the GRM component as
+a ``pl.Enum`` over the FIADB component domain, which cuts per-row memory and
+speeds up the joins, filters and group-bys on large tables such as
+TREE_GRM_COMPONENT. Estimator results are decoded back to the standard
+dtypes, so outputs do not depend on the mode.
+"""
+
+from __future__ import annotations
+
+import polars as pl
+
+from ..constants.status_codes import TreeComponent
+
+# Integer code columns carried as UInt16 in compact mode. Every FIADB code in
+# these columns fits (SPCD, the largest, is below 10000).
+COMPACT_CODE_COLUMNS = (
+    "SPCD",
+    "SPGRPCD",
+    "FORTYPCD",
+    "FLDTYPCD",
+    "OWNGRPCD",
+    "OWNCD",
+    "STATECD",
+    "COUNTYCD",
+    "AGENTCD",
+)
+COMPACT_CODE_DTYPE = pl.UInt16
+
+# GRM component values (SUBP_COMPONENT_*) as an Enum over the FIADB domain
+GRM_COMPONENT_DTYPE = pl.Enum(TreeComponent.GRM_CODES)
+
+
+def uses_compact_codes(db) -> bool:
+    """Return whether a database connection has compact code encoding enabled."""
+    return bool(getattr(db, "compact_codes", False))
+
+
+def encode_code_columns(data: pl.LazyFrame) -> pl.LazyFrame:
+    """Cast the code columns present in ``data`` to their compact dtypes.
+
+    Casts are strict, so a code outside the compact domain fails loudly
+    instead of being silently nulled.
+
+    Parameters
+    ----------
+    data : pl.LazyFrame
+        Loaded table data.
+
+    Returns
+    -------
+    pl.LazyFrame
+        ``data`` with code columns as UInt16 and COMPONENT as an Enum.
+    """
+    schema = data.collect_schema()
+    casts = [
+        pl.col(col).cast(COMPACT_CODE_DTYPE)
+        for col in COMPACT_CODE_COLUMNS
+        if col in schema and schema[col] != COMPACT_CODE_DTYPE
+    ]
+    if "COMPONENT" in schema and schema["COMPONENT"] != GRM_COMPONENT_DTYPE:
+        casts.append(pl.col("COMPONENT").cast(GRM_COMPONENT_DTYPE))
+    if casts:
+        data = data.with_columns(casts)
+    return data
+
+
+def decode_code_columns(results: pl.DataFrame) -> pl.DataFrame:
+    """Cast compact code columns in estimator results back to standard dtypes.
+
+    Parameters
+    ----------
+    results : pl.DataFrame
+        Estimator results.
+
+    Returns
+    -------
+    pl.DataFrame
+        ``results`` with UInt16 code columns as Int64 and an Enum COMPONENT
+        column as String.
+    """
+    casts = [
+        pl.col(col).cast(pl.Int64)
+        for col in COMPACT_CODE_COLUMNS
+        if results.schema.get(col) == COMPACT_CODE_DTYPE
+    ]
+    if isinstance(results.schema.get("COMPONENT"), pl.Enum):
+        casts.append(pl.col("COMPONENT").cast(pl.String))
+    if casts:
+        results = results.with_columns(casts)
+    return results
+
+
+def component_starts_with(prefix: str, compact: bool = False) -> pl.Expr:
+    """Match GRM components by prefix (e.g. 'MORTALITY', 'CUT').
+
+    Enum-encoded components have no string namespace, so in compact mode the
+    prefix is resolved against the known component domain instead.
+
+    Parameters
+    ----------
+    prefix : str
+        Component prefix.
+    compact : bool, default False
+        Whether COMPONENT is Enum-encoded.
+
+    Returns
+    -------
+    pl.Expr
+        Boolean expression on the COMPONENT column.
+    """
+    if compact:
+        return pl.col("COMPONENT").is_in(
+            [code for code in TreeComponent.GRM_CODES if code.startswith(prefix)]
+        )
+    return pl.col("COMPONENT").str.starts_with(prefix)
@@ -20,6 +20,7 @@ import polars as pl
 
 from ..core import FIA
 from ..filtering import apply_plot_filters
+from .codes import encode_code_columns, uses_compact_codes
 
 logger = logging.getLogger(__name__)
 
@@ -225,50 +226,6 @@ class DataLoader:
 
         return tree_cols, cond_cols
 
-    def _load_table_with_cache_check(
-        self,
-        table_name: str,
-        columns: list[str] | None,
-        where: str | None = None,
-    ) -> pl.LazyFrame:
-        """
-        Load a table with cache invalidation if required columns are missing.
-
-        Parameters
-        ----------
-        table_name : str
-            Name of the table to load
-        columns : list[str] | None
-            Required columns
-        where : str | None
-            SQL WHERE clause
-
-        Returns
-        -------
-        pl.LazyFrame
-            Loaded table as LazyFrame
-        """
-        # Check if cached table has all required columns
-        if table_name in self.db.tables:
-            cached = self.db.tables[table_name]
-            cached_cols = set(
-                cached.collect_schema().names()
-                if isinstance(cached, pl.LazyFrame)
-                else cached.columns
-            )
-            required_cols = set(columns) if columns else set()
-            if not required_cols.issubset(cached_cols):
-                del self.db.tables[table_name]
-
-        if table_name not in self.db.tables:
-            self.db.load_table(table_name, columns=columns, where=where)
-
-        df = self.db.tables[table_name]
-        if not isinstance(df, pl.LazyFrame):
-            df = df.lazy()
-
-        return df
-
     def _get_valid_plots_filter(self) -> pl.LazyFrame | None:
         """
         Get valid plot CNs based on EVALID and plot_domain filters.
@@ -385,9 +342,9 @@ class DataLoader:
         tree_where = self._build_tree_sql_filter()
         cond_where = self._build_cond_sql_filter()
 
-        # Load tables with cache invalidation
-        tree_df = self._load_table_with_cache_check("TREE", tree_cols, tree_where)
-        cond_df = self._load_table_with_cache_check("COND", cond_cols, cond_where)
+        # Load tables, reusing cached projections that cover these columns
+        tree_df = self.db.load_table("TREE", columns=tree_cols, where=tree_where)
+        cond_df = self.db.load_table("COND", columns=cond_cols, where=cond_where)
 
         # Get valid plots based on EVALID and plot_domain filters
         valid_plots = self._get_valid_plots_filter()
@@ -400,6 +357,10 @@ class DataLoader:
             cond_df, valid_plots, cond_cols
         )
 
+        if uses_compact_codes(self.db):
+            tree_df = encode_code_columns(tree_df)
+            cond_df = encode_code_columns(cond_df)
+
         # Join tree and condition
         return tree_df.join(cond_df, on=["PLT_CN", "CONDID"], how="inner")
 
@@ -422,21 +383,8 @@ class DataLoader:
         # Get required columns for area estimation
         cond_cols = list(cond_columns) if cond_columns else None
 
-        # Load COND table with cache invalidation
-        if "COND" in self.db.tables:
-            cached = self.db.tables["COND"]
-            cached_cols = set(
-                cached.collect_schema().names()
-                if isinstance(cached, pl.LazyFrame)
-                else cached.columns
-            )
-            required_cols = set(cond_cols) if cond_cols else set()
-            if not required_cols.issubset(cached_cols):
-                # Reload with all required columns
-                del self.db.tables["COND"]
-        if "COND" not in self.db.tables:
-            self.db.load_table("COND", columns=cond_cols)
-        cond_df = self.db.tables["COND"]
+        # Load COND table, reusing a cached projection with these columns
+        cond_df = self.db.load_table("COND", columns=cond_cols)
 
         # Load PLOT table
         if "PLOT" not in self.db.tables:
@@ -479,6 +427,10 @@ class DataLoader:
                 plot_df, plot_domain=self.config["plot_domain"]
             )
 
+        if uses_compact_codes(self.db):
+            cond_df = encode_code_columns(cond_df)
+            plot_df = encode_code_columns(plot_df)
+
         # Join condition and plot (all PLOT columns for grouping flexibility)
         data = cond_df.join(plot_df, left_on="PLT_CN", right_on="CN", how="inner")
 
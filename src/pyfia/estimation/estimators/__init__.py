@@ -14,7 +14,7 @@ from .carbon_flux import carbon_flux
 from .carbon_pools import CarbonPoolEstimator, carbon_pool
 from .growth import GrowthEstimator, growth
 from .mortality import MortalityEstimator, mortality
-from .panel import PanelBuilder, panel
+from .panel import PanelBuilder, panel, write_panel
 from .panel_validation import (
     ComparisonResult,
     compare_panel_to_removals,
@@ -38,6 +38,7 @@ __all__ = [
     "growth",
     "mortality",
     "panel",
+    "write_panel",
     "removals",
     "site_index",
     "tpa",
@@ -10,6 +10,7 @@ import polars as pl
 
 from ...core import FIA
 from ...filtering import get_land_domain_indicator
+from ...validation import validate_engine
 from ..base import AggregationResult, BaseEstimator
 from ..tree_expansion import apply_area_adjustment_factors
 from ..utils import (
@@ -18,6 +19,13 @@ from ..utils import (
     format_output_columns,
     validate_estimator_inputs,
 )
+from ..variance import (
+    align_join_key_dtypes,
+    calculate_grouped_ratio_of_means_variance,
+    calculate_stratum_statistics,
+    calculate_variance_from_stratum_statistics,
+    join_on_groups,
+)
 
 
 class AreaEstimator(BaseEstimator):
@@ -274,24 +282,7 @@ class AreaEstimator(BaseEstimator):
 
         results_df: pl.DataFrame = results_lazy.collect()
 
-        # Add percentage
-        # For grouped data: percentage of total area in groups
-        # For ungrouped data: percentage of total land area (using TOTAL_EXPNS)
-        if group_cols:
-            total_area = results_df["AREA_TOTAL"].sum()
-            results_df = results_df.with_columns(
-                [(100 * pl.col("AREA_TOTAL") / total_area).alias("AREA_PERCENT")]
-            )
-        else:
-            # For ungrouped data, calculate percentage of total land area
-            # TOTAL_EXPNS represents the total land area when summed
-            results_df = results_df.with_columns(
-                [
-                    (100 * pl.col("AREA_TOTAL") / pl.col("TOTAL_EXPNS")).alias(
-                        "AREA_PERCENT"
-                    )
-                ]
-            )
+        results_df = self._add_area_percent(results_df, group_cols)
 
         # Return AggregationResult with explicit data passing
         # Note: We use plot_tree_data field for plot_condition_data
@@ -325,6 +316,72 @@ class AreaEstimator(BaseEstimator):
         )  # Note: uses plot_tree_data field
         group_cols = agg_result.group_cols
 
+        plot_data, strat_cols = self._build_area_plot_data(
+            plot_condition_data, group_cols
+        )
+        all_plots = self._get_area_all_plots(plot_data, strat_cols)
+
+        # If we have grouping variables, calculate variance for each group
+        if group_cols:
+            # All groups in one pass; plots outside a group are analytic
+            # zeros, which is critical for rare categories (issue #68)
+            join_cols = [
+                c for c in group_cols if c in plot_data.columns and c in results.columns
+            ]
+            var_df = calculate_grouped_ratio_of_means_variance(
+                plot_data,
+                all_plots,
+                join_cols,
+                ["y_i"],
+                x_col=None,
+                stratum_col=[c for c in strat_cols if c in all_plots.columns],
+            ).select(
+                join_cols
+                + [
+                    pl.col("y_i_se_total").alias("AREA_SE"),
+                    pl.col("y_i_variance_total").alias("AREA_VARIANCE"),
+                ]
+            )
+            var_df = align_join_key_dtypes(results, var_df, join_cols)
+            results = join_on_groups(results, var_df, join_cols).with_columns(
+                pl.col("AREA_SE").fill_null(0.0),
+                pl.col("AREA_VARIANCE").fill_null(0.0),
+            )
+
+            results = self._add_area_se_percent(results)
+        else:
+            # No grouping, calculate overall variance
+            var_stats = self._calculate_variance_for_group(plot_data, strat_cols)
+
+            # Calculate SE% using actual area total
+            area_total = results["AREA_TOTAL"][0]
+            se_total = var_stats["se_total"]
+            se_percent = (
+                100 * se_total / area_total
+                if area_total is not None and area_total > 0 and se_total is not None
+                else 0
+            )
+
+            results = results.with_columns(
+                [
+                    pl.lit(var_stats["se_total"]).alias("AREA_SE"),
+                    pl.lit(se_percent).alias("AREA_SE_PERCENT"),
+                    pl.lit(var_stats["variance"]).alias("AREA_VARIANCE"),
+                ]
+            )
+
+        return results
+
+    def _build_area_plot_data(
+        self, plot_condition_data: pl.DataFrame, group_cols: list[str]
+    ) -> tuple[pl.DataFrame, list[str]]:
+        """Sum adjusted condition areas to plot level (y_i) per group.
+
+        Returns
+        -------
+        tuple[pl.DataFrame, list[str]]
+            Plot-level data and the stratification columns it carries.
+        """
         # Step 1: Calculate condition-level areas
         cond_data = plot_condition_data.with_columns(
             [
@@ -365,7 +422,12 @@ class AreaEstimator(BaseEstimator):
                 pl.sum("h_ic").alias("y_i")  # Total adjusted area per plot
             ]
         )
+        return plot_data, strat_cols
 
+    def _get_area_all_plots(
+        self, plot_data: pl.DataFrame, strat_cols: list[str]
+    ) -> pl.DataFrame:
+        """Get every plot in the evaluation with its stratum columns and EXPNS."""
         # Get ALL plots from stratification for proper variance calculation
         # (rare categories need zeros for plots without that category)
         try:
@@ -374,92 +436,116 @@ class AreaEstimator(BaseEstimator):
             select_cols = (
                 ["PLT_CN"] + [c for c in strat_cols if c in strat_schema] + ["EXPNS"]
             )
-            all_plots = strat_data.select(select_cols).unique().collect()
+            return strat_data.select(select_cols).unique().collect()
         except (KeyError, AttributeError):
             # Fallback: derive all plots from the plot data itself
-            all_plots = plot_data.select(["PLT_CN"] + strat_cols + ["EXPNS"]).unique()
+            return plot_data.select(["PLT_CN"] + strat_cols + ["EXPNS"]).unique()
 
-        # If we have grouping variables, calculate variance for each group
+    def _add_area_percent(
+        self, results_df: pl.DataFrame, group_cols: list[str]
+    ) -> pl.DataFrame:
+        """Add AREA_PERCENT to aggregated area results."""
+        # For grouped data: percentage of total area in groups
+        # For ungrouped data: percentage of total land area (using TOTAL_EXPNS)
         if group_cols:
-            # Calculate variance for each group separately
-            variance_results = []
-
-            for group_vals in results.iter_rows():
-                # Filter plot data for this group
-                group_filter = pl.lit(True)
-                group_dict = {}
-
-                for i, col in enumerate(group_cols):
-                    if col in plot_data.columns:
-                        val = group_vals[results.columns.index(col)]
-                        group_dict[col] = val
-                        if val is None:
-                            group_filter = group_filter & pl.col(col).is_null()
-                        else:
-                            group_filter = group_filter & (pl.col(col) == val)
-
-                group_plot_data = plot_data.filter(group_filter)
-
-                # Include ALL plots with zeros for non-matching ones
-                # This is critical for rare categories (issue #68)
-                all_plots_group = all_plots.join(
-                    group_plot_data.select(["PLT_CN", "y_i"]),
-                    on="PLT_CN",
-                    how="left",
-                ).with_columns(pl.col("y_i").fill_null(0.0))
-
-                if len(all_plots_group) > 0:
-                    # Calculate variance for this group using all plots
-                    var_stats = self._calculate_variance_for_group(
-                        all_plots_group, strat_cols
-                    )
-                    # Calculate SE% from the area total in results
-                    area_col = (
-                        "AREA_TOTAL" if "AREA_TOTAL" in results.columns else "AREA"
-                    )
-                    area_idx = results.columns.index(area_col)
-                    area_total = group_vals[area_idx]
-                    se_total = var_stats["se_total"]
-                    se_pct = (
-                        100 * se_total / area_total
-                        if area_total and area_total > 0 and se_total
-                        else 0.0
-                    )
-                    variance_results.append(
-                        {
-                            **group_dict,
-                            "AREA_SE": se_total,
-                            "AREA_SE_PERCENT": se_pct,
-                            "AREA_VARIANCE": var_stats["variance"],
-                        }
-                    )
+            total_area = results_df["AREA_TOTAL"].sum()
+            return results_df.with_columns(
+                [(100 * pl.col("AREA_TOTAL") / total_area).alias("AREA_PERCENT")]
+            )
 
-            # Join variance results back to main results
-            if variance_results:
-                var_df = pl.DataFrame(variance_results)
-                results = results.join(var_df, on=group_cols, how="left")
-        else:
-            # No grouping, calculate overall variance
-            var_stats = self._calculate_variance_for_group(plot_data, strat_cols)
+        # For ungrouped data, calculate percentage of total land area
+        # TOTAL_EXPNS represents the total land area when summed
+        return results_df.with_columns(
+            [(100 * pl.col("AREA_TOTAL") / pl.col("TOTAL_EXPNS")).alias("AREA_PERCENT")]
+        )
 
-            # Calculate SE% using actual area total
-            area_total = results["AREA_TOTAL"][0]
-            se_total = var_stats["se_total"]
-            se_percent = (
-                100 * se_total / area_total
-                if area_total is not None and area_total > 0 and se_total is not None
-                else 0
-            )
+    def _add_area_se_percent(self, results: pl.DataFrame) -> pl.DataFrame:
+        """Add AREA_SE_PERCENT and move AREA_VARIANCE to the end."""
+        # SE% from the area total in results
+        area_col = "AREA_TOTAL" if "AREA_TOTAL" in results.columns else "AREA"
+        area_total = pl.col(area_col)
+        results = results.with_columns(
+            pl.when((area_total > 0) & (pl.col("AREA_SE") != 0))
+            .then(100 * pl.col("AREA_SE") / area_total)
+            .otherwise(0.0)
+            .alias("AREA_SE_PERCENT")
+        )
+        return results.select(
+            [c for c in results.columns if c != "AREA_VARIANCE"] + ["AREA_VARIANCE"]
+        )
 
-            results = results.with_columns(
-                [
-                    pl.lit(var_stats["se_total"]).alias("AREA_SE"),
-                    pl.lit(se_percent).alias("AREA_SE_PERCENT"),
-                    pl.lit(var_stats["variance"]).alias("AREA_VARIANCE"),
-                ]
+    def calculate_partial_statistics(
+        self, agg_result: AggregationResult
+    ) -> pl.DataFrame:
+        """Reduce one partition's plot areas to mergeable stratum statistics."""
+        plot_condition_data = agg_result.plot_tree_data
+        if plot_condition_data is None or plot_condition_data.is_empty():
+            return pl.DataFrame()
+
+        plot_data, strat_cols = self._build_area_plot_data(
+            plot_condition_data, agg_result.group_cols
+        )
+        all_plots = self._get_area_all_plots(plot_data, strat_cols)
+        # STRATUM_CN identifies the stratum on its own; the estimation unit
+        # is only a prefix of the key in the single-process calculation
+        stratum_col = strat_cols[-1]
+        return calculate_stratum_statistics(
+            plot_data,
+            all_plots.select(["PLT_CN", stratum_col, "EXPNS"]),
+            [c for c in agg_result.group_cols if c in plot_data.columns],
+            ["y_i"],
+            x_col=None,
+            stratum_col=stratum_col,
+        )
+
+    def combine_partial_results(
+        self,
+        partial_results: list[pl.DataFrame],
+        stats: pl.DataFrame,
+        group_cols: list[str],
+    ) -> pl.DataFrame:
+        """Combine per-partition area results and their stratum statistics.
+
+        Areas, expansion totals and plot counts are summed per group;
+        AREA_PERCENT and the standard errors are recomputed from the
+        combined values.
+        """
+        combined = pl.concat(partial_results, how="diagonal_relaxed")
+        join_cols = [c for c in group_cols if c in combined.columns]
+        sum_cols = [
+            c for c in combined.columns if c not in join_cols and c != "AREA_PERCENT"
+        ]
+        stratum_col = "STRATUM_CN" if "STRATUM_CN" in stats.columns else "STRATUM"
+        var_df = calculate_variance_from_stratum_statistics(
+            stats,
+            [c for c in join_cols if c in stats.columns],
+            ["y_i"],
+            x_col=None,
+            stratum_col=stratum_col,
+        ).select(
+            [c for c in join_cols if c in stats.columns]
+            + [
+                pl.col("y_i_se_total").alias("AREA_SE"),
+                pl.col("y_i_variance_total").alias("AREA_VARIANCE"),
+            ]
+        )
+
+        results = self._sum_partial_results(combined, join_cols, sum_cols)
+        if join_cols:
+            var_df = align_join_key_dtypes(results, var_df, join_cols)
+            results = join_on_groups(results, var_df, join_cols).with_columns(
+                pl.col("AREA_SE").fill_null(0.0),
+                pl.col("AREA_VARIANCE").fill_null(0.0),
             )
+        else:
+            results = pl.concat([results, var_df], how="horizontal")
 
-        return results
+        results = self._add_area_percent(results, join_cols)
+        ordered = [c for c in combined.columns if c in results.columns]
+        results = results.select(
+            ordered + [c for c in results.columns if c not in ordered]
+        )
+        return self._add_area_se_percent(results)
 
     def _calculate_variance_for_group(
         self, plot_data: pl.DataFrame, strat_cols: list[str]
@@ -588,6 +674,7 @@ def area(
     eval_type: str | None = None,
     variance: bool = False,
     totals: bool = True,
+    engine: str = "polars",
 ) -> pl.DataFrame:
     """
     Estimate forest area from FIA data.
@@ -683,6 +770,13 @@ def area(
     totals : bool, default True
         If True, include total area estimates expanded to population level.
         If False, only return per-acre values.
+    engine : {'polars', 'sql'}, default 'polars'
+        Where the estimate is aggregated. 'polars' loads the condition rows
+        and aggregates them in Polars. 'sql' aggregates in DuckDB and
+        fetches only per-group totals and per-stratum statistics, which
+        avoids transferring condition rows from MotherDuck. Both give the
+        same results; 'sql' does not support grouping by polygon
+        attributes.
 
     Returns
     -------
@@ -821,6 +915,7 @@ def area(
         totals=totals,
         most_recent=most_recent,
     )
+    engine = validate_engine(engine)
 
     # Ensure db is a FIA instance using shared utility
     db, owns_db = ensure_fia_instance(db)
@@ -839,6 +934,7 @@ def area(
         "eval_type": eval_type,
         "variance": inputs.variance,
         "totals": inputs.totals,
+        "engine": engine,
     }
 
     try:
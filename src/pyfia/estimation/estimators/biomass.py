@@ -7,9 +7,12 @@ without unnecessary abstractions.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import polars as pl
 
 from ...core import FIA
+from ...validation import quote_sql_identifier
 from ..base import AggregationResult, BaseEstimator
 from ..columns import get_cond_columns as _get_cond_columns
 from ..columns import get_tree_columns as _get_tree_columns
@@ -213,6 +216,38 @@ class BiomassEstimator(BaseEstimator):
             group_cols=group_cols,
         )
 
+    def _sql_tree_values(self) -> list[str]:
+        """Biomass and carbon per acre as SQL for engine='sql'."""
+        component = self.config.get("component", "AG")
+        if component == "TOTAL":
+            drybio = "(DRYBIO_AG + DRYBIO_BG)"
+        else:
+            drybio = quote_sql_identifier(f"DRYBIO_{component}")
+        biomass = (
+            f"CAST({drybio} AS DOUBLE) * CAST(TPA_UNADJ AS DOUBLE)"
+            f" * {LBS_TO_SHORT_TONS!r}"
+        )
+        return [biomass, f"{biomass} * {CARBON_FRACTION!r}"]
+
+    def _variance_metric_configs(self) -> list[dict[str, str]]:
+        """Biomass metric configurations for the shared variance path."""
+        return [
+            {
+                "adjusted_col": "BIOMASS_ADJ",
+                "acre_se_col": "BIO_ACRE_SE",
+                "total_se_col": "BIO_TOTAL_SE",
+                "acre_col": "BIO_ACRE",
+                "total_col": "BIO_TOTAL",
+            },
+            {
+                "adjusted_col": "CARBON_ADJ",
+                "acre_se_col": "CARB_ACRE_SE",
+                "total_se_col": "CARB_TOTAL_SE",
+                "acre_col": "CARB_ACRE",
+                "total_col": "CARB_TOTAL",
+            },
+        ]
+
     def calculate_variance(
         self,
         agg_result: AggregationResult,
@@ -232,21 +267,9 @@ class BiomassEstimator(BaseEstimator):
         # Validate input using shared utility
         validate_aggregation_result(agg_result, "Biomass")
 
-        # Use unified variance calculation method for both biomass and carbon
-        metric_configs = [
-            {
-                "adjusted_col": "BIOMASS_ADJ",
-                "acre_se_col": "BIO_ACRE_SE",
-                "total_se_col": "BIO_TOTAL_SE",
-            },
-            {
-                "adjusted_col": "CARBON_ADJ",
-                "acre_se_col": "CARB_ACRE_SE",
-                "total_se_col": "CARB_TOTAL_SE",
-            },
-        ]
-
-        return self._calculate_variance_for_metrics(agg_result, metric_configs)
+        return self._calculate_variance_for_metrics(
+            agg_result, self._variance_metric_configs()
+        )
 
     def format_output(self, results: pl.DataFrame) -> pl.DataFrame:
         """Format biomass estimation output."""
@@ -294,6 +317,8 @@ def biomass(
     totals: bool = True,
     variance: bool = False,
     most_recent: bool = False,
+    grouping_sets: Sequence[str | list[str] | None] | None = None,
+    engine: str = "polars",
 ) -> pl.DataFrame:
     """
     Estimate tree biomass and carbon from FIA data.
@@ -377,6 +402,20 @@ def biomass(
     most_recent : bool, default False
         If True, automatically filter to the most recent evaluation for
         each state in the database before estimation.
+    grouping_sets : list, optional
+        Several groupings to estimate in one pass over the data. Each entry
+        is a column name, a list of column names, or None for the ungrouped
+        total (e.g. ``[None, "OWNGRPCD", ["FORTYPCD", "OWNGRPCD"]]``).
+        Cannot be combined with ``grp_by``. Results for all sets are stacked
+        in one frame with a GROUPING_SET column holding the set's index;
+        grouping columns a set does not use are null.
+    engine : {'polars', 'sql'}, default 'polars'
+        Where the estimate is aggregated. 'polars' loads the tree and
+        condition rows and aggregates them in Polars. 'sql' aggregates in
+        DuckDB and fetches only per-group totals and per-stratum
+        statistics, which avoids transferring tree rows from MotherDuck.
+        Both give the same results; 'sql' does not support
+        ``grouping_sets`` or grouping by polygon attributes.
 
     Returns
     -------
@@ -590,6 +629,8 @@ def biomass(
         validate_biomass_component,
         validate_boolean,
         validate_domain_expression,
+        validate_engine,
+        validate_grouping_sets,
         validate_grp_by,
         validate_land_type,
         validate_tree_type,
@@ -610,6 +651,8 @@ def biomass(
     totals = validate_boolean(totals, "totals")
     variance = validate_boolean(variance, "variance")
     most_recent = validate_boolean(most_recent, "most_recent")
+    grouping_sets = validate_grouping_sets(grouping_sets, grp_by)
+    engine = validate_engine(engine)
 
     # Ensure db is a FIA instance using shared utility
     db, owns_db = ensure_fia_instance(db)
@@ -635,6 +678,8 @@ def biomass(
         "totals": totals,
         "variance": variance,
         "most_recent": most_recent,
+        "grouping_sets": grouping_sets,
+        "engine": engine,
     }
 
     # Create and run estimator
@@ -18,6 +18,8 @@ import polars as pl
 
 from ...core import FIA
 from ..constants import CARBON_FRACTION
+from ..grm import load_grm_facts
+from ..utils import ensure_fia_instance
 from .area import area
 from .growth import growth
 from .mortality import mortality
@@ -87,73 +89,87 @@ def carbon_flux(
     -----
     Per-acre values are calculated as NET_TOTAL / AREA to ensure consistency,
     since growth, mortality, and removals use different base areas internally.
+
+    The GRM tables are loaded and joined once (see load_grm_facts()) and
+    shared by the growth, mortality and removals estimates.
     """
     # Normalize grouping columns
     group_cols = _normalize_group_cols(grp_by, by_species)
 
-    # Get forest area for per-acre calculation
-    area_result = area(
-        db=db,
-        grp_by=grp_by,
-        land_type=land_type,
-        area_domain=area_domain,
-        most_recent=most_recent,
-    )
+    db, owns_db = ensure_fia_instance(db)
+    try:
+        # Get forest area for per-acre calculation
+        area_result = area(
+            db=db,
+            grp_by=grp_by,
+            land_type=land_type,
+            area_domain=area_domain,
+            most_recent=most_recent,
+        )
 
-    # Get biomass totals from each GRM component
-    growth_result = growth(
-        db=db,
-        grp_by=grp_by,
-        by_species=by_species,
-        land_type=land_type,
-        tree_type=tree_type,
-        measure="biomass",
-        tree_domain=tree_domain,
-        area_domain=area_domain,
-        totals=True,  # Always need totals
-        variance=variance,
-        most_recent=most_recent,
-    )
+        # Join the GRM tables once for all three components
+        if db.evalid is not None:
+            load_grm_facts(
+                db, tree_type=tree_type, land_type=land_type, measures=("biomass",)
+            )
 
-    mortality_result = mortality(
-        db=db,
-        grp_by=grp_by,
-        by_species=by_species,
-        land_type=land_type,
-        tree_type=tree_type,
-        measure="biomass",
-        tree_domain=tree_domain,
-        area_domain=area_domain,
-        totals=True,
-        variance=variance,
-        most_recent=most_recent,
-    )
+        # Get biomass totals from each GRM component
+        growth_result = growth(
+            db=db,
+            grp_by=grp_by,
+            by_species=by_species,
+            land_type=land_type,
+            tree_type=tree_type,
+            measure="biomass",
+            tree_domain=tree_domain,
+            area_domain=area_domain,
+            totals=True,  # Always need totals
+            variance=variance,
+            most_recent=most_recent,
+        )
 
-    removals_result = removals(
-        db=db,
-        grp_by=grp_by,
-        by_species=by_species,
-        land_type=land_type,
-        tree_type=tree_type,
-        measure="biomass",
-        tree_domain=tree_domain,
-        area_domain=area_domain,
-        totals=True,
-        variance=variance,
-        most_recent=most_recent,
-    )
+        mortality_result = mortality(
+            db=db,
+            grp_by=grp_by,
+            by_species=by_species,
+            land_type=land_type,
+            tree_type=tree_type,
+            measure="biomass",
+            tree_domain=tree_domain,
+            area_domain=area_domain,
+            totals=True,
+            variance=variance,
+            most_recent=most_recent,
+        )
 
-    # Calculate carbon flux
-    return _calculate_carbon_flux(
-        area_result=area_result,
-        growth_result=growth_result,
-        mortality_result=mortality_result,
-        removals_result=removals_result,
-        group_cols=group_cols,
-        totals=totals,
-        variance=variance,
-        include_components=include_components,
-    )
+        removals_result = removals(
+            db=db,
+            grp_by=grp_by,
+            by_species=by_species,
+            land_type=land_type,
+            tree_type=tree_type,
+            measure="biomass",
+            tree_domain=tree_domain,
+            area_domain=area_domain,
+            totals=True,
+            variance=variance,
+            most_recent=most_recent,
+        )
+
+        # Calculate carbon flux
+        return _calculate_carbon_flux(
+            area_result=area_result,
+            growth_result=growth_result,
+            mortality_result=mortality_result,
+            removals_result=removals_result,
+            group_cols=group_cols,
+            totals=totals,
+            variance=variance,
+            include_components=include_components,
+        )
+    finally:
+        if owns_db and hasattr(db, "close"):
+            db.close()
 
 
 def _normalize_group_cols(
@@ -15,6 +15,8 @@ Key differences from biomass-derived carbon:
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import polars as pl
 
 from ...core import FIA
@@ -22,7 +24,12 @@ from ..base import AggregationResult, BaseEstimator
 from ..constants import LBS_TO_SHORT_TONS
 from ..tree_expansion import apply_tree_adjustment_factors
 from ..utils import validate_required_columns
-from ..variance import calculate_ratio_of_means_variance
+from ..variance import (
+    align_join_key_dtypes,
+    calculate_grouped_ratio_of_means_variance,
+    calculate_ratio_of_means_variance,
+    join_on_groups,
+)
 
 
 class CarbonPoolEstimator(BaseEstimator):
@@ -287,55 +294,23 @@ class CarbonPoolEstimator(BaseEstimator):
 
         # Step 4: Calculate variance using ratio-of-means
         if group_cols:
-            variance_results = []
-
-            for group_vals in results.iter_rows():
-                group_filter = pl.lit(True)
-                group_dict = {}
-
-                for i, col in enumerate(group_cols):
-                    if col in plot_data.columns:
-                        group_dict[col] = group_vals[results.columns.index(col)]
-                        group_filter = group_filter & (
-                            pl.col(col) == group_vals[results.columns.index(col)]
-                        )
-
-                group_plot_data = plot_data.filter(group_filter)
-
-                all_plots_group = all_plots.join(
-                    group_plot_data.select(["PLT_CN", "y_carb_i", "x_i"]),
-                    on="PLT_CN",
-                    how="left",
-                ).with_columns(
-                    [
-                        pl.col("y_carb_i").fill_null(0.0),
-                        pl.col("x_i").fill_null(0.0),
-                    ]
-                )
-
-                if len(all_plots_group) > 0:
-                    ratio_stats = calculate_ratio_of_means_variance(
-                        all_plots_group, "y_carb_i", "x_i"
-                    )
-                    variance_results.append(
-                        {
-                            **group_dict,
-                            "CARBON_ACRE_SE": ratio_stats["se_ratio"],
-                            "CARBON_TOTAL_SE": ratio_stats["se_total"],
-                        }
-                    )
-                else:
-                    variance_results.append(
-                        {
-                            **group_dict,
-                            "CARBON_ACRE_SE": 0.0,
-                            "CARBON_TOTAL_SE": 0.0,
-                        }
-                    )
-
-            if variance_results:
-                var_df = pl.DataFrame(variance_results)
-                results = results.join(var_df, on=group_cols, how="left")
+            join_cols = [
+                c for c in group_cols if c in plot_data.columns and c in results.columns
+            ]
+            var_df = calculate_grouped_ratio_of_means_variance(
+                plot_data, all_plots, join_cols, ["y_carb_i"], "x_i"
+            ).select(
+                join_cols
+                + [
+                    pl.col("y_carb_i_se_ratio").alias("CARBON_ACRE_SE"),
+                    pl.col("y_carb_i_se_total").alias("CARBON_TOTAL_SE"),
+                ]
+            )
+            var_df = align_join_key_dtypes(results, var_df, join_cols)
+            results = join_on_groups(results, var_df, join_cols).with_columns(
+                pl.col("CARBON_ACRE_SE").fill_null(0.0),
+                pl.col("CARBON_TOTAL_SE").fill_null(0.0),
+            )
         else:
             # No grouping, calculate overall variance with ALL plots
             all_plots_with_values = all_plots.join(
@@ -410,6 +385,7 @@ def carbon_pool(
     totals: bool = True,
     variance: bool = False,
     most_recent: bool = False,
+    grouping_sets: Sequence[str | list[str] | None] | None = None,
 ) -> pl.DataFrame:
     """
     Estimate carbon stocks using FIA's pre-calculated carbon columns.
@@ -447,6 +423,13 @@ def carbon_pool(
         If True, calculate variance and standard error estimates.
     most_recent : bool, default False
         If True, filter to most recent evaluation.
+    grouping_sets : list, optional
+        Several groupings to estimate in one pass over the data. Each entry
+        is a column name, a list of column names, or None for the ungrouped
+        total (e.g. ``[None, "OWNGRPCD", ["FORTYPCD", "OWNGRPCD"]]``).
+        Cannot be combined with ``grp_by``. Results for all sets are stacked
+        in one frame with a GROUPING_SET column holding the set's index;
+        grouping columns a set does not use are null.
 
     Returns
     -------
@@ -486,6 +469,7 @@ def carbon_pool(
     from ...validation import (
         validate_boolean,
         validate_domain_expression,
+        validate_grouping_sets,
         validate_grp_by,
         validate_land_type,
         validate_tree_type,
@@ -510,6 +494,7 @@ def carbon_pool(
     totals = validate_boolean(totals, "totals")
     variance = validate_boolean(variance, "variance")
     most_recent = validate_boolean(most_recent, "most_recent")
+    grouping_sets = validate_grouping_sets(grouping_sets, grp_by)
 
     # Create config
     config = {
@@ -524,6 +509,7 @@ def carbon_pool(
         "totals": totals,
         "variance": variance,
         "most_recent": most_recent,
+        "grouping_sets": grouping_sets,
     }
 
     # Create and run estimator
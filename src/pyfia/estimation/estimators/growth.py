@@ -18,6 +18,7 @@ logger = logging.getLogger(__name__)
 from ...core import FIA
 from ...filtering.utils import create_size_class_expr
 from ..base import AggregationResult
+from ..codes import component_starts_with, encode_code_columns, uses_compact_codes
 from ..constants import LBS_TO_SHORT_TONS
 from ..grm_base import GRMBaseEstimator
 
@@ -48,13 +49,8 @@ class GrowthEstimator(GRMBaseEstimator):
         Growth requires complex join pattern with BEGINEND cross-join.
         Cannot use the simple GRM loading pattern.
         """
-        from ..grm import load_grm_begin, load_grm_component, load_grm_midpt
-
         measure = self.config.get("measure", "volume")
 
-        # Resolve GRM column names
-        grm_cols = self._resolve_grm_columns()
-
         # Load TREE table first - this is our anchor
         if "TREE" not in self.db.tables:
             self.db.load_table("TREE")
@@ -95,46 +91,20 @@ class GrowthEstimator(GRMBaseEstimator):
             data = data.with_columns(pl.col(tree_vol_col).cast(pl.Float64))
             data = data.rename({tree_vol_col: f"TREE_{tree_vol_col}"})
 
-        # Load and join GRM_COMPONENT
-        grm_component = load_grm_component(
-            self.db,
-            grm_cols,
-            include_dia_end=True,
-        )
+        # Join the component, midpoint and beginning rows of each tree from
+        # the shared GRM fact frame
+        grm_facts = self._load_grm_facts().drop("HAS_MIDPT")
+        if measure in ("volume", "biomass"):
+            vol_col = "VOLCFNET" if measure == "volume" else "DRYBIO_AG"
+            grm_facts = grm_facts.rename({vol_col: f"MIDPT_{vol_col}"})
 
         data = data.join(
-            grm_component,
+            grm_facts,
             left_on="CN",
             right_on="TRE_CN",
             how="inner",
         )
 
-        # Load and join TREE_GRM_MIDPT
-        if measure == "volume":
-            midpt_cols = ["VOLCFNET"]
-        elif measure == "biomass":
-            midpt_cols = ["DRYBIO_AG"]
-        else:
-            midpt_cols = None
-
-        grm_midpt = load_grm_midpt(
-            self.db, measure=measure, include_additional_cols=midpt_cols
-        )
-
-        if measure in ("volume", "biomass"):
-            vol_col = "VOLCFNET" if measure == "volume" else "DRYBIO_AG"
-            grm_midpt = grm_midpt.rename({vol_col: f"MIDPT_{vol_col}"})
-
-        data = data.join(grm_midpt, left_on="CN", right_on="TRE_CN", how="left")
-
-        # Load and join TREE_GRM_BEGIN
-        grm_begin = load_grm_begin(self.db, measure=measure)
-        if measure in ("volume", "biomass"):
-            vol_col = "VOLCFNET" if measure == "volume" else "DRYBIO_AG"
-            grm_begin = grm_begin.rename({vol_col: f"BEGIN_{vol_col}"})
-
-        data = data.join(grm_begin, left_on="CN", right_on="TRE_CN", how="left")
-
         # Join PTREE for fallback
         if measure in ("volume", "biomass") and tree_vol_col is not None:
             ptree = (
@@ -189,33 +159,21 @@ class GrowthEstimator(GRMBaseEstimator):
             ]
         )
 
+        if uses_compact_codes(self.db):
+            plot = encode_code_columns(plot)
+
         data = data.join(plot, left_on="PLT_CN", right_on="CN", how="inner")
 
-        # Join COND - check for required columns and reload if necessary
+        # Join COND, reusing a cached projection with the required columns
         cond_cols = self.get_cond_columns()
-        if "COND" in self.db.tables:
-            cached = self.db.tables["COND"]
-            cached_cols = set(
-                cached.collect_schema().names()
-                if isinstance(cached, pl.LazyFrame)
-                else cached.columns
-            )
-            required_cols = set(cond_cols)
-            if not required_cols.issubset(cached_cols):
-                # Reload with all required columns
-                del self.db.tables["COND"]
-
-        if "COND" not in self.db.tables:
-            self.db.load_table("COND", columns=cond_cols)
-
-        cond = self.db.tables["COND"]
-        if not isinstance(cond, pl.LazyFrame):
-            cond = cond.lazy()
+        cond = self.db.load_table("COND", columns=cond_cols)
 
         # Select only the columns we need
         available = cond.collect_schema().names()
         select_cols = [c for c in cond_cols if c in available]
         cond = cond.select(select_cols)
+        if uses_compact_codes(self.db):
+            cond = encode_code_columns(cond)
 
         data = data.join(
             cond,
@@ -334,18 +292,20 @@ class GrowthEstimator(GRMBaseEstimator):
             )
             return data
 
+        compact = uses_compact_codes(self.db)
+
         # ONEORTWO = 2: Add ending volumes
         # MORTALITY gets 0 for ending volumes - they died
         ending_volume = (
             pl.when(
                 (pl.col("COMPONENT") == "SURVIVOR")
                 | (pl.col("COMPONENT") == "INGROWTH")
-                | (pl.col("COMPONENT").str.starts_with("REVERSION"))
+                | component_starts_with("REVERSION", compact)
             )
             .then(pl.col(tree_col).fill_null(0) / pl.col("REMPER").fill_null(5.0))
             .when(
-                (pl.col("COMPONENT").str.starts_with("CUT"))
-                | (pl.col("COMPONENT").str.starts_with("DIVERSION"))
+                component_starts_with("CUT", compact)
+                | component_starts_with("DIVERSION", compact)
             )
             .then(pl.col(midpt_col).fill_null(0) / pl.col("REMPER").fill_null(5.0))
             .otherwise(0.0)
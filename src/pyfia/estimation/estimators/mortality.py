@@ -13,6 +13,7 @@ import polars as pl
 
 from ...core import FIA
 from ..base import AggregationResult
+from ..codes import component_starts_with, encode_code_columns, uses_compact_codes
 from ..constants import BASAL_AREA_FACTOR, LBS_TO_SHORT_TONS
 from ..grm_base import GRMBaseEstimator
 
@@ -32,7 +33,7 @@ class MortalityEstimator(GRMBaseEstimator):
 
     def get_component_filter(self) -> pl.Expr | None:
         """Filter to mortality components only."""
-        return pl.col("COMPONENT").str.starts_with("MORTALITY")
+        return component_starts_with("MORTALITY", uses_compact_codes(self.db))
 
     def load_data(self) -> pl.LazyFrame | None:
         """Load GRM data for mortality estimation."""
@@ -69,6 +70,8 @@ class MortalityEstimator(GRMBaseEstimator):
                     plot_cols.append(col)
 
         plot = plot.select(plot_cols)
+        if uses_compact_codes(self.db):
+            plot = encode_code_columns(plot)
         data = data.join(plot, left_on="PLT_CN", right_on="CN", how="left")
 
         return data
@@ -18,18 +18,23 @@ FIA GRM methodology documentation
 
 from __future__ import annotations
 
-from typing import Literal
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Literal
 
 import polars as pl
 
 from ...core import FIA
+from ...downloader.lineage import plot_lineage_table
 from ...validation import (
     validate_boolean,
     validate_domain_expression,
     validate_land_type,
 )
 from ..aggregation import apply_two_stage_aggregation
+from ..columns import columns_in_table
 from ..grm import (
+    GRMColumns,
     apply_grm_adjustment,
     resolve_grm_columns,
 )
@@ -129,6 +134,18 @@ class PanelBuilder:
         "STATUSCD",
     ]
 
+    # TREE_GRM_MIDPT columns for tree-level panels, when present
+    GRM_MIDPT_COLUMNS = [
+        "TRE_CN",
+        "DIA",
+        "SPCD",
+        "STATUSCD",
+        "VOLCFNET",
+        "DRYBIO_AG",
+        "DRYBIO_BOLE",
+        "SPGRPCD",
+    ]
+
     # Treatment codes indicating harvest (used for condition-level panels only)
     HARVEST_TRTCD = {10, 20}  # 10=Cutting, 20=Site preparation
 
@@ -171,15 +188,12 @@ class PanelBuilder:
 
     def _build_condition_panel(self) -> pl.DataFrame:
         """Build condition-level remeasurement panel."""
-        # Load required tables
-        self._ensure_tables_loaded(["PLOT", "COND"])
-
-        # For chain expansion, load ALL plots (not just current EVALID)
-        # This captures all measurement pairs in the database
+        # For chain expansion, use ALL remeasured plots (not just current
+        # EVALID). This captures all measurement pairs in the database
         expand_chains = self.config.get("expand_chains", True)
 
         if expand_chains:
-            # Load full PLOT table without EVALID filter
+            # Load the remeasured PLOT rows without EVALID filter
             # Include location data (LAT, LON, ELEV) for spatial analysis
             plot_cols_to_load = [
                 "CN",
@@ -190,22 +204,33 @@ class PanelBuilder:
                 "REMPER",
                 "CYCLE",
             ] + self.DEFAULT_PLOT_COLUMNS
+            remeasured = self._remeasured_plots_query("CN")
             plot = self.db._reader.read_table(
                 "PLOT",
-                columns=plot_cols_to_load,
+                columns=columns_in_table(self.db, "PLOT", plot_cols_to_load),
+                where=f"CN IN ({remeasured})",
                 lazy=True,
             )
+
+            # One COND read serves both time points: the remeasured (t2)
+            # plots and the previous (t1) plots they reference
+            cond = self.db._reader.read_table(
+                "COND",
+                columns=columns_in_table(
+                    self.db, "COND", self._get_condition_columns()
+                ),
+                where=(
+                    f"PLT_CN IN ({remeasured}) OR PLT_CN IN "
+                    f"({self._remeasured_plots_query('PREV_PLT_CN')})"
+                ),
+                lazy=False,
+            ).lazy()
         else:
             # Use EVALID-filtered plots (most recent evaluation only)
+            self._ensure_tables_loaded(["PLOT", "COND"])
             plot = self.db.tables["PLOT"]
             if not isinstance(plot, pl.LazyFrame):
                 plot = plot.lazy()
-
-        # Load COND table (also full table for chain expansion)
-        if expand_chains:
-            cond_cols = self._get_condition_columns()
-            cond = self.db._reader.read_table("COND", columns=cond_cols, lazy=True)
-        else:
             cond = self.db.tables["COND"]
             if not isinstance(cond, pl.LazyFrame):
                 cond = cond.lazy()
@@ -274,8 +299,11 @@ class PanelBuilder:
                 t2_rename[col] = f"t2_{col}"
         data = data.rename(t2_rename)
 
-        # Load previous conditions (t1) - need full table without EVALID filter
-        cond_prev = self.db._reader.read_table("COND", columns=cond_cols, lazy=True)
+        # Previous conditions (t1), which are outside the EVALID filter
+        if expand_chains:
+            cond_prev = cond.select(cond_cols)
+        else:
+            cond_prev = self._read_previous_conditions(cond_cols)
 
         # Rename t1 columns with prefix
         t1_rename = {"PLT_CN": "t1_PLT_CN", "CN": "t1_COND_CN", "CONDID": "t1_CONDID"}
@@ -358,79 +386,136 @@ class PanelBuilder:
             required_tables.extend(["POP_STRATUM", "POP_PLOT_STRATUM_ASSGN"])
         self._ensure_tables_loaded(required_tables)
 
-        # Resolve GRM column names based on tree_type and land_type
-        tree_type = self.config.get("tree_type", "gs")
-        land_type = self.config.get("land_type", "forest")
-
-        # Default to "gs" for GRM (more restrictive, matches removals behavior)
-        if tree_type == "all":
-            tree_type = "gs"
-        elif tree_type == "live":
-            tree_type = "al"  # All live = AL in GRM terminology
-
-        grm_cols = resolve_grm_columns("removals", tree_type, land_type)
-
-        # Load TREE_GRM_COMPONENT
         grm_component = self.db.tables["TREE_GRM_COMPONENT"]
         if not isinstance(grm_component, pl.LazyFrame):
             grm_component = grm_component.lazy()
+        grm_midpt = self.db.tables["TREE_GRM_MIDPT"]
+        if not isinstance(grm_midpt, pl.LazyFrame):
+            grm_midpt = grm_midpt.lazy()
 
-        # Select columns from GRM_COMPONENT
-        component_cols = [
+        data = self._tree_panel_data(grm_component, grm_midpt, self._tree_panel_plots())
+
+        # Apply expansion if requested
+        if expand:
+            return self._apply_expansion(data)
+
+        # Clean up and format output (non-expanded)
+        result = data.collect()
+        result = self._format_tree_output(result)
+
+        return result
+
+    def iter_chunks(self, plots_per_chunk: int | None = None) -> Iterator[pl.DataFrame]:
+        """
+        Build the remeasurement panel a chunk of plots at a time.
+
+        Tree-level panels read TREE_GRM_COMPONENT and TREE_GRM_MIDPT for one
+        chunk of remeasured plots at a time and run each chunk through the
+        same joins, fate classification and filters as :meth:`build`, so
+        memory is bounded by the chunk rather than the whole panel. The
+        concatenated chunks hold the same rows as :meth:`build`.
+        Condition-level panels have one row per condition and are yielded
+        as a single chunk.
+
+        Parameters
+        ----------
+        plots_per_chunk : int, optional
+            Number of t2 plots per chunk. Defaults to ``settings.chunk_size``.
+
+        Yields
+        ------
+        pl.DataFrame
+            Non-empty panel chunks.
+
+        Raises
+        ------
+        ValueError
+            If the panel is expanded (``expand=True``), since expanded
+            estimates aggregate over every plot of the evaluation.
+        """
+        if self.config.get("expand", False):
+            raise ValueError("Expanded panels cannot be built in chunks")
+        if self.level != "tree":
+            result = self.build()
+            if not result.is_empty():
+                yield result
+            return
+
+        if plots_per_chunk is None:
+            from ...core.settings import settings
+
+            plots_per_chunk = settings.chunk_size
+        if plots_per_chunk < 1:
+            raise ValueError(f"plots_per_chunk must be positive, got {plots_per_chunk}")
+
+        self._ensure_tables_loaded(["PLOT"])
+        plots = self._tree_panel_plots().collect()
+
+        component_cols = columns_in_table(
+            self.db, "TREE_GRM_COMPONENT", self._grm_component_candidates()
+        )
+        midpt_cols = columns_in_table(self.db, "TREE_GRM_MIDPT", self.GRM_MIDPT_COLUMNS)
+        midpt_has_plt_cn = columns_in_table(self.db, "TREE_GRM_MIDPT", ["PLT_CN"])
+
+        reader = self.db._reader
+        for offset in range(0, plots.height, plots_per_chunk):
+            chunk = plots.slice(offset, plots_per_chunk)
+            plot_filter = reader.plot_filter_clause(
+                "TREE_GRM_COMPONENT", chunk["CN"].to_list()
+            )
+            grm_component = reader.read_table(
+                "TREE_GRM_COMPONENT",
+                columns=component_cols,
+                where=plot_filter,
+                lazy=False,
+            )
+            # TREE_GRM_MIDPT is usually keyed by TRE_CN alone
+            midpt_filter = (
+                plot_filter
+                if midpt_has_plt_cn
+                else "TRE_CN IN (SELECT TRE_CN FROM TREE_GRM_COMPONENT "
+                f"WHERE {plot_filter})"
+            )
+            grm_midpt = reader.read_table(
+                "TREE_GRM_MIDPT", columns=midpt_cols, where=midpt_filter, lazy=False
+            )
+
+            data = self._tree_panel_data(
+                grm_component.lazy(), grm_midpt.lazy(), chunk.lazy()
+            )
+            result = self._format_tree_output(data.collect())
+            if not result.is_empty():
+                yield result
+
+    def _grm_component_candidates(self) -> list[str]:
+        """TREE_GRM_COMPONENT columns a tree panel reads, if present."""
+        grm_cols = self._tree_panel_grm_columns()
+        return [
             "TRE_CN",
             "PLT_CN",
             "DIA_BEGIN",
             "DIA_MIDPT",
             "DIA_END",
+            grm_cols.component,
+            grm_cols.tpa,
+            grm_cols.subptyp,
         ]
 
-        # Add the resolved component and TPA columns
-        grm_schema = grm_component.collect_schema().names()
-        if grm_cols.component in grm_schema:
-            component_cols.append(grm_cols.component)
-        if grm_cols.tpa in grm_schema:
-            component_cols.append(grm_cols.tpa)
-        if grm_cols.subptyp in grm_schema:
-            component_cols.append(grm_cols.subptyp)
-
-        # Filter to valid columns
-        component_cols = [c for c in component_cols if c in grm_schema]
-        grm_data = grm_component.select(component_cols)
-
-        # Rename component column to standard COMPONENT
-        if grm_cols.component in grm_data.collect_schema().names():
-            grm_data = grm_data.rename({grm_cols.component: "COMPONENT"})
-        if grm_cols.tpa in grm_data.collect_schema().names():
-            grm_data = grm_data.rename({grm_cols.tpa: "TPA_UNADJ"})
-        if grm_cols.subptyp in grm_data.collect_schema().names():
-            grm_data = grm_data.rename({grm_cols.subptyp: "SUBPTYP_GRM"})
-
-        # Load TREE_GRM_MIDPT for additional tree attributes
-        grm_midpt = self.db.tables["TREE_GRM_MIDPT"]
-        if not isinstance(grm_midpt, pl.LazyFrame):
-            grm_midpt = grm_midpt.lazy()
-
-        midpt_cols = ["TRE_CN", "DIA", "SPCD", "STATUSCD", "VOLCFNET"]
-        midpt_schema = grm_midpt.collect_schema().names()
-
-        # Add biomass columns if available
-        for col in ["DRYBIO_AG", "DRYBIO_BOLE", "SPGRPCD"]:
-            if col in midpt_schema:
-                midpt_cols.append(col)
+    def _tree_panel_grm_columns(self) -> GRMColumns:
+        """Resolve GRM column names based on tree_type and land_type."""
+        tree_type = self.config.get("tree_type", "gs")
+        land_type = self.config.get("land_type", "forest")
 
-        midpt_cols = [c for c in midpt_cols if c in midpt_schema]
-        grm_midpt = grm_midpt.select(midpt_cols)
+        # Default to "gs" for GRM (more restrictive, matches removals behavior)
+        if tree_type == "all":
+            tree_type = "gs"
+        elif tree_type == "live":
+            tree_type = "al"  # All live = AL in GRM terminology
 
-        # Join GRM_COMPONENT with GRM_MIDPT (inner join to match removals()
-        # behavior — trees without MIDPT data have no volume and should be
-        # excluded from both TPA and volume estimates for consistency)
-        data = grm_data.join(
-            grm_midpt,
-            on="TRE_CN",
-            how="inner",
-        )
+        return resolve_grm_columns("removals", tree_type, land_type)
 
-        # Load PLOT for remeasurement metadata
+    def _tree_panel_plots(self) -> pl.LazyFrame:
+        """Remeasured PLOT rows passing the REMPER and inventory year filters."""
         plot = self.db.tables["PLOT"]
         if not isinstance(plot, pl.LazyFrame):
             plot = plot.lazy()
@@ -463,6 +548,48 @@ class PanelBuilder:
         if min_invyr is not None and min_invyr > 0:
             plot = plot.filter(pl.col("INVYR") >= min_invyr)
 
+        return plot
+
+    def _tree_panel_data(
+        self,
+        grm_component: pl.LazyFrame,
+        grm_midpt: pl.LazyFrame,
+        plot: pl.LazyFrame,
+    ) -> pl.LazyFrame:
+        """Join GRM trees to their plots and classify tree fate."""
+        expand = self.config.get("expand", False)
+        grm_cols = self._tree_panel_grm_columns()
+
+        # Select columns from GRM_COMPONENT, including the resolved component
+        # and TPA columns
+        grm_schema = grm_component.collect_schema().names()
+        component_cols = [
+            c for c in self._grm_component_candidates() if c in grm_schema
+        ]
+        grm_data = grm_component.select(component_cols)
+
+        # Rename component column to standard COMPONENT
+        if grm_cols.component in grm_data.collect_schema().names():
+            grm_data = grm_data.rename({grm_cols.component: "COMPONENT"})
+        if grm_cols.tpa in grm_data.collect_schema().names():
+            grm_data = grm_data.rename({grm_cols.tpa: "TPA_UNADJ"})
+        if grm_cols.subptyp in grm_data.collect_schema().names():
+            grm_data = grm_data.rename({grm_cols.subptyp: "SUBPTYP_GRM"})
+
+        # Select additional tree attributes from TREE_GRM_MIDPT
+        midpt_schema = grm_midpt.collect_schema().names()
+        midpt_cols = [c for c in self.GRM_MIDPT_COLUMNS if c in midpt_schema]
+        grm_midpt = grm_midpt.select(midpt_cols)
+
+        # Join GRM_COMPONENT with GRM_MIDPT (inner join to match removals()
+        # behavior — trees without MIDPT data have no volume and should be
+        # excluded from both TPA and volume estimates for consistency)
+        data = grm_data.join(
+            grm_midpt,
+            on="TRE_CN",
+            how="inner",
+        )
+
         # Join with PLOT data
         data = data.join(
             plot,
@@ -513,15 +640,40 @@ class PanelBuilder:
         if self.config.get("harvest_only", False):
             data = data.filter(pl.col("TREE_FATE").is_in(["cut", "diversion"]))
 
-        # Apply expansion if requested
-        if expand:
-            return self._apply_expansion(data)
+        return data
 
-        # Clean up and format output (non-expanded)
-        result = data.collect()
-        result = self._format_tree_output(result)
+    def _remeasured_plots_query(self, column: str) -> str:
+        """
+        SELECT of a column of the remeasured plots passing the REMPER filters.
 
-        return result
+        Reads the plot-lineage index when the database has one (see
+        :func:`pyfia.build_plot_lineage`), which is far narrower than PLOT.
+        """
+        source = plot_lineage_table(self.db) or "PLOT"
+        conditions = ["PREV_PLT_CN IS NOT NULL", "REMPER > 0"]
+        min_remper = self.config.get("min_remper", 0)
+        max_remper = self.config.get("max_remper")
+        if min_remper > 0:
+            conditions.append(f"REMPER >= {float(min_remper)}")
+        if max_remper is not None:
+            conditions.append(f"REMPER <= {float(max_remper)}")
+        min_invyr = self.config.get("min_invyr", 2000)
+        if min_invyr is not None and min_invyr > 0:
+            conditions.append(f"INVYR >= {int(min_invyr)}")
+        return f"SELECT {column} FROM {source} WHERE {' AND '.join(conditions)}"
+
+    def _read_previous_conditions(self, cond_cols: list[str]) -> pl.LazyFrame:
+        """Read the conditions of the plots previous to the EVALID's plots."""
+        plot_cns = self.db._get_valid_plot_cns()
+        where = None
+        if plot_cns:
+            plot_filter = self.db._reader.plot_filter_clause(
+                "PLOT", plot_cns, column="CN"
+            )
+            where = f"PLT_CN IN (SELECT PREV_PLT_CN FROM PLOT WHERE {plot_filter})"
+        return self.db._reader.read_table(
+            "COND", columns=cond_cols, where=where, lazy=True
+        )
 
     def _ensure_tables_loaded(self, tables: list[str]) -> None:
         """Ensure required tables are loaded."""
@@ -1150,6 +1302,7 @@ def panel(
 
     See Also
     --------
+    write_panel : Write a panel to Parquet a chunk of plots at a time
     removals : Estimate harvest removals (uses same GRM methodology)
     mortality : Estimate tree mortality
     growth : Estimate forest growth
@@ -1222,6 +1375,128 @@ def panel(
 
     FIA Database User Guide, TREE_GRM_COMPONENT table documentation.
     """
+    config = _panel_config(
+        level=level,
+        columns=columns,
+        land_type=land_type,
+        tree_type=tree_type,
+        tree_domain=tree_domain,
+        area_domain=area_domain,
+        expand_chains=expand_chains,
+        min_remper=min_remper,
+        max_remper=max_remper,
+        min_invyr=min_invyr,
+        harvest_only=harvest_only,
+        expand=expand,
+        measure=measure,
+        grp_by=grp_by,
+        by_fate=by_fate,
+    )
+
+    # Handle database connection - convert path string to FIA instance
+    if isinstance(db, str):
+        db = FIA(db)
+
+    builder = PanelBuilder(db, config)
+    return builder.build()
+
+
+def write_panel(
+    db: str | FIA,
+    output: str | Path,
+    partition_by: str | list[str] | None = None,
+    plots_per_chunk: int | None = None,
+    **kwargs: Any,
+) -> pl.LazyFrame:
+    """
+    Write a t1/t2 remeasurement panel to Parquet with bounded memory.
+
+    Tree-level panels are built a chunk of plots at a time (see
+    :meth:`PanelBuilder.iter_chunks`), and each chunk is written before the
+    next is read, so memory is bounded by the chunk rather than the whole
+    panel. The written rows are those :func:`panel` returns for the same
+    arguments.
+
+    Parameters
+    ----------
+    db : str | FIA
+        Database connection or path to FIA database.
+    output : str or Path
+        Directory to write the Parquet files to. It must be empty or not
+        exist.
+    partition_by : str or list of str, optional
+        Columns to Hive-partition the output by, e.g. 'STATECD'. Each
+        partition is written to a ``COLUMN=value`` subdirectory, and the
+        partition columns are kept in the files.
+    plots_per_chunk : int, optional
+        Number of plots per chunk. Defaults to ``settings.chunk_size``.
+    **kwargs
+        Panel options passed to :func:`panel` (``level``, ``land_type``,
+        ``tree_type``, ``min_remper``, ...). ``expand=True`` is not
+        supported, since expanded estimates aggregate over every plot.
+
+    Returns
+    -------
+    pl.LazyFrame
+        Scan of the written Parquet dataset.
+
+    Raises
+    ------
+    FileExistsError
+        If ``output`` exists and is not an empty directory.
+    ValueError
+        If a panel option is invalid, ``expand=True`` is given, or a
+        ``partition_by`` column is not in the panel.
+
+    Examples
+    --------
+    Write a regional tree panel, partitioned by state:
+
+    >>> from pyfia import FIA, write_panel
+    >>> with FIA("path/to/db.duckdb") as db:
+    ...     trees = write_panel(
+    ...         db, "panels/trees", partition_by="STATECD", level="tree"
+    ...     )
+    >>> trees.filter(pl.col("STATECD") == 37).collect()
+    """
+    config = _panel_config(**kwargs)
+    if config["expand"]:
+        raise ValueError("write_panel() does not support expand=True")
+    if isinstance(partition_by, str):
+        partition_by = [partition_by]
+    output = Path(output)
+    if output.exists() and (not output.is_dir() or any(output.iterdir())):
+        raise FileExistsError(f"{output} exists and is not an empty directory")
+    if plots_per_chunk is not None and plots_per_chunk < 1:
+        raise ValueError(f"plots_per_chunk must be positive, got {plots_per_chunk}")
+
+    if isinstance(db, str):
+        db = FIA(db)
+
+    builder = PanelBuilder(db, config)
+    return _write_panel_parquet(
+        builder.iter_chunks(plots_per_chunk), output, partition_by or []
+    )
+
+
+def _panel_config(
+    level: Literal["condition", "tree"] = "condition",
+    columns: list[str] | None = None,
+    land_type: str = "forest",
+    tree_type: str = "gs",
+    tree_domain: str | None = None,
+    area_domain: str | None = None,
+    expand_chains: bool = True,
+    min_remper: float = 0,
+    max_remper: float | None = None,
+    min_invyr: int = 2000,
+    harvest_only: bool = False,
+    expand: bool = False,
+    measure: Literal["tpa", "volume"] = "tpa",
+    grp_by: list[str] | None = None,
+    by_fate: bool = False,
+) -> dict[str, Any]:
+    """Validate :func:`panel` options and build the PanelBuilder config."""
     # Validate inputs
     if level not in ("condition", "tree"):
         raise ValueError(f"Invalid level '{level}'. Must be 'condition' or 'tree'")
@@ -1255,10 +1530,6 @@ def panel(
     if min_invyr is not None and min_invyr < 0:
         raise ValueError(f"min_invyr must be non-negative, got {min_invyr}")
 
-    # Handle database connection - convert path string to FIA instance
-    if isinstance(db, str):
-        db = FIA(db)
-
     # Build config
     config = {
         "level": level,
@@ -1278,5 +1549,38 @@ def panel(
         "by_fate": by_fate,
     }
 
-    builder = PanelBuilder(db, config)
-    return builder.build()
+    return config
+
+
+def _write_panel_parquet(
+    chunks: Iterator[pl.DataFrame], output: Path, partition_by: list[str]
+) -> pl.LazyFrame:
+    """
+    Write panel chunks as (Hive-partitioned) Parquet files under ``output``.
+
+    Each chunk is written as one ``part-NNNNN.parquet`` file per partition,
+    keeping the partition columns in the files so their types survive.
+    Returns a LazyFrame scanning the written dataset.
+    """
+    output.mkdir(parents=True, exist_ok=True)
+    for index, chunk in enumerate(chunks):
+        name = f"part-{index:05d}.parquet"
+        if not partition_by:
+            chunk.write_parquet(output / name)
+            continue
+        missing = [c for c in partition_by if c not in chunk.columns]
+        if missing:
+            raise ValueError(f"partition_by columns not in panel: {missing}")
+        for key, part in chunk.partition_by(partition_by, as_dict=True).items():
+            directory = output.joinpath(
+                *(
+                    f"{col}={'__HIVE_DEFAULT_PARTITION__' if v is None else v}"
+                    for col, v in zip(partition_by, key)
+                )
+            )
+            directory.mkdir(parents=True, exist_ok=True)
+            part.write_parquet(directory / name)
+
+    if not any(output.rglob("*.parquet")):
+        return pl.LazyFrame()
+    return pl.scan_parquet(output, hive_partitioning=bool(partition_by))
@@ -8,11 +8,17 @@ without unnecessary abstractions.
 from __future__ import annotations
 
 import math
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 import polars as pl
 
-from ...validation import validate_boolean, validate_tree_type
+from ...validation import (
+    validate_boolean,
+    validate_engine,
+    validate_grouping_sets,
+    validate_tree_type,
+)
 from ..base import AggregationResult, BaseEstimator
 from ..columns import get_cond_columns as _get_cond_columns
 from ..columns import get_tree_columns as _get_tree_columns
@@ -158,14 +164,6 @@ class TPAEstimator(BaseEstimator):
         # Setup grouping columns - need to include condition-level grouping
         group_cols = self._setup_grouping()
 
-        # Add species to grouping if requested
-        if self.config.get("by_species", False) and "SPCD" not in group_cols:
-            group_cols.append("SPCD")
-
-        # Add size class to grouping if requested
-        if self.config.get("by_size_class", False) and "SIZE_CLASS" not in group_cols:
-            group_cols.append("SIZE_CLASS")
-
         # Preserve plot-tree level data for variance calculation
         plot_tree_data, data_with_strat = self._preserve_plot_tree_data(
             data_with_strat,
@@ -201,6 +199,47 @@ class TPAEstimator(BaseEstimator):
             group_cols=group_cols,
         )
 
+    def _setup_grouping(self) -> list[str]:
+        """Grouping columns, including SPCD and SIZE_CLASS when requested."""
+        group_cols = super()._setup_grouping()
+
+        # Add species to grouping if requested
+        if self.config.get("by_species", False) and "SPCD" not in group_cols:
+            group_cols.append("SPCD")
+
+        # Add size class to grouping if requested
+        if self.config.get("by_size_class", False) and "SIZE_CLASS" not in group_cols:
+            group_cols.append("SIZE_CLASS")
+
+        return group_cols
+
+    def _sql_tree_values(self) -> list[str]:
+        """TPA and BAA as SQL for engine='sql'."""
+        return [
+            "CAST(TPA_UNADJ AS DOUBLE)",
+            f"{math.pi!r} * POWER(CAST(DIA AS DOUBLE) / 24.0, 2)"
+            " * CAST(TPA_UNADJ AS DOUBLE)",
+        ]
+
+    def _variance_metric_configs(self) -> list[dict[str, str]]:
+        """TPA metric configurations for the shared variance path."""
+        return [
+            {
+                "adjusted_col": "TPA_ADJ",
+                "acre_se_col": "TPA_SE",
+                "total_se_col": "TPA_TOTAL_SE",
+                "acre_col": "TPA",
+                "total_col": "TPA_TOTAL",
+            },
+            {
+                "adjusted_col": "BAA_ADJ",
+                "acre_se_col": "BAA_SE",
+                "total_se_col": "BAA_TOTAL_SE",
+                "acre_col": "BAA",
+                "total_col": "BAA_TOTAL",
+            },
+        ]
+
     def calculate_variance(
         self,
         agg_result: AggregationResult,
@@ -221,21 +260,9 @@ class TPAEstimator(BaseEstimator):
         # Validate input using shared utility
         validate_aggregation_result(agg_result, "TPA")
 
-        # Use unified variance calculation method for both TPA and BAA
-        metric_configs = [
-            {
-                "adjusted_col": "TPA_ADJ",
-                "acre_se_col": "TPA_SE",
-                "total_se_col": "TPA_TOTAL_SE",
-            },
-            {
-                "adjusted_col": "BAA_ADJ",
-                "acre_se_col": "BAA_SE",
-                "total_se_col": "BAA_TOTAL_SE",
-            },
-        ]
-
-        results = self._calculate_variance_for_metrics(agg_result, metric_configs)
+        results = self._calculate_variance_for_metrics(
+            agg_result, self._variance_metric_configs()
+        )
 
         # Standard errors are always retained. Variance columns (if requested
         # via variance=True) are added uniformly by apply_variance_columns at
@@ -346,6 +373,8 @@ def tpa(
     plot_domain: str | None = None,
     totals: bool = False,
     variance: bool = False,
+    grouping_sets: Sequence[str | list[str] | None] | None = None,
+    engine: str = "polars",
 ) -> pl.DataFrame:
     """
     Estimate trees per acre (TPA) and basal area per acre (BAA) from FIA data.
@@ -440,6 +469,20 @@ def tpa(
         If True, also return variance columns (``*_VARIANCE``) alongside the
         standard errors. Standard errors (``*_SE``) are always returned;
         variance equals the standard error squared.
+    grouping_sets : list, optional
+        Several groupings to estimate in one pass over the data. Each entry
+        is a column name, a list of column names, or None for the ungrouped
+        total (e.g. ``[None, "OWNGRPCD", ["FORTYPCD", "OWNGRPCD"]]``).
+        Cannot be combined with ``grp_by``. Results for all sets are stacked
+        in one frame with a GROUPING_SET column holding the set's index;
+        grouping columns a set does not use are null.
+    engine : {'polars', 'sql'}, default 'polars'
+        Where the estimate is aggregated. 'polars' loads the tree and
+        condition rows and aggregates them in Polars. 'sql' aggregates in
+        DuckDB and fetches only per-group totals and per-stratum
+        statistics, which avoids transferring tree rows from MotherDuck.
+        Both give the same results; 'sql' does not support
+        ``grouping_sets`` or grouping by polygon attributes.
 
     Returns
     -------
@@ -658,6 +701,8 @@ def tpa(
     tree_type = validate_tree_type(tree_type)
     by_species = validate_boolean(by_species, "by_species")
     by_size_class = validate_boolean(by_size_class, "by_size_class")
+    grouping_sets = validate_grouping_sets(grouping_sets, inputs.grp_by)
+    engine = validate_engine(engine)
 
     # Ensure EVALID is set using shared utility
     # Use "VOL" for TPA/BAA estimation (EXPVOL evaluations)
@@ -675,6 +720,8 @@ def tpa(
         "plot_domain": inputs.plot_domain,
         "totals": inputs.totals,
         "variance": inputs.variance,
+        "grouping_sets": grouping_sets,
+        "engine": engine,
     }
 
     # Create and run estimator - simple and clean
@@ -18,6 +18,7 @@ from ...validation import (
     validate_land_type,
 )
 from ..base import AggregationResult, BaseEstimator
+from ..codes import decode_code_columns
 from ..columns import get_cond_columns as _get_cond_columns
 from ..columns import get_tree_columns as _get_tree_columns
 from ..utils import ensure_evalid_set, ensure_fia_instance
@@ -198,7 +199,7 @@ class TreeMetricsEstimator(BaseEstimator):
         if data is not None:
             data = self.apply_filters(data)
             data = self.calculate_values(data)
-        return self.aggregate_results(data).results
+        return decode_code_columns(self.aggregate_results(data).results)
 
 
 def tree_metrics(
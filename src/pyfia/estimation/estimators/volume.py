@@ -7,10 +7,18 @@ without unnecessary abstractions.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import polars as pl
 
 from ...core import FIA
-from ...validation import validate_boolean, validate_tree_type, validate_vol_type
+from ...validation import (
+    validate_boolean,
+    validate_engine,
+    validate_grouping_sets,
+    validate_tree_type,
+    validate_vol_type,
+)
 from ..base import AggregationResult, BaseEstimator
 from ..columns import get_cond_columns as _get_cond_columns
 from ..columns import get_tree_columns as _get_tree_columns
@@ -31,6 +39,9 @@ class VolumeEstimator(BaseEstimator):
     Estimates tree volume (cubic feet) using standard FIA methods.
     """
 
+    # N_PLOTS reports plots with non-zero volume, as EVALIDator does
+    _count_nonzero_plots = True
+
     def __init__(self, db: str | FIA, config: dict) -> None:
         """Initialize the volume estimator."""
         super().__init__(db, config)
@@ -71,25 +82,29 @@ class VolumeEstimator(BaseEstimator):
             include_prop_basis=True,  # Volume needs PROP_BASIS for area adjustment
         )
 
-    def calculate_values(self, data: pl.LazyFrame) -> pl.LazyFrame:
-        """
-        Calculate volume per acre.
-
-        Volume calculation: VOLUME * TPA_UNADJ
-        """
+    def _volume_column(self) -> str:
+        """TREE volume column for the configured vol_type."""
         vol_type = self.config.get("vol_type", "net")
 
         # Select appropriate volume column
         if vol_type == "net":
-            vol_col = "VOLCFNET"
+            return "VOLCFNET"
         elif vol_type == "gross":
-            vol_col = "VOLCFGRS"
+            return "VOLCFGRS"
         elif vol_type == "sound":
-            vol_col = "VOLCFSND"
+            return "VOLCFSND"
         elif vol_type == "sawlog":
-            vol_col = "VOLBFNET"  # Board feet net for sawlog
+            return "VOLBFNET"  # Board feet net for sawlog
         else:
-            vol_col = "VOLCFNET"  # Default to net
+            return "VOLCFNET"  # Default to net
+
+    def calculate_values(self, data: pl.LazyFrame) -> pl.LazyFrame:
+        """
+        Calculate volume per acre.
+
+        Volume calculation: VOLUME * TPA_UNADJ
+        """
+        vol_col = self._volume_column()
 
         # Calculate volume per acre
         # Volume per acre = tree volume * trees per acre
@@ -205,6 +220,24 @@ class VolumeEstimator(BaseEstimator):
             group_cols=group_cols,
         )
 
+    def _variance_metric_configs(self) -> list[dict[str, str]]:
+        """Volume metric configurations for the shared variance path."""
+        return [
+            {
+                "adjusted_col": "VOLUME_ADJ",
+                "acre_se_col": "VOLUME_ACRE_SE",
+                "total_se_col": "VOLUME_TOTAL_SE",
+                "acre_var_col": "VOLUME_ACRE_VARIANCE",
+                "total_var_col": "VOLUME_TOTAL_VARIANCE",
+                "acre_col": "VOLUME_ACRE",
+                "total_col": "VOLUME_TOTAL",
+            }
+        ]
+
+    def _sql_tree_values(self) -> list[str]:
+        """Volume per acre as SQL for engine='sql'."""
+        return [f"CAST({self._volume_column()} AS DOUBLE) * CAST(TPA_UNADJ AS DOUBLE)"]
+
     def calculate_variance(
         self,
         agg_result: AggregationResult,
@@ -224,22 +257,9 @@ class VolumeEstimator(BaseEstimator):
         # Validate input using shared utility
         validate_aggregation_result(agg_result, "Volume")
 
-        # Use unified variance calculation method
-        metric_configs = [
-            {
-                "adjusted_col": "VOLUME_ADJ",
-                "acre_se_col": "VOLUME_ACRE_SE",
-                "total_se_col": "VOLUME_TOTAL_SE",
-                "acre_var_col": "VOLUME_ACRE_VARIANCE",
-                "total_var_col": "VOLUME_TOTAL_VARIANCE",
-                "acre_col": "VOLUME_ACRE",
-                "total_col": "VOLUME_TOTAL",
-            }
-        ]
-
         return self._calculate_variance_for_metrics(
             agg_result,
-            metric_configs,
+            self._variance_metric_configs(),
             include_cv=self.config.get("include_cv", False),
         )
 
@@ -313,6 +333,8 @@ def volume(
     variance: bool = False,
     most_recent: bool = False,
     eval_type: str | None = None,
+    grouping_sets: Sequence[str | list[str] | None] | None = None,
+    engine: str = "polars",
 ) -> pl.DataFrame:
     """
     Estimate tree volume from FIA data.
@@ -427,6 +449,20 @@ def volume(
         Evaluation type to select if most_recent=True. Options:
         'ALL', 'VOL', 'GROW', 'MORT', 'REMV', 'CHANGE', 'DWM', 'INV'.
         Default is 'VOL' for volume estimation.
+    grouping_sets : list, optional
+        Several groupings to estimate in one pass over the data. Each entry
+        is a column name, a list of column names, or None for the ungrouped
+        total (e.g. ``[None, "OWNGRPCD", ["FORTYPCD", "OWNGRPCD"]]``).
+        Cannot be combined with ``grp_by``. Results for all sets are stacked
+        in one frame with a GROUPING_SET column holding the set's index;
+        grouping columns a set does not use are null.
+    engine : {'polars', 'sql'}, default 'polars'
+        Where the estimate is aggregated. 'polars' loads the tree and
+        condition rows and aggregates them in Polars. 'sql' aggregates in
+        DuckDB and fetches only per-group totals and per-stratum
+        statistics, which avoids transferring tree rows from MotherDuck.
+        Both give the same results; 'sql' does not support
+        ``grouping_sets`` or grouping by polygon attributes.
 
     Returns
     -------
@@ -626,6 +662,8 @@ def volume(
     vol_type = validate_vol_type(vol_type)
     by_species = validate_boolean(by_species, "by_species")
     by_size_class = validate_boolean(by_size_class, "by_size_class")
+    grouping_sets = validate_grouping_sets(grouping_sets, inputs.grp_by)
+    engine = validate_engine(engine)
 
     # Ensure db is a FIA instance using shared utility
     db, owns_db = ensure_fia_instance(db)
@@ -654,6 +692,8 @@ def volume(
         "totals": inputs.totals,
         "variance": inputs.variance,
         "most_recent": inputs.most_recent,
+        "grouping_sets": grouping_sets,
+        "engine": engine,
     }
 
     try:
@@ -8,11 +8,16 @@ TREE_GRM_COMPONENT, TREE_GRM_MIDPT, and TREE_GRM_BEGIN tables.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Literal
 
 import polars as pl
 
+from ..core.table_cache import TableCache
+from .codes import COMPACT_CODE_DTYPE, GRM_COMPONENT_DTYPE, uses_compact_codes
+from .columns import columns_in_table
+
 # Re-export shared variance function
 from .variance import calculate_domain_total_variance  # noqa: F401
 
@@ -22,6 +27,27 @@ TreeType = Literal["gs", "al", "sl", "live", "sawtimber"]
 LandType = Literal["forest", "timber"]
 # Valid GRM component types
 ComponentType = Literal["growth", "mortality", "removals"]
+GRM_COMPONENT_TYPES: tuple[ComponentType, ...] = ("growth", "mortality", "removals")
+
+# TPA column prefix of each component type (SUBP_{prefix}_UNADJ_{tree}_{land})
+GRM_TPA_PREFIXES: dict[ComponentType, str] = {
+    "growth": "TPAGROW",
+    "mortality": "TPAMORT",
+    "removals": "TPAREMV",
+}
+
+# TREE_GRM_MIDPT columns read for each measure
+GRM_MIDPT_MEASURE_COLUMNS = {
+    "volume": ["VOLCFNET"],
+    "sawlog": ["VOLCSNET"],
+    "biomass": ["DRYBIO_BOLE", "DRYBIO_BRANCH", "DRYBIO_AG"],
+}
+
+# TREE_GRM_BEGIN column read for each measure
+GRM_BEGIN_MEASURE_COLUMNS = {"volume": "VOLCFNET", "biomass": "DRYBIO_AG"}
+
+# Table cache name of the frames built by load_grm_facts()
+GRM_FACTS_TABLE = "GRM_FACTS"
 
 
 @dataclass
@@ -130,13 +156,7 @@ def resolve_grm_columns(
     tree_code = normalize_tree_type(tree_type)
     land_code = normalize_land_type(land_type)
 
-    # Map component type to TPA column prefix
-    tpa_prefix_map = {
-        "growth": "TPAGROW",
-        "mortality": "TPAMORT",
-        "removals": "TPAREMV",
-    }
-    tpa_prefix = tpa_prefix_map[component_type]
+    tpa_prefix = GRM_TPA_PREFIXES[component_type]
 
     return GRMColumns(
         component=f"SUBP_COMPONENT_{tree_code}_{land_code}",
@@ -147,10 +167,36 @@ def resolve_grm_columns(
     )
 
 
+def _load_grm_table(db, table_name: str, columns: list[str]) -> pl.LazyFrame:
+    """Load a projection of a GRM table, scoped to the database's EVALID.
+
+    ``db.load_table`` reads only ``columns`` and, for a table with PLT_CN,
+    semi-joins it to the EVALID's plots inside the database. A table keyed
+    only by TRE_CN is semi-joined to the EVALID's TREE_GRM_COMPONENT rows
+    instead, so neither is read in full before filtering.
+    """
+    where = None
+    plot_cns = db._get_valid_plot_cns() if getattr(db, "evalid", None) else None
+    if plot_cns:
+        schema = columns_in_table(db, table_name, ["PLT_CN", "TRE_CN"])
+        if schema == ["TRE_CN"]:
+            plot_filter = db._reader.plot_filter_clause("TREE_GRM_COMPONENT", plot_cns)
+            where = (
+                f"TRE_CN IN (SELECT TRE_CN FROM TREE_GRM_COMPONENT WHERE {plot_filter})"
+            )
+
+    try:
+        frame = db.load_table(table_name, columns=columns, where=where)
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"{table_name} table not found: {e}")
+    return frame if isinstance(frame, pl.LazyFrame) else frame.lazy()
+
+
 def load_grm_component(
     db,
     grm_columns: GRMColumns,
     include_dia_end: bool = False,
+    tpa_columns: dict[str, str] | None = None,
 ) -> pl.LazyFrame:
     """Load TREE_GRM_COMPONENT table with resolved column names.
 
@@ -162,6 +208,9 @@ def load_grm_component(
         Resolved column names from resolve_grm_columns()
     include_dia_end : bool, default False
         Whether to include DIA_END column (needed for growth)
+    tpa_columns : dict, optional
+        Further TPA columns to load, by output name (e.g.
+        ``{"TPAMORT_UNADJ": "SUBP_TPAMORT_UNADJ_GS_FOREST"}``)
 
     Returns
     -------
@@ -170,37 +219,50 @@ def load_grm_component(
         - TRE_CN, PLT_CN: Key columns
         - DIA_BEGIN, DIA_MIDPT: Diameter columns
         - DIA_END: (optional) Ending diameter
-        - COMPONENT: Component type (SURVIVOR, MORTALITY1, CUT, etc.)
+        - COMPONENT: Component type (SURVIVOR, MORTALITY1, CUT, etc.), an
+          Enum when ``db.compact_codes`` is set
         - TPA_UNADJ: Unadjusted TPA value (renamed from specific column)
         - SUBPTYP_GRM: Subplot type for adjustment factor selection
     """
-    if "TREE_GRM_COMPONENT" not in db.tables:
-        try:
-            db.load_table("TREE_GRM_COMPONENT")
-        except (KeyError, ValueError) as e:
-            raise ValueError(f"TREE_GRM_COMPONENT table not found: {e}")
-
-    grm_component = db.tables["TREE_GRM_COMPONENT"]
-    if not isinstance(grm_component, pl.LazyFrame):
-        grm_component = grm_component.lazy()
+    source_cols = [
+        "TRE_CN",
+        "PLT_CN",
+        "DIA_BEGIN",
+        "DIA_MIDPT",
+        grm_columns.component,
+        grm_columns.tpa,
+        grm_columns.subptyp,
+    ]
+    if include_dia_end:
+        source_cols.insert(4, "DIA_END")
+    tpa_columns = tpa_columns or {}
+    source_cols.extend(c for c in tpa_columns.values() if c not in source_cols)
+    grm_component = _load_grm_table(db, "TREE_GRM_COMPONENT", source_cols)
 
     # Build column selection. Numeric columns are cast to their declared types:
     # some state DuckDBs (built from CSV/older snapshots) store FIADB numeric
     # fields as VARCHAR, which breaks downstream division/comparison (#106).
     # Strict casts fail loudly naming the offending column rather than silently
     # nulling values, preserving statistical integrity.
+    component = pl.col(grm_columns.component)
+    if uses_compact_codes(db):
+        component = component.cast(GRM_COMPONENT_DTYPE)
     cols = [
         pl.col("TRE_CN"),
         pl.col("PLT_CN"),
         pl.col("DIA_BEGIN").cast(pl.Float64),
         pl.col("DIA_MIDPT").cast(pl.Float64),
-        pl.col(grm_columns.component).alias("COMPONENT"),
+        component.alias("COMPONENT"),
         pl.col(grm_columns.tpa).cast(pl.Float64).alias("TPA_UNADJ"),
         pl.col(grm_columns.subptyp).cast(pl.Int64).alias("SUBPTYP_GRM"),
     ]
 
     if include_dia_end:
         cols.insert(4, pl.col("DIA_END").cast(pl.Float64))
+    cols.extend(
+        pl.col(source).cast(pl.Float64).alias(name)
+        for name, source in tpa_columns.items()
+    )
 
     result: pl.LazyFrame = grm_component.select(cols)
     return result
@@ -225,34 +287,20 @@ def load_grm_midpt(
     Returns
     -------
     pl.LazyFrame
-        GRM midpoint data with appropriate columns for the measure type
+        GRM midpoint data with appropriate columns for the measure type.
+        SPCD is UInt16 when ``db.compact_codes`` is set.
     """
-    if "TREE_GRM_MIDPT" not in db.tables:
-        try:
-            db.load_table("TREE_GRM_MIDPT")
-        except (KeyError, ValueError) as e:
-            raise ValueError(f"TREE_GRM_MIDPT table not found: {e}")
-
-    grm_midpt = db.tables["TREE_GRM_MIDPT"]
-    if not isinstance(grm_midpt, pl.LazyFrame):
-        grm_midpt = grm_midpt.lazy()
-
     # Base columns always needed
     cols = ["TRE_CN", "DIA", "SPCD", "STATUSCD"]
 
-    # Add measure-specific columns
-    if measure == "volume":
-        cols.append("VOLCFNET")
-    elif measure == "sawlog":
-        cols.append("VOLCSNET")
-    elif measure == "biomass":
-        cols.extend(["DRYBIO_BOLE", "DRYBIO_BRANCH", "DRYBIO_AG"])
-    # count, tpa, basal_area don't need additional volume columns
+    # Add measure-specific columns; count, tpa, basal_area need none
+    cols.extend(GRM_MIDPT_MEASURE_COLUMNS.get(measure, []))
 
     # Add any additional requested columns
     if include_additional_cols:
         cols.extend([c for c in include_additional_cols if c not in cols])
 
+    grm_midpt = _load_grm_table(db, "TREE_GRM_MIDPT", cols)
     result: pl.LazyFrame = grm_midpt.select(cols)
 
     # Cast numeric columns to their declared types in case the source DuckDB
@@ -267,7 +315,8 @@ def load_grm_midpt(
     }
     int_cols = {"SPCD", "STATUSCD"}
     casts = [pl.col(c).cast(pl.Float64) for c in cols if c in float_cols]
-    casts += [pl.col(c).cast(pl.Int64) for c in cols if c in int_cols]
+    int_dtype = {"SPCD": COMPACT_CODE_DTYPE} if uses_compact_codes(db) else {}
+    casts += [pl.col(c).cast(int_dtype.get(c, pl.Int64)) for c in cols if c in int_cols]
     if casts:
         result = result.with_columns(casts)
 
@@ -277,6 +326,7 @@ def load_grm_midpt(
 def load_grm_begin(
     db,
     measure: str = "volume",
+    include_additional_cols: list[str] | None = None,
 ) -> pl.LazyFrame:
     """Load TREE_GRM_BEGIN table for beginning measurements.
 
@@ -288,42 +338,246 @@ def load_grm_begin(
         Database connection
     measure : str, default 'volume'
         What to measure: 'volume' or 'biomass'
+    include_additional_cols : list of str, optional
+        Additional value columns to include from the table
 
     Returns
     -------
     pl.LazyFrame
         GRM begin data with TRE_CN and volume/biomass columns
     """
-    if "TREE_GRM_BEGIN" not in db.tables:
-        try:
-            db.load_table("TREE_GRM_BEGIN")
-        except (KeyError, ValueError) as e:
-            raise ValueError(f"TREE_GRM_BEGIN table not found: {e}")
-
-    grm_begin = db.tables["TREE_GRM_BEGIN"]
-    if not isinstance(grm_begin, pl.LazyFrame):
-        grm_begin = grm_begin.lazy()
-
-    cols = ["TRE_CN"]
-    value_col = None
-
-    if measure == "volume":
-        value_col = "VOLCFNET"
-    elif measure == "biomass":
-        value_col = "DRYBIO_AG"
-    if value_col:
-        cols.append(value_col)
+    value_cols = []
+    if measure in GRM_BEGIN_MEASURE_COLUMNS:
+        value_cols.append(GRM_BEGIN_MEASURE_COLUMNS[measure])
+    if include_additional_cols:
+        value_cols.extend(c for c in include_additional_cols if c not in value_cols)
+    cols = ["TRE_CN", *value_cols]
 
+    grm_begin = _load_grm_table(db, "TREE_GRM_BEGIN", cols)
     result: pl.LazyFrame = grm_begin.select(cols)
 
-    # Cast the value column to numeric in case the source stored it as VARCHAR
-    # (see #106).
-    if value_col:
-        result = result.with_columns(pl.col(value_col).cast(pl.Float64))
+    # Cast the value columns to numeric in case the source stored them as
+    # VARCHAR (see #106).
+    if value_cols:
+        result = result.with_columns(pl.col(c).cast(pl.Float64) for c in value_cols)
 
     return result
 
 
+def grm_tpa_column(component_type: ComponentType) -> str:
+    """Name of a component type's TPA column in load_grm_facts() frames."""
+    return f"{GRM_TPA_PREFIXES[component_type]}_UNADJ"
+
+
+def load_grm_facts(
+    db,
+    tree_type: str = "gs",
+    land_type: str = "forest",
+    components: Sequence[ComponentType] = GRM_COMPONENT_TYPES,
+    measures: Sequence[str] = ("volume",),
+) -> pl.LazyFrame:
+    """Load the joined per-tree GRM frame shared by growth, mortality, removals.
+
+    Joins TREE_GRM_COMPONENT to TREE_GRM_MIDPT and, for growth, to
+    TREE_GRM_BEGIN once, with the TPA column of every requested component
+    and the measure columns of every requested measure. Each estimator
+    selects its component's TPA column and measures from this frame, so
+    estimating several components (e.g. :func:`carbon_flux`, or a mortality
+    and removals report) loads and joins the GRM tables once.
+
+    Built frames are kept in ``db.tables`` like loaded tables, keyed by
+    tree and land type, so later calls asking for a subset of the columns
+    reuse them and a new EVALID clip discards them.
+
+    Parameters
+    ----------
+    db : FIA
+        Database connection, clipped to a GRM evaluation.
+    tree_type : str, default 'gs'
+        Tree type, as for resolve_grm_columns().
+    land_type : str, default 'forest'
+        Land type, as for resolve_grm_columns().
+    components : sequence of {'growth', 'mortality', 'removals'}
+        Component types whose TPA columns to include.
+    measures : sequence of str, default ('volume',)
+        Measures whose TREE_GRM_MIDPT (and, for growth, TREE_GRM_BEGIN)
+        columns to include.
+
+    Returns
+    -------
+    pl.LazyFrame
+        One row per TREE_GRM_COMPONENT row (left-joined to the other
+        tables) with the columns of load_grm_component() (DIA_END
+        included), except TPA_UNADJ, and:
+
+        - {TPAGROW,TPAMORT,TPAREMV}_UNADJ: TPA column of each component
+          (see grm_tpa_column())
+        - HAS_MIDPT: whether the tree has a TREE_GRM_MIDPT row
+        - the columns of load_grm_midpt() for the measures
+        - BEGIN_{column}: TREE_GRM_BEGIN columns, if growth is requested
+    """
+    tpa_cols = [grm_tpa_column(c) for c in components]
+    midpt_cols = ["DIA", "SPCD", "STATUSCD"]
+    for measure in measures:
+        midpt_cols.extend(
+            c for c in GRM_MIDPT_MEASURE_COLUMNS.get(measure, []) if c not in midpt_cols
+        )
+    begin_cols = []
+    if "growth" in components:
+        begin_cols = [
+            f"BEGIN_{GRM_BEGIN_MEASURE_COLUMNS[m]}"
+            for m in dict.fromkeys(measures)
+            if m in GRM_BEGIN_MEASURE_COLUMNS
+        ]
+    columns = [*tpa_cols, "HAS_MIDPT", *midpt_cols, *begin_cols]
+
+    cache = getattr(db, "tables", None)
+    if not isinstance(cache, TableCache):
+        return _build_grm_facts(db, tree_type, land_type, columns)
+
+    key = f"{normalize_tree_type(tree_type)}_{normalize_land_type(land_type)}"
+    cached = cache.lookup(GRM_FACTS_TABLE, columns, key)
+    if cached is not None:
+        return cached
+    # Build the columns of earlier frames too, replacing them
+    columns = cache.columns_to_load(GRM_FACTS_TABLE, columns, key) or columns
+    facts = _build_grm_facts(db, tree_type, land_type, columns).collect()
+    cache.store(
+        GRM_FACTS_TABLE, facts.lazy(), columns, key, int(facts.estimated_size())
+    )
+    return facts.lazy()
+
+
+def _build_grm_facts(
+    db, tree_type: str, land_type: str, columns: list[str]
+) -> pl.LazyFrame:
+    """Join the GRM tables into a load_grm_facts() frame with ``columns``."""
+    tpa_columns: dict[str, str] = {}
+    base_type: ComponentType = "growth"
+    for component_type in GRM_COMPONENT_TYPES:
+        name = grm_tpa_column(component_type)
+        if name in columns:
+            if not tpa_columns:
+                # The first requested component's columns are the base, so
+                # no TPA column of an unrequested component is read
+                base_type = component_type
+            tpa_columns[name] = resolve_grm_columns(
+                component_type,
+                tree_type=tree_type,
+                land_type=land_type,
+            ).tpa
+    grm_cols = resolve_grm_columns(base_type, tree_type=tree_type, land_type=land_type)
+    midpt_extra = [
+        c
+        for c in columns
+        if c not in tpa_columns
+        and c not in ("HAS_MIDPT", "DIA", "SPCD", "STATUSCD")
+        and not c.startswith("BEGIN_")
+    ]
+    begin_cols = [c.removeprefix("BEGIN_") for c in columns if c.startswith("BEGIN_")]
+
+    stored = _load_materialized_grm_facts(
+        db, grm_cols, tpa_columns, midpt_extra, begin_cols
+    )
+    if stored is not None:
+        return stored
+
+    base_tpa = grm_tpa_column(base_type)
+    facts = load_grm_component(
+        db,
+        grm_cols,
+        include_dia_end=True,
+        tpa_columns={k: v for k, v in tpa_columns.items() if k != base_tpa},
+    )
+    if base_tpa in tpa_columns:
+        facts = facts.rename({"TPA_UNADJ": base_tpa})
+    else:
+        facts = facts.drop("TPA_UNADJ")
+
+    midpt = load_grm_midpt(
+        db, measure="count", include_additional_cols=midpt_extra
+    ).with_columns(pl.lit(True).alias("HAS_MIDPT"))
+    facts = facts.join(midpt, on="TRE_CN", how="left").with_columns(
+        pl.col("HAS_MIDPT").fill_null(False)
+    )
+
+    if begin_cols:
+        begin = load_grm_begin(
+            db, measure="count", include_additional_cols=begin_cols
+        ).rename({c: f"BEGIN_{c}" for c in begin_cols})
+        facts = facts.join(begin, on="TRE_CN", how="left")
+
+    return facts
+
+
+def _load_materialized_grm_facts(
+    db,
+    grm_columns: GRMColumns,
+    tpa_columns: dict[str, str],
+    midpt_cols: list[str],
+    begin_cols: list[str],
+) -> pl.LazyFrame | None:
+    """Read a load_grm_facts() frame from the table stored by materialize_grm().
+
+    Returns None, so the GRM tables are joined instead, unless every EVALID
+    the database is clipped to was materialized with the current version
+    and the stored table has every requested column.
+    """
+    from .grm_materialize import GRM_FACTS_DB_TABLE, materialized_grm_evalids
+
+    evalids = getattr(db, "evalid", None)
+    if not evalids:
+        return None
+    if not set(evalids) <= materialized_grm_evalids(db):
+        return None
+
+    value_cols = ["DIA", "SPCD", "STATUSCD", *midpt_cols]
+    source_cols = [
+        "TRE_CN",
+        "PLT_CN",
+        "DIA_BEGIN",
+        "DIA_MIDPT",
+        "DIA_END",
+        grm_columns.component,
+        grm_columns.subptyp,
+        *tpa_columns.values(),
+        "HAS_MIDPT",
+        *value_cols,
+        *(f"BEGIN_{c}" for c in begin_cols),
+    ]
+    source_cols = list(dict.fromkeys(source_cols))
+    if columns_in_table(db, GRM_FACTS_DB_TABLE, source_cols) != source_cols:
+        return None
+
+    evalid_list = ", ".join(str(int(e)) for e in evalids)
+    facts: pl.LazyFrame = db.load_table(
+        GRM_FACTS_DB_TABLE, columns=source_cols, where=f"EVALID IN ({evalid_list})"
+    )
+    if len(evalids) > 1:
+        # A tree on plots of several of the EVALIDs is stored once per EVALID
+        facts = facts.unique(subset="TRE_CN", keep="first", maintain_order=True)
+
+    # Stored columns are already typed; only compact codes need casting
+    component = pl.col(grm_columns.component)
+    spcd = pl.col("SPCD")
+    if uses_compact_codes(db):
+        component = component.cast(GRM_COMPONENT_DTYPE)
+        spcd = spcd.cast(COMPACT_CODE_DTYPE)
+    return facts.select(
+        "TRE_CN",
+        "PLT_CN",
+        "DIA_BEGIN",
+        "DIA_MIDPT",
+        "DIA_END",
+        component.alias("COMPONENT"),
+        pl.col(grm_columns.subptyp).alias("SUBPTYP_GRM"),
+        *(pl.col(source).alias(name) for name, source in tpa_columns.items()),
+        *(spcd if c == "SPCD" else pl.col(c) for c in value_cols),
+        "HAS_MIDPT",
+        *(f"BEGIN_{c}" for c in begin_cols),
+    )
+
+
 def apply_grm_adjustment(data: pl.LazyFrame) -> pl.LazyFrame:
     """Apply GRM-specific adjustment factors based on SUBPTYP_GRM.
 
@@ -15,6 +15,7 @@ import polars as pl
 from ..core.exceptions import NoEVALIDError
 from ..filtering.utils import create_size_class_expr
 from .base import AggregationResult, BaseEstimator
+from .codes import encode_code_columns, uses_compact_codes
 from .columns import collect_referenced_columns, columns_in_table
 
 logger = logging.getLogger(__name__)
@@ -150,36 +151,20 @@ class GRMBaseEstimator(BaseEstimator):
         Load GRM data using the simple pattern (for mortality/removals).
 
         This pattern:
-        1. Loads GRM component table
-        2. Joins with GRM midpt table
+        1. Selects component trees with a midpoint from the GRM fact frame
+        2. Optionally joins TREE for AGENTCD
         3. Applies EVALID filtering
         4. Joins with aggregated COND data
         """
-        from .grm import (
-            aggregate_cond_to_plot,
-            filter_by_evalid,
-            load_grm_component,
-            load_grm_midpt,
-        )
-
-        measure = self.config.get("measure", "volume")
-
-        # Resolve GRM column names
-        grm_cols = self._resolve_grm_columns()
+        from .grm import aggregate_cond_to_plot, filter_by_evalid
 
-        # Load GRM component table
-        grm_component = load_grm_component(
-            self.db,
-            grm_cols,
-            include_dia_end=(self.component_type != "removals"),
+        # Component trees with a midpoint row, from the shared GRM frame
+        data = (
+            self._load_grm_facts(include_dia_end=self.component_type != "removals")
+            .filter(pl.col("HAS_MIDPT"))
+            .drop("HAS_MIDPT")
         )
 
-        # Load GRM midpt table
-        grm_midpt = load_grm_midpt(self.db, measure=measure)
-
-        # Join component with midpt
-        data = grm_component.join(grm_midpt, on="TRE_CN", how="inner")
-
         # Check if AGENTCD is requested for grouping - need to join with TREE table
         grp_by = self.config.get("grp_by")
         if grp_by:
@@ -187,24 +172,9 @@ class GRMBaseEstimator(BaseEstimator):
                 grp_by = [grp_by]
             if "AGENTCD" in grp_by:
                 # Load TREE table with AGENTCD
-                if "TREE" not in self.db.tables:
-                    self.db.load_table("TREE", columns=["CN", "AGENTCD"])
-                else:
-                    # Check if AGENTCD is in the cached TREE table
-                    tree = self.db.tables["TREE"]
-                    tree_cols = (
-                        tree.collect_schema().names()
-                        if isinstance(tree, pl.LazyFrame)
-                        else tree.columns
-                    )
-                    if "AGENTCD" not in tree_cols:
-                        # Reload with AGENTCD
-                        del self.db.tables["TREE"]
-                        self.db.load_table("TREE", columns=["CN", "AGENTCD"])
-
-                tree = self.db.tables["TREE"]
-                if not isinstance(tree, pl.LazyFrame):
-                    tree = tree.lazy()
+                tree = self.db.load_table("TREE", columns=["CN", "AGENTCD"])
+                if uses_compact_codes(self.db):
+                    tree = encode_code_columns(tree)
 
                 # Join on TRE_CN = CN to get AGENTCD
                 data = data.join(
@@ -221,31 +191,68 @@ class GRMBaseEstimator(BaseEstimator):
         # Required columns for aggregate_cond_to_plot()
         cond_cols = self.get_cond_columns()
 
-        # Check if cached COND has all required columns
-        if "COND" in self.db.tables:
-            cached = self.db.tables["COND"]
-            cached_cols = set(
-                cached.collect_schema().names()
-                if isinstance(cached, pl.LazyFrame)
-                else cached.columns
-            )
-            required_cols = set(cond_cols)
-            if not required_cols.issubset(cached_cols):
-                # Reload with all required columns
-                del self.db.tables["COND"]
-
-        if "COND" not in self.db.tables:
-            self.db.load_table("COND", columns=cond_cols)
-
-        cond = self.db.tables["COND"]
-        if not isinstance(cond, pl.LazyFrame):
-            cond = cond.lazy()
+        # Reuses a cached COND projection that has all required columns
+        cond = self.db.load_table("COND", columns=cond_cols)
+        if uses_compact_codes(self.db):
+            cond = encode_code_columns(cond)
 
         cond_agg = aggregate_cond_to_plot(cond)
         data = data.join(cond_agg, on="PLT_CN", how="left")
 
         return data
 
+    def _load_grm_facts(self, include_dia_end: bool = True) -> pl.LazyFrame:
+        """
+        Select this component's columns from the shared GRM fact frame.
+
+        Parameters
+        ----------
+        include_dia_end : bool, default True
+            Whether to keep the DIA_END column.
+
+        Returns
+        -------
+        pl.LazyFrame
+            The columns of load_grm_component() (this component's TPA as
+            TPA_UNADJ), HAS_MIDPT, the load_grm_midpt() columns of the
+            configured measure and, for growth, its BEGIN_* column.
+        """
+        from .grm import (
+            GRM_BEGIN_MEASURE_COLUMNS,
+            GRM_MIDPT_MEASURE_COLUMNS,
+            grm_tpa_column,
+            load_grm_facts,
+        )
+
+        measure = self.config.get("measure", "volume")
+        facts = load_grm_facts(
+            self.db,
+            tree_type=self.config.get("tree_type", "gs"),
+            land_type=self.config.get("land_type", "forest"),
+            components=(self.component_type,),
+            measures=(measure,),
+        )
+
+        cols = [
+            "TRE_CN",
+            "PLT_CN",
+            "DIA_BEGIN",
+            "DIA_MIDPT",
+            "COMPONENT",
+            pl.col(grm_tpa_column(self.component_type)).alias("TPA_UNADJ"),
+            "SUBPTYP_GRM",
+            "HAS_MIDPT",
+            "DIA",
+            "SPCD",
+            "STATUSCD",
+            *GRM_MIDPT_MEASURE_COLUMNS.get(measure, []),
+        ]
+        if include_dia_end:
+            cols.insert(4, "DIA_END")
+        if self.component_type == "growth" and measure in GRM_BEGIN_MEASURE_COLUMNS:
+            cols.append(f"BEGIN_{GRM_BEGIN_MEASURE_COLUMNS[measure]}")
+        return facts.select(cols)
+
     def _apply_grm_filters(self, data: pl.LazyFrame) -> pl.LazyFrame:
         """
         Apply common GRM filters.
@@ -426,7 +433,12 @@ class GRMBaseEstimator(BaseEstimator):
         ValueError
             If plot_tree_data is not available for variance calculation.
         """
-        from .variance import calculate_ratio_of_means_variance
+        from .variance import (
+            align_join_key_dtypes,
+            calculate_grouped_ratio_of_means_variance,
+            calculate_ratio_of_means_variance,
+            join_on_groups,
+        )
 
         if plot_tree_data is None:
             raise ValueError(
@@ -492,64 +504,26 @@ class GRMBaseEstimator(BaseEstimator):
 
         # Calculate variance using ratio-of-means for per-acre SE
         if group_cols:
-            variance_results = []
-
-            for group_vals in results.iter_rows():
-                group_filter = pl.lit(True)
-                group_dict = {}
-
-                for i, col in enumerate(group_cols):
-                    if col in plot_data.columns:
-                        val = group_vals[results.columns.index(col)]
-                        group_dict[col] = val
-                        if val is None:
-                            group_filter = group_filter & pl.col(col).is_null()
-                        else:
-                            group_filter = group_filter & (pl.col(col) == val)
-
-                group_plot_data = plot_data.filter(group_filter)
-
-                all_plots_group = all_plots.join(
-                    group_plot_data.select(["PLT_CN", "y_i", "x_i"]),
-                    on="PLT_CN",
-                    how="left",
-                ).with_columns(
-                    [
-                        pl.col("y_i").fill_null(0.0),
-                        pl.col("x_i").fill_null(0.0),
-                    ]
-                )
-
-                if len(all_plots_group) > 0:
-                    ratio_stats = calculate_ratio_of_means_variance(
-                        all_plots_group, "y_i", "x_i"
-                    )
-
-                    variance_results.append(
-                        {
-                            **group_dict,
-                            acre_se_col: ratio_stats["se_ratio"],
-                            total_se_col: ratio_stats["se_total"],
-                        }
-                    )
-                else:
-                    variance_results.append(
-                        {
-                            **group_dict,
-                            acre_se_col: 0.0,
-                            total_se_col: 0.0,
-                        }
-                    )
-
-            if variance_results:
-                from .variance import align_join_key_dtypes
-
-                var_df = pl.DataFrame(variance_results)
-                # Align all-null group keys so a Null-typed key (e.g. a
-                # disturbance code null across every group) does not break the
-                # join against the typed results key (#105).
-                var_df = align_join_key_dtypes(results, var_df, group_cols)
-                results = results.join(var_df, on=group_cols, how="left")
+            join_cols = [
+                c for c in group_cols if c in plot_data.columns and c in results.columns
+            ]
+            var_df = calculate_grouped_ratio_of_means_variance(
+                plot_data, all_plots, join_cols, ["y_i"], "x_i"
+            ).select(
+                join_cols
+                + [
+                    pl.col("y_i_se_ratio").alias(acre_se_col),
+                    pl.col("y_i_se_total").alias(total_se_col),
+                ]
+            )
+            # Align all-null group keys so a Null-typed key (e.g. a
+            # disturbance code null across every group) does not break the
+            # join against the typed results key (#105).
+            var_df = align_join_key_dtypes(results, var_df, join_cols)
+            results = join_on_groups(results, var_df, join_cols).with_columns(
+                pl.col(acre_se_col).fill_null(0.0),
+                pl.col(total_se_col).fill_null(0.0),
+            )
         else:
             # No grouping, calculate overall variance with ALL plots
             all_plots_with_values = all_plots.join(
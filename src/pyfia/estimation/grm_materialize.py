@@ -0,0 +1,285 @@
+"""
+GRM fact tables materialized inside the FIA DuckDB file.
+
+Every growth, mortality and removals estimate joins TREE_GRM_COMPONENT to
+TREE_GRM_MIDPT and TREE_GRM_BEGIN for the evaluation's plots and casts the
+result (see :func:`pyfia.estimation.grm.load_grm_facts`).
+:func:`materialize_grm` runs that join once inside DuckDB and stores the
+typed result, one row per TRE_CN per EVALID, as :data:`GRM_FACTS_DB_TABLE`.
+The table's :data:`GRM_FACTS_VERSION` and EVALIDs are recorded in the
+database metadata table, and estimators read the stored table in place of
+the GRM tables whenever every EVALID they are clipped to has been
+materialized with the current version.
+
+Examples
+--------
+>>> from pyfia import FIA, materialize_grm, mortality
+>>> materialize_grm("data/ga/ga.duckdb", evalid=132303)
+[132303]
+>>> with FIA("data/ga/ga.duckdb") as db:
+...     db.clip_by_evalid(132303)
+...     result = mortality(db)
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+
+from rich.console import Console
+
+from ..core.backends.base import DatabaseBackend
+from ..core.backends.duckdb_backend import DuckDBBackend
+from ..core.exceptions import NoEVALIDError
+from ..downloader.metadata import METADATA_TABLE, table_columns, write_metadata
+from .grm import GRM_BEGIN_MEASURE_COLUMNS, GRM_MIDPT_MEASURE_COLUMNS, GRM_TPA_PREFIXES
+
+logger = logging.getLogger(__name__)
+console = Console()
+
+# Bump when the columns or content of GRM_FACTS_DB_TABLE change, so stored
+# tables from older versions are ignored and rebuilt
+GRM_FACTS_VERSION = 1
+
+# Table materialize_grm() stores the GRM facts in
+GRM_FACTS_DB_TABLE = "PYFIA_GRM_FACTS"
+
+# Tree and land type suffixes of the TREE_GRM_COMPONENT columns
+GRM_TREE_CODES = ("GS", "AL", "SL")
+GRM_LAND_CODES = ("FOREST", "TIMBER")
+
+_VERSION_KEY = "grm_facts_version"
+_EVALIDS_KEY = "grm_facts_evalids"
+
+
+def materialize_grm(
+    db,
+    evalid: int | list[int] | None = None,
+    show_progress: bool = False,
+) -> list[int]:
+    """
+    Store the joined, typed GRM facts of evaluations in the DuckDB file.
+
+    Joins TREE_GRM_COMPONENT (every tree/land type column set), TREE_GRM_MIDPT
+    and TREE_GRM_BEGIN for the plots of each EVALID and writes the result to
+    :data:`GRM_FACTS_DB_TABLE`, replacing rows stored earlier for the same
+    EVALIDs. Growth, mortality and removals estimates on a database clipped
+    to materialized EVALIDs then read this table instead of joining the GRM
+    tables; their results are unchanged.
+
+    Parameters
+    ----------
+    db : str, Path or FIA
+        Path to a DuckDB database, or an FIA instance for one. The database
+        is opened read-write, so no other connection to it may be open; an
+        FIA instance's own connection is closed while writing and reopened on
+        its next query.
+    evalid : int or list of int, optional
+        GRM EVALIDs to materialize. Defaults to the EVALIDs an FIA instance
+        is clipped to.
+    show_progress : bool, default False
+        Show progress messages.
+
+    Returns
+    -------
+    list of int
+        The EVALIDs materialized.
+
+    Raises
+    ------
+    NoEVALIDError
+        If no EVALID is given and ``db`` is not clipped to one.
+    ValueError
+        If ``db`` is not a local DuckDB database or lacks
+        TREE_GRM_COMPONENT or POP_PLOT_STRATUM_ASSGN.
+    """
+    import duckdb
+
+    from ..core import FIA
+
+    if evalid is None and isinstance(db, FIA):
+        evalid = db.evalid
+    if evalid is None:
+        raise NoEVALIDError(
+            operation="GRM materialization",
+            suggestion="Pass evalid=, or clip the database with clip_by_evalid().",
+        )
+    evalids = sorted(
+        {int(e) for e in (evalid if isinstance(evalid, list) else [evalid])}
+    )
+
+    if isinstance(db, FIA):
+        if getattr(db, "_is_motherduck", False) or not isinstance(
+            db._reader._backend, DuckDBBackend
+        ):
+            raise ValueError("materialize_grm() requires a local DuckDB database")
+        db_path = Path(db.db_path)
+        # DuckDB cannot open a file read-write while this process holds a
+        # read-only connection to it
+        db._reader._backend.disconnect()
+    else:
+        db_path = Path(db)
+
+    conn = duckdb.connect(str(db_path))
+    try:
+        columns = table_columns(conn)
+        for table in ("TREE_GRM_COMPONENT", "POP_PLOT_STRATUM_ASSGN"):
+            if table not in columns:
+                raise ValueError(f"{table} table not found in {db_path}")
+
+        version, stored = _read_grm_metadata(
+            conn.execute(
+                f"SELECT KEY, VALUE FROM {METADATA_TABLE} "
+                f"WHERE KEY IN ('{_VERSION_KEY}', '{_EVALIDS_KEY}')"
+            ).fetchall()
+            if METADATA_TABLE in columns
+            else []
+        )
+        exists = GRM_FACTS_DB_TABLE in columns and version == GRM_FACTS_VERSION
+        if not exists:
+            stored = set()
+
+        if show_progress:
+            console.print(
+                f"  Materializing GRM facts for EVALID {', '.join(map(str, evalids))}..."
+            )
+        select = _grm_facts_select(columns, evalids)
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            if exists:
+                evalid_list = ", ".join(map(str, evalids))
+                conn.execute(
+                    f"DELETE FROM {GRM_FACTS_DB_TABLE} WHERE EVALID IN ({evalid_list})"
+                )
+                conn.execute(f"INSERT INTO {GRM_FACTS_DB_TABLE} BY NAME {select}")
+            else:
+                conn.execute(
+                    f"CREATE OR REPLACE TABLE {GRM_FACTS_DB_TABLE} AS {select}"
+                )
+            write_metadata(
+                conn,
+                {
+                    _VERSION_KEY: str(GRM_FACTS_VERSION),
+                    _EVALIDS_KEY: ",".join(map(str, sorted(stored | set(evalids)))),
+                    "grm_facts_materialized_at": datetime.now(timezone.utc).isoformat(),
+                },
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        empty = set(evalids) - {
+            row[0]
+            for row in conn.execute(
+                f"SELECT DISTINCT EVALID FROM {GRM_FACTS_DB_TABLE}"
+            ).fetchall()
+        }
+        if empty:
+            logger.warning(
+                f"No GRM trees found for EVALID {', '.join(map(str, sorted(empty)))}"
+            )
+        conn.execute("CHECKPOINT")
+    finally:
+        conn.close()
+
+    return evalids
+
+
+def materialized_grm_evalids(db) -> set[int]:
+    """
+    EVALIDs stored by :func:`materialize_grm` with the current version.
+
+    Parameters
+    ----------
+    db : FIA
+        Database connection.
+
+    Returns
+    -------
+    set of int
+        Materialized EVALIDs; empty if the database has no current GRM fact
+        table or is not backed by a database (e.g. a test double).
+    """
+    backend = getattr(getattr(db, "_reader", None), "_backend", None)
+    if not isinstance(backend, DatabaseBackend):
+        return set()
+    if not (
+        backend.table_exists(GRM_FACTS_DB_TABLE)
+        and backend.table_exists(METADATA_TABLE)
+    ):
+        return set()
+    rows = backend.execute_query(
+        f"SELECT KEY, VALUE FROM {METADATA_TABLE} "
+        f"WHERE KEY IN ('{_VERSION_KEY}', '{_EVALIDS_KEY}')"
+    ).rows()
+    version, evalids = _read_grm_metadata(rows)
+    return evalids if version == GRM_FACTS_VERSION else set()
+
+
+def _read_grm_metadata(rows) -> tuple[int | None, set[int]]:
+    """GRM fact table version and EVALIDs from metadata key/value rows."""
+    values = dict(rows)
+    try:
+        version = int(values[_VERSION_KEY])
+        evalids = {int(e) for e in values.get(_EVALIDS_KEY, "").split(",") if e}
+    except (KeyError, ValueError):
+        return None, set()
+    return version, evalids
+
+
+def _grm_facts_select(columns: dict[str, set[str]], evalids: list[int]) -> str:
+    """SELECT building GRM_FACTS_DB_TABLE rows for ``evalids``."""
+    component = columns["TREE_GRM_COMPONENT"]
+    midpt = columns.get("TREE_GRM_MIDPT", set())
+    begin = columns.get("TREE_GRM_BEGIN", set())
+
+    select = ["a.EVALID", "c.TRE_CN", "c.PLT_CN"]
+    select += [
+        f"CAST(c.{col} AS DOUBLE) AS {col}"
+        for col in ("DIA_BEGIN", "DIA_MIDPT", "DIA_END")
+        if col in component
+    ]
+    for tree in GRM_TREE_CODES:
+        for land in GRM_LAND_CODES:
+            suffix = f"{tree}_{land}"
+            if f"SUBP_COMPONENT_{suffix}" in component:
+                select.append(f"c.SUBP_COMPONENT_{suffix}")
+            if f"SUBP_SUBPTYP_GRM_{suffix}" in component:
+                select.append(
+                    f"CAST(c.SUBP_SUBPTYP_GRM_{suffix} AS BIGINT) "
+                    f"AS SUBP_SUBPTYP_GRM_{suffix}"
+                )
+            for prefix in GRM_TPA_PREFIXES.values():
+                col = f"SUBP_{prefix}_UNADJ_{suffix}"
+                if col in component:
+                    select.append(f"CAST(c.{col} AS DOUBLE) AS {col}")
+
+    joins = ""
+    if midpt:
+        select.append("m.TRE_CN IS NOT NULL AS HAS_MIDPT")
+        midpt_cols = {"DIA": "DOUBLE", "SPCD": "BIGINT", "STATUSCD": "BIGINT"}
+        for measure_cols in GRM_MIDPT_MEASURE_COLUMNS.values():
+            midpt_cols.update(dict.fromkeys(measure_cols, "DOUBLE"))
+        select += [
+            f"CAST(m.{col} AS {sql_type}) AS {col}"
+            for col, sql_type in midpt_cols.items()
+            if col in midpt
+        ]
+        joins += " LEFT JOIN TREE_GRM_MIDPT m ON m.TRE_CN = c.TRE_CN"
+    if begin:
+        select += [
+            f"CAST(b.{col} AS DOUBLE) AS BEGIN_{col}"
+            for col in dict.fromkeys(GRM_BEGIN_MEASURE_COLUMNS.values())
+            if col in begin
+        ]
+        joins += " LEFT JOIN TREE_GRM_BEGIN b ON b.TRE_CN = c.TRE_CN"
+
+    evalid_list = ", ".join(map(str, evalids))
+    return (
+        f"SELECT {', '.join(select)} FROM TREE_GRM_COMPONENT c "
+        "JOIN (SELECT DISTINCT PLT_CN, EVALID FROM POP_PLOT_STRATUM_ASSGN "
+        f"WHERE EVALID IN ({evalid_list})) a ON a.PLT_CN = c.PLT_CN"
+        f"{joins} ORDER BY a.EVALID, c.PLT_CN"
+    )
@@ -0,0 +1,333 @@
+"""
+On-disk cache of estimator results.
+
+Repeated estimator calls with the same database, clip state and options
+produce the same result. When ``settings.result_cache_enabled`` (and the
+global ``settings.cache_enabled``) are set, :meth:`BaseEstimator.estimate`
+stores each result as an Arrow IPC file under ``settings.cache_dir`` and
+returns it directly on the next identical call.
+
+Entries are keyed by a hash of:
+
+- the database file's path, size and modification time (and those of its
+  DuckDB write-ahead log), so any change to the file invalidates them
+- the FIA clip state: EVALIDs, state filter and polygon filters
+- the estimator class and its normalized config
+- the pyFIA version
+
+The cache is bounded by ``settings.result_cache_max_mb``; the least
+recently used entries are evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import uuid
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+
+from ..core.settings import settings
+
+if TYPE_CHECKING:
+    from ..core import FIA
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResultCacheStats:
+    """
+    Hit and miss counters for a result cache.
+
+    Parameters
+    ----------
+    hits : int
+        Lookups answered from the cache.
+    misses : int
+        Lookups that found no entry.
+    writes : int
+        Results stored.
+    evictions : int
+        Entries removed to stay within the size limit.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """
+    Size-bounded LRU cache of result DataFrames stored as Arrow IPC files.
+
+    Recency is tracked with file modification times, so several processes
+    can share one cache directory. Writes go to a temporary file that is
+    atomically renamed into place.
+
+    Parameters
+    ----------
+    cache_dir : Path
+        Directory for cached results.
+    max_size_mb : float
+        Total size above which least recently used entries are evicted.
+
+    Examples
+    --------
+    >>> cache = ResultCache(Path("~/.pyfia/cache/results"), max_size_mb=512)
+    >>> if (result := cache.get(key)) is None:
+    ...     result = compute()
+    ...     cache.put(key, result)
+    """
+
+    SUFFIX = ".arrow"
+
+    def __init__(self, cache_dir: Path, max_size_mb: float):
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.stats = ResultCacheStats()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+    def _entries(self) -> list[tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                # Evicted by another process
+                continue
+        return entries
+
+    def get(self, key: str) -> pl.DataFrame | None:
+        """
+        Return the cached result for a key, or None.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from :func:`result_cache_key`.
+
+        Returns
+        -------
+        pl.DataFrame or None
+            The cached result, or None if there is no valid entry.
+        """
+        path = self._path(key)
+        try:
+            result = pl.read_ipc(path)
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        except (OSError, pl.exceptions.ComputeError) as e:
+            logger.warning(f"Discarding unreadable cached result {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            self.stats.misses += 1
+            return None
+
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        self.stats.hits += 1
+        return result
+
+    def put(self, key: str, result: pl.DataFrame) -> None:
+        """
+        Store a result and evict old entries if over the size limit.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from :func:`result_cache_key`.
+        result : pl.DataFrame
+            Result to store.
+        """
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            result.write_ipc(tmp_path)
+            tmp_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Failed to cache result {path.name}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        self.stats.writes += 1
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until within the size limit."""
+        entries = sorted(self._entries(), key=lambda e: e[1].st_mtime_ns)
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total <= self.max_size_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            self.stats.evictions += 1
+            logger.debug(f"Evicted cached result {path.name}")
+
+    def clear(self) -> int:
+        """
+        Remove every cached result.
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        entries = self._entries()
+        for path, _ in entries:
+            path.unlink(missing_ok=True)
+        return len(entries)
+
+    def get_cache_info(self) -> dict:
+        """
+        Get information about the cache.
+
+        Returns
+        -------
+        dict
+            Entry count, total size, size limit and hit/miss statistics.
+        """
+        entries = self._entries()
+        return {
+            "cache_dir": str(self.cache_dir),
+            "total_entries": len(entries),
+            "total_size_mb": sum(stat.st_size for _, stat in entries) / (1024 * 1024),
+            "max_size_mb": self.max_size_bytes / (1024 * 1024),
+            **asdict(self.stats),
+            "hit_rate": self.stats.hit_rate,
+        }
+
+
+_result_cache: ResultCache | None = None
+
+
+def get_result_cache() -> ResultCache | None:
+    """
+    Get the result cache configured in settings.
+
+    Returns
+    -------
+    ResultCache or None
+        The process-wide cache, or None if result caching is disabled.
+    """
+    global _result_cache
+    if not (settings.cache_enabled and settings.result_cache_enabled):
+        return None
+
+    cache_dir = Path(settings.cache_dir).expanduser() / "results"
+    max_size_bytes = int(settings.result_cache_max_mb * 1024 * 1024)
+    if (
+        _result_cache is None
+        or _result_cache.cache_dir != cache_dir
+        or _result_cache.max_size_bytes != max_size_bytes
+    ):
+        _result_cache = ResultCache(cache_dir, settings.result_cache_max_mb)
+    return _result_cache
+
+
+def result_cache_key(db: FIA, estimator: str, config: dict[str, Any]) -> str | None:
+    """
+    Build the cache key for an estimate.
+
+    Parameters
+    ----------
+    db : FIA
+        Database connection, with its current clip state.
+    estimator : str
+        Estimator class name.
+    config : dict
+        Estimator config.
+
+    Returns
+    -------
+    str or None
+        Hex digest key, or None if the database is not a local file and so
+        cannot be fingerprinted.
+    """
+    database = _database_fingerprint(db)
+    if database is None:
+        return None
+
+    polygon_attributes = getattr(db, "_polygon_attributes", None)
+    payload = {
+        "pyfia": _pyfia_version(),
+        "database": database,
+        "evalid": sorted(db.evalid) if db.evalid else None,
+        "state_filter": sorted(db.state_filter) if db.state_filter else None,
+        "key_dtype": getattr(db, "key_dtype", "string"),
+        "polygon": _file_fingerprint(getattr(db, "_polygon_path", None)),
+        "spatial_plots": _plot_set_digest(getattr(db, "_spatial_plot_cns", None)),
+        "polygon_attributes": (
+            [
+                polygon_attributes.columns,
+                int(polygon_attributes.hash_rows().sum()),
+            ]
+            if polygon_attributes is not None
+            else None
+        ),
+        "estimator": estimator,
+        "config": config,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _plot_set_digest(plot_cns: list[str] | None) -> str | None:
+    """Digest of the plot CNs kept by ``clip_by_polygon``, in sorted order."""
+    if plot_cns is None:
+        return None
+    encoded = "\n".join(sorted(str(cn) for cn in plot_cns)).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _database_fingerprint(db: FIA) -> list | None:
+    """Path, size and mtime of a local database file and its WAL."""
+    if getattr(db, "_is_motherduck", False):
+        return None
+    db_path = getattr(db, "db_path", None)
+    fingerprint = _file_fingerprint(db_path)
+    if fingerprint is None:
+        return None
+    return [fingerprint, _file_fingerprint(f"{db_path}.wal")]
+
+
+def _file_fingerprint(path: str | Path | None) -> list | None:
+    """Resolved path, size and mtime of a file, or None if it does not exist."""
+    if path is None:
+        return None
+    try:
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+    except (OSError, TypeError):
+        return None
+    if not resolved.is_file():
+        return None
+    return [str(resolved), stat.st_size, stat.st_mtime_ns]
+
+
+@lru_cache(maxsize=1)
+def _pyfia_version() -> str:
+    try:
+        return version("pyfia")
+    except PackageNotFoundError:
+        return "unknown"
@@ -0,0 +1,560 @@
+"""
+In-database execution of the tree and area estimators.
+
+With ``engine="sql"``, :func:`pyfia.volume`, :func:`pyfia.tpa`,
+:func:`pyfia.biomass` and :func:`pyfia.area` do not pull tree or condition
+rows into Polars. One DuckDB query joins the tables, applies the domain
+filters and adjustment factors, aggregates trees to conditions and plots,
+and reduces the plots to the per-stratum moments the variance needs. Only
+two small tables come back:
+
+- the per-group partial results (totals and plot/tree counts) that
+  ``aggregate_results`` returns, and
+- the stratum statistics of
+  :func:`~pyfia.estimation.variance.calculate_stratum_statistics`.
+
+They are finalized by the estimator's ``combine_partial_results``, the path
+partitioned estimation (:mod:`pyfia.parallel`) uses, so both engines give
+the same estimates. On MotherDuck this replaces the transfer of every tree
+row with a few rows per group and stratum.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from ..validation import quote_sql_identifier, validate_domain_expression
+from .columns import collect_referenced_columns
+from .tree_expansion import get_area_adjustment_sql, get_tree_adjustment_sql
+from .variance import (
+    STAT_EU_N_PLOTS,
+    STAT_N_PLOTS,
+    _sum_col,
+    _sumprod_col,
+    _sumsq_col,
+)
+
+if TYPE_CHECKING:
+    from .base import BaseEstimator
+
+logger = logging.getLogger(__name__)
+
+# Grouping columns computed from TREE columns rather than read from a table
+DERIVED_TREE_COLUMNS = {"SIZE_CLASS": "CAST(FLOOR(DIA / 2.0) * 2 AS INTEGER)"}
+
+# B&P design columns of the tree statistics, after EXPNS
+_BP_DESIGN_COLUMNS = ["STRATUM_WGT", "AREA_USED", "P2POINTCNT"]
+
+# Separates the partial results from the stratum statistics in the output
+_PART = "_PART"
+
+
+def aggregate_in_database(
+    estimator: BaseEstimator,
+) -> tuple[pl.DataFrame, pl.DataFrame, list[str]]:
+    """
+    Aggregate an estimate to group and stratum level in one DuckDB query.
+
+    Parameters
+    ----------
+    estimator : BaseEstimator
+        Volume, TPA, biomass or area estimator with its config.
+
+    Returns
+    -------
+    tuple of (pl.DataFrame, pl.DataFrame, list of str)
+        Partial results and stratum statistics, as ``aggregate_results``
+        and ``calculate_partial_statistics`` give them for a partition,
+        and the grouping columns. The per-acre columns are left out;
+        ``combine_partial_results`` computes them from the statistics.
+
+    Raises
+    ------
+    ValueError
+        If the estimator or one of its options is not supported in SQL.
+    """
+    if estimator.config.get("grouping_sets"):
+        raise ValueError(
+            "grouping_sets is not supported with engine='sql'; use engine='polars'"
+        )
+
+    query = _EstimateQuery(estimator)
+    sql = query.build()
+    logger.debug(f"engine='sql' query for {type(estimator).__name__}:\n{sql}")
+    frame = estimator.db._reader._backend.execute_query(sql)
+
+    results = frame.filter(pl.col(_PART) == "results").select(query.result_columns)
+    stats = frame.filter(pl.col(_PART) == "stats").select(query.stat_columns)
+    stats = stats.with_columns(pl.col(STAT_N_PLOTS).cast(pl.UInt32))
+    results = results.with_columns(
+        pl.col(c).cast(dtype) for c, dtype in query.count_dtypes.items()
+    )
+    return results, stats, query.group_cols
+
+
+def _join(*items: str) -> str:
+    """Comma-join SQL list items, skipping empty ones."""
+    return ", ".join(item for item in items if item)
+
+
+class _EstimateQuery:
+    """SQL of one estimate, built from an estimator and its config."""
+
+    def __init__(self, estimator: BaseEstimator) -> None:
+        self.estimator = estimator
+        self.config = estimator.config
+        self.db = estimator.db
+        self.backend = estimator.db._reader._backend
+        self.is_area = "TREE" not in estimator.get_required_tables()
+        self.group_cols = list(dict.fromkeys(estimator._setup_grouping()))
+        self.groups = [quote_sql_identifier(c) for c in self.group_cols]
+        self.metric_configs = estimator._variance_metric_configs()
+        self.result_columns: list[str] = []
+        self.stat_columns: list[str] = []
+        # Plot and tree counts carry the dtypes the Polars engine gives them
+        self.count_dtypes: dict[str, pl.DataType] = {
+            "N_PLOTS": pl.UInt32(),
+            "N_TREES": pl.UInt32(),
+        }
+
+        if not self.is_area and not estimator._sql_tree_values():
+            raise ValueError(
+                f"{type(estimator).__name__} does not support engine='sql'"
+            )
+        for key in ("tree_domain", "area_domain", "plot_domain"):
+            validate_domain_expression(self.config.get(key), key)
+
+    def build(self) -> str:
+        """Return the query; sets ``result_columns`` and ``stat_columns``."""
+        ctes = self._strat_ctes()
+        if self.is_area:
+            ctes += self._area_ctes()
+            results = self._area_results()
+            ctes += self._stats_ctes(["y_i"], None)
+        else:
+            ctes += self._tree_ctes()
+            results = self._tree_results()
+            y_cols = [f"y_{i}_i" for i in range(len(self.metric_configs))]
+            ctes += self._stats_ctes(y_cols, "x_i")
+
+        return (
+            "WITH "
+            + ",\n".join(ctes)
+            + f"\nSELECT 'results' AS {_PART}, * FROM ({results}\n)"
+            + f"\nUNION ALL BY NAME\nSELECT 'stats' AS {_PART}, * FROM stats"
+        )
+
+    # -- helpers -------------------------------------------------------------
+
+    def _qualified(self, alias: str) -> list[str]:
+        """Group columns qualified by a table alias."""
+        return [f"{alias}.{g}" for g in self.groups]
+
+    def _group_by(self, *keys: str) -> str:
+        """GROUP BY clause over ``keys`` and the group columns."""
+        columns = list(keys) + self.groups
+        return f"GROUP BY {_join(*columns)}" if columns else ""
+
+    def _table(
+        self, table: str, columns: list[str] | None, where: list[str | None]
+    ) -> str:
+        """Typed subquery over ``table``, read as the Polars engine reads it."""
+        if columns is not None:
+            schema = self.backend.get_table_schema(table)
+            columns = [c for c in dict.fromkeys(columns) if c in schema]
+        select = self.backend.build_select_clause(table, columns)
+        sql = f"SELECT {select} FROM {self.backend._get_qualified_table_name(table)}"
+        conditions = [f"({w})" for w in where if w]
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        return f"({sql})"
+
+    def _evalid_filter(self) -> str | None:
+        if not self.db.evalid:
+            return None
+        return f"EVALID IN ({', '.join(str(int(e)) for e in self.db.evalid)})"
+
+    def _spatial_filter(self, table: str, column: str = "PLT_CN") -> str | None:
+        plot_cns = getattr(self.db, "_spatial_plot_cns", None)
+        if plot_cns is None:
+            return None
+        return self.backend.build_semi_join_clause(table, column, plot_cns)
+
+    def _plot_domain_filter(self) -> str | None:
+        """Keep plots matching plot_domain, evaluated on PLOT alone."""
+        plot_domain = self.config.get("plot_domain")
+        if not plot_domain:
+            return None
+        plot = self._table("PLOT", None, [self._spatial_filter("PLOT", "CN")])
+        return f"PLT_CN IN (SELECT CN FROM {plot} WHERE ({plot_domain}))"
+
+    def _check_group_columns(self, available: set[str]) -> None:
+        for col in self.group_cols:
+            if col not in available:
+                raise ValueError(
+                    f"Cannot group by '{col}' with engine='sql': the column is "
+                    "not in the tables the estimate reads. Use engine='polars'."
+                )
+
+    # -- stratification ------------------------------------------------------
+
+    def _strat_ctes(self) -> list[str]:
+        """Stratum assignment and design columns of every evaluation plot."""
+        evalid = self._evalid_filter()
+        ppsa = self._table(
+            "POP_PLOT_STRATUM_ASSGN",
+            ["PLT_CN", "STRATUM_CN"],
+            [evalid, self._spatial_filter("POP_PLOT_STRATUM_ASSGN")],
+        )
+        stratum = self._table(
+            "POP_STRATUM",
+            [
+                "CN",
+                "ESTN_UNIT_CN",
+                "EXPNS",
+                "ADJ_FACTOR_MICR",
+                "ADJ_FACTOR_SUBP",
+                "ADJ_FACTOR_MACR",
+                "P1POINTCNT",
+                "P2POINTCNT",
+            ],
+            [evalid],
+        )
+        estn_unit = self._table(
+            "POP_ESTN_UNIT", ["CN", "AREA_USED", "P1PNTCNT_EU"], [evalid]
+        )
+
+        macro_select = macro_join = ""
+        if not self.is_area:
+            plot = self._table(
+                "PLOT",
+                ["CN", "MACRO_BREAKPOINT_DIA"],
+                [self._spatial_filter("PLOT", "CN")],
+            )
+            macro_select = (
+                ",\n    TRY_CAST(p.MACRO_BREAKPOINT_DIA AS DOUBLE) "
+                "AS MACRO_BREAKPOINT_DIA"
+            )
+            macro_join = f"\n  LEFT JOIN {plot} p ON a.PLT_CN = p.CN"
+
+        return [
+            f"ppsa AS (SELECT DISTINCT PLT_CN, STRATUM_CN FROM {ppsa})",
+            f"pop_stratum AS (SELECT DISTINCT ON (CN) * FROM {stratum})",
+            f"estn_unit AS (SELECT DISTINCT ON (CN) * FROM {estn_unit})",
+            f"""strat AS (
+  SELECT a.PLT_CN, a.STRATUM_CN, s.ESTN_UNIT_CN,
+    CAST(s.EXPNS AS DOUBLE) AS EXPNS,
+    s.ADJ_FACTOR_MICR, s.ADJ_FACTOR_SUBP, s.ADJ_FACTOR_MACR,
+    CASE WHEN CAST(e.P1PNTCNT_EU AS DOUBLE) > 0
+      THEN CAST(s.P1POINTCNT AS DOUBLE) / CAST(e.P1PNTCNT_EU AS DOUBLE)
+      ELSE 0.0 END AS STRATUM_WGT,
+    CAST(e.AREA_USED AS DOUBLE) AS AREA_USED,
+    CAST(s.P2POINTCNT AS DOUBLE) AS P2POINTCNT{macro_select}
+  FROM ppsa a
+  JOIN pop_stratum s ON a.STRATUM_CN = s.CN
+  LEFT JOIN estn_unit e ON s.ESTN_UNIT_CN = e.CN{macro_join}
+)""",
+        ]
+
+    # -- tree estimators -----------------------------------------------------
+
+    def _tree_ctes(self) -> list[str]:
+        """Filtered trees, their adjusted values, and condition and plot sums."""
+        loader = self.estimator.data_loader
+        tree_schema = self.backend.get_table_schema("TREE")
+        cond_schema = self.backend.get_table_schema("COND")
+
+        # Route referenced columns as DataLoader does: TREE first, then COND
+        tree_cols = list(self.estimator.get_tree_columns() or [])
+        cond_cols = list(self.estimator.get_cond_columns() or [])
+        referenced = collect_referenced_columns(
+            self.config.get("grp_by"),
+            self.config.get("area_domain"),
+            self.config.get("tree_domain"),
+        )
+        for col in referenced:
+            if col in tree_schema:
+                tree_cols.append(col)
+            elif col in cond_schema:
+                cond_cols.append(col)
+        tree_cols = [c for c in dict.fromkeys(tree_cols) if c in tree_schema]
+        cond_cols = [
+            c
+            for c in dict.fromkeys(cond_cols)
+            if c in cond_schema and (c not in tree_cols or c in ("PLT_CN", "CONDID"))
+        ]
+        self._check_group_columns(
+            set(tree_cols) | set(cond_cols) | set(DERIVED_TREE_COLUMNS)
+        )
+
+        tree = self._table(
+            "TREE",
+            tree_cols,
+            [loader._build_tree_sql_filter(), self._spatial_filter("TREE")],
+        )
+        cond = self._table(
+            "COND",
+            cond_cols,
+            [loader._build_cond_sql_filter(), self._spatial_filter("COND")],
+        )
+        filters = [
+            self._plot_domain_filter(),
+            self.config.get("tree_domain"),
+            self.config.get("area_domain"),
+        ]
+        if self.config.get("tree_type", "live") == "gs" and "TREECLCD" in tree_cols:
+            filters.append("TREECLCD = 2")
+        where = " AND ".join(f"({f})" for f in filters if f)
+        where = f"\n  WHERE {where}" if where else ""
+
+        groups = [
+            f"t.{g}"
+            if c in tree_cols or c in cond_cols
+            else f"{DERIVED_TREE_COLUMNS[c]} AS {g}"
+            for c, g in zip(self.group_cols, self.groups, strict=True)
+        ]
+        adjustment = " ".join(get_tree_adjustment_sql("t", "s", "s").split())
+        values = _join(
+            *[
+                f"COALESCE(({value}) * ({adjustment}), 0.0) AS y_{i}_i"
+                for i, value in enumerate(self.estimator._sql_tree_values())
+            ]
+        )
+        y_sums = _join(
+            *[f"SUM(y_{i}_i) AS y_{i}_i" for i in range(len(self.metric_configs))]
+        )
+        condition_keys = ["PLT_CN", "CONDID", "STRATUM_CN", "EXPNS", "CONDPROP_UNADJ"]
+        plot_keys = ["PLT_CN", "STRATUM_CN", "EXPNS"]
+
+        return [
+            f"""trees AS (
+  SELECT * FROM {tree} t
+  JOIN {cond} c USING (PLT_CN, CONDID){where}
+)""",
+            f"""tree_values AS (
+  SELECT {_join("t.PLT_CN, t.CONDID, s.STRATUM_CN, s.EXPNS", "CAST(t.CONDPROP_UNADJ AS DOUBLE) AS CONDPROP_UNADJ", *groups, values)}
+  FROM trees t
+  JOIN strat s ON t.PLT_CN = s.PLT_CN
+)""",
+            f"""conditions AS (
+  SELECT {_join(*condition_keys, *self.groups, y_sums, "COUNT(*) AS n_trees")}
+  FROM tree_values
+  {self._group_by(*condition_keys)}
+)""",
+            f"""plots AS MATERIALIZED (
+  SELECT {_join(*plot_keys, *self.groups, y_sums, "COALESCE(SUM(CONDPROP_UNADJ), 0.0) AS x_i")}
+  FROM conditions
+  {self._group_by(*plot_keys)}
+)""",
+        ]
+
+    def _tree_results(self) -> str:
+        """Per-group totals and counts over the condition sums."""
+        total_cols = [cfg["total_col"] for cfg in self.metric_configs]
+        totals = [
+            f"COALESCE(SUM(y_{i}_i * EXPNS), 0.0) AS {quote_sql_identifier(col)}"
+            for i, col in enumerate(total_cols)
+        ]
+        if not self.config.get("totals", True):
+            totals, total_cols = [], []
+        n_trees = "COALESCE(SUM(n_trees), 0) AS N_TREES"
+
+        if not self.estimator._count_nonzero_plots:
+            self.result_columns = self.group_cols + total_cols + ["N_PLOTS", "N_TREES"]
+            n_plots = "COUNT(DISTINCT PLT_CN) AS N_PLOTS"
+            return f"""
+  SELECT {_join(*self.groups, *totals, n_plots, n_trees)}
+  FROM conditions
+  {self._group_by()}"""
+
+        # N_PLOTS counts the plots whose first metric is positive; like the
+        # Polars engine, it follows N_TREES and is null for groups without one
+        # (including the null group, as the Polars join does not match nulls)
+        self.result_columns = self.group_cols + total_cols + ["N_TREES", "N_PLOTS"]
+        if not self.groups:
+            # A literal count in the Polars engine
+            self.count_dtypes["N_PLOTS"] = pl.Int32()
+            n_plots = (
+                "(SELECT COUNT(DISTINCT PLT_CN) FROM plots WHERE y_0_i > 0) AS N_PLOTS"
+            )
+            return f"""
+  SELECT {_join(*totals, n_trees, n_plots)}
+  FROM conditions"""
+
+        on = " AND ".join(f"r.{g} = n.{g}" for g in self.groups)
+        return f"""
+  SELECT r.*, n.N_PLOTS
+  FROM (
+    SELECT {_join(*self.groups, *totals, n_trees)}
+    FROM conditions
+    {self._group_by()}
+  ) r
+  LEFT JOIN (
+    SELECT {_join(*self.groups, "COUNT(DISTINCT PLT_CN) AS N_PLOTS")}
+    FROM plots
+    WHERE y_0_i > 0
+    {self._group_by()}
+  ) n ON {on}"""
+
+    # -- area ----------------------------------------------------------------
+
+    def _area_ctes(self) -> list[str]:
+        """Conditions with their domain indicator and adjusted area per plot."""
+        cond_schema = self.backend.get_table_schema("COND")
+        plot_schema = self.backend.get_table_schema("PLOT")
+        cond_cols = [
+            c for c in self.estimator.get_cond_columns() or [] if c in cond_schema
+        ]
+        # Every PLOT column is available, as in the Polars COND-PLOT join
+        plot_cols = [c for c in plot_schema if c not in cond_cols]
+        self._check_group_columns(set(cond_cols) | set(plot_cols))
+
+        cond = self._table("COND", cond_cols, [self._spatial_filter("COND")])
+        plot = self._table("PLOT", plot_cols, [self._spatial_filter("PLOT", "CN")])
+        plot_domain = self._plot_domain_filter()
+        where = f"\n  WHERE {plot_domain}" if plot_domain else ""
+
+        # DOMAIN_IND: land type and area_domain, with null conditions as 0
+        indicator = " AND ".join(
+            f"({f})"
+            for f in (
+                self.estimator.data_loader._build_cond_sql_filter(),
+                self.config.get("area_domain"),
+            )
+            if f
+        )
+        domain = f"CASE WHEN {indicator} THEN 1.0 ELSE 0.0 END" if indicator else "1.0"
+        adjustment = " ".join(get_area_adjustment_sql("c", "s").split())
+        area_value = f"CAST(c.CONDPROP_UNADJ AS DOUBLE) * {domain} AS AREA_VALUE"
+        adj_factor = f"CAST({adjustment} AS DOUBLE) AS ADJ_FACTOR_AREA"
+        plot_keys = ["PLT_CN", "STRATUM_CN", "EXPNS"]
+
+        return [
+            f"""conds AS (
+  SELECT * FROM {cond} c
+  JOIN {plot} p ON c.PLT_CN = p.CN{where}
+)""",
+            f"""area_values AS MATERIALIZED (
+  SELECT {_join("c.PLT_CN, s.STRATUM_CN, s.EXPNS", *self._qualified("c"), area_value, adj_factor)}
+  FROM conds c
+  JOIN strat s ON c.PLT_CN = s.PLT_CN
+)""",
+            f"""plots AS (
+  SELECT {_join(*plot_keys, *self.groups, "SUM(AREA_VALUE * ADJ_FACTOR_AREA) AS y_i")}
+  FROM area_values
+  {self._group_by(*plot_keys)}
+)""",
+        ]
+
+    def _area_results(self) -> str:
+        """Per-group area totals and non-zero plot counts."""
+        self.result_columns = self.group_cols + [
+            "AREA_TOTAL",
+            "TOTAL_EXPNS",
+            "N_PLOTS",
+        ]
+        del self.count_dtypes["N_TREES"]
+        aggregates = _join(
+            "COALESCE(SUM(AREA_VALUE * ADJ_FACTOR_AREA * EXPNS), 0.0) AS AREA_TOTAL",
+            "COALESCE(SUM(EXPNS), 0.0) AS TOTAL_EXPNS",
+            "COUNT(DISTINCT PLT_CN) FILTER (WHERE AREA_VALUE > 0) AS N_PLOTS",
+        )
+        return f"""
+  SELECT {_join(*self.groups, aggregates)}
+  FROM area_values
+  {self._group_by()}"""
+
+    # -- stratum statistics --------------------------------------------------
+
+    def _stats_ctes(self, y_cols: list[str], x_col: str | None) -> list[str]:
+        """Per-(group, stratum) moments, as calculate_stratum_statistics."""
+        # Area statistics are keyed by stratum alone, without B&P columns
+        has_bp = not self.is_area
+        strata = ["ESTN_UNIT_CN", "STRATUM_CN"] if has_bp else ["STRATUM_CN"]
+        design_cols = ["EXPNS"] + (_BP_DESIGN_COLUMNS if has_bp else [])
+
+        value_cols = y_cols + ([x_col] if x_col else [])
+        sums = {_sum_col(c): f"SUM(p.{c})" for c in value_cols}
+        sums.update({_sumsq_col(c): f"SUM(p.{c} * p.{c})" for c in value_cols})
+        if x_col:
+            sums.update(
+                {_sumprod_col(y, x_col): f"SUM(p.{y} * p.{x_col})" for y in y_cols}
+            )
+
+        moment_keys = self._qualified("p") + [f"a.{k}" for k in strata]
+        moments = _join(
+            *moment_keys,
+            "COUNT(*) AS _k",
+            "COUNT(DISTINCT a._row) AS _k_plots",
+            *[f"{expr} AS {name}" for name, expr in sums.items()],
+        )
+        design = _join(
+            *strata,
+            "COUNT(*) AS _N_h",
+            *[f"CAST(FIRST({c}) AS DOUBLE) AS {c}" for c in design_cols],
+        )
+
+        # Plots without a row for a group are zeros: the design count, plus
+        # duplicate matches of plots assigned to several strata
+        counts = [f"CAST(d._N_h - m._k_plots + m._k AS UINTEGER) AS {STAT_N_PLOTS}"]
+        eu_join = ""
+        if has_bp:
+            partition = _join(*self._qualified("m"), "m.ESTN_UNIT_CN")
+            counts.append(
+                "CAST(e._N_eu + SUM(m._k - m._k_plots) OVER "
+                f"(PARTITION BY {partition}) AS UINTEGER) AS {STAT_EU_N_PLOTS}"
+            )
+            eu_join = (
+                "\n  LEFT JOIN eu_design e"
+                " ON m.ESTN_UNIT_CN IS NOT DISTINCT FROM e.ESTN_UNIT_CN"
+            )
+        stats = _join(
+            *self._qualified("m"),
+            *[f"m.{k}" for k in strata],
+            *counts,
+            *[f"m.{name}" for name in sums],
+            *[f"d.{c}" for c in design_cols],
+        )
+        on = " AND ".join(f"m.{k} IS NOT DISTINCT FROM d.{k}" for k in strata)
+
+        self.stat_columns = (
+            self.group_cols
+            + strata
+            + [STAT_N_PLOTS]
+            + ([STAT_EU_N_PLOTS] if has_bp else [])
+            + list(sums)
+            + design_cols
+        )
+        ctes = [
+            f"""all_plots AS (
+  SELECT *, ROW_NUMBER() OVER () AS _row
+  FROM (SELECT DISTINCT {_join("PLT_CN", *strata, *design_cols)} FROM strat)
+)""",
+            f"""moments AS (
+  SELECT {moments}
+  FROM plots p
+  JOIN all_plots a ON p.PLT_CN = a.PLT_CN
+  GROUP BY {_join(*moment_keys)}
+)""",
+            f"""design AS (
+  SELECT {design}
+  FROM all_plots
+  GROUP BY {_join(*strata)}
+)""",
+        ]
+        if has_bp:
+            ctes.append(
+                "eu_design AS (SELECT ESTN_UNIT_CN, COUNT(*) AS _N_eu "
+                "FROM all_plots GROUP BY ESTN_UNIT_CN)"
+            )
+        ctes.append(
+            f"""stats AS (
+  SELECT {stats}
+  FROM moments m
+  JOIN design d ON {on}{eu_join}
+)"""
+        )
+        return ctes
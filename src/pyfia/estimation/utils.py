@@ -7,17 +7,23 @@ initialization patterns used across all estimator functions.
 
 from __future__ import annotations
 
+import inspect
 import warnings
+from collections.abc import Callable, Collection
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import polars as pl
 
 from ..validation import (
+    validate_biomass_component,
     validate_boolean,
     validate_domain_expression,
+    validate_grouping_sets,
     validate_grp_by,
     validate_land_type,
+    validate_tree_type,
+    validate_vol_type,
 )
 
 if TYPE_CHECKING:
@@ -134,6 +140,100 @@ def validate_estimator_inputs(
     )
 
 
+def build_estimator_config(
+    function: Callable[..., Any],
+    options: dict[str, Any],
+    reserved: Collection[str] = ("db",),
+) -> dict[str, Any]:
+    """
+    Validate keyword options into the config an estimator function builds.
+
+    Used by entry points that construct estimators directly instead of going
+    through the estimator functions. Options missing from ``options`` take
+    the function's defaults.
+
+    Parameters
+    ----------
+    function : callable
+        Estimator function whose signature defines the accepted options
+        (e.g. :func:`pyfia.volume`).
+    options : dict
+        Keyword options as they would be passed to ``function``.
+    reserved : collection of str, default ('db',)
+        Parameters the caller handles itself; passing them is an error and
+        they are left out of the config.
+
+    Returns
+    -------
+    dict
+        Validated estimator config.
+
+    Raises
+    ------
+    ValueError
+        If an option is not accepted by ``function``, is reserved, or has
+        an invalid value.
+    """
+    parameters = inspect.signature(function).parameters
+    unknown = (set(options) - set(parameters)) | (set(options) & set(reserved))
+    if unknown:
+        raise ValueError(
+            f"Unsupported options for {function.__name__}: {', '.join(sorted(unknown))}"
+        )
+
+    values = {
+        name: options.get(name, param.default)
+        for name, param in parameters.items()
+        if name not in reserved and name != "db"
+    }
+    inputs = validate_estimator_inputs(
+        land_type=values["land_type"],
+        grp_by=values["grp_by"],
+        area_domain=values["area_domain"],
+        plot_domain=values.get("plot_domain"),
+        tree_domain=values.get("tree_domain"),
+        variance=values["variance"],
+        totals=values["totals"],
+        most_recent=values.get("most_recent", False),
+    )
+    config = {
+        **values,
+        "grp_by": inputs.grp_by,
+        "land_type": inputs.land_type,
+        "area_domain": inputs.area_domain,
+        "totals": inputs.totals,
+        "variance": inputs.variance,
+    }
+    if "plot_domain" in values:
+        config["plot_domain"] = inputs.plot_domain
+    if "tree_domain" in values:
+        config["tree_domain"] = inputs.tree_domain
+    if "most_recent" in values:
+        config["most_recent"] = inputs.most_recent
+    if "tree_type" in values:
+        config["tree_type"] = validate_tree_type(values["tree_type"])
+    if "vol_type" in values:
+        config["vol_type"] = validate_vol_type(values["vol_type"])
+    if "component" in values:
+        config["component"] = validate_biomass_component(
+            values["component"].lower()
+        ).upper()
+    if "pool" in values:
+        config["pool"] = values["pool"].lower()
+        if config["pool"] not in ("ag", "bg", "total"):
+            raise ValueError(
+                f"Invalid pool '{values['pool']}'. Must be one of: ag, bg, total"
+            )
+    if "grouping_sets" in values:
+        config["grouping_sets"] = validate_grouping_sets(
+            values["grouping_sets"], inputs.grp_by
+        )
+    for flag in ("by_species", "by_size_class"):
+        if flag in values:
+            config[flag] = validate_boolean(values[flag], flag)
+    return config
+
+
 def ensure_fia_instance(db: str | "FIA") -> tuple["FIA", bool]:
     """
     Ensure db is a FIA instance, creating one if a path string is provided.
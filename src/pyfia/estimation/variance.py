@@ -119,6 +119,37 @@ def align_join_key_dtypes(
     return right
 
 
+def join_on_groups(
+    left: pl.DataFrame, right: pl.DataFrame, on: list[str], how: str = "left"
+) -> pl.DataFrame:
+    """Join two frames on grouping keys, treating null keys as equal.
+
+    A null grouping value (e.g. a missing disturbance code) is a group in
+    its own right, so variance rows for it must attach to the matching
+    estimate row rather than being dropped by SQL-style null semantics.
+
+    Parameters
+    ----------
+    left : pl.DataFrame
+        Left frame.
+    right : pl.DataFrame
+        Right frame.
+    on : list[str]
+        Join key column names.
+    how : str, default 'left'
+        Join strategy.
+
+    Returns
+    -------
+    pl.DataFrame
+        Joined frame.
+    """
+    try:
+        return left.join(right, on=on, how=how, nulls_equal=True)  # type: ignore[arg-type]
+    except TypeError:  # polars < 1.24
+        return left.join(right, on=on, how=how, join_nulls=True)  # type: ignore[arg-type,call-arg]
+
+
 def calculate_grouped_domain_total_variance(
     plot_data: pl.DataFrame,
     group_cols: list[str],
@@ -130,6 +161,7 @@ def calculate_grouped_domain_total_variance(
     stratum_wgt_col: str = "STRATUM_WGT",
     area_used_col: str = "AREA_USED",
     p2pointcnt_col: str = "P2POINTCNT",
+    all_plots: pl.DataFrame | None = None,
 ) -> pl.DataFrame:
     """Calculate domain total variance for multiple groups in a single pass.
 
@@ -141,11 +173,18 @@ def calculate_grouped_domain_total_variance(
     variance formula (V1 + V2) when B&P columns are available, falling
     back to the simplified formula otherwise.
 
+    When ``all_plots`` is given, ``plot_data`` may be sparse: it needs only
+    the non-zero plot rows of each group, and the zero-valued plots are
+    reconstructed from the per-stratum plot counts in ``all_plots``
+    instead of being materialized as plots x groups rows.
+
     Parameters
     ----------
     plot_data : pl.DataFrame
         Plot-level data with group columns, stratum assignment, and values.
         Must contain PLT_CN, y_col, stratum_col, weight_col, and group_cols.
+        With ``all_plots``, only PLT_CN, group_cols, y_col and x_col are
+        used.
     group_cols : list[str]
         Columns to group results by (e.g., ["SPCD"] for by-species)
     y_col : str
@@ -164,6 +203,10 @@ def calculate_grouped_domain_total_variance(
         Column name for total area of estimation unit
     p2pointcnt_col : str, default 'P2POINTCNT'
         Column name for number of phase 2 plots in stratum
+    all_plots : pl.DataFrame, optional
+        Every plot in the evaluation with PLT_CN, stratum_col, weight_col
+        and the B&P columns when available. Enables the sparse path; the
+        result matches passing ``plot_data`` zero-filled to every plot.
 
     Returns
     -------
@@ -174,6 +217,21 @@ def calculate_grouped_domain_total_variance(
         - variance_acre: Variance of per-acre estimate
         - variance_total: Variance of total estimate
     """
+    if all_plots is not None:
+        return _calculate_sparse_domain_total_variance(
+            plot_data,
+            all_plots,
+            group_cols,
+            y_col,
+            x_col,
+            stratum_col,
+            weight_col,
+            estn_unit_col,
+            stratum_wgt_col,
+            area_used_col,
+            p2pointcnt_col,
+        )
+
     # Ensure we have the stratum column
     if stratum_col not in plot_data.columns:
         plot_data = plot_data.with_columns(pl.lit(1).alias("_STRATUM"))
@@ -255,6 +313,72 @@ def calculate_grouped_domain_total_variance(
     )
 
 
+def _calculate_sparse_domain_total_variance(
+    plot_data: pl.DataFrame,
+    all_plots: pl.DataFrame,
+    group_cols: list[str],
+    y_col: str,
+    x_col: str,
+    stratum_col: str,
+    weight_col: str,
+    estn_unit_col: str,
+    stratum_wgt_col: str,
+    area_used_col: str,
+    p2pointcnt_col: str,
+) -> pl.DataFrame:
+    """Sparse counterpart of the dense grouped and ungrouped paths.
+
+    Grouped exact B&P results scale stratum variances by the design plot
+    count like :func:`_calculate_grouped_exact_bp_variance`; ungrouped
+    results follow the scalar functions, which do not.
+    """
+    valid_group_cols = [c for c in group_cols if c in plot_data.columns]
+    ratio_col = x_col if x_col in plot_data.columns else None
+
+    stats = _calculate_sparse_grouped_variance(
+        plot_data,
+        all_plots,
+        valid_group_cols,
+        [y_col],
+        ratio_col,
+        stratum_col,
+        weight_col,
+        estn_unit_col,
+        stratum_wgt_col,
+        area_used_col,
+        p2pointcnt_col,
+        scale_by_design_count=bool(valid_group_cols),
+    )
+
+    if ratio_col:
+        acre_cols = [
+            pl.col(f"{y_col}_se_ratio").alias("se_acre"),
+            pl.col(f"{y_col}_variance_ratio").alias("variance_acre"),
+        ]
+    else:
+        acre_cols = [pl.lit(0.0).alias("se_acre"), pl.lit(0.0).alias("variance_acre")]
+    result = stats.select(
+        valid_group_cols
+        + acre_cols
+        + [
+            pl.col(f"{y_col}_se_total").alias("se_total"),
+            pl.col(f"{y_col}_variance_total").alias("variance_total"),
+        ]
+    )
+    result = result.select(
+        valid_group_cols + ["se_acre", "se_total", "variance_acre", "variance_total"]
+    )
+    if not valid_group_cols and result.is_empty():
+        # No non-zero plots at all: every plot is zero
+        result = pl.DataFrame(
+            {
+                c: [0.0]
+                for c in ["se_acre", "se_total", "variance_acre", "variance_total"]
+            }
+        )
+    return result
+
+
 def _calculate_grouped_exact_bp_variance(
     plot_data: pl.DataFrame,
     valid_group_cols: list[str],
@@ -1319,6 +1443,804 @@ def _calculate_simplified_ratio_variance(
     }
 
 
+# =============================================================================
+# Sparse grouped ratio-of-means variance
+# =============================================================================
+
+# Placeholder group key used when estimates are not grouped
+_ALL_GROUPS = "__ALL_GROUPS__"
+
+
+def _attach_strata(
+    plot_data: pl.DataFrame,
+    all_plots: pl.DataFrame,
+    group_cols: list[str],
+    value_cols: list[str],
+    strata_cols: list[str],
+) -> pl.DataFrame:
+    """Attach stratum keys to sparse group rows; ``_row`` identifies the plot."""
+    return plot_data.select(
+        ["PLT_CN"] + group_cols + [pl.col(c).cast(pl.Float64) for c in value_cols]
+    ).join(
+        all_plots.select(["PLT_CN"] + strata_cols).with_row_index("_row"),
+        on="PLT_CN",
+        how="inner",
+    )
+
+
+def _count_stratum_plots(
+    grouped: pl.DataFrame,
+    all_plots: pl.DataFrame,
+    strata_cols: list[str],
+    design_cols: list[str],
+) -> pl.DataFrame:
+    """Add design plot counts and the per-group stratum plot count ``_n_h``.
+
+    ``grouped`` holds per-(group, stratum) ``_k`` (rows) and ``_k_plots``
+    (distinct plots). Plots without a row are zeros, so the group's plot
+    count is the design count plus any duplicate matches.
+    """
+    design = all_plots.group_by(strata_cols).agg(
+        [pl.len().alias("_N_h")]
+        + [pl.first(c).cast(pl.Float64).alias(c) for c in design_cols]
+    )
+    return join_on_groups(grouped, design, strata_cols, how="inner").with_columns(
+        (pl.col("_N_h") - pl.col("_k_plots") + pl.col("_k")).alias("_n_h")
+    )
+
+
+def _count_eu_plots(
+    strata: pl.DataFrame,
+    all_plots: pl.DataFrame,
+    keys: list[str],
+    estn_unit_col: str,
+) -> pl.DataFrame:
+    """Add ``_n_eu``, the group's plot count in each estimation unit.
+
+    Every design plot in the unit counts (strata without group data are all
+    zeros), plus any duplicate matches in strata that have data.
+    """
+    eu_design = all_plots.group_by(estn_unit_col).agg(pl.len().alias("_N_eu"))
+    eu = join_on_groups(
+        strata.group_by(keys + [estn_unit_col]).agg(
+            (pl.col("_n_h") - pl.col("_N_h")).sum().alias("_extra")
+        ),
+        eu_design,
+        [estn_unit_col],
+    ).select(
+        keys + [estn_unit_col, (pl.col("_N_eu") + pl.col("_extra")).alias("_n_eu")]
+    )
+    return join_on_groups(strata, eu, keys + [estn_unit_col])
+
+
+def _calculate_sparse_stratum_moments(
+    plot_data: pl.DataFrame,
+    all_plots: pl.DataFrame,
+    group_cols: list[str],
+    value_cols: list[str],
+    strata_cols: list[str],
+    design_cols: list[str],
+    cross_pairs: list[tuple[str, str]],
+) -> pl.DataFrame:
+    """Per-(group, stratum) mean, variance and covariance from non-zero plots.
+
+    ``plot_data`` holds only the plots that carry a value for a group;
+    every other plot in ``all_plots`` is an implicit zero for that group.
+    Instead of materializing the zeros, each stratum's plot count comes
+    from ``all_plots`` and the zeros enter the centered sums of squares
+    analytically: z zero plots add ``z * mean**2`` to ``Σ(y - mean)²`` and
+    ``z * mean_y * mean_x`` to the cross products. Moments are computed in
+    two passes (sums, then centered deviations) for numerical stability.
+
+    The plot count per stratum matches a left join of ``all_plots`` to the
+    group's rows on PLT_CN, so results agree with zero-filling every plot.
+
+    Returns one row per (group, stratum) that has data, with ``_n_h`` (plots
+    including zeros), ``_N_h`` (design plot count), ``_mean_{c}``,
+    ``_s2_{c}``, ``_cov_{a}_{b}`` (ddof=1, 0 when undefined) and the first
+    value of each design column.
+    """
+    keys = group_cols + strata_cols
+    sparse = _attach_strata(plot_data, all_plots, group_cols, value_cols, strata_cols)
+
+    # Pass 1: counts and sums
+    moments = _count_stratum_plots(
+        sparse.group_by(keys).agg(
+            [pl.len().alias("_k"), pl.col("_row").n_unique().alias("_k_plots")]
+            + [pl.sum(c).alias(f"_sum_{c}") for c in value_cols]
+        ),
+        all_plots,
+        strata_cols,
+        design_cols,
+    ).with_columns(
+        [(pl.col(f"_sum_{c}") / pl.col("_n_h")).alias(f"_mean_{c}") for c in value_cols]
+        + [(pl.col("_n_h") - pl.col("_k")).alias("_zeros")]
+    )
+
+    # Pass 2: centered sums over the non-zero rows
+    mean_cols = [f"_mean_{c}" for c in value_cols]
+    deviations = join_on_groups(
+        sparse, moments.select(keys + mean_cols), keys, how="left"
+    ).with_columns(
+        [(pl.col(c) - pl.col(f"_mean_{c}")).alias(f"_dev_{c}") for c in value_cols]
+    )
+    centered = deviations.group_by(keys).agg(
+        [(pl.col(f"_dev_{c}") ** 2).sum().alias(f"_ss_{c}") for c in value_cols]
+        + [
+            (pl.col(f"_dev_{a}") * pl.col(f"_dev_{b}")).sum().alias(f"_sp_{a}_{b}")
+            for a, b in cross_pairs
+        ]
+    )
+    moments = join_on_groups(moments, centered, keys, how="left")
+
+    # Add the implicit zeros and convert to sample (co)variances
+    denom = pl.col("_n_h") - 1
+    defined = pl.col("_n_h") > 1
+    moments = moments.with_columns(
+        [
+            pl.when(defined)
+            .then(
+                (pl.col(f"_ss_{c}") + pl.col("_zeros") * pl.col(f"_mean_{c}") ** 2)
+                / denom
+            )
+            .otherwise(0.0)
+            .alias(f"_s2_{c}")
+            for c in value_cols
+        ]
+        + [
+            pl.when(defined)
+            .then(
+                (
+                    pl.col(f"_sp_{a}_{b}")
+                    + pl.col("_zeros") * pl.col(f"_mean_{a}") * pl.col(f"_mean_{b}")
+                )
+                / denom
+            )
+            .otherwise(0.0)
+            .alias(f"_cov_{a}_{b}")
+            for a, b in cross_pairs
+        ]
+    )
+
+    return moments.select(
+        keys
+        + ["_n_h", "_N_h"]
+        + mean_cols
+        + [f"_s2_{c}" for c in value_cols]
+        + [f"_cov_{a}_{b}" for a, b in cross_pairs]
+        + design_cols
+    )
+
+
+def calculate_grouped_ratio_of_means_variance(
+    plot_data: pl.DataFrame,
+    all_plots: pl.DataFrame,
+    group_cols: list[str],
+    y_cols: list[str],
+    x_col: str | None = "x_i",
+    stratum_col: str | list[str] = "STRATUM_CN",
+    weight_col: str = "EXPNS",
+    estn_unit_col: str = "ESTN_UNIT_CN",
+    stratum_wgt_col: str = "STRATUM_WGT",
+    area_used_col: str = "AREA_USED",
+    p2pointcnt_col: str = "P2POINTCNT",
+) -> pl.DataFrame:
+    """Calculate ratio-of-means variance for every group in one pass.
+
+    Vectorized equivalent of calling :func:`calculate_ratio_of_means_variance`
+    once per group on all plots, zero-filled for plots outside the group.
+    Only the group's non-zero plot rows are needed: zero plots are accounted
+    for analytically from per-stratum plot counts in ``all_plots``, so the
+    cost is proportional to the data rather than to groups x plots.
+
+    Uses the exact B&P (V1 + V2) formula when ``all_plots`` carries the
+    estimation unit columns, and the simplified formula otherwise.
+
+    Parameters
+    ----------
+    plot_data : pl.DataFrame
+        Plot-level values: PLT_CN, group_cols, y_cols and x_col. Plots
+        without a row for a group are treated as zeros for that group.
+    all_plots : pl.DataFrame
+        All plots in the evaluation with PLT_CN, the stratum column(s),
+        weight_col and, when available, the B&P columns.
+    group_cols : list[str]
+        Grouping columns; null is treated as a group value. May be empty.
+    y_cols : list[str]
+        Columns holding Y values; each gets its own variance columns.
+    x_col : str or None, default 'x_i'
+        Column holding X (area) values for the ratio. If None, only the
+        total variance is computed.
+    stratum_col : str or list[str], default 'STRATUM_CN'
+        Column(s) identifying the stratum.
+    weight_col : str, default 'EXPNS'
+        Column name for stratum weights (expansion factors)
+    estn_unit_col : str, default 'ESTN_UNIT_CN'
+        Column name for estimation unit identifier
+    stratum_wgt_col : str, default 'STRATUM_WGT'
+        Column name for phase 1 stratum weight
+    area_used_col : str, default 'AREA_USED'
+        Column name for total area of estimation unit
+    p2pointcnt_col : str, default 'P2POINTCNT'
+        Column name for number of phase 2 plots in stratum
+
+    Returns
+    -------
+    pl.DataFrame
+        One row per group present in ``plot_data`` with, for each ``y``
+        in y_cols: ``{y}_total``, ``{y}_variance_total``, ``{y}_se_total``
+        and, when x_col is given, ``{y}_ratio``, ``{y}_variance_ratio``,
+        ``{y}_se_ratio``, plus ``{x_col}_total``. Groups absent from
+        ``plot_data`` have all-zero values and are not returned.
+    """
+    return _calculate_sparse_grouped_variance(
+        plot_data,
+        all_plots,
+        group_cols,
+        y_cols,
+        x_col,
+        stratum_col,
+        weight_col,
+        estn_unit_col,
+        stratum_wgt_col,
+        area_used_col,
+        p2pointcnt_col,
+    )
+
+
+def _calculate_sparse_grouped_variance(
+    plot_data: pl.DataFrame,
+    all_plots: pl.DataFrame,
+    group_cols: list[str],
+    y_cols: list[str],
+    x_col: str | None = "x_i",
+    stratum_col: str | list[str] = "STRATUM_CN",
+    weight_col: str = "EXPNS",
+    estn_unit_col: str = "ESTN_UNIT_CN",
+    stratum_wgt_col: str = "STRATUM_WGT",
+    area_used_col: str = "AREA_USED",
+    p2pointcnt_col: str = "P2POINTCNT",
+    scale_by_design_count: bool = False,
+) -> pl.DataFrame:
+    """Sparse grouped variance shared by the ratio-of-means and domain paths.
+
+    With ``scale_by_design_count`` the exact B&P stratum variances are
+    divided by the design plot count (P2POINTCNT), matching
+    :func:`_calculate_grouped_exact_bp_variance`.
+    """
+    strata_cols = [stratum_col] if isinstance(stratum_col, str) else list(stratum_col)
+    if not strata_cols or not all(c in all_plots.columns for c in strata_cols):
+        all_plots = all_plots.with_columns(pl.lit(1).alias("_STRATUM"))
+        plot_data = plot_data.drop([c for c in strata_cols if c in plot_data.columns])
+        strata_cols = ["_STRATUM"]
+
+    has_bp_cols = all(
+        col in all_plots.columns
+        for col in [estn_unit_col, stratum_wgt_col, area_used_col, p2pointcnt_col]
+    )
+    if has_bp_cols and estn_unit_col not in strata_cols:
+        strata_cols = [estn_unit_col] + strata_cols
+    design_cols = [weight_col] + (
+        [stratum_wgt_col, area_used_col] if has_bp_cols else []
+    )
+    if has_bp_cols and scale_by_design_count:
+        design_cols.append(p2pointcnt_col)
+
+    keys = list(group_cols)
+    if not keys:
+        plot_data = plot_data.with_columns(pl.lit(True).alias(_ALL_GROUPS))
+        keys = [_ALL_GROUPS]
+
+    value_cols = list(y_cols) + ([x_col] if x_col else [])
+    cross_pairs = [(y, x_col) for y in y_cols] if x_col else []
+
+    strata = _calculate_sparse_stratum_moments(
+        plot_data,
+        all_plots,
+        keys,
+        value_cols,
+        strata_cols,
+        design_cols,
+        cross_pairs,
+    )
+
+    if has_bp_cols:
+        strata = _count_eu_plots(strata, all_plots, keys, estn_unit_col)
+
+    return _finalize_grouped_variance(
+        strata,
+        keys,
+        y_cols,
+        x_col,
+        weight_col,
+        estn_unit_col,
+        stratum_wgt_col,
+        area_used_col,
+        has_bp_cols,
+        p2pointcnt_col if scale_by_design_count else None,
+    )
+
+
+def _finalize_grouped_variance(
+    strata: pl.DataFrame,
+    keys: list[str],
+    y_cols: list[str],
+    x_col: str | None,
+    weight_col: str,
+    estn_unit_col: str,
+    stratum_wgt_col: str,
+    area_used_col: str,
+    has_bp_cols: bool,
+    design_count_col: str | None = None,
+) -> pl.DataFrame:
+    """Totals, variances and ratios per group from stratum-level moments.
+
+    ``strata`` has one row per (group, stratum) with ``_n_h``,
+    ``_mean_{c}``, ``_s2_{c}``, ``_cov_{y}_{x}``, the design columns and,
+    for exact B&P, ``_n_eu``.
+    """
+    value_cols = list(y_cols) + ([x_col] if x_col else [])
+
+    # Estimated totals: Σ_h ybar_h × w_h × n_h
+    totals = strata.group_by(keys).agg(
+        [
+            (pl.col(f"_mean_{c}") * pl.col(weight_col) * pl.col("_n_h"))
+            .sum()
+            .alias(f"{c}_total")
+            for c in value_cols
+        ]
+    )
+
+    if has_bp_cols:
+        variance = _grouped_exact_bp_components(
+            strata,
+            keys,
+            y_cols,
+            x_col,
+            estn_unit_col,
+            stratum_wgt_col,
+            area_used_col,
+            design_count_col,
+        )
+    else:
+        variance = _grouped_simplified_components(
+            strata, keys, y_cols, x_col, weight_col
+        )
+    result = join_on_groups(totals, variance, keys, how="left")
+
+    # V(Y) clamped at zero, then V(R) = (1/X²)[V(Y) + R²V(X) - 2R·Cov(Y,X)]
+    exprs: list[pl.Expr] = []
+    for y in y_cols:
+        v_y = pl.col(f"_v_{y}").fill_null(0.0)
+        exprs.append(
+            pl.when(v_y < 0).then(0.0).otherwise(v_y).alias(f"{y}_variance_total")
+        )
+    result = result.with_columns(exprs).with_columns(
+        [pl.col(f"{y}_variance_total").sqrt().alias(f"{y}_se_total") for y in y_cols]
+    )
+
+    if x_col:
+        total_x = pl.col(f"{x_col}_total")
+        result = result.with_columns(
+            [
+                pl.when(total_x > 0)
+                .then(pl.col(f"{y}_total") / total_x)
+                .otherwise(0.0)
+                .alias(f"{y}_ratio")
+                for y in y_cols
+            ]
+        )
+        ratio_exprs = []
+        for y in y_cols:
+            ratio = pl.col(f"{y}_ratio")
+            if has_bp_cols:
+                numerator = (
+                    pl.col(f"{y}_variance_total")
+                    + ratio**2 * pl.col("_v_x").fill_null(0.0)
+                    - 2.0 * ratio * pl.col(f"_c_{y}").fill_null(0.0)
+                )
+            else:
+                # Σ_h w²n(s²_y - 2R·cov + R²s²_x), clamped before scaling
+                numerator = (
+                    pl.col(f"_vy_{y}").fill_null(0.0)
+                    - 2.0 * ratio * pl.col(f"_c_{y}").fill_null(0.0)
+                    + ratio**2 * pl.col("_v_x").fill_null(0.0)
+                )
+                numerator = pl.when(numerator < 0).then(0.0).otherwise(numerator)
+            ratio_var = pl.when(total_x > 0).then(numerator / total_x**2).otherwise(0.0)
+            ratio_exprs.append(
+                pl.when(ratio_var < 0)
+                .then(0.0)
+                .otherwise(ratio_var)
+                .alias(f"{y}_variance_ratio")
+            )
+        result = result.with_columns(ratio_exprs).with_columns(
+            [
+                pl.col(f"{y}_variance_ratio").sqrt().alias(f"{y}_se_ratio")
+                for y in y_cols
+            ]
+        )
+
+    output_cols = [c for c in keys if c != _ALL_GROUPS]
+    for y in y_cols:
+        output_cols += [f"{y}_total", f"{y}_variance_total", f"{y}_se_total"]
+        if x_col:
+            output_cols += [f"{y}_ratio", f"{y}_variance_ratio", f"{y}_se_ratio"]
+    if x_col:
+        output_cols.append(f"{x_col}_total")
+    return result.select(output_cols)
+
+
+def _grouped_exact_bp_components(
+    strata: pl.DataFrame,
+    keys: list[str],
+    y_cols: list[str],
+    x_col: str | None,
+    estn_unit_col: str,
+    stratum_wgt_col: str,
+    area_used_col: str,
+    design_count_col: str | None = None,
+) -> pl.DataFrame:
+    """Sum B&P V1 + V2 per estimation unit, then across units, per group.
+
+    Returns ``_v_{y}`` (V(Y)) for each y and, with x_col, ``_v_x`` (V(X))
+    and ``_c_{y}`` (Cov(Y, X)). If ``design_count_col`` is given, stratum
+    (co)variances are divided by it first.
+    """
+    # B&P uses s²_h directly for strata with more than one plot; the
+    # A²/n and A²/n² factors carry the sample size
+    terms = {f"y_{y}": pl.col(f"_s2_{y}") for y in y_cols}
+    if x_col:
+        terms["x"] = pl.col(f"_s2_{x_col}")
+        terms.update({f"c_{y}": pl.col(f"_cov_{y}_{x_col}") for y in y_cols})
+    if design_count_col:
+        terms = {name: v / pl.col(design_count_col) for name, v in terms.items()}
+
+    W = pl.col(stratum_wgt_col)
+    strata = strata.with_columns(
+        [(W * v).alias(f"_v1_{name}") for name, v in terms.items()]
+        + [((1.0 - W) * v).alias(f"_v2_{name}") for name, v in terms.items()]
+    )
+
+    # _n_eu is constant within a (group, EU)
+    eu = strata.group_by(keys + [estn_unit_col]).agg(
+        [pl.sum(f"_v1_{name}") for name in terms]
+        + [pl.sum(f"_v2_{name}") for name in terms]
+        + [
+            pl.first(area_used_col).alias("_A"),
+            pl.first("_n_eu").cast(pl.Float64).alias("_n"),
+        ]
+    )
+
+    a2 = pl.col("_A") ** 2
+    n = pl.col("_n")
+    eu = eu.with_columns(
+        [
+            (
+                (a2 / n) * pl.col(f"_v1_{name}") + (a2 / n**2) * pl.col(f"_v2_{name}")
+            ).alias(f"_V_{name}")
+            for name in terms
+        ]
+    )
+
+    out = {f"y_{y}": f"_v_{y}" for y in y_cols}
+    if x_col:
+        out["x"] = "_v_x"
+        out.update({f"c_{y}": f"_c_{y}" for y in y_cols})
+    return eu.group_by(keys).agg(
+        [
+            pl.col(f"_V_{name}").fill_nan(None).sum().alias(alias)
+            for name, alias in out.items()
+        ]
+    )
+
+
+def _grouped_simplified_components(
+    strata: pl.DataFrame,
+    keys: list[str],
+    y_cols: list[str],
+    x_col: str | None,
+    weight_col: str,
+) -> pl.DataFrame:
+    """Simplified per-group components Σ_h w_h² × n_h × (co)variance.
+
+    Returns ``_v_{y}`` (V(Y)) for each y and, with x_col, the ratio
+    ingredients ``_vy_{y}``, ``_c_{y}`` and ``_v_x``.
+    """
+    scale = pl.col(weight_col) ** 2 * pl.col("_n_h")
+    strata = strata.filter(pl.col("_n_h") > 1)
+
+    exprs = [
+        (scale * pl.col(f"_s2_{y}")).fill_nan(None).sum().alias(f"_v_{y}")
+        for y in y_cols
+    ]
+    if x_col:
+        exprs += [(scale * pl.col(f"_s2_{y}")).sum().alias(f"_vy_{y}") for y in y_cols]
+        exprs += [
+            (scale * pl.col(f"_cov_{y}_{x_col}")).sum().alias(f"_c_{y}") for y in y_cols
+        ]
+        exprs.append((scale * pl.col(f"_s2_{x_col}")).sum().alias("_v_x"))
+    return strata.group_by(keys).agg(exprs)
+
+
+# =============================================================================
+# Mergeable stratum sufficient statistics
+# =============================================================================
+
+# Column names of the stratum statistics table
+STAT_N_PLOTS = "N_PLOTS"
+STAT_EU_N_PLOTS = "EU_N_PLOTS"
+
+
+def _sum_col(col: str) -> str:
+    """Name of the sum column for ``col``."""
+    return f"SUM_{col}"
+
+
+def _sumsq_col(col: str) -> str:
+    """Name of the sum-of-squares column for ``col``."""
+    return f"SUMSQ_{col}"
+
+
+def _sumprod_col(y_col: str, x_col: str) -> str:
+    """Name of the cross-product sum column for ``y_col`` and ``x_col``."""
+    return f"SUMPROD_{y_col}_{x_col}"
+
+
+def calculate_stratum_statistics(
+    plot_data: pl.DataFrame,
+    all_plots: pl.DataFrame,
+    group_cols: list[str],
+    y_cols: list[str],
+    x_col: str | None = "x_i",
+    stratum_col: str = "STRATUM_CN",
+    weight_col: str = "EXPNS",
+    estn_unit_col: str = "ESTN_UNIT_CN",
+    stratum_wgt_col: str = "STRATUM_WGT",
+    area_used_col: str = "AREA_USED",
+    p2pointcnt_col: str = "P2POINTCNT",
+) -> pl.DataFrame:
+    """Reduce plot-level values to per-(group, stratum) sufficient statistics.
+
+    The result is everything :func:`calculate_variance_from_stratum_statistics`
+    needs to produce totals, ratios and Bechtold & Patterson variances:
+    plot counts, sums, sums of squares and cross products, plus the
+    POP_STRATUM design columns. Tables computed independently for disjoint
+    sets of estimation units (e.g. one per state or EVALID) can be
+    concatenated with :func:`combine_stratum_statistics` and finalized
+    without re-reading any tree data.
+
+    Zero-valued plots add nothing to the sums and enter only through the
+    plot counts, so ``plot_data`` needs only the non-zero rows.
+
+    Parameters
+    ----------
+    plot_data : pl.DataFrame
+        Plot-level values with PLT_CN, group_cols, y_cols and x_col.
+    all_plots : pl.DataFrame
+        All plots in the evaluation with PLT_CN, stratum_col, weight_col
+        and, when available, the B&P columns.
+    group_cols : list[str]
+        Grouping columns; may be empty.
+    y_cols : list[str]
+        Columns holding Y values.
+    x_col : str or None, default 'x_i'
+        Column holding X (area) values for ratio estimates.
+    stratum_col : str, default 'STRATUM_CN'
+        Column name for stratum assignment
+    weight_col : str, default 'EXPNS'
+        Column name for stratum weights (expansion factors)
+    estn_unit_col : str, default 'ESTN_UNIT_CN'
+        Column name for estimation unit identifier
+    stratum_wgt_col : str, default 'STRATUM_WGT'
+        Column name for phase 1 stratum weight
+    area_used_col : str, default 'AREA_USED'
+        Column name for total area of estimation unit
+    p2pointcnt_col : str, default 'P2POINTCNT'
+        Column name for number of phase 2 plots in stratum
+
+    Returns
+    -------
+    pl.DataFrame
+        One row per (group, estimation unit, stratum) with data:
+
+        - group_cols, estn_unit_col (when available) and stratum_col
+        - N_PLOTS: plots in the stratum, including zero-valued plots
+        - EU_N_PLOTS: plots in the estimation unit (exact B&P only)
+        - SUM_{c}, SUMSQ_{c} for each y column and x_col
+        - SUMPROD_{y}_{x} for each y column when x_col is given
+        - weight_col and the available B&P design columns
+    """
+    strata_cols = [stratum_col]
+    bp_cols = [estn_unit_col, stratum_wgt_col, area_used_col, p2pointcnt_col]
+    has_bp_cols = all(col in all_plots.columns for col in bp_cols)
+    if has_bp_cols:
+        strata_cols = [estn_unit_col, stratum_col]
+    design_cols = [weight_col] + (bp_cols[1:] if has_bp_cols else [])
+
+    value_cols = list(y_cols) + ([x_col] if x_col else [])
+    sparse = _attach_strata(plot_data, all_plots, group_cols, value_cols, strata_cols)
+
+    sums = [pl.sum(c).alias(_sum_col(c)) for c in value_cols]
+    sums += [(pl.col(c) ** 2).sum().alias(_sumsq_col(c)) for c in value_cols]
+    if x_col:
+        sums += [
+            (pl.col(y) * pl.col(x_col)).sum().alias(_sumprod_col(y, x_col))
+            for y in y_cols
+        ]
+
+    keys = group_cols + strata_cols
+    stats = _count_stratum_plots(
+        sparse.group_by(keys).agg(
+            [pl.len().alias("_k"), pl.col("_row").n_unique().alias("_k_plots")] + sums
+        ),
+        all_plots,
+        strata_cols,
+        design_cols,
+    )
+
+    count_cols = [pl.col("_n_h").alias(STAT_N_PLOTS)]
+    if has_bp_cols:
+        stats = _count_eu_plots(stats, all_plots, group_cols, estn_unit_col)
+        count_cols.append(pl.col("_n_eu").alias(STAT_EU_N_PLOTS))
+
+    stat_cols = [e.meta.output_name() for e in sums]
+    return stats.select([*keys, *count_cols, *stat_cols, *design_cols])
+
+
+def combine_stratum_statistics(
+    partials: list[pl.DataFrame],
+    group_cols: list[str],
+    stratum_col: str = "STRATUM_CN",
+    estn_unit_col: str = "ESTN_UNIT_CN",
+) -> pl.DataFrame:
+    """Concatenate stratum statistics computed for disjoint partitions.
+
+    Each partial must cover complete estimation units (a state, an EVALID),
+    because plot counts of strata and units are only exact within the
+    partition that saw every plot.
+
+    Parameters
+    ----------
+    partials : list of pl.DataFrame
+        Tables from :func:`calculate_stratum_statistics`.
+    group_cols : list[str]
+        Grouping columns of the tables.
+    stratum_col : str, default 'STRATUM_CN'
+        Column name for stratum assignment
+    estn_unit_col : str, default 'ESTN_UNIT_CN'
+        Column name for estimation unit identifier
+
+    Returns
+    -------
+    pl.DataFrame
+        Combined table.
+
+    Raises
+    ------
+    ValueError
+        If the same (group, stratum) appears in more than one partial.
+    """
+    if not partials:
+        raise ValueError("No stratum statistics to combine")
+
+    combined = pl.concat(partials, how="diagonal_relaxed")
+    keys = [
+        c for c in group_cols + [estn_unit_col, stratum_col] if c in combined.columns
+    ]
+    if combined.select(keys).is_duplicated().any():
+        raise ValueError(
+            "Stratum statistics overlap: partials must cover disjoint estimation "
+            "units (e.g. one partial per state or EVALID)"
+        )
+    return combined
+
+
+def calculate_variance_from_stratum_statistics(
+    stats: pl.DataFrame,
+    group_cols: list[str],
+    y_cols: list[str],
+    x_col: str | None = "x_i",
+    stratum_col: str = "STRATUM_CN",
+    weight_col: str = "EXPNS",
+    estn_unit_col: str = "ESTN_UNIT_CN",
+    stratum_wgt_col: str = "STRATUM_WGT",
+    area_used_col: str = "AREA_USED",
+) -> pl.DataFrame:
+    """Finalize totals and variances from stratum sufficient statistics.
+
+    Produces the same result as :func:`calculate_grouped_ratio_of_means_variance`
+    on the plot data the statistics were computed from, using only the
+    table from :func:`calculate_stratum_statistics` (or several combined
+    with :func:`combine_stratum_statistics`). The exact B&P formula is
+    used when the table carries EU_N_PLOTS and the B&P design columns.
+
+    Parameters
+    ----------
+    stats : pl.DataFrame
+        Stratum statistics table.
+    group_cols : list[str]
+        Grouping columns; may be empty.
+    y_cols : list[str]
+        Y columns the statistics were computed for.
+    x_col : str or None, default 'x_i'
+        X column for ratio estimates, or None for totals only.
+    stratum_col : str, default 'STRATUM_CN'
+        Column name for stratum assignment
+    weight_col : str, default 'EXPNS'
+        Column name for stratum weights (expansion factors)
+    estn_unit_col : str, default 'ESTN_UNIT_CN'
+        Column name for estimation unit identifier
+    stratum_wgt_col : str, default 'STRATUM_WGT'
+        Column name for phase 1 stratum weight
+    area_used_col : str, default 'AREA_USED'
+        Column name for total area of estimation unit
+
+    Returns
+    -------
+    pl.DataFrame
+        Same columns as :func:`calculate_grouped_ratio_of_means_variance`.
+    """
+    has_bp_cols = all(
+        col in stats.columns
+        for col in [STAT_EU_N_PLOTS, estn_unit_col, stratum_wgt_col, area_used_col]
+    )
+
+    keys = list(group_cols)
+    if not keys:
+        stats = stats.with_columns(pl.lit(True).alias(_ALL_GROUPS))
+        keys = [_ALL_GROUPS]
+
+    value_cols = list(y_cols) + ([x_col] if x_col else [])
+    n = pl.col(STAT_N_PLOTS).cast(pl.Float64)
+    defined = n > 1
+
+    def centered(sum_sq: pl.Expr, sum_a: pl.Expr, sum_b: pl.Expr) -> pl.Expr:
+        # Σab - ΣaΣb/n over n - 1 (ddof=1), 0 for single-plot strata
+        return (
+            pl.when(defined).then((sum_sq - sum_a * sum_b / n) / (n - 1)).otherwise(0.0)
+        )
+
+    strata = stats.with_columns(
+        [n.alias("_n_h")]
+        + [(pl.col(_sum_col(c)) / n).alias(f"_mean_{c}") for c in value_cols]
+        + [
+            centered(
+                pl.col(_sumsq_col(c)), pl.col(_sum_col(c)), pl.col(_sum_col(c))
+            ).alias(f"_s2_{c}")
+            for c in value_cols
+        ]
+        + (
+            [
+                centered(
+                    pl.col(_sumprod_col(y, x_col)),
+                    pl.col(_sum_col(y)),
+                    pl.col(_sum_col(x_col)),
+                ).alias(f"_cov_{y}_{x_col}")
+                for y in y_cols
+            ]
+            if x_col
+            else []
+        )
+        + ([pl.col(STAT_EU_N_PLOTS).alias("_n_eu")] if has_bp_cols else [])
+    ).with_columns(
+        # Rounding can leave a tiny negative sum of squares
+        [pl.col(f"_s2_{c}").clip(lower_bound=0.0) for c in value_cols]
+    )
+
+    return _finalize_grouped_variance(
+        strata,
+        keys,
+        y_cols,
+        x_col,
+        weight_col,
+        estn_unit_col,
+        stratum_wgt_col,
+        area_used_col,
+        has_bp_cols,
+    )
+
+
 # =============================================================================
 # Utility functions salvaged from statistics.py
 # =============================================================================
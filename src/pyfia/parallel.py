@@ -0,0 +1,225 @@
+"""
+Partitioned multi-state estimation.
+
+A database holding many states is normally estimated as one large joined
+frame in a single process. :func:`estimate_by_partition` instead runs each
+state (or EVALID) in its own worker process: every worker opens its own
+read-only connection, clips to its partition's EVALID, and reduces its data
+to per-stratum sufficient statistics. Estimation units never span states,
+so the parent can concatenate the statistics and finalize totals, per-acre
+ratios and Bechtold & Patterson variances without seeing any plot data.
+The wall time of a many-state run is then bounded by the slowest state
+rather than by the sum of all states.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import polars as pl
+
+from .core.exceptions import InsufficientDataError, NoEVALIDError
+from .core.fia import FIA
+from .core.settings import settings
+from .estimation.base import BaseEstimator
+from .estimation.codes import decode_code_columns
+from .estimation.estimators.area import AreaEstimator, area
+from .estimation.estimators.biomass import BiomassEstimator, biomass
+from .estimation.estimators.tpa import TPAEstimator, tpa
+from .estimation.estimators.volume import VolumeEstimator, volume
+from .estimation.utils import apply_variance_columns, build_estimator_config
+from .estimation.variance import combine_stratum_statistics
+
+logger = logging.getLogger(__name__)
+
+VALID_PARTITIONS = {"STATECD", "EVALID"}
+
+
+@dataclass(frozen=True)
+class _PartitionedEstimator:
+    """An estimator that can run partition by partition."""
+
+    estimator_cls: type[BaseEstimator]
+    function: Callable[..., pl.DataFrame]
+    eval_type: str
+
+
+_ESTIMATORS: dict[str, _PartitionedEstimator] = {
+    "area": _PartitionedEstimator(AreaEstimator, area, "ALL"),
+    "biomass": _PartitionedEstimator(BiomassEstimator, biomass, "VOL"),
+    "tpa": _PartitionedEstimator(TPAEstimator, tpa, "VOL"),
+    "volume": _PartitionedEstimator(VolumeEstimator, volume, "VOL"),
+}
+
+
+def estimate_by_partition(
+    db_path: str | Path,
+    estimator: str = "volume",
+    partition: str = "STATECD",
+    workers: int | None = None,
+    states: int | list[int] | None = None,
+    evalids: list[int] | None = None,
+    eval_type: str | None = None,
+    **kwargs: Any,
+) -> pl.DataFrame:
+    """
+    Run an estimator over a multi-state database, one process per partition.
+
+    Produces the same columns as calling the estimator function on the
+    whole database clipped to the same EVALIDs. Totals and counts are summed
+    across partitions; per-acre estimates and standard errors are computed
+    from the combined stratum statistics, so they are exact rather than
+    approximations from per-state results.
+
+    Parameters
+    ----------
+    db_path : str or Path
+        Path to a local DuckDB or SQLite FIA database.
+    estimator : {'volume', 'tpa', 'biomass', 'area'}, default 'volume'
+        Estimator to run.
+    partition : {'STATECD', 'EVALID'}, default 'STATECD'
+        POP_EVAL column that defines one unit of work. Each partition must
+        cover whole estimation units, which both choices guarantee.
+    workers : int, optional
+        Number of worker processes. Defaults to ``settings.max_threads``,
+        capped at the number of partitions. With 1, partitions run in the
+        calling process.
+    states : int or list of int, optional
+        Restrict the run to these state FIPS codes.
+    evalids : list of int, optional
+        Explicit EVALIDs to estimate. By default, the most recent
+        evaluation of the estimator's type is used for each state.
+    eval_type : str, optional
+        Evaluation type used to select EVALIDs ('VOL' for the tree
+        estimators, 'ALL' for area by default).
+    **kwargs
+        Estimator options, as accepted by the estimator function (e.g.
+        ``grp_by``, ``land_type``, ``tree_domain``, ``totals``,
+        ``variance``).
+
+    Returns
+    -------
+    pl.DataFrame
+        Estimates with the same schema as the estimator function.
+
+    Raises
+    ------
+    ValueError
+        If the estimator, partition or an option is not supported.
+    NoEVALIDError
+        If no evaluations match the selection.
+    InsufficientDataError
+        If no partition has data for the estimate.
+
+    Examples
+    --------
+    >>> from pyfia.parallel import estimate_by_partition
+    >>> results = estimate_by_partition(
+    ...     "conus.duckdb", estimator="volume", grp_by="OWNGRPCD", workers=16
+    ... )
+    """
+    if estimator not in _ESTIMATORS:
+        raise ValueError(
+            f"Invalid estimator '{estimator}'. "
+            f"Must be one of: {', '.join(sorted(_ESTIMATORS))}"
+        )
+    if partition not in VALID_PARTITIONS:
+        raise ValueError(
+            f"Invalid partition '{partition}'. "
+            f"Must be one of: {', '.join(sorted(VALID_PARTITIONS))}"
+        )
+
+    spec = _ESTIMATORS[estimator]
+    # EVALID selection is made per partition, not through the options
+    config = build_estimator_config(
+        spec.function,
+        kwargs,
+        reserved=("db", "most_recent", "eval_type", "grouping_sets", "engine"),
+    )
+
+    with FIA(db_path) as db:
+        partitions = _find_partitions(
+            db, partition, states, evalids, eval_type or spec.eval_type
+        )
+
+        n_workers = min(workers or settings.max_threads, len(partitions))
+        logger.info(
+            f"Running {estimator} over {len(partitions)} partitions "
+            f"with {n_workers} workers"
+        )
+        jobs = [(str(db_path), estimator, config, ids) for ids in partitions]
+        if n_workers <= 1:
+            outputs = [_estimate_partition(*job) for job in jobs]
+        else:
+            # Spawned workers do not inherit DuckDB or Polars thread pools
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(n_workers, mp_context=context) as pool:
+                outputs = list(pool.map(_estimate_partition, *zip(*jobs)))
+
+        with_data = [(res, stats) for res, stats, _ in outputs if stats.height > 0]
+        if not with_data:
+            raise InsufficientDataError(
+                f"No partition has data for the {estimator} estimate"
+            )
+        group_cols = outputs[0][2]
+        stats = combine_stratum_statistics(
+            [stats for _, stats in with_data], group_cols
+        )
+
+        # Format against every partition's EVALID, as a single-process run
+        # clipped to the same evaluations would
+        db.clip_by_evalid([evalid for ids in partitions for evalid in ids])
+        combiner = spec.estimator_cls(db, config)
+        results = combiner.combine_partial_results(
+            [res for res, _ in with_data], stats, group_cols
+        )
+        formatted = decode_code_columns(combiner.format_output(results))
+
+    return apply_variance_columns(formatted, config.get("variance", False))
+
+
+def _estimate_partition(
+    db_path: str, estimator: str, config: dict, evalids: list[int]
+) -> tuple[pl.DataFrame, pl.DataFrame, list[str]]:
+    """Aggregate one partition and reduce it to stratum statistics."""
+    with FIA(db_path) as db:
+        db.clip_by_evalid(evalids)
+        worker = _ESTIMATORS[estimator].estimator_cls(db, config)
+        agg_result = worker.run_aggregation()
+        stats = worker.calculate_partial_statistics(agg_result)
+    return agg_result.results, stats, agg_result.group_cols
+
+
+def _find_partitions(
+    db: FIA,
+    partition: str,
+    states: int | list[int] | None,
+    evalids: list[int] | None,
+    eval_type: str,
+) -> list[list[int]]:
+    """Group the selected EVALIDs by the partition column."""
+    if evalids is None:
+        evalids = db.find_evalid(most_recent=True, state=states, eval_type=eval_type)
+    if not evalids:
+        raise NoEVALIDError(
+            operation=f"estimate_by_partition(eval_type='{eval_type}')",
+            suggestion="Check the state codes, or pass evalids explicitly.",
+        )
+
+    if "POP_EVAL" not in db.tables:
+        db.load_table("POP_EVAL")
+    groups = (
+        db.tables["POP_EVAL"]
+        .filter(pl.col("EVALID").is_in([int(e) for e in evalids]))
+        .group_by(partition)
+        .agg(pl.col("EVALID").unique().sort())
+        .sort(partition)
+        .collect()
+    )
+    return [[int(e) for e in ids] for ids in groups["EVALID"].to_list()]
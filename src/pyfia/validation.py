@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +16,7 @@ VALID_VOL_TYPES = {"net", "gross", "sound", "sawlog"}
 # Belowground/coarse-root biomass is "bg" (DRYBIO_BG); there is no DRYBIO_ROOT.
 VALID_BIOMASS_COMPONENTS = {"total", "ag", "bg", "bole", "branch", "foliage"}
 VALID_TEMPORAL_METHODS = {"TI", "ANNUAL", "SMA", "LMA", "EMA"}
+VALID_ENGINES = {"polars", "sql"}
 
 
 def validate_land_type(land_type: str) -> str:
@@ -86,6 +88,16 @@ def validate_temporal_method(method: str) -> str:
     return method
 
 
+def validate_engine(engine: str) -> str:
+    """Validate estimation engine parameter."""
+    if engine not in VALID_ENGINES:
+        raise ValueError(
+            f"Invalid engine '{engine}'. "
+            f"Must be one of: {', '.join(sorted(VALID_ENGINES))}"
+        )
+    return engine
+
+
 def validate_domain_expression(domain: str | None, domain_type: str) -> str | None:
     """Validate domain expression syntax, including SQL parsing.
 
@@ -187,6 +199,28 @@ def validate_grp_by(
     return grp_by
 
 
+def validate_grouping_sets(
+    grouping_sets: Sequence[str | list[str] | None] | None,
+    grp_by: str | list[str] | None = None,
+) -> list[list[str]] | None:
+    """Validate grouping_sets parameter into a list of column lists."""
+    if grouping_sets is None:
+        return None
+    if grp_by is not None:
+        raise ValueError("grp_by and grouping_sets cannot be combined")
+    if not isinstance(grouping_sets, (list, tuple)) or not grouping_sets:
+        raise TypeError("grouping_sets must be a non-empty list")
+
+    validated: list[list[str]] = []
+    for grouping in grouping_sets:
+        grouping = validate_grp_by(grouping)
+        columns = [grouping] if isinstance(grouping, str) else list(grouping or [])
+        if columns in validated:
+            raise ValueError(f"Duplicate grouping set: {columns}")
+        validated.append(columns)
+    return validated
+
+
 def validate_positive_number(value: Any, param_name: str) -> int | float:
     """Validate that a value is a positive number."""
     if not isinstance(value, (int, float)):
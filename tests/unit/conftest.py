@@ -9,8 +9,16 @@ real databases. These are marked with `db` and `slow` markers so they
 are skipped by default.
 """
 
+import hashlib
+import io
+import threading
+import time
+import zipfile
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+import duckdb
 import pytest
 
 # Test classes that require a real database connection
@@ -54,3 +62,236 @@ def pytest_collection_modifyitems(items):
         if filename in _DB_TEST_FILES or class_name in _DB_TEST_CLASSES:
             item.add_marker(pytest.mark.db)
             item.add_marker(pytest.mark.slow)
+
+
+# Synthetic multi-state database shared by the partitioned and batch tests
+MULTI_STATE_STATES = [13, 37, 45]
+MULTI_STATE_PLOTS = 48
+
+
+@pytest.fixture(scope="module")
+def multi_state_db(tmp_path_factory):
+    """Three-state FIA-shaped database with one evaluation per state."""
+    path = tmp_path_factory.mktemp("multi_state") / "fia.duckdb"
+    states = ", ".join(f"({s})" for s in MULTI_STATE_STATES)
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute(f"CREATE TABLE S AS SELECT * FROM (VALUES {states}) t(STATECD)")
+        conn.execute(
+            """
+            CREATE TABLE POP_EVAL AS
+            SELECT STATECD * 100 AS CN, STATECD * 10000 + 2301 AS EVALID,
+                   STATECD, 2023 - STATECD % 3 AS END_INVYR,
+                   'State ' || STATECD AS LOCATION_NM
+            FROM S
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE POP_EVAL_TYP AS
+            SELECT CN AS EVAL_CN, t.EVAL_TYP
+            FROM POP_EVAL, (VALUES ('EXPALL'), ('EXPVOL')) t(EVAL_TYP)
+            """
+        )
+        # Two estimation units with two strata each per state
+        conn.execute(
+            """
+            CREATE TABLE POP_ESTN_UNIT AS
+            SELECT STATECD * 1000 + u AS CN, STATECD * 10000 + 2301 AS EVALID,
+                   CAST(400000 + 50000 * u + STATECD * 100 AS DOUBLE) AS AREA_USED,
+                   CAST(4000 + 100 * u AS DOUBLE) AS P1PNTCNT_EU
+            FROM S, range(2) r(u)
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TABLE POP_STRATUM AS
+            SELECT e.CN * 10 + h AS CN, e.EVALID, e.CN AS ESTN_UNIT_CN,
+                   CAST(5000 + 700 * h + e.CN % 7 * 50 AS DOUBLE) AS EXPNS,
+                   12.0 AS ADJ_FACTOR_MICR, 1.0 AS ADJ_FACTOR_SUBP,
+                   0.25 AS ADJ_FACTOR_MACR,
+                   CAST(e.P1PNTCNT_EU * (0.3 + 0.4 * h) AS DOUBLE) AS P1POINTCNT,
+                   CAST({MULTI_STATE_PLOTS // 4} AS DOUBLE) AS P2POINTCNT
+            FROM POP_ESTN_UNIT e, range(2) r(h)
+            """
+        )
+        conn.execute(
+            f"""
+            CREATE TABLE PLOT AS
+            SELECT CAST(STATECD * 100000 + i AS BIGINT) AS CN, STATECD,
+                   2020 + i % 4 AS INVYR, 1 AS PLOT_STATUS_CD,
+                   1 + i % 2 AS UNITCD, 1 + i % 5 AS COUNTYCD,
+                   CASE WHEN i % 3 = 0 THEN 24.0 ELSE NULL END
+                       AS MACRO_BREAKPOINT_DIA
+            FROM S, range({MULTI_STATE_PLOTS}) r(i)
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE POP_PLOT_STRATUM_ASSGN AS
+            SELECT p.CN AS PLT_CN,
+                   (p.STATECD * 1000 + (p.CN % 100000) % 2) * 10
+                       + (p.CN % 100000) // 2 % 2 AS STRATUM_CN,
+                   p.STATECD * 10000 + 2301 AS EVALID, p.STATECD
+            FROM PLOT p
+            """
+        )
+        # Every third plot has a second, non-forest condition
+        conn.execute(
+            """
+            CREATE TABLE COND AS
+            SELECT p.CN * 10 + c AS CN, p.CN AS PLT_CN, c AS CONDID,
+                   CASE WHEN c = 1 THEN 1 ELSE 2 END AS COND_STATUS_CD,
+                   CASE WHEN p.CN % 3 = 0 THEN 0.75 - 0.5 * (c - 1) ELSE 1.0 END
+                       AS CONDPROP_UNADJ,
+                   CASE WHEN p.CN % 4 = 0 THEN 'MACR' ELSE 'SUBP' END
+                       AS PROP_BASIS,
+                   CASE WHEN p.CN % 5 < 2 THEN 10 ELSE 40 END AS OWNGRPCD,
+                   CASE WHEN p.CN % 7 = 0 THEN NULL ELSE 100 * (1 + p.CN % 3) END
+                       AS FORTYPCD,
+                   1 + p.CN % 5 AS SITECLCD, CAST(p.CN % 9 = 0 AS INTEGER)
+                       AS RESERVCD,
+                   1 + p.CN % 3 AS STDSZCD, 20 + p.CN % 60 AS STDAGE
+            FROM PLOT p, range(1, 3) r(c)
+            WHERE c = 1 OR p.CN % 3 = 0
+            """
+        )
+        # Some plots have no trees at all
+        conn.execute(
+            """
+            CREATE TABLE TREE AS
+            SELECT p.CN * 100 + t AS CN, p.CN AS PLT_CN, 1 AS CONDID,
+                   CASE WHEN t % 6 = 5 THEN 2 ELSE 1 END AS STATUSCD,
+                   CASE WHEN (p.CN + t) % 3 = 0 THEN 131 ELSE 316 END AS SPCD,
+                   2.0 + (p.CN * 7 + t * 13) % 30 AS DIA,
+                   CASE WHEN (p.CN * 7 + t * 13) % 30 < 3 THEN 74.965
+                        ELSE 6.018 END AS TPA_UNADJ,
+                   CASE WHEN t % 4 = 0 THEN 3 ELSE 2 END AS TREECLCD,
+                   CAST((p.CN * 7 + t * 13) % 30 AS DOUBLE) * 1.7 AS VOLCFNET,
+                   CAST((p.CN * 7 + t * 13) % 30 AS DOUBLE) * 1.9 AS VOLCFGRS,
+                   CAST((p.CN * 7 + t * 13) % 30 AS DOUBLE) * 1.8 AS VOLCFSND,
+                   CAST((p.CN * 7 + t * 13) % 30 AS DOUBLE) * 5.1 AS VOLBFNET,
+                   CAST((p.CN * 7 + t * 13) % 30 AS DOUBLE) * 5.5 AS VOLBFGRS,
+                   CAST((p.CN * 7 + t * 13) % 30 AS DOUBLE) * 40 AS DRYBIO_AG,
+                   CAST((p.CN * 7 + t * 13) % 30 AS DOUBLE) * 8 AS DRYBIO_BG,
+                   CAST((p.CN * 7 + t * 13) % 30 AS DOUBLE) * 20 AS CARBON_AG,
+                   CAST((p.CN * 7 + t * 13) % 30 AS DOUBLE) * 4 AS CARBON_BG,
+                   30.0 + t AS HT, 30.0 + t AS ACTUALHT, 40 AS CR
+            FROM PLOT p, range(1 + p.CN % 9) r(t)
+            WHERE p.CN % 11 <> 0
+            """
+        )
+        conn.execute("DROP TABLE S")
+    finally:
+        conn.close()
+    return path
+
+
+@dataclass
+class DataMartStandIn:
+    """Files and request log of a local HTTP stand-in for the FIA DataMart."""
+
+    url: str
+    files: dict[str, bytes] = field(default_factory=dict)
+    delays: dict[str, float] = field(default_factory=dict)
+    # Bytes sent before the connection drops, once, for the next GET of a file
+    drop_after: dict[str, int] = field(default_factory=dict)
+    # Body a file is replaced with after its connection drops
+    replace_after_drop: dict[str, bytes] = field(default_factory=dict)
+    requests: list[tuple[str, str]] = field(default_factory=list)
+    ranges: list[str | None] = field(default_factory=list)
+    active: int = 0
+    max_active: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add_zip(self, name: str, members: dict[str, str]) -> None:
+        """Serve ``{name}.zip`` holding the given CSV members."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            for member, text in members.items():
+                zf.writestr(f"{member}.csv", text)
+        self.files[f"{name}.zip"] = buffer.getvalue()
+
+    def add_csv_zip(self, name: str, csv_text: str) -> None:
+        """Serve ``csv_text`` as ``{name}.csv`` inside ``{name}.zip``."""
+        self.add_zip(name, {name: csv_text})
+
+
+@pytest.fixture
+def datamart_server():
+    """Local HTTP server serving DataMart-style ZIP files."""
+    stand_in = DataMartStandIn(url="")
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send_headers(self, status: int, body: bytes, length: int) -> None:
+            self.send_response(status)
+            self.send_header("Content-Length", str(length))
+            self.send_header("ETag", f'"{hashlib.md5(body).hexdigest()}"')
+            self.send_header("Last-Modified", "Mon, 06 Jan 2025 00:00:00 GMT")
+            self.send_header("Accept-Ranges", "bytes")
+
+        def do_HEAD(self):
+            name = self.path.lstrip("/")
+            with stand_in.lock:
+                stand_in.requests.append(("HEAD", name))
+            body = stand_in.files.get(name)
+            if body is None:
+                self.send_error(404)
+                return
+            self._send_headers(200, body, len(body))
+            self.end_headers()
+
+        def do_GET(self):
+            name = self.path.lstrip("/")
+            with stand_in.lock:
+                stand_in.requests.append(("GET", name))
+                stand_in.ranges.append(self.headers.get("Range"))
+                stand_in.active += 1
+                stand_in.max_active = max(stand_in.max_active, stand_in.active)
+            try:
+                time.sleep(stand_in.delays.get(name, 0.0))
+                body = stand_in.files.get(name)
+                if body is None:
+                    self.send_error(404)
+                    return
+
+                start = 0
+                range_header = self.headers.get("Range")
+                etag = f'"{hashlib.md5(body).hexdigest()}"'
+                if range_header and self.headers.get("If-Range") in (None, etag):
+                    start = int(range_header.removeprefix("bytes=").split("-")[0])
+                if start:
+                    self._send_headers(206, body, len(body) - start)
+                    self.send_header(
+                        "Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}"
+                    )
+                else:
+                    self._send_headers(200, body, len(body))
+                self.end_headers()
+
+                drop = stand_in.drop_after.pop(name, None)
+                if drop is not None:
+                    # Send part of the body, then close the connection
+                    self.wfile.write(body[start : start + drop])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    if name in stand_in.replace_after_drop:
+                        stand_in.files[name] = stand_in.replace_after_drop.pop(name)
+                    return
+                self.wfile.write(body[start:])
+            finally:
+                with stand_in.lock:
+                    stand_in.active -= 1
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    stand_in.url = f"http://127.0.0.1:{server.server_address[1]}/"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield stand_in
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,79 @@
+"""Batch estimation over a shared load against individual estimator calls."""
+
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from pyfia import FIA, biomass, estimate_many, tpa, volume
+from pyfia.estimation.estimators.carbon_pools import carbon_pool
+
+EVALIDS = [132301, 372301, 452301]
+
+FUNCTIONS = {
+    "biomass": biomass,
+    "carbon_pool": carbon_pool,
+    "tpa": tpa,
+    "volume": volume,
+}
+
+
+def _clipped(path) -> FIA:
+    db = FIA(path)
+    db.clip_by_evalid(EVALIDS)
+    return db
+
+
+def _assert_same(result: pl.DataFrame, expected: pl.DataFrame):
+    assert result.columns == expected.columns
+    keys = [c for c in expected.columns if not expected[c].dtype.is_float()]
+    result = result.sort(keys, nulls_last=True)
+    expected = expected.sort(keys, nulls_last=True)
+    for col in expected.columns:
+        if expected[col].dtype.is_numeric():
+            np.testing.assert_allclose(
+                result[col].cast(pl.Float64).to_numpy(),
+                expected[col].cast(pl.Float64).to_numpy(),
+                rtol=1e-12,
+            )
+        else:
+            assert result[col].to_list() == expected[col].to_list()
+
+
+def test_matches_individual_calls(multi_state_db):
+    requests = [
+        ("volume", {}),
+        ("volume", {"vol_type": "gross", "tree_type": "gs"}),
+        ("biomass", {"component": "AG", "variance": True}),
+        ("tpa", {"by_species": True, "tree_type": "dead", "land_type": "all"}),
+        ("carbon_pool", {"pool": "ag", "land_type": "timber"}),
+        ("volume", {"tree_domain": "DIA >= 10.0", "plot_domain": "COUNTYCD = 2"}),
+    ]
+    common = {"grp_by": "OWNGRPCD"}
+
+    results = estimate_many(_clipped(multi_state_db), requests, **common)
+
+    assert len(results) == len(requests)
+    for result, (name, options) in zip(results, requests):
+        expected = FUNCTIONS[name](_clipped(multi_state_db), **common, **options)
+        _assert_same(result, expected)
+
+
+def test_request_options_override_shared(multi_state_db):
+    (result,) = estimate_many(
+        _clipped(multi_state_db), [("tpa", {"grp_by": None})], grp_by="OWNGRPCD"
+    )
+    assert "OWNGRPCD" not in result.columns
+    assert result.height == 1
+
+
+def test_invalid_requests(multi_state_db):
+    db = _clipped(multi_state_db)
+    with pytest.raises(ValueError, match="estimator"):
+        estimate_many(db, [("growth", {})])
+    with pytest.raises(ValueError, match="vol_typ"):
+        estimate_many(db, [("volume", {"vol_typ": "net"})])
+    with pytest.raises(ValueError, match="most_recent"):
+        estimate_many(db, [("tpa", {})], most_recent=True)
+    assert estimate_many(db, []) == []
@@ -0,0 +1,120 @@
+"""Compact encoding of FIA code columns during estimation."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import numpy as np
+import polars as pl
+import pytest
+
+from pyfia import FIA, area, tpa, volume
+from pyfia.estimation.codes import (
+    GRM_COMPONENT_DTYPE,
+    component_starts_with,
+    decode_code_columns,
+    encode_code_columns,
+)
+from pyfia.estimation.grm import load_grm_component, load_grm_midpt, resolve_grm_columns
+
+EVALIDS = [132301, 372301, 452301]
+
+
+def _clipped(path, compact_codes: bool) -> FIA:
+    db = FIA(path, compact_codes=compact_codes)
+    db.clip_by_evalid(EVALIDS)
+    return db
+
+
+@pytest.mark.parametrize(
+    "function, kwargs",
+    [
+        (tpa, {"grp_by": ["STATECD", "OWNGRPCD"]}),
+        (tpa, {"by_species": True, "grp_by": "FORTYPCD"}),
+        (volume, {"grp_by": "OWNGRPCD", "by_species": True}),
+        (area, {"grp_by": ["OWNGRPCD", "FORTYPCD"]}),
+    ],
+)
+def test_compact_mode_matches_standard(multi_state_db, function, kwargs):
+    expected = function(_clipped(multi_state_db, False), **kwargs)
+    result = function(_clipped(multi_state_db, True), **kwargs)
+
+    assert result.schema == expected.schema
+    keys = [c for c in expected.columns if not expected[c].dtype.is_float()]
+    result = result.sort(keys, nulls_last=True)
+    expected = expected.sort(keys, nulls_last=True)
+    for col in expected.columns:
+        if expected[col].dtype.is_float():
+            np.testing.assert_allclose(
+                result[col].to_numpy(), expected[col].to_numpy(), rtol=1e-12
+            )
+        else:
+            assert result[col].to_list() == expected[col].to_list()
+
+
+def test_encode_and_decode_round_trip():
+    frame = pl.DataFrame(
+        {
+            "SPCD": [131, 316, None],
+            "STATECD": [13, 37, 45],
+            "COMPONENT": ["SURVIVOR", "MORTALITY1", "CUT2"],
+            "DIA": [5.0, 6.0, 7.0],
+        }
+    )
+    encoded = encode_code_columns(frame.lazy()).collect()
+
+    assert encoded.schema["SPCD"] == pl.UInt16
+    assert encoded.schema["STATECD"] == pl.UInt16
+    assert encoded.schema["COMPONENT"] == GRM_COMPONENT_DTYPE
+    assert encoded.schema["DIA"] == pl.Float64
+    assert decode_code_columns(encoded).equals(frame)
+
+
+def test_encode_rejects_unknown_component():
+    frame = pl.LazyFrame({"COMPONENT": ["MORTALITY9"]})
+    with pytest.raises(pl.exceptions.InvalidOperationError):
+        encode_code_columns(frame).collect()
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_component_starts_with(compact):
+    frame = pl.DataFrame({"COMPONENT": ["SURVIVOR", "CUT1", "CUT2", "MORTALITY1"]})
+    if compact:
+        frame = frame.with_columns(pl.col("COMPONENT").cast(GRM_COMPONENT_DTYPE))
+
+    out = frame.filter(component_starts_with("CUT", compact))
+
+    assert out["COMPONENT"].cast(pl.String).to_list() == ["CUT1", "CUT2"]
+
+
+def test_grm_loaders_encode_codes():
+    cols = resolve_grm_columns("mortality", tree_type="gs", land_type="forest")
+    component = pl.DataFrame(
+        {
+            "TRE_CN": ["1"],
+            "PLT_CN": ["10"],
+            "DIA_BEGIN": [5.0],
+            "DIA_MIDPT": [6.5],
+            cols.component: ["MORTALITY1"],
+            cols.tpa: [0.5],
+            cols.subptyp: [1],
+        }
+    )
+    midpt = pl.DataFrame(
+        {"TRE_CN": ["1"], "DIA": [6.5], "SPCD": [131], "STATUSCD": [2]}
+    )
+    tables = {
+        "TREE_GRM_COMPONENT": component.lazy(),
+        "TREE_GRM_MIDPT": midpt.lazy(),
+    }
+    db = SimpleNamespace(
+        load_table=lambda table, columns=None, where=None: tables[table],
+        compact_codes=True,
+    )
+
+    assert load_grm_component(db, cols).collect_schema()["COMPONENT"] == (
+        GRM_COMPONENT_DTYPE
+    )
+    midpt_schema = load_grm_midpt(db, measure="count").collect_schema()
+    assert midpt_schema["SPCD"] == pl.UInt16
+    assert midpt_schema["STATUSCD"] == pl.Int64
@@ -0,0 +1,93 @@
+"""Concurrent DataMart downloads against a local HTTP stand-in server."""
+
+from __future__ import annotations
+
+import duckdb
+import pytest
+
+import pyfia.downloader as downloader
+from pyfia.downloader import DataMartClient
+
+TABLES = ["PLOT", "COND", "TREE", "POP_STRATUM", "POP_ESTN_UNIT", "POP_EVAL"]
+
+
+@pytest.fixture
+def client(datamart_server):
+    for table in TABLES:
+        datamart_server.add_csv_zip(f"GA_{table}", "CN,PLT_CN\n1,10\n2,10\n")
+        datamart_server.delays[f"GA_{table}.zip"] = 0.1
+    return DataMartClient(max_workers=3, base_url=datamart_server.url)
+
+
+def test_downloads_tables_concurrently(client, datamart_server, tmp_path):
+    paths = client.download_tables(
+        "GA", tables=TABLES, dest_dir=tmp_path, show_progress=False
+    )
+
+    assert sorted(paths) == sorted(TABLES)
+    assert all(path.read_text().startswith("CN,PLT_CN") for path in paths.values())
+    # Bounded by the per-host connection limit
+    assert 1 < datamart_server.max_active <= 3
+
+
+def test_missing_tables_are_skipped(client, tmp_path):
+    paths = client.download_tables(
+        "GA", tables=["PLOT", "NOT_A_TABLE"], dest_dir=tmp_path, show_progress=False
+    )
+
+    assert list(paths) == ["PLOT"]
+
+
+def test_tables_are_yielded_as_they_finish(client, datamart_server, tmp_path):
+    datamart_server.delays["GA_TREE.zip"] = 0.5
+
+    order = [
+        table
+        for table, _ in client.iter_download_tables(
+            "GA",
+            tables=["TREE", "PLOT", "COND"],
+            dest_dir=tmp_path,
+            show_progress=False,
+        )
+    ]
+
+    assert order[-1] == "TREE"
+    assert sorted(order) == ["COND", "PLOT", "TREE"]
+
+
+def test_download_builds_database(datamart_server, tmp_path, monkeypatch):
+    datamart_server.add_csv_zip("GA_PLOT", "CN,STATECD,INVYR\n10,13,2020\n11,13,2021\n")
+    datamart_server.add_csv_zip(
+        "GA_TREE", "CN,PLT_CN,DIA\n1,11,5.0\n2,10,6.5\n3,11,7.0\n"
+    )
+    datamart_server.add_zip(
+        "FIADB_REFERENCE",
+        {
+            "REF_SPECIES": "SPCD,COMMON_NAME\n131,loblolly pine\n",
+            "REF_FOREST_TYPE": "VALUE,MEANING\n161,Loblolly pine\n",
+            "REF_STATE": "STATECD,STATE_NAME\n13,Georgia\n",
+        },
+    )
+    monkeypatch.setattr(
+        downloader,
+        "DataMartClient",
+        lambda: DataMartClient(base_url=datamart_server.url),
+    )
+
+    path = downloader.download(
+        "GA",
+        dir=tmp_path,
+        tables=["PLOT", "TREE"],
+        show_progress=False,
+        use_cache=False,
+    )
+
+    conn = duckdb.connect(str(path), read_only=True)
+    try:
+        trees = conn.execute("SELECT CN, PLT_CN, DIA FROM TREE").fetchall()
+        tables = {row[0] for row in conn.execute("SHOW TABLES").fetchall()}
+    finally:
+        conn.close()
+    assert sorted(trees) == [(1, 11, 5.0), (2, 10, 6.5), (3, 11, 7.0)]
+    assert {"PLOT", "TREE", "REF_SPECIES", "REF_FOREST_TYPE", "REF_STATE"} <= tables
+    assert not list((tmp_path / "ga").glob("*.csv"))
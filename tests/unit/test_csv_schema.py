@@ -0,0 +1,74 @@
+"""Typed DataMart CSV conversion and the reject report."""
+
+from __future__ import annotations
+
+import duckdb
+
+from pyfia.downloader import _convert_csvs_to_duckdb
+from pyfia.downloader.schema import REJECTS_TABLE, csv_column_types
+
+
+def _convert(tmp_path, files: dict[str, str]):
+    csv_dir = tmp_path / "csv"
+    csv_dir.mkdir()
+    for name, text in files.items():
+        (csv_dir / name).write_text(text)
+    path = _convert_csvs_to_duckdb(csv_dir, tmp_path / "ga.duckdb", show_progress=False)
+    return duckdb.connect(str(path), read_only=True)
+
+
+def test_csv_column_types():
+    types = csv_column_types(
+        ["CN", "PLT_CN", "DIA", "SPCD", "SUBP_TPAMORT_UNADJ_GS_FOREST", "REMARKS"]
+    )
+
+    assert types == {
+        "CN": "BIGINT",
+        "PLT_CN": "BIGINT",
+        "DIA": "DOUBLE",
+        "SPCD": "BIGINT",
+        "SUBP_TPAMORT_UNADJ_GS_FOREST": "DOUBLE",
+    }
+
+
+def test_declared_types_override_sniffing(tmp_path):
+    # An all-empty numeric column would be sniffed as VARCHAR (#106)
+    conn = _convert(
+        tmp_path,
+        {"GA_PLOT.csv": "CN,STATECD,MACRO_BREAKPOINT_DIA,REMARKS\n1,13,,a\n2,13,,b\n"},
+    )
+    try:
+        schema = dict(
+            (row[0], row[1]) for row in conn.execute("DESCRIBE PLOT").fetchall()
+        )
+        tables = {row[0] for row in conn.execute("SHOW TABLES").fetchall()}
+    finally:
+        conn.close()
+
+    assert schema["CN"] == "BIGINT"
+    assert schema["MACRO_BREAKPOINT_DIA"] == "DOUBLE"
+    assert schema["REMARKS"] == "VARCHAR"
+    assert REJECTS_TABLE not in tables
+
+
+def test_unparseable_rows_are_reported(tmp_path):
+    conn = _convert(
+        tmp_path,
+        {
+            "GA_TREE.csv": "CN,PLT_CN,DIA\n1,10,5.5\n2,10,x\n3,11,7.0\n",
+            "GA_COND.csv": "PLT_CN,CONDID,CONDPROP_UNADJ\n10,1,1.0\n",
+        },
+    )
+    try:
+        n_trees = conn.execute("SELECT COUNT(*) FROM TREE").fetchone()[0]
+        rejects = conn.execute(
+            f"SELECT FILE_PATH, LINE, COLUMN_NAME FROM {REJECTS_TABLE}"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert n_trees == 2
+    assert len(rejects) == 1
+    file_path, line, column = rejects[0]
+    assert file_path.endswith("GA_TREE.csv")
+    assert (line, column) == (3, "DIA")
@@ -0,0 +1,108 @@
+"""Sort order, indexes and layout metadata written by optimize_database."""
+
+from __future__ import annotations
+
+import shutil
+
+import duckdb
+import numpy as np
+import pytest
+
+from pyfia import FIA, optimize_database, tpa, volume
+from pyfia.downloader import LAYOUT_VERSION, get_layout_version
+from pyfia.downloader.metadata import METADATA_TABLE
+
+EVALIDS = [132301, 372301, 452301]
+
+
+@pytest.fixture
+def optimized_db(multi_state_db, tmp_path):
+    path = tmp_path / "fia.duckdb"
+    shutil.copy(multi_state_db, path)
+    optimize_database(path)
+    return path
+
+
+def _indexes(path) -> set[tuple[str, str]]:
+    conn = duckdb.connect(str(path), read_only=True)
+    try:
+        rows = conn.execute(
+            "SELECT table_name, expressions FROM duckdb_indexes()"
+        ).fetchall()
+    finally:
+        conn.close()
+    return {(table, expr.strip("[]'\"")) for table, expr in rows}
+
+
+def test_records_layout_version(multi_state_db, optimized_db):
+    assert get_layout_version(multi_state_db) is None
+    assert get_layout_version(optimized_db) == LAYOUT_VERSION
+
+
+def _tree_keys(conn) -> list[tuple[int, int]]:
+    return conn.execute("SELECT STATECD, PLT_CN FROM TREE").fetchall()
+
+
+def test_sorts_plot_keyed_tables(multi_state_db, tmp_path):
+    path = tmp_path / "shuffled.duckdb"
+    shutil.copy(multi_state_db, path)
+    conn = duckdb.connect(str(path))
+    try:
+        # STATECD is deliberately out of PLT_CN order, so sorting by PLT_CN
+        # alone does not pass
+        conn.execute(
+            "CREATE OR REPLACE TABLE TREE AS "
+            "SELECT *, CAST(PLT_CN % 3 AS INTEGER) AS STATECD FROM TREE "
+            "ORDER BY random()"
+        )
+        before = _tree_keys(conn)
+    finally:
+        conn.close()
+    assert before != sorted(before)
+
+    optimize_database(path)
+
+    conn = duckdb.connect(str(path), read_only=True)
+    try:
+        after = _tree_keys(conn)
+    finally:
+        conn.close()
+    assert after == sorted(after)
+    assert after != sorted(after, key=lambda key: key[1])
+
+
+def test_indexes_key_columns(optimized_db):
+    indexes = _indexes(optimized_db)
+
+    assert ("TREE", "CN") in indexes
+    assert ("TREE", "PLT_CN") in indexes
+    assert ("COND", "PLT_CN") in indexes
+    assert ("POP_PLOT_STRATUM_ASSGN", "EVALID") in indexes
+    assert not any(table == METADATA_TABLE for table, _ in indexes)
+
+
+def test_rerun_is_noop_unless_forced(optimized_db):
+    before = _indexes(optimized_db)
+
+    optimize_database(optimized_db)
+    optimize_database(optimized_db, force=True)
+
+    assert _indexes(optimized_db) == before
+    assert get_layout_version(optimized_db) == LAYOUT_VERSION
+
+
+@pytest.mark.parametrize("function", [tpa, volume])
+def test_estimates_unchanged(multi_state_db, optimized_db, function):
+    results = []
+    for path in (multi_state_db, optimized_db):
+        db = FIA(path)
+        db.clip_by_evalid(EVALIDS)
+        results.append(function(db, grp_by="OWNGRPCD"))
+    expected, result = (r.sort("OWNGRPCD") for r in results)
+
+    assert result.schema == expected.schema
+    for col in expected.columns:
+        if expected[col].dtype.is_float():
+            np.testing.assert_allclose(result[col], expected[col], rtol=1e-12)
+        else:
+            assert result[col].to_list() == expected[col].to_list()
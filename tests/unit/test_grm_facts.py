@@ -0,0 +1,199 @@
+"""Shared per-tree GRM fact frame used by growth, mortality and removals."""
+
+from __future__ import annotations
+
+import duckdb
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from pyfia import FIA, materialize_grm
+from pyfia.estimation.estimators.growth import GrowthEstimator
+from pyfia.estimation.estimators.mortality import MortalityEstimator
+from pyfia.estimation.estimators.removals import RemovalsEstimator
+from pyfia.estimation.grm import (
+    GRM_FACTS_TABLE,
+    load_grm_component,
+    load_grm_facts,
+    load_grm_midpt,
+    resolve_grm_columns,
+)
+from pyfia.estimation.grm_materialize import (
+    GRM_FACTS_DB_TABLE,
+    materialized_grm_evalids,
+)
+
+
+@pytest.fixture
+def grm_db(tmp_path):
+    """Two evaluations; every third tree has no TREE_GRM_MIDPT row."""
+    path = tmp_path / "grm.duckdb"
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute(
+            """
+            CREATE TABLE POP_PLOT_STRATUM_ASSGN AS
+            SELECT i AS PLT_CN, CASE WHEN i < 5 THEN 132303 ELSE 132203 END AS EVALID
+            FROM range(10) t(i);
+
+            CREATE TABLE TREE_GRM_COMPONENT AS
+            SELECT 100 + i AS TRE_CN, i % 10 AS PLT_CN,
+                   10.0 AS DIA_BEGIN, 11.0 AS DIA_MIDPT, 12.0 AS DIA_END,
+                   CASE i % 3 WHEN 0 THEN 'SURVIVOR' WHEN 1 THEN 'MORTALITY1'
+                        ELSE 'CUT1' END AS SUBP_COMPONENT_GS_FOREST,
+                   i * 0.1 AS SUBP_TPAGROW_UNADJ_GS_FOREST,
+                   i * 0.2 AS SUBP_TPAMORT_UNADJ_GS_FOREST,
+                   i * 0.3 AS SUBP_TPAREMV_UNADJ_GS_FOREST,
+                   1 AS SUBP_SUBPTYP_GRM_GS_FOREST
+            FROM range(40) t(i);
+
+            CREATE TABLE TREE_GRM_MIDPT AS
+            SELECT 100 + i AS TRE_CN, 11.0 AS DIA, 131 AS SPCD, 2 AS STATUSCD,
+                   20.0 AS VOLCFNET, 4.0 AS DRYBIO_BOLE, 1.0 AS DRYBIO_BRANCH,
+                   6.0 AS DRYBIO_AG
+            FROM range(40) t(i) WHERE i % 3 <> 0;
+
+            CREATE TABLE TREE_GRM_BEGIN AS
+            SELECT 100 + i AS TRE_CN, i % 10 AS PLT_CN, 18.0 AS VOLCFNET,
+                   5.0 AS DRYBIO_AG
+            FROM range(40) t(i);
+            """
+        )
+    finally:
+        conn.close()
+    return path
+
+
+@pytest.fixture
+def db(grm_db):
+    with FIA(grm_db) as fia:
+        fia.clip_by_evalid(132303)
+        yield fia
+
+
+def _config(measure="volume"):
+    return {"measure": measure, "tree_type": "gs", "land_type": "forest"}
+
+
+def _cache_entries(db, table):
+    return [
+        entry
+        for entry in db.tables.get_cache_info()["entries"]
+        if entry["table"] == table
+    ]
+
+
+def test_component_selection_matches_separate_loads(db):
+    estimator = MortalityEstimator(db, _config())
+
+    shared = (
+        estimator._load_grm_facts()
+        .filter(pl.col("HAS_MIDPT"))
+        .drop("HAS_MIDPT")
+        .collect()
+    )
+    separate = (
+        load_grm_component(db, resolve_grm_columns("mortality"), include_dia_end=True)
+        .join(load_grm_midpt(db, measure="volume"), on="TRE_CN", how="inner")
+        .collect()
+    )
+
+    assert_frame_equal(shared, separate, check_row_order=False)
+
+
+def test_frame_is_built_once_for_all_components(db):
+    load_grm_facts(db, measures=("biomass",))
+
+    for estimator_class in (GrowthEstimator, MortalityEstimator, RemovalsEstimator):
+        estimator_class(db, _config("biomass"))._load_grm_facts().collect()
+
+    assert len(_cache_entries(db, GRM_FACTS_TABLE)) == 1
+    assert len(_cache_entries(db, "TREE_GRM_COMPONENT")) == 1
+
+
+def test_loads_only_requested_tpa_columns(db):
+    load_grm_facts(db, components=("mortality",)).collect()
+
+    (entry,) = _cache_entries(db, "TREE_GRM_COMPONENT")
+    assert "SUBP_TPAMORT_UNADJ_GS_FOREST" in entry["columns"]
+    assert "SUBP_TPAGROW_UNADJ_GS_FOREST" not in entry["columns"]
+
+
+def test_later_components_extend_the_cached_frame(db):
+    MortalityEstimator(db, _config())._load_grm_facts().collect()
+    RemovalsEstimator(db, _config())._load_grm_facts().collect()
+    MortalityEstimator(db, _config())._load_grm_facts().collect()
+
+    (entry,) = _cache_entries(db, GRM_FACTS_TABLE)
+    assert {"TPAMORT_UNADJ", "TPAREMV_UNADJ"} <= set(entry["columns"])
+
+
+def test_growth_keeps_trees_without_midpoint(db):
+    facts = GrowthEstimator(db, _config())._load_grm_facts().collect()
+
+    assert facts.height == 20
+    assert facts.filter(~pl.col("HAS_MIDPT"))["VOLCFNET"].is_null().all()
+    assert facts["BEGIN_VOLCFNET"].to_list() == [18.0] * 20
+
+
+def test_new_evaluation_rebuilds_frame(db):
+    load_grm_facts(db)
+    db.clip_by_evalid(132203)
+
+    assert not _cache_entries(db, GRM_FACTS_TABLE)
+    assert set(load_grm_facts(db).collect()["PLT_CN"].cast(int)) == set(range(5, 10))
+
+
+def _facts(db, components=("growth", "mortality", "removals")):
+    return (
+        load_grm_facts(db, components=components, measures=("volume", "biomass"))
+        .collect()
+        .sort("TRE_CN")
+    )
+
+
+def test_materialized_facts_match_joined_tables(db):
+    joined = _facts(db)
+    db.tables.clear()
+
+    assert materialize_grm(db, evalid=[132303, 132203]) == [132203, 132303]
+    stored = _facts(db)
+
+    assert materialized_grm_evalids(db) == {132203, 132303}
+    assert _cache_entries(db, GRM_FACTS_DB_TABLE)
+    assert not _cache_entries(db, "TREE_GRM_COMPONENT")
+    assert_frame_equal(stored, joined, check_column_order=False)
+
+
+def test_defaults_to_clipped_evaluation(db):
+    assert materialize_grm(db) == [132303]
+    assert materialized_grm_evalids(db) == {132303}
+
+
+def test_unmaterialized_evaluation_joins_tables(grm_db):
+    materialize_grm(grm_db, evalid=132203)
+
+    with FIA(grm_db) as fia:
+        fia.clip_by_evalid([132203, 132303])
+        facts = _facts(fia, components=("mortality",))
+
+        assert facts.height == 40
+        assert not _cache_entries(fia, GRM_FACTS_DB_TABLE)
+
+
+def test_other_version_is_ignored(grm_db):
+    materialize_grm(grm_db, evalid=132303)
+    conn = duckdb.connect(str(grm_db))
+    try:
+        conn.execute(
+            "UPDATE PYFIA_METADATA SET VALUE = '0' WHERE KEY = 'grm_facts_version'"
+        )
+    finally:
+        conn.close()
+
+    with FIA(grm_db) as fia:
+        fia.clip_by_evalid(132303)
+        assert materialized_grm_evalids(fia) == set()
+
+        materialize_grm(fia)
+        assert materialized_grm_evalids(fia) == {132303}
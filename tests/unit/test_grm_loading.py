@@ -0,0 +1,118 @@
+"""EVALID-scoped, projected loading of the GRM tables."""
+
+from __future__ import annotations
+
+import duckdb
+import pytest
+
+from pyfia import FIA
+from pyfia.estimation.grm import (
+    load_grm_begin,
+    load_grm_component,
+    load_grm_midpt,
+    resolve_grm_columns,
+)
+
+
+@pytest.fixture
+def grm_db(tmp_path):
+    """Two evaluations over disjoint plots; TREE_GRM_MIDPT has no PLT_CN."""
+    path = tmp_path / "grm.duckdb"
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute(
+            """
+            CREATE TABLE POP_PLOT_STRATUM_ASSGN AS
+            SELECT i AS PLT_CN, CASE WHEN i < 5 THEN 132301 ELSE 132201 END AS EVALID
+            FROM range(10) t(i);
+
+            CREATE TABLE TREE_GRM_COMPONENT AS
+            SELECT 100 + i AS TRE_CN, i % 10 AS PLT_CN,
+                   10.0 AS DIA_BEGIN, 11.0 AS DIA_MIDPT, 12.0 AS DIA_END,
+                   'MORTALITY1' AS SUBP_COMPONENT_GS_FOREST,
+                   0.5 AS SUBP_TPAMORT_UNADJ_GS_FOREST,
+                   1 AS SUBP_SUBPTYP_GRM_GS_FOREST,
+                   'SURVIVOR' AS SUBP_COMPONENT_AL_TIMBER,
+                   'unused' AS REMARKS
+            FROM range(40) t(i);
+
+            CREATE TABLE TREE_GRM_MIDPT AS
+            SELECT 100 + i AS TRE_CN, 11.0 AS DIA, 131 AS SPCD, 2 AS STATUSCD,
+                   20.0 AS VOLCFNET, 'unused' AS REMARKS
+            FROM range(40) t(i);
+
+            CREATE TABLE TREE_GRM_BEGIN AS
+            SELECT 100 + i AS TRE_CN, i % 10 AS PLT_CN, 18.0 AS VOLCFNET,
+                   'unused' AS REMARKS
+            FROM range(40) t(i);
+            """
+        )
+    finally:
+        conn.close()
+    return path
+
+
+@pytest.fixture
+def db(grm_db):
+    with FIA(grm_db) as fia:
+        fia.clip_by_evalid(132301)
+        yield fia
+
+
+def _loaded_columns(db, table):
+    return [
+        set(entry["columns"] or [])
+        for entry in db.tables.get_cache_info()["entries"]
+        if entry["table"] == table
+    ]
+
+
+def test_component_is_projected_and_scoped(db):
+    cols = resolve_grm_columns("mortality")
+
+    data = load_grm_component(db, cols).collect()
+
+    assert data.height == 20
+    assert set(data["PLT_CN"].cast(int)) == set(range(5))
+    assert _loaded_columns(db, "TREE_GRM_COMPONENT") == [
+        {
+            "TRE_CN",
+            "PLT_CN",
+            "DIA_BEGIN",
+            "DIA_MIDPT",
+            cols.component,
+            cols.tpa,
+            cols.subptyp,
+        }
+    ]
+
+
+def test_midpt_without_plt_cn_is_semi_joined_to_components(db):
+    data = load_grm_midpt(db, measure="volume").collect()
+
+    # Trees on the evaluation's plots: TRE_CN 100 + i with i % 10 < 5
+    assert sorted(data["TRE_CN"].cast(int)) == [
+        100 + i for i in range(40) if i % 10 < 5
+    ]
+    assert _loaded_columns(db, "TREE_GRM_MIDPT") == [
+        {"TRE_CN", "DIA", "SPCD", "STATUSCD", "VOLCFNET"}
+    ]
+
+
+def test_begin_is_projected_and_scoped(db):
+    data = load_grm_begin(db, measure="volume").collect()
+
+    assert data.columns == ["TRE_CN", "VOLCFNET"]
+    assert data.height == 20
+
+
+def test_unclipped_database_loads_every_row(grm_db):
+    with FIA(grm_db) as fia:
+        assert load_grm_midpt(fia, measure="volume").collect().height == 40
+
+
+def test_components_for_other_columns_reuse_cache(db):
+    load_grm_component(db, resolve_grm_columns("mortality"), include_dia_end=True)
+    load_grm_component(db, resolve_grm_columns("mortality"))
+
+    assert len(_loaded_columns(db, "TREE_GRM_COMPONENT")) == 1
@@ -20,8 +20,11 @@ from pyfia.estimation.grm import (
 
 
 def _mock_db(table_name, frame):
-    """A minimal db whose .tables holds a single lazy frame."""
-    return SimpleNamespace(tables={table_name: frame.lazy()})
+    """A minimal db whose load_table() returns a single lazy frame."""
+    tables = {table_name: frame.lazy()}
+    return SimpleNamespace(
+        load_table=lambda table, columns=None, where=None: tables[table],
+    )
 
 
 class TestLoadGRMComponentCast:
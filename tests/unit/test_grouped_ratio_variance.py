@@ -0,0 +1,229 @@
+"""Sparse grouped variance against the zero-filled per-group and dense paths."""
+
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from pyfia.estimation.variance import (
+    calculate_grouped_domain_total_variance,
+    calculate_grouped_ratio_of_means_variance,
+    calculate_ratio_of_means_variance,
+    calculate_stratum_statistics,
+    calculate_variance_from_stratum_statistics,
+    combine_stratum_statistics,
+    join_on_groups,
+)
+
+
+def _design(n_plots: int = 60, bp: bool = True, seed: int = 0) -> pl.DataFrame:
+    """All plots of a two-EU, four-stratum design."""
+    rng = np.random.default_rng(seed)
+    eu = np.arange(n_plots) % 2
+    stratum = eu * 10 + (np.arange(n_plots) // 2) % 2
+    frame = pl.DataFrame(
+        {
+            "PLT_CN": [str(i) for i in range(n_plots)],
+            "STRATUM_CN": stratum.astype(np.int64),
+            "EXPNS": 1000.0 + stratum * 10.0,
+        }
+    )
+    if bp:
+        frame = frame.with_columns(
+            pl.Series("ESTN_UNIT_CN", eu.astype(np.int64)),
+            pl.Series("STRATUM_WGT", np.where(stratum % 2 == 0, 0.4, 0.6)),
+            pl.Series("AREA_USED", 50_000.0 + eu * 1000.0),
+            pl.Series("P2POINTCNT", np.full(n_plots, n_plots / 4)),
+        )
+    # Shuffle so nothing relies on row order
+    return frame.sample(fraction=1.0, shuffle=True, seed=int(rng.integers(1000)))
+
+
+def _plot_values(all_plots: pl.DataFrame, seed: int = 1) -> pl.DataFrame:
+    """Sparse plot-level values: only some plots carry each group."""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for cn in all_plots["PLT_CN"]:
+        for group in ("a", "b", None):
+            if rng.random() < 0.4:
+                rows.append(
+                    {
+                        "PLT_CN": cn,
+                        "GRP": group,
+                        "y1": float(rng.gamma(2.0, 5.0)),
+                        "y2": float(rng.integers(0, 3)),
+                        "x_i": float(rng.uniform(0.25, 1.0)),
+                    }
+                )
+    return pl.DataFrame(rows)
+
+
+def _reference(
+    plot_data: pl.DataFrame, all_plots: pl.DataFrame, group: str | None, y: str
+) -> dict[str, float]:
+    """Zero-filled single-group call, as the estimators used to do."""
+    rows = plot_data.filter(
+        pl.col("GRP").is_null() if group is None else pl.col("GRP") == group
+    ).select("PLT_CN", y, "x_i")
+    filled = all_plots.join(rows, on="PLT_CN", how="left").with_columns(
+        pl.col(y).fill_null(0.0), pl.col("x_i").fill_null(0.0)
+    )
+    return calculate_ratio_of_means_variance(filled, y, "x_i")
+
+
+@pytest.mark.parametrize("bp", [True, False])
+def test_matches_per_group_reference(bp):
+    all_plots = _design(bp=bp)
+    plot_data = _plot_values(all_plots)
+
+    result = calculate_grouped_ratio_of_means_variance(
+        plot_data, all_plots, ["GRP"], ["y1", "y2"], "x_i"
+    )
+
+    assert result.height == 3
+    for row in result.iter_rows(named=True):
+        for y in ("y1", "y2"):
+            expected = _reference(plot_data, all_plots, row["GRP"], y)
+            assert row[f"{y}_total"] == pytest.approx(expected["total_y"])
+            assert row["x_i_total"] == pytest.approx(expected["total_x"])
+            assert row[f"{y}_ratio"] == pytest.approx(expected["ratio"])
+            assert row[f"{y}_variance_total"] == pytest.approx(
+                expected["variance_total"]
+            )
+            assert row[f"{y}_se_ratio"] == pytest.approx(expected["se_ratio"])
+
+
+def test_duplicate_plot_rows_count_as_extra_plots():
+    all_plots = _design()
+    plot_data = _plot_values(all_plots).filter(pl.col("GRP") == "a")
+    plot_data = pl.concat([plot_data, plot_data.head(5)])
+
+    result = calculate_grouped_ratio_of_means_variance(
+        plot_data, all_plots, ["GRP"], ["y1"], "x_i"
+    )
+    expected = _reference(plot_data, all_plots, "a", "y1")
+    assert result["y1_se_total"][0] == pytest.approx(expected["se_total"])
+    assert result["y1_se_ratio"][0] == pytest.approx(expected["se_ratio"])
+
+
+def test_ungrouped_and_total_only():
+    all_plots = _design(bp=False)
+    plot_data = _plot_values(all_plots).filter(pl.col("GRP") == "b")
+
+    result = calculate_grouped_ratio_of_means_variance(
+        plot_data, all_plots, [], ["y1"], x_col=None
+    )
+    expected = _reference(plot_data, all_plots, "b", "y1")
+    assert result.columns == ["y1_total", "y1_variance_total", "y1_se_total"]
+    assert result["y1_variance_total"][0] == pytest.approx(expected["variance_total"])
+
+
+def test_zero_area_group_has_zero_ratio():
+    all_plots = _design()
+    plot_data = _plot_values(all_plots).with_columns(pl.lit(0.0).alias("x_i"))
+
+    result = calculate_grouped_ratio_of_means_variance(
+        plot_data, all_plots, ["GRP"], ["y1"], "x_i"
+    )
+    assert result["y1_ratio"].to_list() == [0.0] * result.height
+    assert result["y1_se_ratio"].to_list() == [0.0] * result.height
+    assert (result["y1_se_total"] > 0).all()
+
+
+def _dense(plot_data: pl.DataFrame, all_plots: pl.DataFrame) -> pl.DataFrame:
+    """Plots x groups expansion with zeros, as the dense path expects."""
+    groups = plot_data.select("GRP").unique()
+    expanded = all_plots.join(groups, how="cross")
+    return join_on_groups(expanded, plot_data, ["PLT_CN", "GRP"]).with_columns(
+        pl.col("y1", "x_i").fill_null(0.0)
+    )
+
+
+@pytest.mark.parametrize("bp", [True, False])
+@pytest.mark.parametrize("x_col", ["x_i", "missing"])
+def test_sparse_domain_total_matches_dense(bp, x_col):
+    all_plots = _design(bp=bp)
+    plot_data = _plot_values(all_plots).select("PLT_CN", "GRP", "y1", "x_i")
+
+    dense = calculate_grouped_domain_total_variance(
+        _dense(plot_data, all_plots), ["GRP"], "y1", x_col=x_col
+    )
+    sparse = calculate_grouped_domain_total_variance(
+        plot_data, ["GRP"], "y1", x_col=x_col, all_plots=all_plots
+    )
+
+    assert sparse.columns == dense.columns
+    # The dense path's internal joins drop null keys, so compare the rest
+    dense = dense.filter(pl.col("GRP").is_not_null()).sort("GRP")
+    sparse = sparse.filter(pl.col("GRP").is_not_null()).sort("GRP")
+    assert sparse["GRP"].to_list() == dense["GRP"].to_list()
+    for col in ("se_acre", "se_total", "variance_acre", "variance_total"):
+        np.testing.assert_allclose(sparse[col], dense[col], rtol=1e-12)
+
+
+def test_sparse_domain_total_ungrouped_matches_scalar():
+    all_plots = _design()
+    plot_data = _plot_values(all_plots).filter(pl.col("GRP") == "a")
+
+    sparse = calculate_grouped_domain_total_variance(
+        plot_data.drop("GRP"), [], "y1", all_plots=all_plots
+    )
+    expected = _reference(plot_data, all_plots, "a", "y1")
+    assert sparse["se_total"][0] == pytest.approx(expected["se_total"])
+    assert sparse["se_acre"][0] == pytest.approx(expected["se_ratio"])
+
+    empty = calculate_grouped_domain_total_variance(
+        plot_data.clear().drop("GRP"), [], "y1", all_plots=all_plots
+    )
+    assert empty.row(0) == (0.0, 0.0, 0.0, 0.0)
+
+
+@pytest.mark.parametrize("bp", [True, False])
+def test_stratum_statistics_round_trip(bp):
+    all_plots = _design(bp=bp)
+    plot_data = _plot_values(all_plots)
+
+    direct = calculate_grouped_ratio_of_means_variance(
+        plot_data, all_plots, ["GRP"], ["y1", "y2"], "x_i"
+    )
+    stats = calculate_stratum_statistics(
+        plot_data, all_plots, ["GRP"], ["y1", "y2"], "x_i"
+    )
+    assert ("EU_N_PLOTS" in stats.columns) == bp
+    from_stats = calculate_variance_from_stratum_statistics(
+        stats, ["GRP"], ["y1", "y2"], "x_i"
+    )
+
+    assert from_stats.columns == direct.columns
+    direct = direct.sort("GRP", nulls_last=True)
+    from_stats = from_stats.sort("GRP", nulls_last=True)
+    for col in direct.columns[1:]:
+        np.testing.assert_allclose(from_stats[col], direct[col], rtol=1e-9)
+
+
+def test_partial_statistics_combine_across_partitions():
+    all_plots = _design()
+    plot_data = _plot_values(all_plots)
+
+    # Each estimation unit processed on its own, as a per-state worker would
+    partials = []
+    for eu in (0, 1):
+        eu_plots = all_plots.filter(pl.col("ESTN_UNIT_CN") == eu)
+        eu_data = plot_data.join(eu_plots.select("PLT_CN"), on="PLT_CN")
+        partials.append(
+            calculate_stratum_statistics(eu_data, eu_plots, ["GRP"], ["y1"], "x_i")
+        )
+    combined = combine_stratum_statistics(partials, ["GRP"])
+
+    result = calculate_variance_from_stratum_statistics(
+        combined, ["GRP"], ["y1"], "x_i"
+    ).sort("GRP", nulls_last=True)
+    expected = calculate_grouped_ratio_of_means_variance(
+        plot_data, all_plots, ["GRP"], ["y1"], "x_i"
+    ).sort("GRP", nulls_last=True)
+    for col in expected.columns[1:]:
+        np.testing.assert_allclose(result[col], expected[col], rtol=1e-9)
+
+    with pytest.raises(ValueError, match="disjoint"):
+        combine_stratum_statistics([partials[0], partials[0]], ["GRP"])
@@ -0,0 +1,72 @@
+"""Grouping-sets estimation against one estimator call per grouping."""
+
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from pyfia import FIA, biomass, tpa, volume
+from pyfia.estimation.estimators.carbon_pools import carbon_pool
+from pyfia.validation import validate_grouping_sets
+
+EVALIDS = [132301, 372301, 452301]
+SETS = [None, "OWNGRPCD", ["FORTYPCD", "OWNGRPCD"]]
+
+
+def _clipped(path) -> FIA:
+    db = FIA(path)
+    db.clip_by_evalid(EVALIDS)
+    return db
+
+
+def _assert_same(result: pl.DataFrame, expected: pl.DataFrame, keys: list[str]):
+    assert result.height == expected.height
+    if keys:
+        result = result.sort(keys, nulls_last=True)
+        expected = expected.sort(keys, nulls_last=True)
+    for col in expected.columns:
+        if expected[col].dtype.is_numeric():
+            np.testing.assert_allclose(
+                result[col].cast(pl.Float64).to_numpy(),
+                expected[col].cast(pl.Float64).to_numpy(),
+                rtol=1e-12,
+                atol=1e-6,
+            )
+        else:
+            assert result[col].to_list() == expected[col].to_list()
+
+
+@pytest.mark.parametrize(
+    "function, kwargs",
+    [
+        (volume, {}),
+        (volume, {"variance": True, "tree_domain": "DIA >= 10.0"}),
+        (tpa, {"by_species": True}),
+        (biomass, {"component": "AG", "land_type": "timber"}),
+        (carbon_pool, {"pool": "total"}),
+    ],
+)
+def test_matches_individual_groupings(multi_state_db, function, kwargs):
+    result = function(_clipped(multi_state_db), grouping_sets=SETS, **kwargs)
+
+    assert result.columns[0] == "GROUPING_SET"
+    assert result["GROUPING_SET"].unique().sort().to_list() == [0, 1, 2]
+    for set_id, grp_by in enumerate(SETS):
+        expected = function(_clipped(multi_state_db), grp_by=grp_by, **kwargs)
+        rows = result.filter(pl.col("GROUPING_SET") == set_id)
+        unused = [c for c in ("FORTYPCD", "OWNGRPCD") if c not in expected.columns]
+        assert rows.select(unused).null_count().row(0) == (rows.height,) * len(unused)
+        keys = [c for c in ("FORTYPCD", "OWNGRPCD", "SPCD") if c in expected.columns]
+        _assert_same(rows.select(expected.columns), expected, keys)
+
+
+def test_validate_grouping_sets():
+    assert validate_grouping_sets(SETS) == [[], ["OWNGRPCD"], ["FORTYPCD", "OWNGRPCD"]]
+    assert validate_grouping_sets(None) is None
+    with pytest.raises(ValueError, match="grp_by"):
+        validate_grouping_sets(SETS, grp_by="SPCD")
+    with pytest.raises(ValueError, match="Duplicate"):
+        validate_grouping_sets(["OWNGRPCD", ["OWNGRPCD"]])
+    with pytest.raises(TypeError):
+        validate_grouping_sets([])
@@ -0,0 +1,84 @@
+"""CN columns read as Int64 in ``key_dtype="int64"`` mode."""
+
+from __future__ import annotations
+
+import duckdb
+import polars as pl
+import pytest
+
+from pyfia.core.backends.base import validate_key_dtype
+from pyfia.core.data_reader import FIADataReader
+
+
+@pytest.fixture
+def cn_db(tmp_path):
+    """DuckDB file with BIGINT- and VARCHAR-stored CN columns."""
+    path = tmp_path / "fia.duckdb"
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute(
+            """
+            CREATE TABLE TREE AS
+            SELECT
+                CAST(412538912010478 + i AS BIGINT) AS CN,
+                CAST(247862125010854 + i % 4 AS VARCHAR) AS PLT_CN,
+                CASE WHEN i = 0 THEN '' ELSE CAST(i AS VARCHAR) END AS PREV_TRE_CN,
+                CAST(i % 5 AS SMALLINT) AS STATUSCD
+            FROM range(20) t(i)
+            """
+        )
+    finally:
+        conn.close()
+    return path
+
+
+def test_string_mode_is_default(cn_db):
+    reader = FIADataReader(cn_db)
+    df = reader.read_table("TREE", lazy=False)
+
+    assert reader.key_dtype == "string"
+    assert df.schema["CN"] == pl.String
+    assert df.schema["PLT_CN"] == pl.String
+
+
+def test_int64_mode_reads_cn_columns_as_int64(cn_db):
+    reader = FIADataReader(cn_db, key_dtype="int64")
+    df = reader.read_table("TREE", lazy=False)
+
+    assert dict(df.schema) == {
+        "CN": pl.Int64,
+        "PLT_CN": pl.Int64,
+        "PREV_TRE_CN": pl.Int64,
+        "STATUSCD": pl.Int64,
+    }
+    # Empty strings are read as missing keys
+    assert df.sort("CN")["PREV_TRE_CN"][0] is None
+    assert df["PLT_CN"].n_unique() == 4
+    assert reader._backend.is_integer_column("TREE", "PLT_CN")
+    assert not reader._backend.is_string_column("TREE", "PLT_CN")
+
+
+def test_int64_mode_scan_matches_read(cn_db):
+    reader = FIADataReader(cn_db, key_dtype="int64")
+    lf = reader.scan_table("TREE", batch_size=7)
+
+    assert lf.collect_schema()["PLT_CN"] == pl.Int64
+    eager = reader.read_table("TREE", lazy=False)
+    assert lf.collect().sort("CN").equals(eager.sort("CN"))
+
+
+def test_int64_mode_plot_filter(cn_db):
+    reader = FIADataReader(cn_db, key_dtype="int64")
+    plot_cns = [247862125010854, 247862125010855]
+    df = reader.read_table(
+        "TREE", where=reader.plot_filter_clause("TREE", plot_cns), lazy=False
+    )
+
+    assert df.height == 10
+    assert set(df["PLT_CN"].to_list()) == set(plot_cns)
+
+
+def test_invalid_key_dtype(cn_db):
+    with pytest.raises(ValueError, match="Invalid key_dtype"):
+        FIADataReader(cn_db, key_dtype="int32")
+    assert validate_key_dtype("int64") == "int64"
@@ -45,13 +45,20 @@ class TestEVALIDFilteringByColumn:
         mock_fia._reader.read_table.return_value = pl.DataFrame(
             {"TRE_CN": ["1"], "PLT_CN": ["100"], "TPA_UNADJ": [1.0]}
         ).lazy()
+        mock_fia._reader.plot_filter_clause.return_value = (
+            "PLT_CN IN (SELECT CAST(VALUE AS VARCHAR) FROM pyfia_values_x)"
+        )
 
         mock_fia.load_table("TREE_GRM_COMPONENT")
 
-        # Verify read_table was called with a PLT_CN IN (...) WHERE clause
+        # The valid plot set is applied as a single semi-join
+        mock_fia._reader.plot_filter_clause.assert_called_once_with(
+            "TREE_GRM_COMPONENT", ["100", "200", "300"]
+        )
+        assert mock_fia._reader.read_table.call_count == 1
         call_args = mock_fia._reader.read_table.call_args
         where_clause = call_args.kwargs.get("where", "") or ""
-        assert "PLT_CN IN" in where_clause
+        assert "PLT_CN IN (SELECT" in where_clause
 
     def test_table_without_plt_cn_skips_evalid_filter(self, mock_fia):
         """Tables without PLT_CN (e.g. POP_EVAL) should not get EVALID filtering."""
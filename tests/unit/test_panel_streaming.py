@@ -0,0 +1,117 @@
+"""Chunked tree panels and Parquet panel output."""
+
+from __future__ import annotations
+
+import duckdb
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from pyfia import FIA, panel, write_panel
+from pyfia.estimation.estimators.panel import PanelBuilder
+
+
+@pytest.fixture
+def grm_panel_db(tmp_path):
+    """Fourteen plots in two states, four GRM trees per plot."""
+    path = tmp_path / "panel.duckdb"
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute(
+            """
+            CREATE TABLE PLOT AS
+            SELECT 100 + i AS CN, CASE WHEN i < 12 THEN 200 + i END AS PREV_PLT_CN,
+                   CASE WHEN i % 2 = 0 THEN 13 ELSE 37 END AS STATECD,
+                   1 + i % 3 AS COUNTYCD, 2010 + i % 5 AS INVYR,
+                   CASE WHEN i < 12 THEN 5.0 END AS REMPER, 2 AS CYCLE,
+                   33.0 AS LAT, -83.0 AS LON, 100.0 AS ELEV
+            FROM range(14) t(i);
+
+            CREATE TABLE COND AS
+            SELECT 1000 + i AS CN, 100 + i AS PLT_CN, 1 AS CONDID,
+                   1 AS COND_STATUS_CD, 1.0 AS CONDPROP_UNADJ
+            FROM range(14) t(i);
+
+            CREATE TABLE TREE_GRM_COMPONENT AS
+            SELECT 5000 + i AS TRE_CN, 100 + i % 14 AS PLT_CN,
+                   10.0 AS DIA_BEGIN, 10.5 AS DIA_MIDPT, 11.0 AS DIA_END,
+                   ['SURVIVOR', 'MORTALITY1', 'CUT1', 'INGROWTH'][i % 4 + 1]
+                       AS SUBP_COMPONENT_GS_FOREST,
+                   6.0 AS SUBP_TPAREMV_UNADJ_GS_FOREST,
+                   1 AS SUBP_SUBPTYP_GRM_GS_FOREST
+            FROM range(56) t(i);
+
+            CREATE TABLE TREE_GRM_MIDPT AS
+            SELECT 5000 + i AS TRE_CN, 10.5 AS DIA, 131 AS SPCD, 1 AS STATUSCD,
+                   20.0 + i AS VOLCFNET, 300.0 AS DRYBIO_AG
+            FROM range(56) t(i);
+            """
+        )
+    finally:
+        conn.close()
+    return path
+
+
+def _tree_config(**overrides):
+    return {"level": "tree", "tree_type": "gs", "land_type": "forest", **overrides}
+
+
+def test_chunks_match_single_build(grm_panel_db):
+    with FIA(grm_panel_db) as db:
+        builder = PanelBuilder(db, _tree_config())
+        expected = builder.build()
+        chunks = list(builder.iter_chunks(plots_per_chunk=5))
+
+    assert [chunk["PLT_CN"].n_unique() for chunk in chunks] == [5, 5, 4]
+    assert_frame_equal(
+        pl.concat(chunks).sort("TRE_CN"), expected.sort("TRE_CN"), check_dtypes=True
+    )
+
+
+def test_harvest_only_chunks(grm_panel_db):
+    with FIA(grm_panel_db) as db:
+        builder = PanelBuilder(db, _tree_config(harvest_only=True))
+        chunks = list(builder.iter_chunks(plots_per_chunk=4))
+
+    assert pl.concat(chunks)["TREE_FATE"].unique().to_list() == ["cut"]
+
+
+@pytest.mark.parametrize("level", ["tree", "condition"])
+def test_partitioned_output_matches_panel(grm_panel_db, tmp_path, level):
+    output = tmp_path / "out"
+    with FIA(grm_panel_db) as db:
+        expected = panel(db, level=level)
+        written = write_panel(
+            db, output, partition_by="STATECD", plots_per_chunk=5, level=level
+        )
+
+    assert isinstance(written, pl.LazyFrame)
+    assert sorted(p.name for p in output.iterdir()) == ["STATECD=13", "STATECD=37"]
+    key = "TRE_CN" if level == "tree" else "PLT_CN"
+    assert_frame_equal(written.collect().sort(key), expected.sort(key))
+
+
+def test_unpartitioned_output_writes_one_file_per_chunk(grm_panel_db, tmp_path):
+    output = tmp_path / "out"
+    with FIA(grm_panel_db) as db:
+        written = write_panel(db, str(output), plots_per_chunk=5, level="tree")
+
+    assert sorted(p.name for p in output.iterdir()) == [
+        "part-00000.parquet",
+        "part-00001.parquet",
+        "part-00002.parquet",
+    ]
+    assert written.collect().height == 56
+
+
+def test_output_validation(grm_panel_db, tmp_path):
+    (tmp_path / "stale.parquet").touch()
+    with FIA(grm_panel_db) as db:
+        with pytest.raises(ValueError, match="expand"):
+            write_panel(db, tmp_path / "new", level="tree", expand=True)
+        with pytest.raises(ValueError, match="plots_per_chunk"):
+            write_panel(db, tmp_path / "new", plots_per_chunk=0)
+        with pytest.raises(FileExistsError):
+            write_panel(db, tmp_path, level="tree")
+        with pytest.raises(ValueError, match="partition_by columns"):
+            write_panel(db, tmp_path / "new", partition_by="NOPE", level="tree")
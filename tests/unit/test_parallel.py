@@ -0,0 +1,83 @@
+"""Partitioned multi-state estimation against single-process estimates."""
+
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from pyfia import FIA, area, biomass, tpa, volume
+from pyfia.parallel import estimate_by_partition
+
+STATES = [13, 37, 45]
+
+
+def _single_process(path, function, **kwargs) -> pl.DataFrame:
+    db = FIA(path)
+    db.clip_by_evalid([s * 10000 + 2301 for s in STATES])
+    return function(db, **kwargs)
+
+
+def _assert_same(result: pl.DataFrame, expected: pl.DataFrame, keys: list[str]):
+    assert result.columns == expected.columns
+    assert result.height == expected.height
+    if keys:
+        result = result.sort(keys, nulls_last=True)
+        expected = expected.sort(keys, nulls_last=True)
+    for col in expected.columns:
+        if expected[col].dtype.is_numeric():
+            np.testing.assert_allclose(
+                result[col].cast(pl.Float64).to_numpy(),
+                expected[col].cast(pl.Float64).to_numpy(),
+                rtol=1e-9,
+            )
+        else:
+            assert result[col].to_list() == expected[col].to_list()
+
+
+@pytest.mark.parametrize(
+    "estimator, function, kwargs, keys",
+    [
+        ("volume", volume, {}, []),
+        (
+            "volume",
+            volume,
+            {"grp_by": ["OWNGRPCD", "FORTYPCD"]},
+            ["OWNGRPCD", "FORTYPCD"],
+        ),
+        ("tpa", tpa, {"by_species": True, "totals": True}, ["SPCD"]),
+        ("biomass", biomass, {"grp_by": "OWNGRPCD"}, ["OWNGRPCD"]),
+        ("area", area, {}, []),
+        ("area", area, {"grp_by": "FORTYPCD", "variance": True}, ["FORTYPCD"]),
+    ],
+)
+def test_matches_single_process(multi_state_db, estimator, function, kwargs, keys):
+    expected = _single_process(multi_state_db, function, **kwargs)
+    result = estimate_by_partition(
+        multi_state_db, estimator=estimator, workers=1, **kwargs
+    )
+    _assert_same(result, expected, keys)
+
+
+def test_process_pool(multi_state_db):
+    expected = _single_process(multi_state_db, volume, grp_by="OWNGRPCD")
+    result = estimate_by_partition(
+        multi_state_db, estimator="volume", grp_by="OWNGRPCD", workers=2
+    )
+    _assert_same(result, expected, ["OWNGRPCD"])
+
+
+def test_states_subset(multi_state_db):
+    result = estimate_by_partition(multi_state_db, states=[13, 45], workers=1)
+    db = FIA(multi_state_db)
+    db.clip_by_evalid([132301, 452301])
+    _assert_same(result, volume(db), [])
+
+
+def test_invalid_arguments(multi_state_db):
+    with pytest.raises(ValueError, match="estimator"):
+        estimate_by_partition(multi_state_db, estimator="growth")
+    with pytest.raises(ValueError, match="partition"):
+        estimate_by_partition(multi_state_db, partition="COUNTYCD")
+    with pytest.raises(ValueError, match="vol_typ"):
+        estimate_by_partition(multi_state_db, vol_typ="net")
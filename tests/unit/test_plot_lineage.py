@@ -0,0 +1,113 @@
+"""Plot-lineage index and scoped remeasurement reads for condition panels."""
+
+from __future__ import annotations
+
+import shutil
+
+import duckdb
+import pytest
+from polars.testing import assert_frame_equal
+
+from pyfia import FIA, build_plot_lineage, optimize_database, panel
+from pyfia.downloader.lineage import LINEAGE_TABLE, plot_lineage_table
+
+
+@pytest.fixture
+def chain_db(tmp_path):
+    """Eight plot locations measured in 1990, 1995, 2005 and 2015."""
+    path = tmp_path / "chains.duckdb"
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute(
+            """
+            CREATE TABLE PLOT AS
+            SELECT loc * 10 + m AS CN,
+                   CASE WHEN m > 0 THEN loc * 10 + m - 1 END AS PREV_PLT_CN,
+                   13 AS STATECD, 1 + loc % 3 AS COUNTYCD,
+                   [1990, 1995, 2005, 2015][m + 1] AS INVYR,
+                   CASE WHEN m > 0 THEN 5.0 + m END AS REMPER, m + 1 AS CYCLE,
+                   33.0 AS LAT, -83.0 AS LON, 100.0 AS ELEV
+            FROM range(1, 9) l(loc), range(4) r(m);
+
+            CREATE TABLE COND AS
+            SELECT CN * 10 + 1 AS CN, CN AS PLT_CN, 1 AS CONDID,
+                   CASE WHEN CN % 7 = 0 THEN 2 ELSE 1 END AS COND_STATUS_CD,
+                   1.0 AS CONDPROP_UNADJ, 10 * (1 + CN % 4) AS OWNGRPCD,
+                   CASE WHEN CN % 3 = 0 THEN 10 END AS TRTCD1,
+                   20 + CN % 50 AS STDAGE
+            FROM PLOT;
+            """
+        )
+    finally:
+        conn.close()
+    return path
+
+
+@pytest.fixture
+def lineage_db(chain_db, tmp_path):
+    path = tmp_path / "lineage.duckdb"
+    shutil.copy(chain_db, path)
+    build_plot_lineage(path)
+    return path
+
+
+def _lineage(path):
+    conn = duckdb.connect(str(path), read_only=True)
+    try:
+        return conn.execute(
+            f"SELECT CN, CHAIN_CN, MEASUREMENT, REMPER FROM {LINEAGE_TABLE} ORDER BY CN"
+        ).fetchall()
+    finally:
+        conn.close()
+
+
+def test_lineage_numbers_measurements_along_chains(lineage_db):
+    rows = _lineage(lineage_db)
+
+    assert len(rows) == 32
+    assert [row[:3] for row in rows[:4]] == [
+        (10, 10, 1),
+        (11, 10, 2),
+        (12, 10, 3),
+        (13, 10, 4),
+    ]
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"min_remper": 7.0, "harvest_only": True}])
+def test_panel_unchanged_by_lineage_index(chain_db, lineage_db, kwargs):
+    results = []
+    for path in (chain_db, lineage_db):
+        with FIA(path) as db:
+            results.append(
+                panel(db, level="condition", **kwargs).sort("PLT_CN", "CONDID")
+            )
+    expected, result = results
+
+    assert len(expected) > 0
+    assert_frame_equal(result, expected)
+
+
+def test_conditions_read_once_for_referenced_plots(lineage_db, monkeypatch):
+    with FIA(lineage_db) as db:
+        assert plot_lineage_table(db) == LINEAGE_TABLE
+        reads = []
+        read_table = db._reader.read_table
+
+        def spy(table_name, *args, **kwargs):
+            frame = read_table(table_name, *args, **kwargs)
+            reads.append((table_name, frame.lazy().collect().height))
+            return frame
+
+        monkeypatch.setattr(db._reader, "read_table", spy)
+        result = panel(db, level="condition", land_type="all")
+
+    # The 2005 and 2015 remeasurements (t2) and the plots they follow (t1); the
+    # 1995 remeasurements fall before min_invyr
+    assert len(result) == 16
+    assert reads == [("PLOT", 16), ("COND", 24)]
+
+
+def test_optimize_builds_lineage(chain_db):
+    optimize_database(chain_db)
+
+    assert _lineage(chain_db)
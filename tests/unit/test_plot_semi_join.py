@@ -0,0 +1,145 @@
+"""EVALID plot filtering as a single semi-join against a registered plot set."""
+
+from __future__ import annotations
+
+import duckdb
+import polars as pl
+import pytest
+
+from pyfia.core.backends.base import VALUE_RELATION_PREFIX, DatabaseBackend
+from pyfia.core.data_reader import FIADataReader
+from pyfia.core.fia import FIA
+
+
+@pytest.fixture
+def plot_db(tmp_path):
+    """DuckDB file with two evaluations and BIGINT/VARCHAR plot keys."""
+    path = tmp_path / "fia.duckdb"
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute(
+            """
+            CREATE TABLE POP_PLOT_STRATUM_ASSGN AS
+            SELECT CAST(i AS BIGINT) AS PLT_CN,
+                   CAST(i % 3 AS BIGINT) AS STRATUM_CN,
+                   CASE WHEN i < 60 THEN 132301 ELSE 132302 END AS EVALID,
+                   13 AS STATECD
+            FROM range(100) t(i)
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE PLOT AS
+            SELECT CAST(i AS BIGINT) AS CN, 13 AS STATECD, i % 4 AS PLOT_STATUS_CD
+            FROM range(100) t(i)
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE TREE AS
+            SELECT CAST(10000 + i AS BIGINT) AS CN,
+                   CAST(i % 100 AS BIGINT) AS PLT_CN,
+                   13 AS STATECD,
+                   CAST(i AS DOUBLE) AS DIA
+            FROM range(2000) t(i)
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE COND AS
+            SELECT CAST(i AS VARCHAR) AS PLT_CN, 13 AS STATECD, 1 AS CONDID
+            FROM range(100) t(i)
+            """
+        )
+    finally:
+        conn.close()
+    return path
+
+
+class TestLoadTableSemiJoin:
+    def test_evalid_filter_matches_plot_set(self, plot_db):
+        db = FIA(plot_db)
+        db.clip_by_evalid(132301)
+        trees = db.load_table("TREE").collect()
+        assert trees.height == 1200
+        assert set(trees["PLT_CN"].cast(pl.Int64).unique()) == set(range(60))
+
+    def test_varchar_plot_key(self, plot_db):
+        db = FIA(plot_db)
+        db.clip_by_evalid(132302)
+        conds = db.load_table("COND").collect()
+        assert sorted(conds["PLT_CN"].cast(pl.Int64)) == list(range(60, 100))
+
+    def test_combined_with_user_where(self, plot_db):
+        db = FIA(plot_db)
+        db.clip_by_evalid(132301)
+        trees = db.load_table("TREE", where="DIA < 10 OR DIA >= 1990").collect()
+        assert sorted(trees["DIA"].to_list()) == [float(i) for i in range(10)]
+
+    def test_changing_evalid_reregisters(self, plot_db):
+        db = FIA(plot_db)
+        db.clip_by_evalid(132301)
+        first = db.load_table("TREE").collect()
+        db.clip_by_evalid(132302)
+        second = db.load_table("TREE").collect()
+        assert first.height + second.height == 2000
+        assert set(first["PLT_CN"]).isdisjoint(set(second["PLT_CN"]))
+
+
+class TestReaderPlotFilter:
+    def test_read_tree_and_plot_data(self, plot_db):
+        reader = FIADataReader(plot_db)
+        plot_cns = [str(i) for i in range(5)]
+        assert reader.read_tree_data(plot_cns).height == 100
+        assert reader.read_cond_data(plot_cns).height == 5
+        plots = reader.read_plot_data([132301])
+        assert plots.height == 60
+
+    def test_same_plot_set_registered_once(self, plot_db):
+        reader = FIADataReader(plot_db)
+        plot_cns = [str(i) for i in range(10)]
+        first = reader.plot_filter_clause("TREE", plot_cns)
+        second = reader.plot_filter_clause("COND", list(plot_cns))
+        registered = [
+            name
+            for name in reader._backend._relations
+            if name.startswith(VALUE_RELATION_PREFIX)
+        ]
+        assert len(registered) == 1
+        assert "AS BIGINT" in first
+        assert "AS VARCHAR" in second
+
+    def test_registered_sets_are_bounded(self, plot_db):
+        reader = FIADataReader(plot_db)
+        for i in range(DatabaseBackend.MAX_VALUE_RELATIONS + 3):
+            reader.plot_filter_clause("TREE", [str(i)])
+        registered = [
+            name
+            for name in reader._backend._relations
+            if name.startswith(VALUE_RELATION_PREFIX)
+        ]
+        assert len(registered) == DatabaseBackend.MAX_VALUE_RELATIONS
+
+    def test_reused_set_is_kept_over_older_sets(self, plot_db):
+        reader = FIADataReader(plot_db)
+        first = reader.plot_filter_clause("TREE", ["first"])
+        name = first.split("FROM ")[-1].rstrip(")")
+        for i in range(DatabaseBackend.MAX_VALUE_RELATIONS * 2):
+            reader.plot_filter_clause("TREE", [str(i)])
+            assert name in reader._backend._relations
+            reader.plot_filter_clause("TREE", ["first"])
+
+    def test_lazy_scan_outlives_evicted_plot_set(self, plot_db):
+        db = FIA(plot_db, streaming=True)
+        db.clip_by_evalid(132302)
+        trees = db.load_table("TREE", columns=["CN", "PLT_CN"])
+        for i in range(DatabaseBackend.MAX_VALUE_RELATIONS + 1):
+            db._reader.plot_filter_clause("TREE", [str(i)])
+        assert trees.collect().height == 800
+        assert trees.collect().height == 800
+
+    def test_streaming_scan_sees_plot_set(self, plot_db):
+        db = FIA(plot_db, streaming=True)
+        db.clip_by_evalid(132302)
+        trees = db.load_table("TREE", columns=["CN", "PLT_CN"])
+        assert trees.collect().height == 800
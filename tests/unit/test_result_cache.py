@@ -0,0 +1,143 @@
+"""On-disk estimator result cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+
+import duckdb
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from pyfia import FIA, tpa, volume
+from pyfia.core.settings import settings
+from pyfia.estimation.result_cache import (
+    ResultCache,
+    get_result_cache,
+    result_cache_key,
+)
+
+
+@pytest.fixture
+def result_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cache_enabled", True)
+    monkeypatch.setattr(settings, "result_cache_enabled", True)
+    monkeypatch.setattr(settings, "cache_dir", tmp_path)
+    return get_result_cache()
+
+
+def _clipped(path, evalids=(132301, 372301, 452301)) -> FIA:
+    db = FIA(path)
+    db.clip_by_evalid(list(evalids))
+    return db
+
+
+def _spatial_available() -> bool:
+    try:
+        duckdb.connect().execute("LOAD spatial")
+    except duckdb.Error:
+        return False
+    return True
+
+
+def test_disabled_by_default(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cache_dir", tmp_path)
+    assert settings.model_fields["result_cache_enabled"].default is False
+    monkeypatch.setattr(settings, "result_cache_enabled", False)
+    assert get_result_cache() is None
+    monkeypatch.setattr(settings, "result_cache_enabled", True)
+    monkeypatch.setattr(settings, "cache_enabled", False)
+    assert get_result_cache() is None
+
+
+def test_repeated_estimate_is_served_from_cache(multi_state_db, result_cache):
+    first = volume(_clipped(multi_state_db), grp_by="OWNGRPCD", variance=True)
+    assert result_cache.stats.misses == 1
+    assert result_cache.stats.writes == 1
+
+    second = volume(_clipped(multi_state_db), grp_by="OWNGRPCD", variance=True)
+    assert result_cache.stats.hits == 1
+    assert_frame_equal(second, first)
+
+
+def test_config_and_clip_state_change_key(multi_state_db, result_cache):
+    volume(_clipped(multi_state_db))
+    volume(_clipped(multi_state_db), vol_type="gross")
+    tpa(_clipped(multi_state_db))
+    volume(_clipped(multi_state_db, evalids=[132301]))
+    assert result_cache.stats.hits == 0
+    assert result_cache.get_cache_info()["total_entries"] == 4
+
+
+def test_spatial_plot_set_changes_key(multi_state_db):
+    db = _clipped(multi_state_db)
+    db._spatial_plot_cns = ["1300000", "1300001"]
+    key = result_cache_key(db, "VolumeEstimator", {})
+
+    db._spatial_plot_cns = ["1300001", "1300000"]
+    assert key == result_cache_key(db, "VolumeEstimator", {})
+    db._spatial_plot_cns = ["1300000"]
+    assert key != result_cache_key(db, "VolumeEstimator", {})
+
+
+@pytest.mark.skipif(not _spatial_available(), reason="DuckDB spatial not installed")
+def test_polygon_predicate_changes_estimate(multi_state_db, tmp_path, result_cache):
+    # Odd plots sit on the polygon's west edge, so "within" drops them
+    path = tmp_path / "fia.duckdb"
+    shutil.copy(multi_state_db, path)
+    conn = duckdb.connect(str(path))
+    conn.execute("ALTER TABLE PLOT ADD COLUMN LAT DOUBLE DEFAULT 33.0")
+    conn.execute("ALTER TABLE PLOT ADD COLUMN LON DOUBLE DEFAULT -84.0")
+    conn.execute("UPDATE PLOT SET LON = -85.0 WHERE CN % 2 = 1")
+    conn.close()
+    ring = [[-85.0, 32.0], [-83.0, 32.0], [-83.0, 34.0], [-85.0, 34.0], [-85.0, 32.0]]
+    polygon = tmp_path / "region.geojson"
+    feature = {
+        "type": "Feature",
+        "properties": {},
+        "geometry": {"type": "Polygon", "coordinates": [ring]},
+    }
+    polygon.write_text(
+        json.dumps({"type": "FeatureCollection", "features": [feature]}),
+        encoding="utf-8",
+    )
+
+    intersects = volume(_clipped(path).clip_by_polygon(polygon))
+    within = volume(_clipped(path).clip_by_polygon(polygon, predicate="within"))
+    assert result_cache.stats.hits == 0
+    assert within["VOLCFNET_TOTAL"][0] < intersects["VOLCFNET_TOTAL"][0]
+
+
+def test_database_change_invalidates(multi_state_db, tmp_path):
+    db = _clipped(multi_state_db)
+    key = result_cache_key(db, "VolumeEstimator", {"vol_type": "net"})
+    assert key == result_cache_key(db, "VolumeEstimator", {"vol_type": "net"})
+
+    stat = os.stat(multi_state_db)
+    os.utime(multi_state_db, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert key != result_cache_key(db, "VolumeEstimator", {"vol_type": "net"})
+
+
+def test_lru_eviction(tmp_path):
+    frame = pl.DataFrame({"x": range(10_000)})
+    cache = ResultCache(tmp_path, max_size_mb=1)
+    size = len(frame.write_ipc(None).getvalue())
+    per_mb = (1024 * 1024) // size
+
+    for i in range(per_mb):
+        cache.put(f"k{i}", frame)
+        os.utime(cache._path(f"k{i}"), ns=(i, i))
+    assert cache.stats.evictions == 0
+
+    # Reading k0 makes k1 the least recently used entry
+    assert cache.get("k0") is not None
+    cache.put("new", frame)
+    assert cache.stats.evictions == 1
+    assert cache.get("k1") is None
+    assert cache.get("k0") is not None
+    assert cache.get_cache_info()["total_size_mb"] <= 1
+
+    assert cache.clear() == per_mb
+    assert cache.get("new") is None
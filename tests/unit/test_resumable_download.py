@@ -0,0 +1,100 @@
+"""Resumed downloads and cache freshness checks against a local stand-in server."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from pyfia.downloader import DataMartClient, _check_cached
+from pyfia.downloader.cache import DownloadCache
+
+BODY = bytes(range(256)) * 64
+
+
+@pytest.fixture
+def client(datamart_server):
+    datamart_server.files["GA_TREE.zip"] = BODY
+    return DataMartClient(chunk_size=1024, base_url=datamart_server.url)
+
+
+def test_resumes_after_dropped_connection(client, datamart_server, tmp_path):
+    datamart_server.drop_after["GA_TREE.zip"] = 5120
+    dest = tmp_path / "GA_TREE.zip"
+
+    client._download_file(
+        datamart_server.url + "GA_TREE.zip", dest, show_progress=False
+    )
+
+    assert dest.read_bytes() == BODY
+    assert datamart_server.ranges == [None, "bytes=5120-"]
+    assert not dest.with_name("GA_TREE.zip.part").exists()
+
+
+def test_changed_file_is_downloaded_in_full(client, datamart_server, tmp_path):
+    changed = BODY[::-1]
+    datamart_server.drop_after["GA_TREE.zip"] = 5120
+    datamart_server.replace_after_drop["GA_TREE.zip"] = changed
+    dest = tmp_path / "GA_TREE.zip"
+
+    client._download_file(
+        datamart_server.url + "GA_TREE.zip", dest, show_progress=False
+    )
+
+    # If-Range no longer matches, so the server sends the whole new file
+    assert dest.read_bytes() == changed
+    assert datamart_server.ranges == [None, "bytes=5120-"]
+
+
+def test_records_validators(client, datamart_server, tmp_path):
+    url = datamart_server.url + "GA_TREE.zip"
+    client._download_file(url, tmp_path / "GA_TREE.zip", show_progress=False)
+
+    assert set(client.validators[url]) == {"ETag", "Last-Modified"}
+    assert client.is_unchanged(client.validators)
+
+    datamart_server.files["GA_TREE.zip"] = BODY[::-1]
+    assert not client.is_unchanged(client.validators)
+
+
+@pytest.fixture
+def stale_cache(client, datamart_server, tmp_path):
+    url = datamart_server.url + "GA_TREE.zip"
+    client._download_file(url, tmp_path / "GA_TREE.zip", show_progress=False)
+    db_path = tmp_path / "ga.duckdb"
+    db_path.write_bytes(b"duckdb-bytes")
+    cache = DownloadCache(tmp_path / "cache")
+    cache.add_to_cache("GA", db_path, validators=client.validators)
+    entry = cache.get_entry("GA")
+    entry.downloaded_at = (datetime.now() - timedelta(days=120)).isoformat()
+    return cache
+
+
+def test_stale_unchanged_cache_is_refreshed(client, stale_cache, tmp_path):
+    path, changed = _check_cached(stale_cache, client, "GA", "data for GA", False)
+
+    assert path == tmp_path / "ga.duckdb"
+    assert not changed
+    assert not stale_cache.get_entry("GA").is_stale
+
+
+def test_stale_changed_cache_is_dropped(client, datamart_server, stale_cache):
+    datamart_server.files["GA_TREE.zip"] = BODY[::-1]
+
+    path, changed = _check_cached(stale_cache, client, "GA", "data for GA", False)
+
+    assert path is None
+    assert changed
+    assert stale_cache.get_entry("GA") is None
+
+
+def test_unreachable_server_uses_stale_cache(stale_cache, tmp_path):
+    offline = DataMartClient(base_url="http://127.0.0.1:9/", timeout=1)
+    entry = stale_cache.get_entry("GA")
+    entry.validators = {"http://127.0.0.1:9/GA_TREE.zip": {"ETag": '"x"'}}
+
+    path, changed = _check_cached(stale_cache, offline, "GA", "data for GA", False)
+
+    assert path == tmp_path / "ga.duckdb"
+    assert not changed
+    assert stale_cache.get_entry("GA").is_stale
@@ -0,0 +1,111 @@
+"""Schema catalog shared by backend schema lookups."""
+
+from __future__ import annotations
+
+import duckdb
+import pytest
+
+from pyfia.core.backends import DuckDBBackend
+from pyfia.core.data_reader import FIADataReader
+
+
+class CountingConnection:
+    """Proxy for a DuckDB connection that records executed SQL."""
+
+    def __init__(self, connection):
+        self._connection = connection
+        self.queries: list[str] = []
+
+    def execute(self, query, *args, **kwargs):
+        self.queries.append(query)
+        return self._connection.execute(query, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "fia.duckdb"
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute("CREATE TABLE TREE (CN BIGINT, PLT_CN BIGINT, DIA DOUBLE)")
+        conn.execute("CREATE TABLE COND (PLT_CN BIGINT, CONDID INTEGER)")
+        conn.execute("CREATE TABLE PLOT (CN BIGINT, STATECD SMALLINT)")
+    finally:
+        conn.close()
+    return path
+
+
+def _counting_backend(path, **kwargs) -> tuple[DuckDBBackend, CountingConnection]:
+    backend = DuckDBBackend(path, **kwargs)
+    backend.connect()
+    proxy = CountingConnection(backend._connection)
+    backend._connection = proxy
+    return backend, proxy
+
+
+def test_one_query_serves_all_lookups(db_path):
+    backend, conn = _counting_backend(db_path)
+
+    assert backend.get_table_schema("TREE") == {
+        "CN": "BIGINT",
+        "PLT_CN": "BIGINT",
+        "DIA": "DOUBLE",
+    }
+    for table in ("TREE", "COND", "PLOT"):
+        assert backend.table_exists(table)
+        for column in backend.get_table_schema(table):
+            backend.is_integer_column(table, column)
+            backend.is_float_column(table, column)
+            backend.is_string_column(table, column)
+        backend.build_select_clause(table)
+    assert not backend.table_exists("BEGINEND")
+
+    assert len(conn.queries) == 1
+    assert "information_schema.columns" in conn.queries[0]
+
+
+def test_reader_shares_backend_catalog(db_path):
+    reader = FIADataReader(db_path)
+    assert reader.get_table_schema("COND") == {
+        "PLT_CN": "BIGINT",
+        "CONDID": "INTEGER",
+    }
+    assert reader._schemas is reader._backend.schema_catalog()
+
+
+def test_missing_table_still_raises(db_path):
+    backend = DuckDBBackend(db_path)
+    with pytest.raises(duckdb.CatalogException):
+        backend.get_table_schema("BEGINEND")
+
+
+def test_ddl_invalidates_catalog(db_path):
+    backend, conn = _counting_backend(db_path, read_only=False)
+    assert not backend.table_exists("SEEDLING")
+
+    backend.execute_query("CREATE TABLE SEEDLING (PLT_CN BIGINT, TREECOUNT DOUBLE)")
+    assert backend.table_exists("SEEDLING")
+    backend.execute_query("ALTER TABLE SEEDLING ADD COLUMN SPCD INTEGER")
+    assert "SPCD" in backend.get_table_schema("SEEDLING")
+    assert sum("information_schema" in q for q in conn.queries) == 3
+
+
+def test_fingerprint_change_reloads_catalog(db_path, monkeypatch):
+    backend, conn = _counting_backend(db_path)
+    backend.get_table_schema("TREE")
+    backend.get_table_schema("TREE")
+    assert len(conn.queries) == 1
+
+    monkeypatch.setattr(backend, "_database_fingerprint", lambda: "rewritten")
+    backend.get_table_schema("TREE")
+    assert len(conn.queries) == 2
+
+
+def test_describe_table_is_cached(db_path):
+    backend, conn = _counting_backend(db_path)
+    first = backend.describe_table("TREE")
+    assert backend.describe_table("TREE") == first
+    assert [row[0] for row in first] == ["CN", "PLT_CN", "DIA"]
+    assert sum(q.startswith("DESCRIBE") for q in conn.queries) == 1
@@ -0,0 +1,81 @@
+"""In-database estimation (engine='sql') against the Polars engine."""
+
+from __future__ import annotations
+
+import numpy as np
+import polars as pl
+import pytest
+
+from pyfia import FIA, area, biomass, tpa, volume
+
+EVALIDS = [132301, 372301, 452301]
+
+
+def _clipped(path) -> FIA:
+    db = FIA(path)
+    db.clip_by_evalid(EVALIDS)
+    return db
+
+
+def _assert_same(result: pl.DataFrame, expected: pl.DataFrame) -> None:
+    assert result.schema == expected.schema
+    assert result.height == expected.height
+    keys = [c for c in expected.columns if not expected[c].dtype.is_float()]
+    result = result.sort(keys, nulls_last=True)
+    expected = expected.sort(keys, nulls_last=True)
+    for col in expected.columns:
+        if expected[col].dtype.is_float():
+            np.testing.assert_allclose(
+                result[col].to_numpy(),
+                expected[col].to_numpy(),
+                rtol=1e-9,
+                atol=1e-9,
+                err_msg=col,
+            )
+        else:
+            assert result[col].to_list() == expected[col].to_list(), col
+
+
+@pytest.mark.parametrize(
+    "function, kwargs",
+    [
+        (volume, {}),
+        (volume, {"grp_by": "OWNGRPCD", "by_species": True}),
+        (volume, {"grp_by": "FORTYPCD", "vol_type": "gross", "totals": False}),
+        (volume, {"tree_type": "gs", "land_type": "timber", "variance": True}),
+        (tpa, {}),
+        (tpa, {"by_species": True, "by_size_class": True, "totals": True}),
+        (tpa, {"grp_by": ["FORTYPCD", "OWNGRPCD"], "tree_domain": "DIA >= 5.0"}),
+        (tpa, {"tree_type": "dead", "land_type": "all", "plot_domain": "INVYR > 0"}),
+        (biomass, {"grp_by": "OWNGRPCD"}),
+        (biomass, {"component": "TOTAL", "area_domain": "OWNGRPCD == 40"}),
+        (area, {}),
+        (area, {"grp_by": ["OWNGRPCD", "FORTYPCD"], "variance": True}),
+        (area, {"land_type": "timber", "area_domain": "OWNGRPCD IN (10, 40)"}),
+        (area, {"grp_by": "SITECLCD", "land_type": "all", "plot_domain": "INVYR > 0"}),
+    ],
+)
+def test_sql_engine_matches_polars(multi_state_db, function, kwargs):
+    expected = function(_clipped(multi_state_db), **kwargs)
+    result = function(_clipped(multi_state_db), engine="sql", **kwargs)
+
+    _assert_same(result, expected)
+
+
+def test_sql_engine_rejects_grouping_sets(multi_state_db):
+    with pytest.raises(ValueError, match="grouping_sets"):
+        tpa(
+            _clipped(multi_state_db),
+            grouping_sets=[None, "OWNGRPCD"],
+            engine="sql",
+        )
+
+
+def test_sql_engine_rejects_plot_only_grouping(multi_state_db):
+    with pytest.raises(ValueError, match="engine='polars'"):
+        volume(_clipped(multi_state_db), grp_by="STATECD", engine="sql")
+
+
+def test_invalid_engine(multi_state_db):
+    with pytest.raises(ValueError, match="Invalid engine"):
+        volume(_clipped(multi_state_db), engine="spark")
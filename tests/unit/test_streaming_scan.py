@@ -0,0 +1,152 @@
+"""Streaming table scans backed by DuckDB record batches."""
+
+from __future__ import annotations
+
+import duckdb
+import polars as pl
+import pytest
+
+from pyfia.core.data_reader import FIADataReader
+from pyfia.core.pushdown import expr_to_sql
+
+
+@pytest.fixture
+def tree_db(tmp_path):
+    """Small DuckDB file with a TREE-like table."""
+    path = tmp_path / "fia.duckdb"
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute(
+            """
+            CREATE TABLE TREE AS
+            SELECT
+                CAST(1000 + i AS BIGINT) AS CN,
+                CAST(i % 10 AS BIGINT) AS PLT_CN,
+                CAST(i % 3 + 1 AS INTEGER) AS STATUSCD,
+                CAST(i % 7 AS SMALLINT) AS SPCD,
+                CAST(i AS DOUBLE) / 4 AS DIA,
+                CASE WHEN i % 5 = 0 THEN NULL ELSE 'x' || i END AS NOTE
+            FROM range(1000) t(i)
+            """
+        )
+    finally:
+        conn.close()
+    return path
+
+
+class TestScanTable:
+    def test_matches_eager_read(self, tree_db):
+        reader = FIADataReader(tree_db)
+        eager = reader.read_table("TREE", lazy=False)
+        streamed = reader.scan_table("TREE", batch_size=1000).collect()
+        assert streamed.schema == eager.schema
+        assert streamed.sort("CN").equals(eager.sort("CN"))
+
+    def test_nothing_read_until_collect(self, tree_db, monkeypatch):
+        reader = FIADataReader(tree_db)
+        queries: list[str] = []
+        original = reader._backend.iter_dataframes
+
+        def spy(query, batch_size=100_000):
+            queries.append(query)
+            return original(query, batch_size=batch_size)
+
+        monkeypatch.setattr(reader._backend, "iter_dataframes", spy)
+        lf = reader.scan_table("TREE")
+        assert queries == []
+        lf.select("DIA").collect()
+        assert len(queries) == 1
+
+    def test_projection_and_predicate_pushdown(self, tree_db, monkeypatch):
+        reader = FIADataReader(tree_db)
+        queries: list[str] = []
+        original = reader._backend.iter_dataframes
+
+        def spy(query, batch_size=100_000):
+            queries.append(query)
+            return original(query, batch_size=batch_size)
+
+        monkeypatch.setattr(reader._backend, "iter_dataframes", spy)
+        result = (
+            reader.scan_table("TREE", batch_size=1000)
+            .filter((pl.col("STATUSCD") == 1) & (pl.col("DIA") >= 100.0))
+            .select("PLT_CN", "DIA")
+            .collect()
+        )
+        expected = (
+            reader.read_table("TREE", lazy=False)
+            .filter((pl.col("STATUSCD") == 1) & (pl.col("DIA") >= 100.0))
+            .select("PLT_CN", "DIA")
+        )
+        assert result.sort("DIA").equals(expected.sort("DIA"))
+        assert '"STATUSCD" = 1' in queries[0]
+        assert '"DIA" >= 100.0' in queries[0]
+        assert '"NOTE"' not in queries[0]
+
+    def test_unsupported_predicate_still_applied(self, tree_db):
+        reader = FIADataReader(tree_db)
+        result = (
+            reader.scan_table("TREE", batch_size=1000)
+            .filter(pl.col("SPCD").is_in([1, 2]) & pl.col("NOTE").is_not_null())
+            .collect()
+        )
+        assert result.height > 0
+        assert set(result["SPCD"].unique()) <= {1, 2}
+        assert result["NOTE"].null_count() == 0
+
+    def test_head_and_len(self, tree_db):
+        reader = FIADataReader(tree_db)
+        lf = reader.scan_table("TREE", batch_size=1000)
+        assert lf.head(7).collect().height == 7
+        assert lf.select(pl.len()).collect().item() == 1000
+        assert lf.filter(pl.col("SPCD").is_in([3])).head(5).collect().height == 5
+
+    def test_where_and_columns(self, tree_db):
+        reader = FIADataReader(tree_db)
+        result = reader.scan_table(
+            "TREE", columns=["CN", "STATUSCD"], where="STATUSCD = 2"
+        ).collect()
+        assert result.columns == ["CN", "STATUSCD"]
+        assert result.schema["CN"] == pl.String
+        assert result.schema["STATUSCD"] == pl.Int64
+        assert set(result["STATUSCD"].unique()) == {2}
+
+    def test_streaming_reader_returns_scan(self, tree_db):
+        reader = FIADataReader(tree_db, streaming=True)
+        lf = reader.read_table("TREE", columns=["CN", "DIA"])
+        assert "pyfia_scan" in lf.explain()
+        assert lf.collect().height == 1000
+        # Eager reads are unaffected by the streaming flag
+        assert isinstance(reader.read_table("TREE", lazy=False), pl.DataFrame)
+
+
+class TestExprToSql:
+    @pytest.mark.parametrize(
+        "expr, expected",
+        [
+            (pl.col("A") == 1, '"A" = 1'),
+            (pl.col("S") == "o'k", "\"S\" = 'o''k'"),
+            (pl.lit(3) < pl.col("A"), '"A" > 3'),
+            (pl.col("A").is_null(), '"A" IS NULL'),
+            (~(pl.col("A") <= 2.5), '(NOT "A" <= 2.5)'),
+            (
+                (pl.col("A") > 1) | (pl.col("B") != True),  # noqa: E712
+                '("A" > 1 OR "B" <> TRUE)',
+            ),
+            (
+                (pl.col("A") > 1) & pl.col("B").is_not_null(),
+                '"A" > 1 AND "B" IS NOT NULL',
+            ),
+        ],
+    )
+    def test_translates_simple_predicates(self, expr, expected):
+        assert expr_to_sql(expr) == expected
+
+    def test_partial_conjunction(self):
+        expr = (pl.col("A") == 1) & pl.col("B").is_in([1, 2])
+        assert expr_to_sql(expr) == '"A" = 1'
+
+    def test_untranslatable(self):
+        assert expr_to_sql(pl.col("B").is_in([1, 2])) is None
+        assert expr_to_sql((pl.col("A") == 1) | pl.col("B").is_in([1])) is None
+        assert expr_to_sql(pl.col("A") == pl.col("B")) is None
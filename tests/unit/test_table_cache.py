@@ -0,0 +1,96 @@
+"""Table cache behind FIA.load_table."""
+
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from pyfia import FIA
+from pyfia.core.table_cache import TableCache
+
+
+@pytest.fixture
+def db(multi_state_db, monkeypatch):
+    db = FIA(multi_state_db)
+    reads = []
+    read_table = db._reader.read_table
+
+    def counting_read_table(table_name, columns=None, where=None, lazy=True):
+        reads.append((table_name, columns, where))
+        return read_table(table_name, columns=columns, where=where, lazy=lazy)
+
+    monkeypatch.setattr(db._reader, "read_table", counting_read_table)
+    db.reads = reads
+    return db
+
+
+def test_superset_projection_is_reused(db):
+    full = db.load_table("TREE", ["CN", "PLT_CN", "DIA"]).collect()
+    subset = db.load_table("TREE", ["DIA", "CN"])
+
+    assert len(db.reads) == 1
+    assert subset.collect().equals(full)
+    assert db.tables.stats.hits == 1
+    assert db.tables.stats.misses == 1
+
+
+def test_column_sets_merge_on_reload(db):
+    db.load_table("TREE", ["CN", "DIA"])
+    merged = db.load_table("TREE", ["CN", "HT"])
+
+    assert db.reads[-1][1] == ["CN", "HT", "DIA"]
+    assert merged.collect_schema().names() == ["CN", "HT", "DIA"]
+    assert len(db.tables.get_cache_info()["entries"]) == 1
+
+    db.load_table("TREE", ["DIA", "HT"])
+    assert len(db.reads) == 2
+
+
+def test_where_clause_is_part_of_key(db):
+    live = db.load_table("TREE", ["CN", "STATUSCD"], where="STATUSCD = 1")
+    dead = db.load_table("TREE", ["CN", "STATUSCD"], where="STATUSCD = 2")
+
+    assert len(db.reads) == 2
+    assert live.collect()["STATUSCD"].unique().to_list() == [1]
+    assert dead.collect()["STATUSCD"].unique().to_list() == [2]
+    # Name lookups return the most recently used projection
+    assert db.tables["TREE"] is dead
+    db.load_table("TREE", ["CN"], where="STATUSCD = 1")
+    assert db.tables["TREE"] is live
+    assert len(db.reads) == 2
+
+
+def test_clip_clears_cache(db):
+    db.load_table("COND", ["PLT_CN", "CONDID"])
+    db.clip_by_evalid([132301])
+    assert "COND" not in db.tables
+    db.load_table("COND", ["PLT_CN", "CONDID"])
+    assert [read[0] for read in db.reads].count("COND") == 2
+
+
+def test_lru_eviction_under_budget():
+    frame = pl.DataFrame({"x": range(100_000)}, schema={"x": pl.Int64})
+    nbytes = frame.estimated_size()
+    cache = TableCache(max_memory_mb=2.5 * nbytes / (1024 * 1024))
+
+    cache.store("A", frame.lazy(), ["x"], None, nbytes)
+    cache.store("B", frame.lazy(), ["x"], None, nbytes)
+    assert cache.lookup("A", ["x"], None) is not None
+    cache.store("C", frame.lazy(), ["x"], None, nbytes)
+
+    assert list(cache) == ["A", "C"]
+    assert cache.stats.evictions == 1
+    assert cache.nbytes <= cache.max_bytes
+
+
+def test_mapping_compatibility(db):
+    db.tables = {"POP_EVAL": pl.DataFrame({"EVALID": [132301]})}
+    assert isinstance(db.tables, TableCache)
+    assert "POP_EVAL" in db.tables
+    assert db.load_table("POP_EVAL", ["EVALID"]).collect().height == 1
+    assert db.reads == []
+
+    del db.tables["POP_EVAL"]
+    assert len(db.tables) == 0
+    with pytest.raises(KeyError):
+        db.tables["POP_EVAL"]
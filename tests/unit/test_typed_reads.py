@@ -0,0 +1,94 @@
+"""Column types cast in the SELECT clause of table reads."""
+
+from __future__ import annotations
+
+import duckdb
+import polars as pl
+import pytest
+
+from pyfia.core.backends.base import fiadb_numeric_type
+from pyfia.core.data_reader import FIADataReader
+
+
+@pytest.fixture
+def varchar_db(tmp_path):
+    """DuckDB file with integer and VARCHAR-stored numeric FIADB columns (#106)."""
+    path = tmp_path / "fia.duckdb"
+    conn = duckdb.connect(str(path))
+    try:
+        conn.execute(
+            """
+            CREATE TABLE TREE_GRM_COMPONENT AS
+            SELECT
+                CAST(i AS BIGINT) AS TRE_CN,
+                CAST(i % 4 AS BIGINT) AS PLT_CN,
+                CAST(i / 2 AS VARCHAR) AS DIA_MIDPT,
+                CASE WHEN i = 0 THEN '' ELSE CAST(i / 10 AS VARCHAR) END
+                    AS SUBP_TPAREMV_UNADJ_GS_FOREST,
+                CAST(i % 3 AS VARCHAR) AS SUBP_SUBPTYP_GRM_GS_FOREST,
+                'CUT1' AS SUBP_COMPONENT_GS_FOREST,
+                CAST(i % 5 AS SMALLINT) AS STATUSCD,
+                CAST(i AS INTEGER) AS INVYR
+            FROM range(20) t(i)
+            """
+        )
+    finally:
+        conn.close()
+    return path
+
+
+EXPECTED_SCHEMA = {
+    "TRE_CN": pl.String,
+    "PLT_CN": pl.String,
+    "DIA_MIDPT": pl.Float64,
+    "SUBP_TPAREMV_UNADJ_GS_FOREST": pl.Float64,
+    "SUBP_SUBPTYP_GRM_GS_FOREST": pl.Int64,
+    "SUBP_COMPONENT_GS_FOREST": pl.String,
+    "STATUSCD": pl.Int64,
+    "INVYR": pl.Int64,
+}
+
+
+def test_read_table_types_columns_in_sql(varchar_db):
+    reader = FIADataReader(varchar_db)
+    df = reader.read_table("TREE_GRM_COMPONENT", lazy=False)
+
+    assert dict(df.schema) == EXPECTED_SCHEMA
+    # Empty strings are read as missing values
+    assert df.sort("INVYR")["SUBP_TPAREMV_UNADJ_GS_FOREST"][0] is None
+    assert df["DIA_MIDPT"].sum() == pytest.approx(sum(i / 2 for i in range(20)))
+
+
+def test_scan_table_types_columns_in_sql(varchar_db):
+    reader = FIADataReader(varchar_db)
+    lf = reader.scan_table("TREE_GRM_COMPONENT", batch_size=7)
+
+    assert dict(lf.collect_schema()) == EXPECTED_SCHEMA
+    eager = reader.read_table("TREE_GRM_COMPONENT", lazy=False)
+    assert lf.collect().sort("INVYR").equals(eager.sort("INVYR"))
+
+
+def test_select_clause_casts(varchar_db):
+    backend = FIADataReader(varchar_db)._backend
+    clause = backend.build_select_clause(
+        "TREE_GRM_COMPONENT",
+        ["TRE_CN", "STATUSCD", "DIA_MIDPT", "SUBP_COMPONENT_GS_FOREST"],
+    )
+    assert clause == (
+        "CAST(TRE_CN AS VARCHAR) AS TRE_CN, "
+        "CAST(STATUSCD AS BIGINT) AS STATUSCD, "
+        "CAST(NULLIF(DIA_MIDPT, '') AS DOUBLE) AS DIA_MIDPT, "
+        "SUBP_COMPONENT_GS_FOREST"
+    )
+    # Computed once per table
+    assert backend.select_expressions("TREE_GRM_COMPONENT") is (
+        backend.select_expressions("TREE_GRM_COMPONENT")
+    )
+
+
+def test_fiadb_numeric_type():
+    assert fiadb_numeric_type("DRYBIO_AG") == "DOUBLE"
+    assert fiadb_numeric_type("SPCD") == "BIGINT"
+    assert fiadb_numeric_type("SUBP_TPAMORT_UNADJ_AL_TIMBER") == "DOUBLE"
+    assert fiadb_numeric_type("SUBP_SUBPTYP_GRM_AL_FOREST") == "BIGINT"
+    assert fiadb_numeric_type("SUBP_COMPONENT_AL_FOREST") is None
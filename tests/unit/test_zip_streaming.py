@@ -0,0 +1,113 @@
+"""Streaming DataMart ZIP members into DuckDB without extracted CSVs."""
+
+from __future__ import annotations
+
+import os
+import zipfile
+
+import duckdb
+import pytest
+
+from pyfia.downloader import DownloadError, _import_zip_file
+from pyfia.downloader.schema import REJECTS_TABLE, save_csv_rejects
+from pyfia.downloader.stream import open_zip_csv, zip_csv_members
+
+TREE_CSV = "CN,PLT_CN,DIA,SPCD\n" + "".join(
+    f"{i},{i // 3},{i * 0.1:.1f},{100 + i % 7}\n" for i in range(1, 20001)
+)
+
+
+def _zip(path, members, compression=zipfile.ZIP_DEFLATED):
+    with zipfile.ZipFile(path, "w", compression) as zf:
+        for name, text in members.items():
+            zf.writestr(name, text)
+    return path
+
+
+@pytest.fixture
+def tree_zip(tmp_path):
+    return _zip(tmp_path / "GA_TREE.zip", {"GA_TREE.csv": TREE_CSV})
+
+
+def test_streams_member_through_pipe(tree_zip):
+    with open_zip_csv(tree_zip, "GA_TREE.csv") as (path, columns):
+        assert path.name == "GA_TREE.csv"
+        assert columns == ["CN", "PLT_CN", "DIA", "SPCD"]
+        if hasattr(os, "mkfifo"):
+            assert not path.is_file()
+        count = duckdb.execute(f"SELECT COUNT(*) FROM read_csv('{path}')").fetchone()
+
+    assert count == (20000,)
+
+
+def test_imports_zip_with_declared_types(tmp_path):
+    zip_path = _zip(
+        tmp_path / "GA_TREE.zip",
+        {"GA_TREE.csv": TREE_CSV + "bad,1,2.0,110\n"},
+    )
+    conn = duckdb.connect()
+
+    assert _import_zip_file(conn, zip_path, state_code=13, show_progress=False) == 1
+
+    types = dict(
+        conn.execute("SELECT column_name, column_type FROM (DESCRIBE TREE)").fetchall()
+    )
+    assert types["CN"] == "BIGINT"
+    assert types["DIA"] == "DOUBLE"
+    assert types["STATE_ADDED"] == "INTEGER"
+    assert conn.execute("SELECT COUNT(*) FROM TREE").fetchone() == (20000,)
+    assert save_csv_rejects(conn) == {"GA_TREE.csv": 1}
+    assert conn.execute(f"SELECT CSV_LINE FROM {REJECTS_TABLE}").fetchall() == [
+        ("bad,1,2.0,110",)
+    ]
+
+
+def test_selects_members_and_appends(tmp_path):
+    zip_path = _zip(
+        tmp_path / "FIADB_REFERENCE.zip",
+        {
+            "REF_SPECIES.csv": "SPCD,COMMON_NAME\n110,shortleaf pine\n",
+            "REF_UNITS.csv": "UNITCD,NAME\n1,one\n",
+        },
+    )
+    conn = duckdb.connect()
+
+    for _ in range(2):
+        _import_zip_file(
+            conn, zip_path, tables=["REF_SPECIES"], append=True, show_progress=False
+        )
+
+    assert zip_csv_members(zip_path) == ["REF_SPECIES.csv", "REF_UNITS.csv"]
+    assert conn.execute("SELECT COUNT(*) FROM REF_SPECIES").fetchone() == (2,)
+    tables = conn.execute("SELECT table_name FROM duckdb_tables()").fetchall()
+    assert ("REF_UNITS",) not in tables
+
+
+def test_corrupt_member_leaves_no_table(tmp_path):
+    zip_path = _zip(
+        tmp_path / "GA_TREE.zip", {"GA_TREE.csv": TREE_CSV}, zipfile.ZIP_STORED
+    )
+    data = zip_path.read_bytes()
+    zip_path.write_bytes(data.replace(b"19999,6666", b"19999,6667"))
+    conn = duckdb.connect()
+
+    with pytest.raises(DownloadError, match="decompress"):
+        with open_zip_csv(zip_path, "GA_TREE.csv") as (path, _):
+            duckdb.execute(f"SELECT COUNT(*) FROM read_csv('{path}')").fetchall()
+
+    assert _import_zip_file(conn, zip_path, show_progress=False) == 0
+    assert conn.execute("SELECT COUNT(*) FROM duckdb_tables()").fetchone() == (0,)
+
+
+def test_unread_pipe_does_not_block(tree_zip):
+    with open_zip_csv(tree_zip, "GA_TREE.csv") as (path, _):
+        pass
+
+    assert not path.exists()
+
+
+def test_extracts_without_named_pipes(tree_zip, monkeypatch):
+    monkeypatch.delattr(os, "mkfifo", raising=False)
+
+    with open_zip_csv(tree_zip, "GA_TREE.csv") as (path, _):
+        assert path.read_text() == TREE_CSV